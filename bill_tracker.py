@@ -45,6 +45,8 @@ import cadence   # LIS-safety guardrail #5 — the SHARED cadence decision (same
 # Reuse the worker's proven, guarded primitives + structural resolvers — single source of truth.
 from calendar_worker import (
     safe_fetch_csv,
+    load_vote_index,                # VOTE.CSV roll calls, indexed per ETag (shared with the worker)
+    blob_cache_maintain,            # .lis_blob_cache LRU budget + integrity (shared with the worker)
     get_armored_session,
     get_active_session_info,
     build_committee_maps,           # populates the global COMMITTEE_CODE_MAP …
@@ -419,8 +421,8 @@ def _latest_vote(rows):
     Heuristic (Standard #1):
       - ASSUMES LIS writes tallies in its published `N-Y N-N [N-A...]` form (the `_TALLY_RE` shape).
       - BREAKS if LIS changes that surface form → a real vote could read as no-vote (empty tally).
-      - RUNTIME CHECK: a structural cross-check (votes present in VOTE.CSV vs. tallies surfaced) is a
-        future follow-up; until then the LIS bill-page link on the card is the authoritative backstop.
+      - RUNTIME CHECK: build_bill_records cross-checks against VOTE.CSV (load_vote_index) — a bill with a
+        tallied roll call but no tally here is counted in `latest_vote_unsurfaced` and alerts past 1%.
     """
     for r in reversed(rows):   # newest first
         m = _TALLY_RE.search(str(r.get("action", "")))
@@ -529,6 +531,16 @@ def build_bill_records(http_session, session_code):
             hist_by_bill.setdefault(b, []).append(
                 {"action": act, "date": dt.strip(), "refid": rf.strip().upper()})
 
+    # 2b) VOTE.CSV roll calls joined onto those rows — the worker's shared, per-ETag VoteIndex (a
+    # conditional GET, so usually a 304 + an index load). FAIL-OPEN: it feeds only the latest-vote
+    # cross-check below, never a published value.
+    vote_index = None
+    try:
+        vote_index = load_vote_index(blob_code).attach_history(
+            (b, r["date"], r["refid"], r["action"]) for b, rows in hist_by_bill.items() for r in rows)
+    except Exception as _vi_err:
+        print(f"⚠️  VOTE.CSV index unavailable ({_vi_err}); latest-vote cross-check skipped this cycle.")
+
     # 3) Committee maps (populates the global COMMITTEE_CODE_MAP for resolve_committee_from_refid).
     #    Enrichment only: build_committee_maps already has its OWN static fallback, so this broad
     #    catch is a deliberate belt-and-suspenders guard for a truly unexpected failure — it must
@@ -577,6 +589,9 @@ def build_bill_records(http_session, session_code):
     # single-chamber and excluded), how many DON'T show both floor passages? Should be ~0; a rising rate
     # means LIS drifted its "passed House/Senate" action vocabulary. floor_both_expected is the denominator.
     floor_house_bills = floor_senate_bills = floor_both_expected = floor_both_missing = 0
+    # Latest-vote cross-check (the _latest_vote RUNTIME CHECK): bills with a tallied roll call in VOTE.CSV
+    # vs. those whose card surfaced NO tally. Should be 0; a rising count means _TALLY_RE lost LIS's form.
+    vote_rollcall_bills, vote_unsurfaced_bills = 0, []
     for item in universe:
         bill = _clean_bill(item.get("LegislationNumber", ""))
         if not bill:
@@ -657,6 +672,11 @@ def build_bill_records(http_session, session_code):
             floor_both_expected += 1
             if not (floor["house"] == "passed" and floor["senate"] == "passed"):
                 floor_both_missing += 1
+        latest_vote = _latest_vote(rows)
+        if vote_index is not None and any(v.tally for v in vote_index.votes_for(bill)):
+            vote_rollcall_bills += 1
+            if not latest_vote["tally"]:
+                vote_unsurfaced_bills.append(bill)
         records.append({
             "bill": bill,
             "title": str(item.get("Description", "") or "").strip(),
@@ -671,7 +691,7 @@ def build_bill_records(http_session, session_code):
             "floor_senate": floor["senate"],                         # ""|"passed"|"defeated" (Timeline Floor stage)
             "last_committee": position["last_committee"],
             "referral_count": position["referral_count"],
-            "latest_vote": _latest_vote(rows),                       # {tally, location, date}
+            "latest_vote": latest_vote,                              # {tally, location, date}
             "upcoming": upcoming,                                    # [{date, committee}] (empty off-season)
             "last_action_date": rows[-1]["date"] if rows else "",
             "history": [{"action": r["action"], "date": r["date"]} for r in rows],  # UI doesn't need refids
@@ -754,6 +774,10 @@ def build_bill_records(http_session, session_code):
         "floor_passage_both_expected": floor_both_expected,
         "floor_passage_both_missing": floor_both_missing,
         "floor_passage_reconcile_rate": round(floor_both_missing / floor_both_expected, 4) if floor_both_expected else 0.0,
+        # Latest-vote cross-check against VOTE.CSV (None = the index was unavailable this cycle, not 0).
+        "vote_rollcall_bills": vote_rollcall_bills if vote_index is not None else None,
+        "latest_vote_unsurfaced": len(vote_unsurfaced_bills) if vote_index is not None else None,
+        "latest_vote_unsurfaced_sample": sorted(vote_unsurfaced_bills)[:10],
         "checked_at_utc": now_utc,
     }
     # Self-calibrating check must ALERT, not just sit in the JSON (Standard #4; CodeRabbit #191). Steady
@@ -765,6 +789,11 @@ def build_bill_records(http_session, session_code):
                f"bills lack both floor passages ({100 * floor_both_missing / floor_both_expected:.1f}%; "
                f"steady ≈ 0). LIS's floor-passage vocabulary may have changed — check _PASS_HOUSE_RE / "
                f"_PASS_SENATE_RE against current HISTORY actions.")
+    if vote_unsurfaced_bills and len(vote_unsurfaced_bills) > 0.01 * max(1, vote_rollcall_bills):
+        _alert("WARN", "DATA_ANOMALY",
+               f"latest-vote cross-check: {len(vote_unsurfaced_bills)}/{vote_rollcall_bills} bills with a "
+               f"tallied VOTE.CSV roll call show no tally on their card (e.g. {sorted(vote_unsurfaced_bills)[:5]}; "
+               f"steady ≈ 0). LIS may have changed its tally form — check _TALLY_RE against HISTORY actions.")
     return records, completeness
 
 
@@ -919,6 +948,7 @@ def run_bill_tracker():
             return
 
         records, completeness = build_bill_records(http_session, session_code)
+        blob_cache_maintain()   # this job saves its own copy of the shared cache: keep it in budget too
         prior_unverified, prior_universe, _sheet = write_bill_tracker(records, completeness)
         crossed = sum(1 for r in records if r["crossed_over"])
         print(f"✅ Bill_Tracker written: {len(records)} bills "
@@ -5,17 +5,26 @@ import time
 import random
 import threading
 import hashlib
+import inspect
+import base64
+import zlib
+import gzip
+import functools
+import heapq
+import multiprocessing
 import requests
 import gspread
 import pandas as pd
+import numpy as np
 import re
 import io
 import csv
 import tempfile
 import traceback
 import urllib.parse
-from collections import Counter, defaultdict
-from concurrent.futures import ThreadPoolExecutor
+from collections import Counter, defaultdict, namedtuple
+from operator import attrgetter
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
 import pytz
 from requests.adapters import HTTPAdapter
@@ -23,6 +32,13 @@ from urllib3.util.retry import Retry
 from google.oauth2.service_account import Credentials
 from bs4 import BeautifulSoup
 import pdfplumber
+from pdfminer.pdfparser import PDFParser
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
+from pdfminer.pdfdevice import PDFTextDevice
+from pdfminer.pdffont import PDFUnicodeNotDefined
+from pdfminer.utils import apply_matrix_pt
 import logging
 import cadence   # LIS-safety guardrail #5 (activity-correlated cadence) — pure module, no back-import
 
@@ -69,7 +85,45 @@ def notify_slack(text):
 # 2026-07-04.1: date-aware SortTime resolver (#189) + the TimeClass column (#193) both change
 # Sheet1 output — force a recompute so cached/incremental paths can't serve pre-change rows
 # (Qodo #193; #189 omitted this bump, caught here).
-WORKER_OUTPUT_LOGIC_VERSION = "2026-07-31.1"   # ABC row-conservation counters + worker_version stamped into SYSTEM_METRICS (audit #96: the metrics row is worker OUTPUT, so its content changing is an output-value change)
+# 2026-10-18.1: STM columnar pre-pass (_stm_preclassify) — output byte-identical by construction (proven by
+# test_stm_preclassify.py); bumped anyway because run_sequential_turing_machine changed (audit #96 is mechanical).
+# 2026-10-18.2: compiled committee-alias matcher (_CommitteeAliasMatcher) for the STM lexicon scans — same
+# dict-order first match as the loop it replaced (test_committee_alias_matcher.py); bumped for run_sequential_turing_machine.
+# 2026-10-18.3: opt-in sharded STM (STM_SHARD_WORKERS) — serial-order replay, output identical to
+# run_sequential_turing_machine (test_stm_sharding.py); bumped because the STM call path changed.
+# 2026-10-18.4: ScheduleIndex — find_api_schedule_match is a per-date indexed lookup with the same return
+# values as the full-map scan (test_schedule_index.py); bumped because find_api_schedule_match changed.
+# 2026-10-18.5: LegEventIndex — the four LegEvent cache matchers share one per-bill, pre-tokenized
+# date index (test_legevent_index.py); bumped because _route_for_row / the resolver changed.
+# 2026-10-18.6: bounded memo layer over the pure hot-path helpers (parse_24h_time, normalize_room_key,
+# _legislation_event_token_set, _parse_relative_offset_minutes, _is_relative_time_text) — same results
+# (test_hot_memo.py); bumped because parse_24h_time / the relative-time helpers changed.
+# 2026-10-18.7: opt-in concurrent LegEvent hydration (LEGEVENT_HYDRATE_WORKERS) — per-bill resolver calls
+# merged in queue order, identical caches / bills_meta / alerts (test_legevent_hydration.py); bumped because
+# the resolver's hydration call site moved.
+# 2026-10-18.8: adaptive per-host request governor (_LIS_GOVERNOR) replaces extract_rogue_agenda's fixed
+# sleep(0.25) — pacing only, same responses parsed the same way (test_request_governor.py); bumped because
+# extract_rogue_agenda changed.
+# 2026-10-18.9: opt-in agenda prefetch (AGENDA_FETCH_WORKERS / AGENDA_PARSE_WORKERS) — extract_rogue_agenda
+# split into fetch + PDF-parse halves, results read back in meeting order (test_agenda_prefetch.py); bumped
+# because extract_rogue_agenda changed.
+# 2026-10-18.10: conditional-GET agenda validators (_AGENDA_VALIDATORS) — a 304 / identical body reuses the
+# bills its last clean parse produced (test_agenda_validators.py); bumped because extract_rogue_agenda changed.
+# 2026-10-18.11: per-bill STM dependency tracking (StmDependencyRecorder, STM_Bill_Cache.DepsJSON) — the STM
+# notes which shared-input keys each bill's rows read, so a shared-input change recomputes only those bills
+# (test_stm_dependencies.py); bumped because run_sequential_turing_machine changed.
+# 2026-10-18.12: Merkle digest of STM output (STM_Bill_Cache.OutputDigest + root) and sampled incremental-
+# primary verification (STM_VERIFY_SAMPLE / STM_VERIFY_FULL_EVERY) (test_stm_merkle.py); bumped because the
+# verification reruns run_sequential_turing_machine through _append_event.
+# 2026-10-18.13: compact event buffer (EventBuffer / StmEventRecord, _events_frame) — master_events holds
+# slotted records with interned strings; the frame built from them equals pd.DataFrame(dicts)
+# (test_event_buffer.py); bumped because _append_event's master_events changed.
+# 2026-10-18.14: per-stage STM cost attribution (StmCostProfiler, STM_COST_PROFILE / STM_COST_SAMPLE_EVERY) —
+# timing marks only, stm_cost_* into SYSTEM_METRICS (test_stm_cost.py); bumped because
+# run_sequential_turing_machine changed.
+# 2026-10-18.15: agenda validators hold a pending body per (url, meeting date), so overlapping prefetches of
+# one URL each record the body they parsed (test_agenda_validators.py); bumped because extract_rogue_agenda changed.
+WORKER_OUTPUT_LOGIC_VERSION = "2026-10-18.15"   # per-meeting pending agenda validators (no output change; forces one clean recompute)
 
 
 def _sha(*parts):
@@ -113,7 +167,7 @@ _STM_EVENT_KEY_FIELDS = ("Date", "Time", "SortTime", "Status", "Committee", "Bil
 def _stm_event_key(ev):
     """Canonical, hashable identity of an STM event dict (all output-defining fields).
     A non-dict (e.g. a malformed cache row) yields an all-empty key, never a crash."""
-    if not isinstance(ev, dict):
+    if not isinstance(ev, (dict, StmEventRecord)):
         return tuple("" for _ in _STM_EVENT_KEY_FIELDS)
     return tuple(str(ev.get(k, "")) for k in _STM_EVENT_KEY_FIELDS)
 
@@ -153,6 +207,183 @@ def _stm_outputs_equivalent(events_a, events_b):
     return (not only_a and not only_b), only_a, only_b
 
 
+def _telemetry_deltas(full, incr, base, keys=None):
+    """{key: (full - base, incr - base)} for every counter whose STM delta differs between the full and
+    the incremental run (`keys`: only those; default every key of the three). Numbers only — a non-numeric
+    value (a label that slipped into the counters) is skipped, never a TypeError that voids the verdict."""
+    out = {}
+    for k in (keys if keys is not None else set(full) | set(incr) | set(base)):
+        f, i, b = full.get(k, 0), incr.get(k, 0), base.get(k, 0)
+        if not all(isinstance(v, (int, float)) for v in (f, i, b)):
+            continue
+        if f - b != i - b:
+            out[k] = (f - b, i - b)
+    return out
+
+
+# ── Compact event buffer for master_events ───────────────────────────────────────
+# A cycle appends ~60k events, and as dicts each one is a ~15-key hash table (≈650 B before its values)
+# plus its own copy of strings every other event repeats (date, committee, status, origin, route and
+# class tags). StmEventRecord keeps the _STM_EVENT_KEY_FIELDS in __slots__, records its key order as
+# one shared tuple, and routes any other key to a small side dict. EventBuffer (a list subclass, so
+# slicing / del / len / iteration are unchanged) converts whatever is appended into a record and interns
+# its string values in a per-buffer pool. Records behave as read-write mappings — ev["Time"],
+# ev.get(...), "Time" in ev, dict(ev), ev.items() — so the rest of the pipeline reads them as it read
+# dicts. _events_frame builds the final DataFrame column-wise in one pass: same columns (first-seen
+# order), values and dtypes as pd.DataFrame(list_of_dicts) — tools/verification/test_event_buffer.py.
+_EVENT_SLOT_SET = frozenset(_STM_EVENT_KEY_FIELDS)
+_ABSENT = object()
+
+
+class StmEventRecord:
+    """One event, slotted. A mapping for every read/write the pipeline does on an event dict."""
+    __slots__ = _STM_EVENT_KEY_FIELDS + ("_keys", "_extra", "_pool")
+
+    def __init__(self, event, pool):
+        self._pool, self._extra = pool, None
+        for k, v in event.items():
+            if k in _EVENT_SLOT_SET:
+                setattr(self, k, pool.value(v))
+            else:
+                if self._extra is None:
+                    self._extra = {}
+                self._extra[k] = pool.value(v)
+        self._keys = pool.layout(tuple(event))
+
+    def __getitem__(self, key):
+        v = self.get(key, _ABSENT)
+        if v is _ABSENT:
+            raise KeyError(key)
+        return v
+
+    def get(self, key, default=None):
+        if key in _EVENT_SLOT_SET:
+            return getattr(self, key, default)
+        return self._extra.get(key, default) if self._extra else default
+
+    def __contains__(self, key):
+        return self.get(key, _ABSENT) is not _ABSENT
+
+    def __setitem__(self, key, value):
+        if key not in self:
+            self._keys = self._pool.layout(self._keys + (key,))
+        if key in _EVENT_SLOT_SET:
+            setattr(self, key, self._pool.value(value))
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = self._pool.value(value)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def keys(self):
+        return list(self._keys)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def values(self):
+        return [self[k] for k in self._keys]
+
+    def items(self):
+        return [(k, self[k]) for k in self._keys]
+
+    def copy(self):
+        return dict(self.items())
+
+    def __eq__(self, other):
+        if isinstance(other, (StmEventRecord, dict)):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"StmEventRecord({dict(self.items())!r})"
+
+
+class _EventPool:
+    """Interning for one buffer: repeated string values and key layouts share one object each."""
+
+    def __init__(self):
+        self._strings, self._layouts = {}, {}
+
+    def value(self, v):
+        return self._strings.setdefault(v, v) if type(v) is str else v
+
+    def layout(self, keys):
+        return self._layouts.setdefault(keys, keys)
+
+
+class EventBuffer(list):
+    """master_events: a list of StmEventRecord. Every way in (append / extend / insert / item or slice
+    assignment / +=) stores records; a non-mapping item (never produced today) is kept as-is."""
+
+    def __init__(self, events=()):
+        super().__init__()
+        self.pool = _EventPool()
+        self.extend(events)
+
+    def _record(self, ev):
+        if isinstance(ev, StmEventRecord) or not isinstance(ev, dict):
+            return ev
+        return StmEventRecord(ev, self.pool)
+
+    def append(self, ev):
+        super().append(self._record(ev))
+
+    def extend(self, events):
+        super().extend(self._record(e) for e in events)
+
+    def insert(self, i, ev):
+        super().insert(i, self._record(ev))
+
+    def __setitem__(self, i, value):
+        if isinstance(i, slice):
+            super().__setitem__(i, [self._record(e) for e in value])
+        else:
+            super().__setitem__(i, self._record(value))
+
+    def __iadd__(self, events):
+        self.extend(events)
+        return self
+
+
+def _events_frame(events):
+    """pd.DataFrame(events) for event dicts and/or StmEventRecords, built column-wise in one pass —
+    the columns in first-seen key order, a missing key as NaN, dtypes inferred per column exactly as the
+    list-of-dicts constructor infers them. The leading run of records (master_events; alert rows are
+    dicts appended after it) is read with one C-level attrgetter map per column."""
+    columns, seen_layouts = {}, set()
+    for ev in events:
+        layout = ev._keys if type(ev) is StmEventRecord else tuple(ev)
+        if layout not in seen_layouts:
+            seen_layouts.add(layout)
+            for k in layout:
+                columns.setdefault(k, None)
+    n = len(events)
+    head = next((i for i, ev in enumerate(events) if type(ev) is not StmEventRecord), n)
+    records, rest = events[:head], events[head:]
+    data = {}
+    for c in columns:
+        if c in _EVENT_SLOT_SET:
+            try:
+                values = list(map(attrgetter(c), records))
+            except AttributeError:         # a record with this slot unset
+                values = [getattr(ev, c, np.nan) for ev in records]
+        else:
+            values = [ev.get(c, np.nan) for ev in records]
+        values.extend(ev.get(c, np.nan) for ev in rest)
+        data[c] = np.fromiter(values, dtype=object, count=n)   # never reads a list value as a row
+    return pd.DataFrame(data, columns=list(columns)).infer_objects()
+
+
 # ── Incremental-STM engine: per-bill reuse + SHADOW differential ───────────────
 # Order-invariance is PROVEN (run 27661570960: 58,294 events identical), so a bill's
 # events depend only on its own HISTORY rows + the shared inputs. The engine reuses a
@@ -163,20 +394,23 @@ def _stm_outputs_equivalent(events_a, events_b):
 # the recompute. _STM_EVENT_KEY_FIELDS is the canonical event identity (above).
 def _event_bill_key(ev):
     """The CleanBill the STM keyed this event on (no spaces, uppercase) — matches
-    the legevent_history_hashes keys + df_past['CleanBill']."""
-    if not isinstance(ev, dict):
+    the stm_bill_digests keys + df_past['CleanBill']."""
+    if not isinstance(ev, (dict, StmEventRecord)):
         return ""
     return str(ev.get("Bill", "")).replace(" ", "").upper()
 
 
-def _stm_incremental_shadow(full_events, current_hashes, shared_changed, prev_cache):
+def _stm_incremental_shadow(full_events, current_hashes, shared_changed, prev_cache,
+                            dep_changed_bills=frozenset()):
     """Build the incremental event set from last cycle's per-bill cache + this cycle's
     full per-bill output, and compare to full. Pure (no I/O) — the engine's core.
 
     full_events : flat list of THIS cycle's full-STM event dicts (its contribution).
-    current_hashes : {bill -> current HISTORY hash} (reuse of legevent_history_hashes).
+    current_hashes : {bill -> current HISTORY digest} (stm_bill_digests — _stm_bill_digests).
     shared_changed : True if the shared inputs moved since last cycle (-> no reuse).
     prev_cache : {bill -> {"hash": str, "events": [event_key_tuples]}} from last cycle.
+    dep_changed_bills : bills a moved shared-input key they read invalidates (dependency
+        tracking — _stm_dependency_changed_bills); recomputed even when their hash matches.
 
     Returns (matches, only_in_full, only_in_incr, n_reused, n_recomputed). A reused bill
     contributes its CACHED keys; a recomputed bill contributes THIS cycle's full keys.
@@ -197,7 +431,7 @@ def _stm_incremental_shadow(full_events, current_hashes, shared_changed, prev_ca
         # A malformed cache entry (events not a list — e.g. a JSON parse failure set it to
         # None) must RECOMPUTE, not reuse-as-empty: reusing it would silently drop that
         # bill's events and false-flag a divergence (Gemini #151).
-        reusable = (not shared_changed) and isinstance(cached, dict) \
+        reusable = (not shared_changed) and bill not in dep_changed_bills and isinstance(cached, dict) \
             and isinstance(cached.get("events"), list) \
             and current_hashes.get(bill, "\x00MISSING") == cached.get("hash")
         if reusable:
@@ -217,12 +451,161 @@ def _stm_incremental_shadow(full_events, current_hashes, shared_changed, prev_ca
     return (not only_full and not only_incr), only_full, only_incr, n_reused, n_recomputed
 
 
+# Per-bill digest the incremental engine keys reuse on (STM_Bill_Cache.HistoryHash). Same change
+# semantics as the LegEvent hash (_hash_history_rows_for_bill: the bill's (date, outcome, refid) rows as
+# a multiset) but vectorized: one pd.util.hash_pandas_object pass gives a 64-bit hash per row over the
+# canonical column order, rows are put in canonical order (bill, row hash), and each bill's run is folded
+# order-sensitively (position-keyed mix, summed per bill) with one segment reduction — no per-bill
+# hashlib / string joins. Digests carry a scheme prefix: rows written under another scheme (the bare
+# SHA-256 hex before 2026-10-18) never compare equal, so an upgrade is a clean one-cycle recompute of
+# every bill, never a stale reuse. Bump _STM_DIGEST_SCHEME with any change to the row columns or mix.
+# LegEvent_Bills.LastHistoryHash keeps the SHA-256: changing it would re-queue every bill's LIS fetch.
+_STM_DIGEST_SCHEME = "h2"
+_MIX64_A, _MIX64_B = np.uint64(0xBF58476D1CE4E5B9), np.uint64(0x94D049BB133111EB)
+_GOLDEN64 = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _mix64(x):
+    """splitmix64 finalizer over a uint64 array (wrapping arithmetic)."""
+    x = (x ^ (x >> np.uint64(30))) * _MIX64_A
+    x = (x ^ (x >> np.uint64(27))) * _MIX64_B
+    return x ^ (x >> np.uint64(31))
+
+
+def _stm_bill_digests(df, desc_col, refid_col):
+    """{CleanBill: "<_STM_DIGEST_SCHEME>:<16 hex>"} over df_past's (date, outcome, refid) rows. Row order
+    in the frame doesn't matter (canonical sort first); any added / removed / edited row changes its
+    bill's digest. Empty CleanBill rows are skipped, as in the LegEvent hash."""
+    if df is None or df.empty:
+        return {}
+    n = len(df)
+    bills = df["CleanBill"].astype(str).str.strip().to_numpy()
+    canon = pd.DataFrame({
+        "d": df["ParsedDate"].dt.normalize().to_numpy().view("i8"),      # the day (NaT → one sentinel)
+        "o": df[desc_col].astype(str).to_numpy() if desc_col in df.columns else [""] * n,
+        "r": df[refid_col].astype(str).to_numpy() if (refid_col and refid_col in df.columns) else [""] * n,
+    })
+    row_h = pd.util.hash_pandas_object(canon, index=False, categorize=False).to_numpy(dtype=np.uint64)
+    codes, uniques = pd.factorize(bills)
+    order = np.lexsort((row_h, codes))                  # canonical: by bill, then by row hash
+    codes, row_h = codes[order], row_h[order]
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    counts = np.diff(np.r_[starts, n])
+    pos = (np.arange(n) - np.repeat(starts, counts)).astype(np.uint64)
+    terms = _mix64(row_h ^ _mix64((pos + np.uint64(1)) * _GOLDEN64))
+    folded = _mix64(np.add.reduceat(terms, starts) ^ _mix64(counts.astype(np.uint64)))
+    return {uniques[c]: f"{_STM_DIGEST_SCHEME}:{int(v):016x}"
+            for c, v in zip(codes[starts], folded) if uniques[c]}
+
+
+# Merkle digest of the STM's OUTPUT (the mirror of the HISTORY digest above, on the other side of the STM).
+# Leaf = one bill's events as a multiset (sorted _stm_event_key tuples — the same equality
+# _stm_outputs_equivalent applies); root = a binary Merkle tree over (bill, leaf) in bill order. Leaves are
+# stored in STM_Bill_Cache.OutputDigest and the root in the sig row, so a cache tab whose rows no longer
+# hash to the root it was written with is discarded on load. Incremental-primary verifies itself against
+# these instead of a second full STM every cycle: a rotating sample of reused bills is recomputed and
+# leaf-compared each cycle (STM_VERIFY_SAMPLE), and every STM_VERIFY_FULL_EVERY-th primary cycle one full
+# isolated run is root-compared (a root match proves every bill; a mismatch names the bills by leaf).
+_STM_MERKLE_SCHEME = "m1"
+STM_VERIFY_SAMPLE = max(0, int(os.environ.get("STM_VERIFY_SAMPLE", "25") or 0))          # 0 disables
+STM_VERIFY_FULL_EVERY = max(0, int(os.environ.get("STM_VERIFY_FULL_EVERY", "96") or 0))  # 0 disables
+_STM_VERIFY_SCHEMA = "1"
+
+
+def _blake16(text):
+    return hashlib.blake2b(text.encode("utf-8", "replace"), digest_size=8).hexdigest()
+
+
+def _stm_output_leaf(event_keys):
+    """One bill's output digest: its event keys as a multiset (tuples or JSON lists; order-free)."""
+    rows = sorted([str(x) for x in k] if isinstance(k, (list, tuple)) else [str(k)] for k in (event_keys or []))
+    return f"{_STM_MERKLE_SCHEME}:{_blake16(json.dumps(rows, separators=(',', ':')))}"
+
+
+def _stm_output_leaves(events):
+    """{bill: leaf} over a flat list of STM event dicts."""
+    by_bill = {}
+    for e in events or []:
+        by_bill.setdefault(_event_bill_key(e), []).append(_stm_event_key(e))
+    return {b: _stm_output_leaf(k) for b, k in by_bill.items()}
+
+
+def _stm_merkle_root(leaves):
+    """Root of the binary Merkle tree over {bill: leaf} in bill order (an odd node is hashed alone)."""
+    level = [_blake16(f"{b}\x1f{leaves[b]}") for b in sorted(leaves)] or [_blake16("")]
+    while len(level) > 1:
+        level = [_blake16("".join(level[i:i + 2])) for i in range(0, len(level), 2)]
+    return f"{_STM_MERKLE_SCHEME}:{level[0]}"
+
+
+def _stm_merkle_diff(expected, actual):
+    """Bills whose leaves differ (present on one side only included) — the root mismatch, localized."""
+    return sorted(b for b in set(expected) | set(actual) if expected.get(b) != actual.get(b))
+
+
+def _stm_verify_state_path():
+    return os.path.join(_BLOB_CACHE_DIR, "stm_verify.json")
+
+
+def _load_stm_verify_state(path=None):
+    """Sampling cursor + today's covered bills + primary cycles since the last full root check."""
+    fresh = {"schema": _STM_VERIFY_SCHEMA, "cursor": 0, "day": "", "covered": set(), "since_full": 0}
+    if not _BLOB_CACHE_ENABLED:
+        return fresh
+    try:
+        with open(path or _stm_verify_state_path(), "r") as f:
+            state = json.load(f)
+        if isinstance(state, dict) and state.get("schema") == _STM_VERIFY_SCHEMA:
+            state["covered"] = set(state.get("covered") or ())
+            return state
+    except FileNotFoundError:
+        pass
+    except Exception as _e:
+        print(f"⚠️ STM verify state unreadable ({_e}); sampling restarts from the first bill.")
+    return fresh
+
+
+def _save_stm_verify_state(state, path=None):
+    if not _BLOB_CACHE_ENABLED:
+        return
+    path = path or _stm_verify_state_path()
+    tmp = path + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(tmp, "w") as f:
+            json.dump(dict(state, covered=sorted(state.get("covered") or ())), f, separators=(",", ":"))
+        os.replace(tmp, path)
+    except Exception as _e:
+        print(f"⚠️ STM verify state write skipped: {_e}")
+
+
+def _stm_verify_pick(reused_bills, k, state):
+    """The next `k` reused bills after the state's cursor, in bill order, wrapping; advances the cursor.
+    Successive cycles walk the whole reused set (the set shifting between cycles only shifts the walk)."""
+    ordered = sorted(reused_bills)
+    if not ordered or k <= 0:
+        return []
+    start = state.get("cursor", 0) % len(ordered)
+    picked = (ordered + ordered)[start:start + min(k, len(ordered))]
+    state["cursor"] = start + len(picked)
+    return picked
+
+
+def _stm_verify_coverage(state, day, verified, all_bills):
+    """Fold this cycle's verified bills (sampled + recomputed) into `day`'s running set; percent of
+    all_bills verified so far today."""
+    if state.get("day") != day:
+        state["day"], state["covered"] = day, set()
+    state["covered"] = (set(state.get("covered") or ()) | set(verified)) & set(all_bills)
+    return int(100 * len(state["covered"]) / len(all_bills)) if all_bills else 100
+
+
 # Per-bill event cache for the incremental engine: {bill -> (history_hash, event_keys)}.
 # Persisted each shadow cycle as the ground truth for the NEXT cycle's reuse check; later
 # (the flip) it's what the engine reads to reuse unchanged bills' events. Fail-safe like
 # the agenda cache: any error -> empty/skip -> recompute, never a crash or a wipe.
 STM_BILL_CACHE_TAB = "STM_Bill_Cache"
-STM_BILL_CACHE_HEADER = ["Bill", "HistoryHash", "EventsJSON"]
+STM_BILL_CACHE_HEADER = ["Bill", "HistoryHash", "EventsJSON", "DepsJSON", "OutputDigest"]
 
 
 _STM_CACHE_SHARED_SIG_KEY = "__SHARED_SIG__"   # special row holding the shared-input signature
@@ -250,66 +633,408 @@ def _compute_stm_shared_sig(active_session, df_docket, vote_id_set, api_schedule
 
 
 def _load_stm_bill_cache(sheet):
-    """Load {bill -> {"hash": str, "events": [key_lists]}} + the stored shared-input sig.
-    Returns (cache, ws, load_ok, prev_shared_sig). load_ok is False ONLY on a transient
-    open/read failure (so persist won't wipe a tab it couldn't read — agenda-cache guard,
-    Gemini #140). The shared sig is a special row (survives Sheet1's clear, unlike a state
-    cell). Never raises."""
+    """Load {bill -> {"hash": str, "events": [key_lists], "deps": {kind: [keys]} | None}} + the
+    stored shared-input sig and dependency token. Returns (cache, ws, load_ok, prev_shared_sig,
+    prev_dep_token). load_ok is False ONLY on a transient open/read failure (so persist won't wipe
+    a tab it couldn't read — agenda-cache guard, Gemini #140). The shared sig is a special row
+    (survives Sheet1's clear, unlike a state cell); its third cell is the dependency token and its
+    OutputDigest cell the Merkle root of the bills' output leaves — rows that no longer hash to it
+    (a partial / hand-edited tab) load as an empty cache, i.e. a full recompute. A bill whose DepsJSON
+    is absent (older rows) or malformed gets deps None = "unknown". Never raises."""
     try:
         ws = sheet.worksheet(STM_BILL_CACHE_TAB)
     except gspread.exceptions.WorksheetNotFound:
-        return {}, None, True, ""        # absent (first run) -> safe to create on persist
+        return {}, None, True, "", ""    # absent (first run) -> safe to create on persist
     except Exception as e:
         print(f"⚠️ STM_Bill_Cache open failed ({e}); shadow recomputes all this cycle.")
-        return {}, None, False, ""
+        return {}, None, False, "", ""
     try:
         rows = ws.get_all_values() or []
     except Exception as e:
         print(f"⚠️ STM_Bill_Cache read failed ({e}); shadow recomputes all this cycle.")
-        return {}, ws, False, ""
-    cache, prev_shared_sig = {}, ""
+        return {}, ws, False, "", ""
+    cache, prev_shared_sig, prev_dep_token, stored_root = {}, "", "", ""
     for r in rows[1:]:                   # skip header
         if not r or len(r) < 3 or not r[0]:
             continue
         bill = r[0].strip()
         if bill == _STM_CACHE_SHARED_SIG_KEY:
-            prev_shared_sig = r[1]
+            prev_shared_sig, prev_dep_token = r[1], r[2]
+            stored_root = r[4] if len(r) > 4 else ""
             continue
         try:
             events = json.loads(r[2]) if r[2] else []
         except Exception:
             events = None                # malformed -> _stm_incremental_shadow guards it (recompute)
-        cache[bill] = {"hash": r[1], "events": events}
-    return cache, ws, True, prev_shared_sig   # reached here => open + read succeeded
-
-
-def _persist_stm_bill_cache(sheet, ws, full_events, current_hashes, shared_sig, load_ok):
+        try:
+            deps = json.loads(r[3]) if len(r) > 3 and r[3] else None
+        except Exception:
+            deps = None                  # unknown deps -> reusable only when no shared key moved
+        output = r[4] if len(r) > 4 and r[4] else None
+        if output and isinstance(events, list) and _stm_output_leaf(events) != output:
+            events = None                # EventsJSON no longer matches its leaf -> recompute that bill
+        cache[bill] = {"hash": r[1], "events": events,
+                       "deps": deps if isinstance(deps, dict) else None, "output": output}
+    if stored_root:                      # a pre-OutputDigest tab has no root: nothing to check
+        _root = _stm_merkle_root({b: c["output"] or "" for b, c in cache.items()})
+        if _root != stored_root:
+            print(f"⚠️ STM_Bill_Cache rows don't match their Merkle root ({_root} != {stored_root}); "
+                  f"every bill recomputes this cycle.")
+            return {}, ws, True, "", ""
+    return cache, ws, True, prev_shared_sig, prev_dep_token   # reached here => open + read succeeded
+
+
+def _persist_stm_bill_cache(sheet, ws, full_events, current_hashes, shared_sig, load_ok,
+                            bill_deps=None, dep_token=""):
     """Rewrite the cache from THIS cycle's full output (next cycle's reuse ground truth) +
-    the shared-input sig (special row). Skips on load failure (don't wipe a tab we couldn't
-    read). Chunked write (the events JSON can be large). Fail-safe: a write error just means
-    next shadow recomputes."""
+    the shared-input sig, dependency token and output Merkle root (special row) + each bill's recorded
+    shared-input dependencies (DepsJSON; "" when not recorded this cycle) and output leaf
+    (OutputDigest, over the events written). Skips on load failure (don't wipe a
+    tab we couldn't read). Chunked write (the events JSON can be large). Returns True iff written.
+    Fail-safe: a write error just means next shadow recomputes."""
     if not load_ok:
         print("⚠️ STM_Bill_Cache persist skipped — load failed this cycle (avoids wiping it).")
-        return
+        return False
     try:
         by_bill = {}
         for e in (full_events or []):
             by_bill.setdefault(_event_bill_key(e), []).append(_stm_event_key(e))   # json.dumps serializes tuples natively
-        rows = [STM_BILL_CACHE_HEADER, [_STM_CACHE_SHARED_SIG_KEY, shared_sig, ""]]
+        rows, leaves = [STM_BILL_CACHE_HEADER], {}
         for bill in sorted(set(by_bill) | set(current_hashes or {})):
-            rows.append([bill, (current_hashes or {}).get(bill, ""), json.dumps(by_bill.get(bill, []))])
+            _deps = (bill_deps or {}).get(bill)
+            leaves[bill] = _stm_output_leaf(by_bill.get(bill, []))
+            rows.append([bill, (current_hashes or {}).get(bill, ""), json.dumps(by_bill.get(bill, [])),
+                         json.dumps(_deps, sort_keys=True) if isinstance(_deps, dict) else "", leaves[bill]])
+        rows.insert(1, [_STM_CACHE_SHARED_SIG_KEY, shared_sig, dep_token, "", _stm_merkle_root(leaves)])
         if ws is None:
             ws = sheet.add_worksheet(title=STM_BILL_CACHE_TAB,
                                      rows=max(1000, len(rows) + 100), cols=len(STM_BILL_CACHE_HEADER))
-        elif len(rows) > ws.row_count:
-            ws.add_rows(len(rows) - ws.row_count + 100)
+        else:
+            if len(rows) > ws.row_count:
+                ws.add_rows(len(rows) - ws.row_count + 100)
+            if ws.col_count < len(STM_BILL_CACHE_HEADER):      # a tab from before DepsJSON / OutputDigest
+                ws.add_cols(len(STM_BILL_CACHE_HEADER) - ws.col_count)
         ws.clear()
         _CHUNK = 1000                    # the EventsJSON cells are large; keep each request small
         for i in range(0, len(rows), _CHUNK):
             ws.update(values=rows[i:i + _CHUNK], range_name=f"A{i + 1}")
         print(f"🗄️ STM_Bill_Cache: persisted {len(rows) - 1} bills for next-cycle reuse.")
+        return True
     except Exception as e:
         print(f"⚠️ STM_Bill_Cache persist failed ({e}); next shadow recomputes (no harm).")
+        return False
+
+
+# ── Incremental-STM per-bill dependency tracking (2026-10-18) ───────────────────────────────────────
+# _compute_stm_shared_sig is all-or-nothing: one Schedule API change on one committee-date invalidates
+# every cached bill. Instead the STM records, per bill, which keys of each shared input it actually read
+# (StmDependencyRecorder — read-through proxies over the STM kwargs, the STM naming the row's bill), and
+# those keys are stored with the bill's cached events (STM_Bill_Cache.DepsJSON). The next cycle
+# fingerprints every key of every tracked input and recomputes only bills whose recorded keys moved.
+# Key granularity is what the STM's lookup actually depends on: the Schedule matcher scans its date's
+# whole partition (a new room on that date can change the match), so schedule keys are DATES; docket /
+# convene / adjourned-clock keys are dates; LegEvent / LegislationID keys are (bill, session); modal
+# standing keys are committees; refid fan-out keys are (refid, date); VOTE ids are the ids looked up.
+# Iterating or sizing an input records "*" (the bill depends on all of it); a truthiness test records
+# "nonempty". Everything the STM reads that is NOT tracked per key — logic version, session, columns,
+# ministerial codes, admin-recovery index, the Committee API globals — forms the residual sig; any change
+# there recomputes every bill. The per-key fingerprints of the cycle that wrote the cache are kept in
+# .lis_blob_cache/stm_dependencies.json under a token also written to the cache's sig row; no state, a
+# token mismatch, or STM_DEPENDENCY_TRACKING=0 → the all-or-nothing sig, exactly as before.
+STM_DEPENDENCY_TRACKING = os.environ.get("STM_DEPENDENCY_TRACKING", "1") == "1"
+_STM_DEPS_SCHEMA = "1"
+_STM_DEP_ALL = "*"
+_STM_DEP_NONEMPTY = "nonempty"
+_STM_TRACKED_INPUTS = {                     # STM kwarg -> dependency kind
+    "api_schedule_map": "schedule",
+    "docket_memory": "docket",
+    "convene_times": "convene",
+    "adjourned_clock_by_date": "adjourned",
+    "committee_modal_standing": "modal",
+    "_legislation_event_cache": "legevent",
+    "_legislation_id_cache": "legid",
+    "_refid_fanout": "fanout",
+    "_vote_id_set": "vote",
+}
+
+
+def _stm_dep_key(kind, key):
+    """The dependency key one read of `key` records (and the fingerprint bucket it lands in)."""
+    if kind == "schedule":
+        return str(key).split("_", 1)[0]          # "<date>_<room>" -> the date's partition
+    if isinstance(key, tuple):
+        return "\x1f".join(str(k) for k in key)
+    return str(key)
+
+
+class StmDependencyRecorder:
+    """Per-bill record of the shared-input keys one STM run read. The STM calls begin(bill) at the top
+    of every row; reads made outside any row (none today) count against every bill."""
+
+    def __init__(self):
+        self.current = None
+        self.deps = {}
+
+    def begin(self, bill):
+        self.current = bill
+        self.deps.setdefault(bill, {})
+
+    def note(self, kind, key):
+        self.deps.setdefault(self.current, {}).setdefault(kind, set()).add(key)
+
+    def wrap(self, shared_kwargs):
+        """A copy of the STM kwargs with every tracked input (and the Schedule index) behind a proxy."""
+        out = dict(shared_kwargs)
+        for name, kind in _STM_TRACKED_INPUTS.items():
+            data = out.get(name)
+            if isinstance(data, (set, frozenset)):
+                out[name] = _RecordingSet(data, self, kind)
+            elif isinstance(data, dict):
+                out[name] = _RecordingMapping(data, self, kind)
+        if out.get("schedule_index") is not None:
+            out["schedule_index"] = _RecordingScheduleIndex(out["schedule_index"], self,
+                                                            out.get("api_schedule_map"))
+        return out
+
+    def bill_deps(self):
+        """{bill: {kind: sorted keys}} — JSON-ready; row-less reads folded into every bill."""
+        shared = self.deps.get(None, {})
+        out = {}
+        for bill, kinds in self.deps.items():
+            if bill is None:
+                continue
+            merged = {k: set(v) for k, v in kinds.items()}
+            for k, v in shared.items():
+                merged.setdefault(k, set()).update(v)
+            out[str(bill).replace(" ", "").upper()] = {k: sorted(v) for k, v in merged.items()}   # _event_bill_key
+        return out
+
+
+class _RecordingMapping:
+    """Read-through (and write-through) view of one STM dict input that notes every key touched."""
+    __slots__ = ("_data", "_rec", "_kind")
+
+    def __init__(self, data, recorder, kind):
+        self._data, self._rec, self._kind = data, recorder, kind
+
+    def _note(self, key):
+        self._rec.note(self._kind, _stm_dep_key(self._kind, key))
+
+    def __getitem__(self, key):
+        self._note(key)
+        return self._data[key]
+
+    def get(self, key, default=None):
+        self._note(key)
+        return self._data.get(key, default)
+
+    def __contains__(self, key):
+        self._note(key)
+        return key in self._data
+
+    def __setitem__(self, key, value):
+        self._note(key)
+        self._data[key] = value
+
+    def __delitem__(self, key):
+        self._note(key)
+        del self._data[key]
+
+    def setdefault(self, key, default=None):
+        self._note(key)
+        return self._data.setdefault(key, default)
+
+    def pop(self, key, *default):
+        self._note(key)
+        return self._data.pop(key, *default)
+
+    def _all(self):
+        self._rec.note(self._kind, _STM_DEP_ALL)
+        return self._data
+
+    def __iter__(self):
+        return iter(self._all())
+
+    def __len__(self):
+        return len(self._all())
+
+    def keys(self):
+        return self._all().keys()
+
+    def values(self):
+        return self._all().values()
+
+    def items(self):
+        return self._all().items()
+
+    def __bool__(self):
+        self._rec.note(self._kind, _STM_DEP_NONEMPTY)
+        return bool(self._data)
+
+
+class _RecordingSet:
+    """Membership-recording view of one STM set input (the VOTE id set)."""
+    __slots__ = ("_data", "_rec", "_kind")
+
+    def __init__(self, data, recorder, kind):
+        self._data, self._rec, self._kind = data, recorder, kind
+
+    def __contains__(self, item):
+        self._rec.note(self._kind, _stm_dep_key(self._kind, item))
+        return item in self._data
+
+    def __iter__(self):
+        self._rec.note(self._kind, _STM_DEP_ALL)
+        return iter(self._data)
+
+    def __len__(self):
+        self._rec.note(self._kind, _STM_DEP_ALL)
+        return len(self._data)
+
+    def __bool__(self):
+        self._rec.note(self._kind, _STM_DEP_NONEMPTY)
+        return bool(self._data)
+
+
+class _RecordingScheduleIndex:
+    """ScheduleIndex view for find_api_schedule_match: a date partition read is a schedule dependency."""
+
+    def __init__(self, index, recorder, api_schedule_map):
+        self._index, self._rec = index, recorder
+        self.by_date = _RecordingMapping(index.by_date, recorder, "schedule")
+        self.api_schedule_map = api_schedule_map
+
+    def subpanels(self, date_str, raw_target):
+        self._rec.note("schedule", _stm_dep_key("schedule", date_str))
+        return self._index.subpanels(date_str, raw_target)
+
+
+def _stm_fp_default(o):
+    if isinstance(o, (set, frozenset)):
+        return sorted(o, key=str)
+    return str(o)
+
+
+def _stm_fp(value):
+    """Short stable digest of one dependency bucket's value (canonical JSON; repr if it won't encode)."""
+    try:
+        raw = json.dumps(value, sort_keys=True, default=_stm_fp_default, separators=(",", ":"))
+    except (TypeError, ValueError):
+        raw = repr(value)
+    return hashlib.blake2b(raw.encode("utf-8", "replace"), digest_size=8).hexdigest()
+
+
+def _stm_dependency_fingerprints(shared_kwargs):
+    """{kind: {dep_key: digest}} for every tracked input — the value each dependency key would read —
+    plus "*" (the whole input, in order) and "nonempty". Taken BEFORE the STM runs (it writes LegEvent
+    negative-cache seeds)."""
+    fps = {}
+    for name, kind in _STM_TRACKED_INPUTS.items():
+        data = shared_kwargs.get(name)
+        if data is None:
+            data = {}
+        buckets = {}
+        if isinstance(data, (set, frozenset)):
+            for item in data:
+                buckets[_stm_dep_key(kind, item)] = True
+        else:
+            for k, v in data.items():
+                buckets.setdefault(_stm_dep_key(kind, k), []).append((str(k), v))   # map order kept
+        fp = {k: _stm_fp(v) for k, v in buckets.items()}
+        order = list(buckets) if not isinstance(data, (set, frozenset)) else sorted(buckets)
+        fp[_STM_DEP_ALL] = _stm_fp([(k, fp[k]) for k in order])
+        fp[_STM_DEP_NONEMPTY] = "1" if len(data) else "0"
+        fps[kind] = fp
+    return fps
+
+
+def _compute_stm_residual_sig(shared_kwargs):
+    """Everything the STM reads that is not tracked per key. A change here recomputes every bill."""
+    return _sha(
+        "v=" + WORKER_OUTPUT_LOGIC_VERSION,
+        "sess=" + str(shared_kwargs.get("_session_code_5d", "")),
+        "cols=" + f"{shared_kwargs.get('desc_col')}|{shared_kwargs.get('refid_col')}",
+        "min=" + _stm_fp(shared_kwargs.get("_ministerial_codes") or frozenset()),
+        "adm=" + _stm_fp(shared_kwargs.get("_admin_recovery_index") or frozenset()),
+        "cmte=" + _stm_fp([COMMITTEE_CODE_MAP, LOCAL_LEXICON, PARENT_COMMITTEE_MAP, NORM_TO_CODE,
+                           CHILDREN_OF_PARENT]),
+    )
+
+
+def _stm_dependency_token(residual_sig, fingerprints):
+    """Names one cycle's dependency state; written to both the cache's sig row and the state file."""
+    return "deps" + _STM_DEPS_SCHEMA + ":" + _sha(residual_sig, _stm_fp(fingerprints))
+
+
+def _stm_dependency_state_path():
+    return os.path.join(_BLOB_CACHE_DIR, "stm_dependencies.json")
+
+
+def _save_stm_dependency_state(token, residual_sig, fingerprints, path=None):
+    """Best-effort atomic write; a failure only costs the next cycle the all-or-nothing sig."""
+    if not (STM_DEPENDENCY_TRACKING and _BLOB_CACHE_ENABLED and token):
+        return
+    path = path or _stm_dependency_state_path()
+    tmp = path + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(tmp, "w") as f:
+            json.dump({"schema": _STM_DEPS_SCHEMA, "token": token, "residual": residual_sig,
+                       "fingerprints": fingerprints}, f, separators=(",", ":"))
+        os.replace(tmp, path)
+    except Exception as _e:
+        print(f"⚠️ STM dependency state write skipped: {_e}")
+        try:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        except Exception:
+            pass
+
+
+def _stm_changed_dependency_keys(prev_token, residual_sig, fingerprints, path=None):
+    """{kind: {dep_key whose value moved}} since the cycle that wrote the cache (identified by the
+    sig row's `prev_token`), or None when fine-grained reuse can't be trusted this cycle: tracking off,
+    no / stale / corrupt state file, or the residual sig moved."""
+    if not (STM_DEPENDENCY_TRACKING and _BLOB_CACHE_ENABLED and prev_token):
+        return None
+    try:
+        with open(path or _stm_dependency_state_path(), "r") as f:
+            state = json.load(f)
+        if not isinstance(state, dict) or state.get("schema") != _STM_DEPS_SCHEMA \
+                or state.get("token") != prev_token or state.get("residual") != residual_sig:
+            return None
+        prev = state["fingerprints"]
+        changed = {}
+        for kind in _STM_TRACKED_INPUTS.values():
+            old, new = prev.get(kind) or {}, fingerprints.get(kind) or {}
+            changed[kind] = {k for k in set(old) | set(new) if old.get(k) != new.get(k)}
+        return changed
+    except Exception:
+        return None
+
+
+def _stm_dependency_changed_bills(prev_cache, changed_keys):
+    """Cached bills at least one of whose recorded dependencies moved. A bill with unknown deps (not
+    recorded, malformed, an unknown kind) counts as changed whenever ANY tracked key moved."""
+    any_moved = any(changed_keys.values())
+    out = set()
+    for bill, entry in (prev_cache or {}).items():
+        deps = entry.get("deps") if isinstance(entry, dict) else None
+        if not isinstance(deps, dict):
+            if any_moved:
+                out.add(bill)
+            continue
+        for kind, keys in deps.items():
+            moved = changed_keys.get(kind)
+            if moved is None or not isinstance(keys, list):
+                if any_moved:
+                    out.add(bill)
+                    break
+                continue
+            if moved and not moved.isdisjoint(keys):
+                out.add(bill)
+                break
+    return out
 
 
 # PR-C7.1b-1: the dictionary-free structural calendar-vs-ledger router.
@@ -323,6 +1048,7 @@ from structural_router import validate_governor_eventcodes as _validate_governor
 from structural_router import compute_ministerial_eventcodes as _compute_ministerial_eventcodes
 from structural_router import build_admin_recovery_index as _build_admin_recovery_index
 from structural_router import recover_admin_route as _recover_admin_route
+from structural_router import normalize_event_description as _normalize_event_description  # memo telemetry only
 from structural_router import classify_refid as _classify_refid  # PR-C8.1 structural refid identity
 from structural_router import validate_refid_shapes as _validate_refid_shapes  # refid SHAPE drift monitor
 from structural_router import REFID_UNKNOWN as _REFID_UNKNOWN, REFID_SHAPE_MIN_VOLUME as _REFID_SHAPE_MIN_VOLUME
@@ -494,6 +1220,57 @@ _STATIC_LOCAL_LEXICON = {
 }
 LOCAL_LEXICON = dict(_STATIC_LOCAL_LEXICON)  # Will be replaced at runtime by build_committee_maps()
 
+
+class _CommitteeAliasMatcher:
+    """Compiled form of the STM's LOCAL_LEXICON scan — one regex pass per row instead of
+    O(committees x aliases) substring tests, with the SAME first-match answer as
+
+        for api_name, aliases in lexicon.items():
+            if api_name.startswith(prefix) and any(alias and alias in text for alias in aliases):
+                return api_name
+
+    Per prefix ("House "/"Senate "/"Joint "), one zero-width lookahead alternation enumerates, at
+    every text position, the LONGEST alias matching there (alternatives sorted longest-first). Any
+    other alias matching at that position is a prefix of it, so each alias is pre-mapped to the
+    lowest lexicon index among the aliases it starts with; the answer is the minimum over positions
+    — exactly the dict-order first match. Built per lexicon object: build_committee_maps() rebinds
+    LOCAL_LEXICON (never mutates it), and _lexicon_matcher() rebuilds on a rebind."""
+
+    def __init__(self, lexicon):
+        self.lexicon = lexicon
+        self._names = list(lexicon)
+        self._by_prefix = {}
+
+    def _compile(self, prefix):
+        entries = [(i, alias) for i, name in enumerate(self._names) if name.startswith(prefix)
+                   for alias in (self.lexicon[name] or []) if alias]
+        best = {}
+        for _, longer in entries:
+            best[longer] = min(i for i, shorter in entries if longer.startswith(shorter))
+        alts = sorted(best, key=lambda a: (-len(a), a))
+        rx = re.compile("(?=(" + "|".join(re.escape(a) for a in alts) + "))") if alts else None
+        self._by_prefix[prefix] = (rx, best)
+        return rx, best
+
+    def match(self, prefix, text):
+        """The first lexicon api_name (dict order) under `prefix` with an alias in `text`, else None."""
+        rx, best = self._by_prefix.get(prefix) or self._compile(prefix)
+        if rx is None:
+            return None
+        hits = rx.findall(text)
+        return self._names[min(best[h] for h in hits)] if hits else None
+
+
+_LEXICON_MATCHER = _CommitteeAliasMatcher(LOCAL_LEXICON)
+
+
+def _lexicon_matcher():
+    """The compiled matcher for the CURRENT LOCAL_LEXICON (rebuilt if it was rebound)."""
+    global _LEXICON_MATCHER
+    if _LEXICON_MATCHER.lexicon is not LOCAL_LEXICON:
+        _LEXICON_MATCHER = _CommitteeAliasMatcher(LOCAL_LEXICON)
+    return _LEXICON_MATCHER
+
 IGNORE_WORDS = {"committee", "on", "the", "of", "and", "for", "meeting", "joint", "to", "referred", "assigned", "re-referred", "substitute", "substitutes", "placed", "with", "amendment", "amendments", "a", "an", "by", "recommendation", "recommends", "recommend", "block", "vote", "voice"}
 
 # === NOISE FILTER CONSTANTS (Positive Identification) ===
@@ -607,7 +1384,7 @@ def build_committee_maps(http_session, session_code, alert_fn=None):
     How it could break: API schema changes, new fields, or endpoint moves.
     Runtime check: Drift detection compares live vs static and alerts on differences.
     """
-    global COMMITTEE_CODE_MAP, LOCAL_LEXICON, PARENT_COMMITTEE_MAP, NORM_TO_CODE, CHILDREN_OF_PARENT
+    global COMMITTEE_CODE_MAP, LOCAL_LEXICON, PARENT_COMMITTEE_MAP, NORM_TO_CODE, CHILDREN_OF_PARENT, _LEXICON_MATCHER
 
     url = f"https://lis.virginia.gov/Committee/api/getcommitteelistasync?sessionCode={session_code}"
     try:
@@ -702,6 +1479,7 @@ def build_committee_maps(http_session, session_code, alert_fn=None):
         # Apply live maps
         COMMITTEE_CODE_MAP = live_code_map
         LOCAL_LEXICON = live_lexicon
+        _LEXICON_MATCHER = _CommitteeAliasMatcher(live_lexicon)   # compiled once per cycle for the STM
         PARENT_COMMITTEE_MAP = resolved_parent_map
         NORM_TO_CODE = {normalize_room_key(v): k for k, v in live_code_map.items()}
         # Pre-calculate reverse parent->children map for O(1) lookups in find_api_schedule_match()
@@ -777,6 +1555,57 @@ DYNAMIC_VERBS = ["passed by", "reconsidered", "failed", "defeated", "laid on the
 # keep their OWN verb lists — they are standalone scripts, NOT imports of this constant.
 
 
+# ── Hot-path memo layer ──
+# The worker's pure string helpers (room keys, clock parsing, relative-time detection, description
+# tokens) run tens of thousands of times a cycle over a few hundred distinct inputs. Each is wrapped in
+# a BOUNDED LRU memo (typed, so 1 and "1" never share an entry; unhashable args bypass it) and
+# registered here so run_calendar_update folds per-helper hits/misses/size into SYSTEM_METRICS — a
+# saturated memo (size == maxsize) means the input vocabulary blew up, which is itself a drift signal.
+_HOT_MEMOS = {}
+
+
+def _hot_memo(maxsize):
+    def deco(fn):
+        cached = functools.lru_cache(maxsize=maxsize, typed=True)(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                hash((args, tuple(kwargs.items())))
+            except TypeError:
+                return fn(*args, **kwargs)
+            return cached(*args, **kwargs)
+        wrapper.cache_info = cached.cache_info
+        wrapper.cache_clear = cached.cache_clear
+        _HOT_MEMOS[fn.__name__] = wrapper
+        return wrapper
+    return deco
+
+
+def _all_hot_memos():
+    return dict(_HOT_MEMOS, normalize_event_description=_normalize_event_description)
+
+
+def _hot_memo_metrics():
+    """{memo_<helper>_hits/_misses/_size: int} for every registered memo (+ the structural router's
+    normalize_event_description), for SYSTEM_METRICS."""
+    out = {}
+    for name, fn in _all_hot_memos().items():
+        info = fn.cache_info()
+        key = name.lstrip("_")
+        out[f"memo_{key}_hits"] = info.hits
+        out[f"memo_{key}_misses"] = info.misses
+        out[f"memo_{key}_size"] = info.currsize
+    return out
+
+
+def _saturated_hot_memos():
+    """Helpers whose memo filled to maxsize (vocabulary blow-up -> LRU eviction), sorted."""
+    return sorted(name for name, fn in _all_hot_memos().items()
+                  if fn.cache_info().maxsize and fn.cache_info().currsize >= fn.cache_info().maxsize)
+
+
+@_hot_memo(maxsize=4096)
 def normalize_room_key(text):
     if not text:
         return ""
@@ -806,24 +1635,61 @@ def derive_room_hints(outcome_text, acting_chamber_prefix):
 
     return hints
 
-def find_api_schedule_match(api_schedule_map, date_str, event_location, outcome_text, acting_chamber_prefix):
-    prefix = f"{date_str}_"
-    dated_keys = [k for k in api_schedule_map.keys() if k.startswith(prefix)]
-    if not dated_keys:
+class ScheduleIndex:
+    """Date-partitioned view of api_schedule_map for find_api_schedule_match, built once per cycle
+    after the Schedule API loop (nothing writes the map after it). Per date: the keys in map order,
+    each key's normalize_room_key'd room name, its concrete-time flag, and normalized-room -> keys —
+    so a HISTORY row's lookup touches only its own date, and never re-normalizes a schedule key.
+    Hyphen sub-panel groups are resolved lazily per (date, raw parent name) and memoized."""
+
+    _NON_CONCRETE_TIMES = ("", "time tba", "tba", "journal entry", "ledger")
+
+    def __init__(self, api_schedule_map):
+        self.api_schedule_map = api_schedule_map
+        self.by_date = {}
+        self._subpanels = {}
+        for k, v in api_schedule_map.items():
+            if "_" not in k:
+                continue
+            date_str, raw = k.split("_", 1)
+            day = self.by_date.get(date_str)
+            if day is None:
+                day = self.by_date[date_str] = {"keys": [], "raw": {}, "norm": {}, "concrete": {}, "by_norm": {}}
+            norm = normalize_room_key(raw)
+            day["keys"].append(k)
+            day["raw"][k] = raw
+            day["norm"][k] = norm
+            day["concrete"][k] = str(v.get("Time", "")).strip().lower() not in self._NON_CONCRETE_TIMES
+            day["by_norm"].setdefault(norm, []).append(k)
+
+    def subpanels(self, date_str, raw_target):
+        """Concrete-time entries on date_str named "<raw_target>-Suffix" / "<raw_target> - Suffix"
+        (Schedule-only sub-panels, e.g. "House Courts of Justice-Civil"), in map order."""
+        memo_key = (date_str, raw_target)
+        hit = self._subpanels.get(memo_key)
+        if hit is None:
+            day = self.by_date.get(date_str)
+            prefixes = (raw_target + "-", raw_target + " -")
+            hit = [k for k in day["keys"] if day["concrete"][k] and day["raw"][k].startswith(prefixes)] if day else []
+            self._subpanels[memo_key] = hit
+        return hit
+
+
+def find_api_schedule_match(api_schedule_map, date_str, event_location, outcome_text, acting_chamber_prefix,
+                            schedule_index=None):
+    # The STM passes the cycle's ScheduleIndex; a direct caller without one gets a throwaway index
+    # (same result, just no reuse).
+    if schedule_index is None:
+        schedule_index = ScheduleIndex(api_schedule_map)
+    day = schedule_index.by_date.get(date_str)
+    if not day:
         return None
-
-    def has_concrete_time(key):
-        time_val = str(api_schedule_map.get(key, {}).get("Time", "")).strip().lower()
-        return time_val not in ["", "time tba", "tba", "journal entry", "ledger"]
+    dated_keys, dated_norms, concrete, by_norm = day["keys"], day["norm"], day["concrete"], day["by_norm"]
 
     target_norm = normalize_room_key(event_location)
-    exact_matches = []
-    for k in dated_keys:
-        k_norm = normalize_room_key(k.split("_", 1)[1])
-        if k_norm == target_norm:
-            exact_matches.append(k)
+    exact_matches = by_norm.get(target_norm, [])
     for k in exact_matches:
-        if has_concrete_time(k):
+        if concrete[k]:
             return k
 
     # --- Subcommittee -> parent committee fallback (both directions) ---
@@ -836,22 +1702,19 @@ def find_api_schedule_match(api_schedule_map, date_str, event_location, outcome_
     child_matches = []
 
     # Direction 2: If exact match exists but has no concrete time, check children
-    if exact_matches and not any(has_concrete_time(k) for k in exact_matches):
+    # (the loop above already returned on any concrete exact match).
+    if exact_matches:
         # Strategy A: Structural lookup via CHILDREN_OF_PARENT (Committee API ParentCommitteeID)
         if CHILDREN_OF_PARENT:
             event_code = NORM_TO_CODE.get(target_norm)
             if event_code and event_code in CHILDREN_OF_PARENT:
-                # O(1) lookup of child committees via pre-calculated reverse map
-                child_codes = CHILDREN_OF_PARENT[event_code]
-                # Pre-calculate normalized keys for dated entries (avoid redundant normalize_room_key calls)
-                dated_norms = {k: normalize_room_key(k.split("_", 1)[1]) for k in dated_keys}
-                for child_code in child_codes:
+                # O(1) lookup of child committees via pre-calculated reverse map, then the
+                # date's normalized-room index (no scan of the day's keys)
+                for child_code in CHILDREN_OF_PARENT[event_code]:
                     child_name = COMMITTEE_CODE_MAP.get(child_code, "")
                     if child_name:
-                        child_norm = normalize_room_key(child_name)
-                        for k in dated_keys:
-                            if dated_norms[k] == child_norm and has_concrete_time(k):
-                                child_matches.append(k)
+                        child_matches.extend(k for k in by_norm.get(normalize_room_key(child_name), ())
+                                             if concrete[k])
         # Strategy B: Schedule-level hyphen-suffix matching.
         # Some committees (e.g., "House Courts of Justice") have Schedule API entries
         # for sub-panels ("House Courts of Justice-Civil", "-Criminal") that are NOT
@@ -868,12 +1731,9 @@ def find_api_schedule_match(api_schedule_map, date_str, event_location, outcome_
                 raw_target = em.split("_", 1)[1]
                 if not raw_target:
                     continue
-                for k in dated_keys:
-                    raw_k = k.split("_", 1)[1]
-                    # Match "Parent-Suffix" or "Parent - Suffix" patterns only
-                    if raw_k.startswith((raw_target + "-", raw_target + " -")) and has_concrete_time(k):
-                        if k not in child_matches:
-                            child_matches.append(k)
+                for k in schedule_index.subpanels(date_str, raw_target):
+                    if k not in child_matches:
+                        child_matches.append(k)
         # If we found children with concrete times, use the earliest by SortTime
         if child_matches:
             child_matches.sort(key=lambda k: api_schedule_map[k].get("SortTime", "23:59"))
@@ -889,19 +1749,15 @@ def find_api_schedule_match(api_schedule_map, date_str, event_location, outcome_
                 parent_code = PARENT_COMMITTEE_MAP[event_code]
                 parent_name = COMMITTEE_CODE_MAP.get(parent_code, "")
                 if parent_name:
-                    parent_norm = normalize_room_key(parent_name)
-                    for k in dated_keys:
-                        k_norm = normalize_room_key(k.split("_", 1)[1])
-                        if k_norm == parent_norm:
-                            parent_matches.append(k)
+                    parent_matches = list(by_norm.get(normalize_room_key(parent_name), ()))
         # Fallback: name-prefix heuristic (only if no PARENT_COMMITTEE_MAP data)
         if not parent_matches and not PARENT_COMMITTEE_MAP:
             for k in dated_keys:
-                k_norm = normalize_room_key(k.split("_", 1)[1])
+                k_norm = dated_norms[k]
                 if k_norm and target_norm.startswith(k_norm) and target_norm != k_norm:
                     parent_matches.append(k)
         for k in parent_matches:
-            if has_concrete_time(k):
+            if concrete[k]:
                 return k
 
     hints = derive_room_hints(outcome_text, acting_chamber_prefix)
@@ -909,11 +1765,11 @@ def find_api_schedule_match(api_schedule_map, date_str, event_location, outcome_
     for hint in hints:
         hint_norm = normalize_room_key(hint)
         for k in dated_keys:
-            k_norm = normalize_room_key(k.split("_", 1)[1])
+            k_norm = dated_norms[k]
             if hint_norm and (hint_norm in k_norm or k_norm in hint_norm):
                 hint_matches.append(k)
     for k in hint_matches:
-        if has_concrete_time(k):
+        if concrete[k]:
             return k
 
     if exact_matches:
@@ -924,7 +1780,7 @@ def find_api_schedule_match(api_schedule_map, date_str, event_location, outcome_
         return hint_matches[0]
 
     for k in dated_keys:
-        k_norm = normalize_room_key(k.split("_", 1)[1])
+        k_norm = dated_norms[k]
         if target_norm and (target_norm in k_norm or k_norm in target_norm):
             return k
     return None
@@ -963,6 +1819,7 @@ def _normalize_session_code_5d(active_session):
     return ""
 
 
+@_hot_memo(maxsize=65536)   # 241's HISTORY alone has 18,340 distinct descriptions, + LegEvent descriptions
 def _legislation_event_token_set(text):
     """Lowercased ≥3-letter alphabetic tokens for description matching.
 
@@ -971,15 +1828,68 @@ def _legislation_event_token_set(text):
     score. Used by `_resolve_via_legislation_event_api` to match the
     Sheet1 outcome text against the right LegislationEvent when a bill
     has multiple events on the same date+chamber (Codex PR-C3 P1).
+    Frozen because it is memoized — callers share the returned set.
     """
     if not text:
-        return set()
-    return {w.lower() for w in re.findall(r'[A-Za-z]{3,}', text)}
+        return frozenset()
+    return frozenset(w.lower() for w in re.findall(r'[A-Za-z]{3,}', text))
+
+
+class LegEventIndex:
+    """Per-bill LegislationEvent lookup shared by the four cache matchers (`_route_for_row`,
+    `_find_legevent_time_in_cache`, `_recover_time_via_legevent_committee`,
+    `_resolve_via_legislation_event_api`): a bill's cached event list -> date -> entries of
+    (event, upper-cased ChamberCode, frozen Description token set), in list order. A row's candidate
+    lookup is then O(its date's events) with zero re-tokenization.
+
+    Keyed by the event LIST's identity, so it always agrees with whatever list the matcher was handed:
+    a list added or replaced after `warm` (the resolver's own fetch, a negative-cache seed) is indexed
+    on first use, and a held list whose length moved (an in-place append / pop) is re-indexed. Each
+    indexed list is held, which pins its id for the life of the index. Non-dict entries (a corrupt cache
+    row) are skipped and counted — metrics()."""
+
+    def __init__(self):
+        self._lists = {}
+
+    def warm(self, legislation_event_cache):
+        """Index every cached bill up front (run once the LegEvent cache is loaded + hydrated)."""
+        for events in legislation_event_cache.values():
+            self._by_date(events)
+        return self
+
+    def _by_date(self, events):
+        hit = self._lists.get(id(events))
+        if hit is None or hit[1] != len(events):
+            by_date, skipped = {}, 0
+            for e in events:
+                if not isinstance(e, dict):
+                    skipped += 1
+                    continue
+                by_date.setdefault(str(e.get("EventDate") or "")[:10], []).append((
+                    e,
+                    str(e.get("ChamberCode") or "").strip().upper(),
+                    _legislation_event_token_set(str(e.get("Description") or "")),
+                ))
+            hit = self._lists[id(events)] = (events, len(events), by_date, skipped)
+        return hit[2]
+
+    def metrics(self):
+        """SYSTEM_METRICS int: non-dict entries skipped across the indexed lists (each list counted once)."""
+        return {"legevent_index_nondict_events": sum(h[3] for h in self._lists.values())}
+
+    def candidates(self, events, action_date_str, acting_chamber_code):
+        """[(event, token_set)] on action_date_str, minus explicit cross-chamber events (a blank
+        ChamberCode is tolerated — some joint-action events lack it), in the cached list's order."""
+        if not events:
+            return []
+        return [(e, toks) for e, ev_chamber, toks in self._by_date(events).get(action_date_str, ())
+                if not (acting_chamber_code and ev_chamber and ev_chamber != acting_chamber_code)]
 
 
 def _route_for_row(bill_num, session_5d, action_date_str, outcome_text,
                    acting_chamber_code, legislation_event_cache,
-                   ministerial_codes=frozenset(), admin_recovery_index=frozenset()):
+                   ministerial_codes=frozenset(), admin_recovery_index=frozenset(),
+                   legevent_index=None, cost_lap=None):
     """PR-C7.1b-1: structural calendar-vs-ledger route for one Sheet1 row.
 
     Cache-lookup-only (NO network — same contract as the row loop's
@@ -997,27 +1907,19 @@ def _route_for_row(bill_num, session_5d, action_date_str, outcome_text,
     description to is admin. Recovers an admin route without an exact event
     match and WITHOUT a hand-authored text pattern; asserts admin only, so it
     can never manufacture a false meeting. Never raises.
+
+    `cost_lap` (the STM's StmCostProfiler mark) charges the event match to
+    "legevent_route" and the EventType fallback to "admin_recovery".
     """
     route = ""
     try:
         events = legislation_event_cache.get((bill_num, session_5d)) or []
         if events:
             date10 = str(action_date_str or "")[:10]
-            cands = []
-            for e in events:
-                if not isinstance(e, dict):
-                    continue
-                if str(e.get("EventDate") or "")[:10] != date10:
-                    continue
-                ev_chamber = str(e.get("ChamberCode") or "").strip().upper()
-                if acting_chamber_code and ev_chamber and ev_chamber != acting_chamber_code:
-                    continue
-                cands.append(e)
+            cands = (legevent_index or LegEventIndex()).candidates(events, date10, acting_chamber_code)
             if cands:
                 otoks = _legislation_event_token_set(outcome_text)
-                def _overlap(e):
-                    return len(otoks & _legislation_event_token_set(str(e.get("Description") or "")))
-                best = max(cands, key=_overlap)
+                best_overlap, best = max(((len(otoks & toks), e) for e, toks in cands), key=lambda t: t[0])
                 # PR-C7.1i: require a NON-ZERO token overlap — the same guard
                 # `_find_legevent_time_in_cache` already enforces (`best_score == 0
                 # -> return None`). `_route_for_row` was the ONLY matcher that
@@ -1027,23 +1929,27 @@ def _route_for_row(bill_num, session_5d, action_date_str, outcome_text,
                 # (admin) picked up the route of that day's "Reported from
                 # Transportation (14-Y 0-N)" (a committee vote → meeting). Zero
                 # shared tokens ⇒ not this row's action.
-                if _overlap(best) != 0:
+                if best_overlap != 0:
                     route = _route_event(best, ministerial_codes=ministerial_codes).route
     except Exception:
         # Observability-only column — never let it break the cycle.
         route = ""
+    if cost_lap is not None:
+        cost_lap("legevent_route")
     # PR-C7.1n: EventType-reference admin recovery for an unresolved (blank) route.
     if not route:
         try:
             route = _recover_admin_route(outcome_text, admin_recovery_index)
         except Exception:
             route = ""
+        if cost_lap is not None:
+            cost_lap("admin_recovery")
     return route
 
 
 def _find_legevent_time_in_cache(
     events, bill_num, action_date_str, outcome_text,
-    acting_chamber_code, push_alert,
+    acting_chamber_code, push_alert, legevent_index=None,
 ):
     """PR-C7.1c review fold-in (Codex P1): pure cache-side time extraction.
 
@@ -1071,24 +1977,14 @@ def _find_legevent_time_in_cache(
     status)` on success, `None` on any miss / parse failure / ambiguity.
     Never raises into the caller. Never makes a network call.
     """
-    # Step 1: filter to events on this date + chamber.
-    matching = []
-    for e in events or ():
-        if not isinstance(e, dict):
-            continue
-        edate_full = str(e.get("EventDate") or "")
-        if edate_full[:10] != action_date_str:
-            continue
-        ev_chamber = str(e.get("ChamberCode") or "").strip().upper()
-        if acting_chamber_code and ev_chamber and ev_chamber != acting_chamber_code:
-            continue
-        matching.append(e)
+    # Step 1: filter to events on this date + chamber (pre-tokenized, via the per-bill index).
+    matching = (legevent_index or LegEventIndex()).candidates(events, action_date_str, acting_chamber_code)
     if not matching:
         return None
 
     # Step 2: real-time events only (skip midnight-only date-stamps).
     real_time_events = [
-        e for e in matching
+        (e, ev_tokens) for e, ev_tokens in matching
         if str(e.get("EventDate") or "")[11:] not in ("", "00:00:00")
     ]
     if not real_time_events:
@@ -1099,8 +1995,7 @@ def _find_legevent_time_in_cache(
     if not outcome_tokens:
         return None
     scored = []
-    for e in real_time_events:
-        ev_tokens = _legislation_event_token_set(str(e.get("Description") or ""))
+    for e, ev_tokens in real_time_events:
         score = len(outcome_tokens & ev_tokens)
         scored.append((score, e.get("EventDate") or "", e))
     scored.sort(key=lambda triple: (triple[0], triple[1]), reverse=True)
@@ -1183,7 +2078,7 @@ def _plausible_meeting_time(eventdate_raw):
 def _recover_time_via_legevent_committee(
     events, action_date_str, acting_chamber_code, outcome_text,
     api_schedule_map, convene_times,
-    committee_modal_standing=None, adjourned_clock_by_date=None,
+    committee_modal_standing=None, adjourned_clock_by_date=None, legevent_index=None,
 ):
     """Standardized structural meeting-time recovery (assumptions_audit #71).
 
@@ -1212,16 +2107,7 @@ def _recover_time_via_legevent_committee(
     """
     try:
         # Match the row to its event(s) on this date + chamber, best overlap.
-        matching = []
-        for e in events or ():
-            if not isinstance(e, dict):
-                continue
-            if str(e.get("EventDate") or "")[:10] != action_date_str:
-                continue
-            ev_ch = str(e.get("ChamberCode") or "").strip().upper()
-            if acting_chamber_code and ev_ch and ev_ch != acting_chamber_code:
-                continue
-            matching.append(e)
+        matching = (legevent_index or LegEventIndex()).candidates(events, action_date_str, acting_chamber_code)
         if not matching:
             return None
         otoks = _legislation_event_token_set(outcome_text)
@@ -1229,7 +2115,7 @@ def _recover_time_via_legevent_committee(
             return None
         # Gemini fold-in (PR #81): score each candidate once, not twice
         # (once in max(), once in the re-check).
-        scored = [(len(otoks & _legislation_event_token_set(str(e.get("Description") or ""))), e) for e in matching]
+        scored = [(len(otoks & toks), e) for e, toks in matching]
         best_score, best = max(scored, key=lambda t: t[0])
         if best_score == 0:
             return None  # coincidental same-date event, not this row's action
@@ -1438,7 +2324,7 @@ def _derive_standing_committee_time(committee_norm, committee_label, chamber_cod
 def _resolve_via_legislation_event_api(
     http_session, bill_num, action_date_str, outcome_text,
     session_code_5d, acting_chamber_code,
-    legislation_id_cache, legislation_event_cache, push_alert,
+    legislation_id_cache, legislation_event_cache, push_alert, legevent_index=None,
 ):
     """PR-C3: secondary time source via LIS LegislationEvent API.
 
@@ -1589,18 +2475,10 @@ def _resolve_via_legislation_event_api(
                 )
 
     # Step 3: filter to events on the action date AND the acting chamber
-    # (House actions should not borrow Senate-side timestamps).
-    matching = []
-    for e in events:
-        edate_full = str(e.get("EventDate") or "")
-        if edate_full[:10] != action_date_str:
-            continue
-        # Chamber filter: tolerate empty ChamberCode in the response (some
-        # joint-action events lack it), but reject explicit cross-chamber.
-        ev_chamber = str(e.get("ChamberCode") or "").strip().upper()
-        if acting_chamber_code and ev_chamber and ev_chamber != acting_chamber_code:
-            continue
-        matching.append(e)
+    # (House actions should not borrow Senate-side timestamps). Chamber filter:
+    # tolerate empty ChamberCode in the response (some joint-action events lack
+    # it), but reject explicit cross-chamber. Pre-tokenized via the per-bill index.
+    matching = (legevent_index or LegEventIndex()).candidates(events, action_date_str, acting_chamber_code)
     if not matching:
         return None
 
@@ -1619,7 +2497,7 @@ def _resolve_via_legislation_event_api(
     # marker + the diagnostic_hint so the human can see what we did and didn't
     # have (routed to Ledger, counted in unsourced_journal — no per-row alert).
     real_time_events = [
-        e for e in matching
+        (e, ev_tokens) for e, ev_tokens in matching
         if str(e.get("EventDate") or "")[11:] not in ("", "00:00:00")
     ]
     if not real_time_events:
@@ -1632,8 +2510,7 @@ def _resolve_via_legislation_event_api(
         # is still visible (no per-row alert — a routine deferral, Standard #8).
         return None
     scored = []
-    for e in real_time_events:
-        ev_tokens = _legislation_event_token_set(str(e.get("Description") or ""))
+    for e, ev_tokens in real_time_events:
         score = len(outcome_tokens & ev_tokens)
         scored.append((score, e.get("EventDate") or "", e))
     # Sort: highest score first, latest EventDate as tie-break.
@@ -1760,6 +2637,20 @@ LEGEVENT_EVENTS_REQUIRED_COLS = [
 ]
 LEGEVENT_TTL_SECONDS = 6 * 3600       # owner-mandated 6h TTL safety net
 LEGEVENT_FETCHES_PER_CYCLE = 500      # owner-mandated 500 cap; raise w/ telemetry
+# Adaptive per-bill TTL (LEGEVENT_ADAPTIVE_TTL, default on; 0 = the flat TTL and alphabetical tiers). A
+# bill's TTL starts at LEGEVENT_TTL_SECONDS and doubles with each consecutive refresh that came back with
+# the same events, up to LEGEVENT_TTL_MAX_SECONDS; one changed refresh resets it. A bill on the docket /
+# an agenda in the next LEGEVENT_UPCOMING_DAYS always keeps the base TTL, and a HISTORY change still
+# queues it as Tier B whatever its TTL. Streaks: .lis_blob_cache/legevent_refresh.json.
+LEGEVENT_ADAPTIVE_TTL = os.environ.get("LEGEVENT_ADAPTIVE_TTL", "1") == "1"
+LEGEVENT_TTL_MAX_SECONDS = 48 * 3600
+LEGEVENT_UPCOMING_DAYS = 7
+# Concurrent hydration (opt-in, LEGEVENT_HYDRATE_WORKERS env; 1 = the serial loop). Workers share the
+# counted session, so guardrail #4 (LIS_REQUEST_CAP) sees every request exactly as before, and the per-host
+# request governor (_LIS_GOVERNOR) paces ALL workers together: N workers never exceed LIS_HOST_MAX_RPS
+# against LIS. Results merge in queue order — output identical to the serial loop
+# (tools/verification/test_legevent_hydration.py).
+LEGEVENT_HYDRATE_MAX_WORKERS = 8      # <= the adapter's default connection pool (10): no discarded sockets
 # G2 (scalability_audit): derived_standing is the FLAGGED last-resort assumed-time
 # path; it should be rare (1 in the 2026 session). A spike means over-derivation
 # (a modal-map/matching bug) that would LOWER meeting_unsourced and look falsely
@@ -1805,6 +2696,206 @@ def _hash_history_rows_for_bill(rows: list[tuple]) -> str:
     return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
+# ── HISTORY delta ingestion (2026-10-18) ────────────────────────────────────────────────────────────
+# legevent_history_hashes — the per-bill HISTORY digest behind LegEvent tier B (LastHistoryHash) — was
+# rebuilt from every windowed row each cycle, though HISTORY.CSV is append-mostly. _HistoryDelta keeps
+# last cycle's normalized per-bill rows + digests beside the blob (<key>.delta.json) and derives THIS
+# cycle's touched bills from the difference:
+#   • prefix — the new body extends the old one byte-for-byte (old body newline-terminated, row count not
+#              shrunk): only rows past the old row count are new (the frame index IS the file row number),
+#              so the touched set is their bills, plus any bill with a row a grown date window now admits;
+#   • merge  — anything else: per-bill rows compared against the stored snapshot (no hashing); touched =
+#              the bills whose rows differ.
+# Only touched bills are re-hashed; every other digest is carried forward unchanged. The same touched set
+# drives the incremental STM's reuse keys (stm_bill_digests): with an incremental mode on, the state also
+# carries each bill's _stm_bill_digests value and only the touched bills' rows are re-digested (one
+# vectorized pass over that subset; full pass on any fallback). No state, a schema /
+# column mismatch, a window that shrank, no served body, or any error → the full per-bill hash (the old
+# path); an error also sets history_delta_errors and raises a WARN. Kill switch HISTORY_DELTA=0; off with the blob cache (LIS_BLOB_CACHE=0) too.
+_HISTORY_DELTA_SCHEMA = "3"   # bump with any change to the row tuple, _hash_history_rows_for_bill or the file
+HISTORY_DELTA_ENABLED = os.environ.get("HISTORY_DELTA", "1") == "1"
+
+
+def _history_rows_by_bill(df, desc_col, refid_col, bills=None):
+    """{CleanBill: sorted [(date, outcome, refid)]} — exactly the tuples _hash_history_rows_for_bill
+    digests — in one column-wise pass over `df` (optionally only the rows of `bills`)."""
+    keys = df["CleanBill"].astype(str).str.strip()
+    if bills is not None:
+        mask = keys.isin(bills)
+        df, keys = df[mask], keys[mask]
+    n = len(df)
+    dates = df["ParsedDate"].dt.strftime("%Y-%m-%d").fillna("") if n else []
+    descs = df[desc_col] if desc_col in df.columns else [""] * n
+    refids = df[refid_col] if (refid_col and refid_col in df.columns) else [""] * n
+    out = {}
+    for bill, d, o, r in zip(keys, dates, descs, refids):
+        if bill:
+            out.setdefault(bill, []).append((d, str(o or ""), str(r or "")))
+    for rows in out.values():
+        rows.sort()
+    return out
+
+
+class _HistoryDelta:
+    """Last cycle's HISTORY body fingerprint (etag / length / SHA-256 / newline-terminated / row count),
+    the date window and columns the digests were taken over, and the per-bill rows + digests: the LegEvent
+    SHA-256 (hashes) and, when the incremental STM read them, its reuse keys (stm, under stm_scheme)."""
+
+    def __init__(self, etag, body, nrows, window, cols, rows, hashes, stm=None):
+        self.etag, self.length, self.sha256 = etag, len(body), hashlib.sha256(body).hexdigest()
+        self.ends_newline = body.endswith(b"\n")
+        self.nrows, self.window, self.cols = nrows, window, cols
+        self.rows, self.hashes = rows, hashes
+        self.stm, self.stm_scheme = stm, _STM_DIGEST_SCHEME
+
+    def extended_by(self, body, nrows):
+        """True iff `body` is this body plus appended whole rows."""
+        return (self.ends_newline and self.length < len(body) and nrows >= self.nrows
+                and hashlib.sha256(body[:self.length]).hexdigest() == self.sha256)
+
+    @staticmethod
+    def load(path):
+        if not (HISTORY_DELTA_ENABLED and _BLOB_CACHE_ENABLED):
+            return None
+        try:
+            with open(path, "r") as f:
+                raw = json.load(f)
+            if not isinstance(raw, dict) or raw.get("schema") != _HISTORY_DELTA_SCHEMA:
+                return None
+            fields = raw["state"]
+            if set(fields) != _HISTORY_DELTA_FIELDS or not isinstance(fields["rows"], dict):
+                return None
+            state = object.__new__(_HistoryDelta)
+            state.__dict__.update(fields)
+            # JSON has no tuples / Timestamps: restore the shapes the delta compares against
+            state.window = (pd.Timestamp(fields["window"][0]), pd.Timestamp(fields["window"][1]))
+            state.cols = tuple(fields["cols"])
+            state.rows = {bill: [tuple(r) for r in rows] for bill, rows in fields["rows"].items()}
+            return state
+        except FileNotFoundError:
+            return None
+        except Exception as _e:
+            print(f"⚠️ HISTORY delta state unreadable ({_e}); full per-bill hash this cycle.")
+            return None
+
+    def persist(self, path):
+        """Best-effort atomic write; a failure only costs the next cycle a full hash."""
+        if not (HISTORY_DELTA_ENABLED and _BLOB_CACHE_ENABLED and self.etag):
+            return
+        tmp = path + ".tmp"
+        try:
+            state = dict(self.__dict__, window=[self.window[0].isoformat(), self.window[1].isoformat()])
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(tmp, "w") as f:
+                json.dump({"schema": _HISTORY_DELTA_SCHEMA, "state": state}, f, separators=(",", ":"))
+            os.replace(tmp, path)
+        except Exception as _e:
+            print(f"⚠️ HISTORY delta state write skipped: {_e}")
+            try:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+            except Exception:
+                pass
+
+
+_HISTORY_DELTA_FIELDS = {"etag", "length", "sha256", "ends_newline", "nrows", "window", "cols", "rows", "hashes",
+                         "stm", "stm_scheme"}
+
+
+def _history_delta_path(url):
+    bin_path, _ = _blob_cache_paths(url)
+    return bin_path[:-len(".bin")] + ".delta.json"
+
+
+def _history_row_changes(old_rows, new_rows):
+    """(inserted, removed, modified) row counts for one bill. A removed + inserted pair that shares its
+    (date, refid) is one MODIFIED row (an edited action text), not an insert and a delete."""
+    old_c, new_c = Counter(old_rows), Counter(new_rows)
+    gone, added = old_c - new_c, new_c - old_c
+    gone_k = Counter((d, r) for (d, _o, r), n in gone.items() for _ in range(n))
+    added_k = Counter((d, r) for (d, _o, r), n in added.items() for _ in range(n))
+    modified = sum((gone_k & added_k).values())
+    return sum(added.values()) - modified, sum(gone.values()) - modified, modified
+
+
+def _history_delta_hashes(df, desc_col, refid_col, served, nrows, window, path, stm=False):
+    """Per-bill HISTORY digests for the windowed `df`, re-hashing only the bills the delta against last
+    cycle touched. `served` = (etag, body) safe_fetch_csv parsed `df` from; `nrows` = its row count
+    before the window filter; `window` = (start, end) Timestamps. stm=True also returns the incremental
+    STM's reuse keys (_stm_bill_digests), vectorized over the touched bills' rows only. Returns
+    (hashes, stm_digests, stats); stm_digests is {} when stm is False."""
+    stats = {"history_delta_prefix": 0, "history_delta_merge": 0, "history_delta_full": 0,
+             "history_delta_touched_bills": 0, "history_delta_inserted": 0,
+             "history_delta_removed": 0, "history_delta_modified": 0, "history_delta_errors": 0,
+             "history_delta_stm_redigested": 0}
+    etag, body = served if served else (None, None)
+    cols = (desc_col, refid_col)
+    window = (pd.Timestamp(window[0]), pd.Timestamp(window[1]))
+    prior = _HistoryDelta.load(path) if (etag and body is not None) else None
+    rows = hashes = stm_digests = None
+    try:
+        if prior is not None and prior.cols == cols \
+                and window[0] <= prior.window[0] and window[1] >= prior.window[1]:
+            same_body = prior.length == len(body) and prior.nrows == nrows \
+                and prior.sha256 == hashlib.sha256(body).hexdigest()
+            if same_body or prior.extended_by(body, nrows):
+                # new rows = past the old row count; admitted = already present, newly inside the window
+                fresh = (df.index >= prior.nrows) | (df["ParsedDate"] < prior.window[0]) \
+                    | (df["ParsedDate"] > prior.window[1])
+                touched = set(df.loc[fresh, "CleanBill"].astype(str).str.strip()) - {""}
+                rows = dict(prior.rows)
+                current = _history_rows_by_bill(df, desc_col, refid_col, bills=touched)
+                for bill in touched:
+                    if bill in current:
+                        rows[bill] = current[bill]
+                    else:
+                        rows.pop(bill, None)
+                stats["history_delta_prefix"] = 1
+            else:
+                rows = _history_rows_by_bill(df, desc_col, refid_col)
+                touched = {b for b in set(rows) | set(prior.rows) if rows.get(b) != prior.rows.get(b)}
+                stats["history_delta_merge"] = 1
+            hashes = dict(prior.hashes)
+            for bill in touched:
+                ins, rem, mod = _history_row_changes(prior.rows.get(bill, []), rows.get(bill, []))
+                stats["history_delta_inserted"] += ins
+                stats["history_delta_removed"] += rem
+                stats["history_delta_modified"] += mod
+                if bill in rows:
+                    hashes[bill] = _hash_history_rows_for_bill(rows[bill])
+                else:
+                    hashes.pop(bill, None)
+            stats["history_delta_touched_bills"] = len(touched)
+            carried = stm and isinstance(prior.stm, dict) and prior.stm_scheme == _STM_DIGEST_SCHEME
+            if carried:
+                # a bill's STM digest is a function of its own rows alone: re-digest the touched bills
+                stm_digests = {b: h for b, h in prior.stm.items() if b not in touched}
+                if touched:
+                    sub = df[df["CleanBill"].astype(str).str.strip().isin(touched)]
+                    stm_digests.update(_stm_bill_digests(sub, desc_col, refid_col))
+                stats["history_delta_stm_redigested"] = len(touched)
+            elif stm:
+                stm_digests = _stm_bill_digests(df, desc_col, refid_col)
+                stats["history_delta_stm_redigested"] = len(stm_digests)
+            if same_body and window == prior.window and (carried or not stm):
+                return hashes, stm_digests or {}, stats   # nothing moved: state on disk is already current
+    except Exception as _e:
+        print(f"⚠️ HISTORY delta failed ({type(_e).__name__}: {_e}); full per-bill hash this cycle.")
+        rows = hashes = stm_digests = None
+        stats.update({k: 0 for k in stats})
+        stats["history_delta_errors"] = 1                 # a crash, not a plain no-state cycle
+    if hashes is None:                                    # ambiguous / no usable state → full hash
+        rows = _history_rows_by_bill(df, desc_col, refid_col)
+        hashes = {bill: _hash_history_rows_for_bill(r) for bill, r in rows.items()}
+        stats["history_delta_full"] = 1
+        if stm:
+            stm_digests = _stm_bill_digests(df, desc_col, refid_col)
+            stats["history_delta_stm_redigested"] = len(stm_digests)
+    if etag and body is not None:
+        _HistoryDelta(etag, body, nrows, window, cols, rows, hashes, stm_digests if stm else None).persist(path)
+    return hashes, stm_digests or {}, stats
+
+
 def _get_or_create_legevent_tabs(sheet, push_alert):
     """Idempotent creation of LegEvent_Bills + LegEvent_Events tabs.
 
@@ -2141,6 +3232,7 @@ def _load_legevent_cache(bills_ws, events_ws, push_alert, active_session=None):
 def _build_legevent_refresh_queue(
     candidate_bills, current_hashes, bills_meta, session_5d,
     now_utc, fetch_cap, ttl_seconds, events_cache=None,
+    unchanged_streaks=None, upcoming_bills=frozenset(), activity_age_days=None,
 ):
     """Build the refresh queue with explicit Tier A → B → C priority.
 
@@ -2167,6 +3259,17 @@ def _build_legevent_refresh_queue(
     OF queue-build time (reloaded from the tab; the negative-cache `[]`
     seeding happens later, so absent/empty here == genuinely no events).
 
+    Adaptive TTL + value scoring (LEGEVENT_ADAPTIVE_TTL): with
+    `unchanged_streaks` ({bill: consecutive unchanged refreshes}) given,
+    Tier C uses each bill's _legevent_adaptive_ttl instead of the flat
+    `ttl_seconds`, and each tier is ordered by _legevent_refresh_score
+    (highest first; ties alphabetical) so an overflowing cap drops the
+    least valuable bills, not the late-alphabet ones. The tiers themselves
+    still drain strictly A → B → C. `upcoming_bills` = bills on a docket /
+    agenda in the next LEGEVENT_UPCOMING_DAYS; `activity_age_days` = {bill:
+    days since its latest HISTORY action}. `unchanged_streaks=None` is the
+    flat-TTL, alphabetical queue.
+
     Returns (queue, tier_counts) where:
       queue:        list of bills (capped at fetch_cap), drained in
                     Tier A → B → C order
@@ -2175,6 +3278,11 @@ def _build_legevent_refresh_queue(
     from datetime import timezone
 
     events_cache = events_cache or {}
+    adaptive = unchanged_streaks is not None
+    streaks = unchanged_streaks or {}
+    activity_age_days = activity_age_days or {}
+    scores: dict = {}
+    ttl_backoff_skipped = 0  # expired under the flat TTL, still fresh under the bill's adaptive TTL
     tier_a: list = []  # uncached (no cached events)
     tier_b: list = []  # hash-changed
     tier_c: list = []  # TTL-expired
@@ -2190,7 +3298,19 @@ def _build_legevent_refresh_queue(
         has_events = bool(events_cache.get((bill, session_5d)))
         if cached is None or not has_events:
             tier_a.append(bill)
+            scores[bill] = _legevent_refresh_score(
+                None, ttl_seconds, 0, bill in upcoming_bills, activity_age_days.get(bill))
             continue
+        # Age since the last fetch (scores every tier; gates Tier C below)
+        fetched_at = cached.get("FetchedAtUTC", "")
+        try:
+            fa = datetime.fromisoformat(fetched_at.replace("Z", "+00:00"))
+            if fa.tzinfo is None:
+                fa = fa.replace(tzinfo=timezone.utc)
+            age = (now_utc - fa).total_seconds()
+        except (ValueError, AttributeError):
+            age = float("inf")  # unparseable timestamp → treat as expired
+        upcoming = bill in upcoming_bills
         # PR-C7.1v: schema-incomplete cache migration (assumptions_audit #75).
         # A bill whose cached events predate the CommitteeName column carry the
         # "?" sentinel; the structural time-recovery REFUSES "?" (it can't tell a
@@ -2209,29 +3329,38 @@ def _build_legevent_refresh_queue(
                for _e in (events_cache.get((bill, session_5d)) or [])):
             tier_b.append(bill)
             schema_backfill += 1
+            scores[bill] = _legevent_refresh_score(age, ttl_seconds, 0, upcoming, activity_age_days.get(bill))
             continue
         # (terminal-skip removed 2026-07-10 — see _hydrate_legevent_cache's IsTerminal note; a bill that
         #  can't mutate is already caught by the hash-unchanged + TTL-fresh gates below, no text guess.)
         if cached.get("LastHistoryHash") != current_hash:
             tier_b.append(bill)
+            # new HISTORY is itself the change signal: score as a bill with no unchanged streak
+            scores[bill] = _legevent_refresh_score(age, ttl_seconds, 0, upcoming, activity_age_days.get(bill))
             continue
-        # Hash unchanged AND non-terminal — check TTL
-        fetched_at = cached.get("FetchedAtUTC", "")
-        try:
-            fa = datetime.fromisoformat(fetched_at.replace("Z", "+00:00"))
-            if fa.tzinfo is None:
-                fa = fa.replace(tzinfo=timezone.utc)
-            age = (now_utc - fa).total_seconds()
-        except (ValueError, AttributeError):
-            age = float("inf")  # unparseable timestamp → treat as expired
-        if age > ttl_seconds:
+        # Hash unchanged AND non-terminal — check the bill's TTL
+        streak = streaks.get(bill, 0) if adaptive else 0
+        bill_ttl = _legevent_adaptive_ttl(ttl_seconds, streak, upcoming)
+        if age > bill_ttl:
             tier_c.append(bill)
+            scores[bill] = _legevent_refresh_score(age, bill_ttl, streak, upcoming, activity_age_days.get(bill))
         else:
             skipped_fresh += 1
+            if age > ttl_seconds:
+                ttl_backoff_skipped += 1
+
+    if adaptive:
+        for tier in (tier_a, tier_b, tier_c):
+            tier.sort(key=lambda b: -scores[b])   # stable: ties keep the alphabetical order
 
     full = tier_a + tier_b + tier_c
     queue = full[:fetch_cap]
     queued_overflow = max(0, len(full) - fetch_cap)
+    queued_scores = sorted(scores[b] for b in queue)
+
+    def _pct(q):
+        return round(queued_scores[min(len(queued_scores) - 1, int(q * len(queued_scores)))], 3) \
+            if queued_scores else 0.0
 
     return queue, {
         "tier_a": len(tier_a),
@@ -2242,83 +3371,395 @@ def _build_legevent_refresh_queue(
         "schema_backfill": schema_backfill,
         "queue_size": len(queue),
         "queued_overflow": queued_overflow,
+        "ttl_backoff_skipped": ttl_backoff_skipped,
+        "upcoming_queued": sum(1 for b in queue if b in upcoming_bills),
+        "score_min": _pct(0.0),
+        "score_p50": _pct(0.5),
+        "score_p90": _pct(0.9),
+        "score_max": _pct(1.0),
+        "score_dropped_max": round(max((scores[b] for b in full[fetch_cap:]), default=0.0), 3),
     }
 
 
+def _legevent_adaptive_ttl(base_ttl, unchanged_streak, upcoming):
+    """A bill's refresh TTL: `base_ttl` doubled per consecutive unchanged refresh, capped at
+    LEGEVENT_TTL_MAX_SECONDS; a bill with an upcoming docket / agenda appearance keeps `base_ttl`."""
+    if upcoming or unchanged_streak <= 0:
+        return base_ttl
+    return min(base_ttl * 2 ** min(unchanged_streak, 16), max(base_ttl, LEGEVENT_TTL_MAX_SECONDS))
+
+
+def _legevent_refresh_score(age_seconds, ttl_seconds, unchanged_streak, upcoming, activity_age_days):
+    """Expected value of refreshing a bill now: P(its events changed) × what a change is worth.
+
+    P(change) grows with staleness (age / TTL, capped at 4; an uncached bill counts as fully stale) and
+    falls with each unchanged refresh (1 / (1 + streak)). The worth is 1, +2 when the bill is on an
+    upcoming docket / agenda (its events feed tomorrow's calendar), + a HISTORY-recency term that halves
+    after a week without an action."""
+    if age_seconds is None or ttl_seconds <= 0:
+        staleness = 4.0
+    else:
+        staleness = min(age_seconds / ttl_seconds, 4.0)
+    p_change = staleness / (1 + max(unchanged_streak, 0))
+    recency = 0.0 if activity_age_days is None else 1.0 / (1.0 + max(activity_age_days, 0) / 7.0)
+    return p_change * (1.0 + (2.0 if upcoming else 0.0) + recency)
+
+
+def _legevent_upcoming_bills(docket_memory, today, days=None):
+    """Bills on a docket / agenda (docket_memory: date -> {bill: [committee]}) from `today` through the
+    next `days` (LEGEVENT_UPCOMING_DAYS) days."""
+    days = LEGEVENT_UPCOMING_DAYS if days is None else days
+    start = today.strftime("%Y-%m-%d")
+    end = (today + timedelta(days=days)).strftime("%Y-%m-%d")
+    out = set()
+    for date_str, bills in docket_memory.items():
+        if start <= date_str <= end:
+            out.update(bills)
+    return frozenset(out)
+
+
+def _legevent_events_signature(events):
+    """What a refresh can change, as a comparable value: the persisted LEGEVENT_EVENTS_HEADER fields
+    of every event (as written to the tab, so a fresh API list and its reloaded copy compare equal),
+    order-free. None for no events."""
+    if not events:
+        return None
+    return tuple(sorted(
+        (str(e.get("LegislationEventID") or e.get("EventID") or ""), _clean_legevent_cell(e.get("EventDate")),
+         _clean_legevent_cell(e.get("ChamberCode")), str(e.get("Description", ""))[:1000],
+         _clean_legevent_cell(e.get("EventCode")), _clean_legevent_cell(e.get("CommitteeName", "?")))
+        for e in events))
+
+
+_LEGEVENT_REFRESH_SCHEMA = "1"
+
+
+def _legevent_refresh_state_path():
+    return os.path.join(_BLOB_CACHE_DIR, "legevent_refresh.json")
+
+
+def _load_legevent_refresh_state(path=None):
+    """{"schema", "sessions": {session_5d: {bill: consecutive unchanged refreshes}}}."""
+    fresh = {"schema": _LEGEVENT_REFRESH_SCHEMA, "sessions": {}}
+    if not _BLOB_CACHE_ENABLED:
+        return fresh
+    try:
+        with open(path or _legevent_refresh_state_path(), "r") as f:
+            state = json.load(f)
+        if isinstance(state, dict) and state.get("schema") == _LEGEVENT_REFRESH_SCHEMA \
+                and isinstance(state.get("sessions"), dict):
+            return state
+    except FileNotFoundError:
+        pass
+    except Exception as _e:
+        print(f"⚠️ LegEvent refresh state unreadable ({_e}); every bill starts at the base TTL.")
+    return fresh
+
+
+def _save_legevent_refresh_state(state, path=None):
+    if not _BLOB_CACHE_ENABLED:
+        return
+    path = path or _legevent_refresh_state_path()
+    tmp = path + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(tmp, "w") as f:
+            json.dump(state, f, separators=(",", ":"))
+        os.replace(tmp, path)
+    except Exception as _e:
+        print(f"⚠️ LegEvent refresh state write skipped: {_e}")
+
+
+def _legevent_record_refreshes(unchanged_streaks, queue, before, events_cache, session_5d):
+    """Update each refreshed bill's unchanged streak from its events before (`before`: {bill: signature})
+    and after hydration. A refresh that came back empty (fetch failure or no events) teaches nothing and
+    leaves the streak alone; a bill with no prior events starts at 0. Returns (observed, changed) over the
+    bills that had events to compare against."""
+    observed = changed = 0
+    for bill in queue:
+        after = _legevent_events_signature(events_cache.get((bill, session_5d)))
+        if after is None:
+            continue
+        prior = before.get(bill)
+        if prior is None:
+            unchanged_streaks[bill] = 0
+            continue
+        observed += 1
+        if after != prior:
+            changed += 1
+            unchanged_streaks[bill] = 0
+        else:
+            unchanged_streaks[bill] = unchanged_streaks.get(bill, 0) + 1
+    return observed, changed
+
+
+def _legevent_hydrate_worker_count(raw):
+    """LEGEVENT_HYDRATE_WORKERS -> worker count: "" / "0" / "1" / junk = serial, capped at
+    LEGEVENT_HYDRATE_MAX_WORKERS (the fetch is I/O-bound, so there is no "auto" = per-core)."""
+    try:
+        n = int((raw or "").strip())
+    except ValueError:
+        return 1
+    return min(max(n, 1), LEGEVENT_HYDRATE_MAX_WORKERS)
+
+
+def _fetch_legevent_bill(http_session, bill, session_5d, legislation_id):
+    """One bill's hydration fetch, isolated from the shared caches so it can run on a worker thread.
+
+    Runs the resolver against per-bill scratch caches (seeded with the bill's known LegislationID, if
+    any) and records its alerts instead of pushing them. Returns (id_cache, event_cache, alerts) for
+    the caller to merge on the main thread, in queue order."""
+    cache_key = (bill, session_5d)
+    id_cache = {} if legislation_id is None else {cache_key: legislation_id}
+    event_cache = {}
+    alerts = []
+    # Use the resolver as the fetch primitive. We pass a sentinel date
+    # ("0000-00-00") that will never match any event; the resolver
+    # will populate the per-bill cache as a side effect even though
+    # it returns None for the synthetic match.
+    _resolve_via_legislation_event_api(
+        http_session=http_session,
+        bill_num=bill,
+        action_date_str="0000-00-00",
+        outcome_text="",  # empty token set → returns None defensively
+        session_code_5d=session_5d,
+        acting_chamber_code="",
+        legislation_id_cache=id_cache,
+        legislation_event_cache=event_cache,
+        push_alert=lambda *a, **k: alerts.append((a, k)),
+    )
+    return id_cache, event_cache, alerts
+
+
 def _hydrate_legevent_cache(
     refresh_queue, http_session, session_5d, current_hashes,
     legislation_id_cache, legislation_event_cache, bills_meta,
-    push_alert, now_utc,
+    push_alert, now_utc, workers=1,
 ):
     """Fetch each queued bill's LegEvent history and update both caches.
 
     Reuses _resolve_via_legislation_event_api's existing fetch + negative-
     cache logic by calling it with a synthetic action_date_str (any date —
-    we only care about populating the per-bill events cache). The function
-    is idempotent against `legislation_event_cache` membership: if the key
-    is already present, it returns from cache without re-fetching.
+    we only care about populating the per-bill events cache), via
+    _fetch_legevent_bill. Every queued bill is re-fetched: its prior
+    `legislation_event_cache` entry is dropped first (the cross-cycle
+    refresh semantic).
+
+    `workers` > 1 fetches that many bills concurrently through the SAME
+    session (so _CountingHTTPAdapter / LIS_REQUEST_CAP count every request,
+    LisRequestCapExceeded still aborts the cycle, and the per-host
+    _LIS_GOVERNOR paces all workers together).
+    Results — cache entries, alerts, bills_meta rows — are merged on this
+    thread strictly in queue order, so the outcome is identical to the
+    serial loop whatever order the fetches complete in.
 
     For each bill, after fetch:
-      - Populate `legislation_event_cache[(bill, session)]` (already done
-        by the resolver; we just observe the side-effect)
+      - Populate `legislation_event_cache[(bill, session)]` (and the
+        LegislationID cache) from the resolver's per-bill result
       - Update `bills_meta[(bill, session)]` with new metadata (hash,
         FetchedAtUTC, LatestEventType, LatestEventDate, IsTerminal)
 
-    Returns int — number of fetches actually performed (may be < queue
-    length if any bills hit cached-already short-circuit).
+    Returns int — number of fetches actually performed.
     """
-    fetches = 0
-    for bill in refresh_queue:
-        cache_key = (bill, session_5d)
-        # Force re-fetch for this cycle: drop any prior cache entry so the
-        # resolver's "if cache_key in cache" short-circuit doesn't apply.
-        # This is the cross-cycle refresh semantic.
-        legislation_event_cache.pop(cache_key, None)
-
-        # Use the resolver as the fetch primitive. We pass a sentinel date
-        # ("0000-00-00") that will never match any event; the resolver
-        # will populate the per-bill cache as a side effect even though
-        # it returns None for the synthetic match.
-        _resolve_via_legislation_event_api(
-            http_session=http_session,
-            bill_num=bill,
-            action_date_str="0000-00-00",
-            outcome_text="",  # empty token set → returns None defensively
-            session_code_5d=session_5d,
-            acting_chamber_code="",
-            legislation_id_cache=legislation_id_cache,
-            legislation_event_cache=legislation_event_cache,
-            push_alert=push_alert,
-        )
-        fetches += 1
+    queue = list(refresh_queue)
+    workers = min(max(int(workers or 1), 1), LEGEVENT_HYDRATE_MAX_WORKERS, max(len(queue), 1))
+    # Snapshot each bill's known LegislationID up front: workers never read the shared caches, and
+    # the merge below is the only writer.
+    known_ids = [legislation_id_cache.get((bill, session_5d)) for bill in queue]
+    jobs = ((http_session, bill, session_5d, lid) for bill, lid in zip(queue, known_ids))
+    aborted = []                               # the first exception any fetch raised
+    if workers > 1:
+        abort_lock = threading.Lock()
+
+        def _run_job(job):
+            # Once any fetch aborts (LisRequestCapExceeded), jobs that START afterwards are skipped —
+            # (False, None). A skipped job can precede the aborting bill in queue order (a worker pulled
+            # it, then checked the flag after a later job raised), so the merge re-raises the recorded
+            # exception at whichever of the two slots it reaches first.
+            if aborted:
+                return False, None
+            try:
+                return True, _fetch_legevent_bill(*job)
+            except BaseException as e:
+                with abort_lock:
+                    if not aborted:
+                        aborted.append(e)
+                raise
 
-        # Update bills_meta from whatever events the cache now contains
-        events = legislation_event_cache.get(cache_key) or []
-        if events:
-            # Latest event = max EventDate
-            latest = max(events, key=lambda e: str(e.get("EventDate") or ""))
-            latest_desc = str(latest.get("Description") or "")
-            latest_date = str(latest.get("EventDate") or "")[:10]
-        else:
-            latest_desc = ""
-            latest_date = ""
-
-        bills_meta[cache_key] = {
-            "LastHistoryHash": current_hashes.get(bill, ""),
-            "FetchedAtUTC":    now_utc.isoformat().replace("+00:00", "Z"),
-            "LatestEventType": latest_desc[:200],  # truncate against runaway descriptions
-            "LatestEventDate": latest_date,
-            # IsTerminal is retained in the persisted schema (dropping a stored column is a migration) but
-            # is now ALWAYS False. The terminal-skip optimization was removed 2026-07-10: it was TEXT-based
-            # (fail-unsafe — a mislabeled-terminal bill silently stops updating, a lobbyist accuracy loss),
-            # its pattern list had stayed empty since PR-C7 so it never once fired, and the TTL-fresh +
-            # hash-unchanged gates already skip steady-state bills. If a fetch-budget need ever appears,
-            # rebuild it STRUCTURALLY (a terminal-EventCode set + a drift alert). See assumptions_audit #103.
-            "IsTerminal":      False,
-        }
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="legevent")
+        results = pool.map(_run_job, jobs)
+    else:
+        pool = None
+        results = ((True, _fetch_legevent_bill(*job)) for job in jobs)
+
+    fetches = 0
+    try:
+        for bill, (ran, result) in zip(queue, results):
+            if not ran:
+                raise aborted[0]
+            id_cache, event_cache, alerts = result
+            cache_key = (bill, session_5d)
+            # Force re-fetch semantics: the prior entry never survives a refresh.
+            legislation_event_cache.pop(cache_key, None)
+            legislation_id_cache.update(id_cache)
+            legislation_event_cache.update(event_cache)
+            for args, kwargs in alerts:
+                push_alert(*args, **kwargs)
+            fetches += 1
+
+            # Update bills_meta from whatever events the cache now contains
+            events = legislation_event_cache.get(cache_key) or []
+            if events:
+                # Latest event = max EventDate
+                latest = max(events, key=lambda e: str(e.get("EventDate") or ""))
+                latest_desc = str(latest.get("Description") or "")
+                latest_date = str(latest.get("EventDate") or "")[:10]
+            else:
+                latest_desc = ""
+                latest_date = ""
+
+            bills_meta[cache_key] = {
+                "LastHistoryHash": current_hashes.get(bill, ""),
+                "FetchedAtUTC":    now_utc.isoformat().replace("+00:00", "Z"),
+                "LatestEventType": latest_desc[:200],  # truncate against runaway descriptions
+                "LatestEventDate": latest_date,
+                # IsTerminal is retained in the persisted schema (dropping a stored column is a migration) but
+                # is now ALWAYS False. The terminal-skip optimization was removed 2026-07-10: it was TEXT-based
+                # (fail-unsafe — a mislabeled-terminal bill silently stops updating, a lobbyist accuracy loss),
+                # its pattern list had stayed empty since PR-C7 so it never once fired, and the TTL-fresh +
+                # hash-unchanged gates already skip steady-state bills. If a fetch-budget need ever appears,
+                # rebuild it STRUCTURALLY (a terminal-EventCode set + a drift alert). See assumptions_audit #103.
+                "IsTerminal":      False,
+            }
+    finally:
+        # On LisRequestCapExceeded (or any abort) drop the not-yet-started fetches too.
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
     return fetches
 
 
+# A-1: bills-list DATA endpoint used to PROBE-verify authorization for a newly-active session (a 200 +
+# non-empty body proves the WebAPIKey is authorized for that session's data; a 401/403 proves it is not).
+# The LegislationID map below bulk-primes from the same list.
+_SESSION_PROBE_URL = "https://lis.virginia.gov/Legislation/api/getlegislationsessionlistasync"
+
+
+# ── Persisted bill → LegislationID map (.lis_blob_cache/legislation_ids.json) ──
+# A LegislationID never changes within a session, but _legislation_id_cache starts empty every cycle, so
+# each hydrated bill spent one of its two LIS requests (GetLegislationVersionbyBillNumberAsync) re-learning
+# it. The map keeps every ID the resolver learns (lazy fill), per session, and is bulk-primed from the
+# session's bill list (getlegislationsessionlistasync — the universe in ONE request, used only if its rows
+# carry LegislationID) when LEGISLATION_ID_PRIME_MIN or more queued bills have no known ID and the session
+# was not primed in the last LEGISLATION_ID_PRIME_TTL_SECONDS. Known IDs are seeded for the HYDRATION QUEUE
+# only, so _hydrate_legevent_cache goes straight to the events call; the row loop's view of the ID cache
+# is unchanged. Only real IDs are stored (a lookup miss may resolve later in the session). No state / a
+# bad file / LEGISLATION_ID_MAP=0 = an empty map: every bill looks its ID up, as before.
+LEGISLATION_ID_MAP_ENABLED = os.environ.get("LEGISLATION_ID_MAP", "1") == "1"
+LEGISLATION_ID_PRIME_MIN = max(0, int(os.environ.get("LEGISLATION_ID_PRIME_MIN", "25") or 0))   # 0 = never prime
+LEGISLATION_ID_PRIME_TTL_SECONDS = 24 * 3600
+_LEGISLATION_ID_MAP_SCHEMA = "1"
+
+
+def _legislation_id_map_path():
+    return os.path.join(_BLOB_CACHE_DIR, "legislation_ids.json")
+
+
+def _load_legislation_id_map(path=None):
+    """{"schema", "sessions": {session_5d: {"ids": {bill: LegislationID}, "primed_at": epoch}}}."""
+    fresh = {"schema": _LEGISLATION_ID_MAP_SCHEMA, "sessions": {}}
+    if not _BLOB_CACHE_ENABLED:
+        return fresh
+    try:
+        with open(path or _legislation_id_map_path(), "r") as f:
+            state = json.load(f)
+        if isinstance(state, dict) and state.get("schema") == _LEGISLATION_ID_MAP_SCHEMA \
+                and isinstance(state.get("sessions"), dict):
+            return state
+    except FileNotFoundError:
+        pass
+    except Exception as _e:
+        print(f"⚠️ LegislationID map unreadable ({_e}); IDs are looked up per bill this cycle.")
+    return fresh
+
+
+def _save_legislation_id_map(state, path=None):
+    if not _BLOB_CACHE_ENABLED:
+        return
+    path = path or _legislation_id_map_path()
+    tmp = path + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(tmp, "w") as f:
+            json.dump(state, f, separators=(",", ":"))
+        os.replace(tmp, path)
+    except Exception as _e:
+        print(f"⚠️ LegislationID map write skipped: {_e}")
+
+
+def _prime_legislation_ids(http_session, session_5d):
+    """{bill: LegislationID} for the session's whole bill list in one request; {} when the list carries
+    no LegislationID. Raises on a transport / HTTP / shape failure (the caller counts it and moves on)."""
+    r = http_session.get(_SESSION_PROBE_URL, headers=HEADERS, params={"sessionCode": session_5d}, timeout=30)
+    if r.status_code != 200:
+        raise RuntimeError(f"HTTP {r.status_code}")
+    payload = r.json()
+    if not isinstance(payload, dict):
+        raise RuntimeError(f"non-dict JSON ({type(payload).__name__})")
+    ids = {}
+    for item in payload.get("Legislations") or []:
+        if not isinstance(item, dict):
+            continue
+        bill = str(item.get("LegislationNumber") or "").replace(" ", "").upper()
+        lid = item.get("LegislationID")
+        if bill and lid:
+            ids[bill] = lid
+    return ids
+
+
+def _seed_legislation_ids(state, session_5d, queue, legislation_id_cache, http_session, now_ts):
+    """Seed the hydration queue's known LegislationIDs into legislation_id_cache (bulk-priming the
+    session's map first when enough of the queue is unknown). Returns the cycle's legid_* counters."""
+    entry = state["sessions"].setdefault(session_5d, {"ids": {}, "primed_at": 0.0})
+    ids = entry["ids"]
+    stats = {"legid_primed": 0, "legid_prime_new": 0, "legid_prime_failures": 0}
+    unknown = [b for b in queue if b not in ids]
+    if (LEGISLATION_ID_PRIME_MIN and len(unknown) >= LEGISLATION_ID_PRIME_MIN
+            and now_ts - entry.get("primed_at", 0.0) >= LEGISLATION_ID_PRIME_TTL_SECONDS):
+        entry["primed_at"] = now_ts          # attempted: a list without IDs is not retried every cycle
+        try:
+            listed = _prime_legislation_ids(http_session, session_5d)
+            stats["legid_primed"] = 1
+            stats["legid_prime_new"] = sum(1 for b in listed if b not in ids)
+            ids.update(listed)
+            print(f"🪪 LegislationID map: primed {len(listed)} ID(s) for {session_5d} from the bill list "
+                  f"({stats['legid_prime_new']} new).")
+        except LisRequestCapExceeded:
+            raise
+        except Exception as _prime_err:
+            stats["legid_prime_failures"] = 1
+            print(f"⚠️ LegislationID bulk prime skipped ({type(_prime_err).__name__}: {_prime_err}); "
+                  f"IDs fill lazily.")
+    hits = 0
+    for bill in queue:
+        if ids.get(bill):
+            legislation_id_cache[(bill, session_5d)] = ids[bill]
+            hits += 1
+    stats["legid_map_hits"] = hits
+    stats["legid_lookups"] = len(queue) - hits
+    return stats
+
+
+def _remember_legislation_ids(state, session_5d, legislation_id_cache):
+    """Fold every real LegislationID the cycle learned into the session's map; returns how many were new."""
+    ids = state["sessions"].setdefault(session_5d, {"ids": {}, "primed_at": 0.0})["ids"]
+    new = 0
+    for (bill, session), lid in legislation_id_cache.items():
+        if session == session_5d and lid and ids.get(bill) != lid:
+            ids[bill] = lid
+            new += 1
+    return new
+
+
 def _persist_legevent_cache(
     bills_meta, events_cache, bills_ws, events_ws, push_alert,
 ):
@@ -2536,7 +3977,7 @@ def _persist_legevent_cache(
 # requests, and the Backfill Burst batches per process), so it trips only on a genuine
 # runaway (e.g. an infinite loop), never on normal operation (Pre-Push Audit #14
 # calibration). Scope note: gspread/Sheets use their own session (not counted); blob fetches
-# via safe_fetch_csv are bare-requests + bounded (attempts<=3). See docs/knowledge/lis_api_safety.md.
+# via safe_fetch_csv use the uncounted pooled _BLOB_SESSION + bounded (attempts<=3). See docs/knowledge/lis_api_safety.md.
 try:
     LIS_REQUEST_CAP = max(0, int(os.environ.get("LIS_REQUEST_CAP", "15000")))  # 0 disables
 except (ValueError, TypeError):
@@ -2563,12 +4004,196 @@ class _CountingHTTPAdapter(HTTPAdapter):
             raise LisRequestCapExceeded(
                 f"{_n} session requests in one cycle exceeds the cap of "
                 f"{LIS_REQUEST_CAP} — aborting to protect the LIS API (likely a runaway loop).")
-        return super().send(request, *args, **kwargs)
+        return _LIS_GOVERNOR.governed(getattr(request, "url", "") or "",
+                                      lambda: super(_CountingHTTPAdapter, self).send(request, *args, **kwargs))
+
+
+# ── LIS-safety: adaptive per-host request governor (guardrail #3, made proactive) ──
+# One token bucket per host, shared by every thread and every session in the process, in front of every
+# counted-session request (in _CountingHTTPAdapter.send) and every blob GET (safe_fetch_csv's _blob_get). It
+# replaces the scattered fixed sleeps: a healthy LIS costs no wall-clock beyond the per-host ceiling, and
+# a throttling one slows EVERY caller, not just the thread that got the 429. AIMD: a 429/503 halves the
+# host's rate (floor 5%) and a Retry-After becomes debt every later request waits out; each clean
+# response then wins back 2% of the base rate. Throttles seen inside urllib3's own retry loop reach it
+# through _GovernedRetry. Per-endpoint latency / wait / throttle counts land in SYSTEM_METRICS.
+try:
+    LIS_HOST_MAX_RPS = max(0.0, float(os.environ.get("LIS_HOST_MAX_RPS", "20")))  # 0 = no ceiling on LIS
+except (ValueError, TypeError):
+    LIS_HOST_MAX_RPS = 20.0  # malformed env var must never crash the worker
+_GOVERNOR_HOST_RPS = {"lis.virginia.gov": LIS_HOST_MAX_RPS, "lis.blob.core.windows.net": 5.0}
+_GOVERNOR_DEFAULT_RPS = 4.0        # any other host (chamber-site agenda PDFs): the old sleep(0.25) pace
+_GOVERNOR_MAX_ENDPOINTS = 40       # metric-cardinality bound; later endpoints pool into "<host>/other"
+_GOVERNOR_MAX_RETRY_AFTER_S = 600  # a garbage multi-day Retry-After must not wedge the cycle
+
+
+def _retry_after_seconds(value):
+    """Retry-After header -> seconds (delta-seconds or an HTTP-date), clamped to
+    [0, _GOVERNOR_MAX_RETRY_AFTER_S]; None when absent or unparseable."""
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        secs = float(value)
+    except ValueError:
+        from email.utils import parsedate_to_datetime
+        try:
+            secs = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(secs, 0.0), _GOVERNOR_MAX_RETRY_AFTER_S)
+
+
+class _HostGovernor:
+    """Per-host token buckets (AIMD-adaptive) + per-endpoint request telemetry. Thread-safe; every
+    wait is reserved under the lock and slept OUTSIDE it, so concurrent callers queue up at the
+    host's rate instead of bursting together."""
+
+    THROTTLE_STATUSES = (429, 503)
+
+    def __init__(self, host_rps, default_rps, clock=time.monotonic, sleep=time.sleep,
+                 floor_frac=0.05, recover_frac=0.02):
+        self._host_rps = {h.lower(): float(r) for h, r in host_rps.items()}
+        self._default_rps = float(default_rps)
+        self._clock, self._sleep = clock, sleep
+        self._floor_frac, self._recover_frac = floor_frac, recover_frac
+        self._lock = threading.Lock()
+        self._buckets = {}   # host -> {"base", "rate", "tokens", "stamp"}; absent/None = ungoverned
+        self._stats = {}     # endpoint label -> [requests, latency_s, wait_s, throttled, errors]
+
+    @staticmethod
+    def _host(url):
+        return (urllib.parse.urlsplit(url).hostname or "").lower()
+
+    def configure(self, host, rps):
+        """Set (or, with rps <= 0, lift) a host's base rate; resets its adaptive state."""
+        with self._lock:
+            self._host_rps[host.lower()] = float(rps)
+            self._buckets.pop(host.lower(), None)
+
+    def _bucket(self, host, now):
+        if not host:
+            return None
+        if host not in self._buckets:
+            base = self._host_rps.get(host, self._default_rps)
+            self._buckets[host] = ({"base": base, "rate": base, "tokens": max(1.0, base / 4), "stamp": now}
+                                   if base > 0 else None)
+        b = self._buckets[host]
+        if b is not None:   # refill at the CURRENT rate up to the burst (a quarter-second of base rate)
+            b["tokens"] = min(max(1.0, b["base"] / 4), b["tokens"] + (now - b["stamp"]) * b["rate"])
+            b["stamp"] = now
+        return b
+
+    def _endpoint(self, url):
+        parts = urllib.parse.urlsplit(url)
+        seg = parts.path.strip("/").split("/", 1)[0]
+        label = f"{(parts.hostname or '').lower()}/{seg}" if seg else (parts.hostname or "").lower()
+        if label not in self._stats and len(self._stats) >= _GOVERNOR_MAX_ENDPOINTS:
+            label = f"{(parts.hostname or '').lower()}/other"
+        return self._stats.setdefault(label, [0, 0.0, 0.0, 0, 0])
+
+    def acquire(self, url):
+        """Take one token for url's host, sleeping until it is available. Returns the seconds waited."""
+        with self._lock:
+            now = self._clock()
+            b = self._bucket(self._host(url), now)
+            if b is None:
+                return 0.0
+            b["tokens"] -= 1.0
+            wait = -b["tokens"] / b["rate"] if b["tokens"] < 0 else 0.0
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def throttle(self, url, retry_after=None):
+        """url's host answered 429/503: halve its rate (floor floor_frac x base) and turn any
+        Retry-After into debt that every later request on the host waits out."""
+        secs = _retry_after_seconds(retry_after)
+        with self._lock:
+            self._endpoint(url)[3] += 1
+            b = self._bucket(self._host(url), self._clock())
+            if b is None:
+                return
+            b["rate"] = max(b["base"] * self._floor_frac, b["rate"] / 2)
+            if secs:
+                b["tokens"] = min(b["tokens"], 0.0) - secs * b["rate"]
+
+    def observe(self, url, status, headers, latency_s, wait_s):
+        """Record one finished request (status None = it raised) and adapt the host's rate."""
+        if status in self.THROTTLE_STATUSES:
+            self.throttle(url, (headers or {}).get("Retry-After"))
+        with self._lock:
+            st = self._endpoint(url)
+            st[0] += 1
+            st[1] += latency_s
+            st[2] += wait_s
+            if status is None or status >= 500:
+                st[4] += 1
+            b = self._buckets.get(self._host(url))
+            if b is not None and status is not None and status not in self.THROTTLE_STATUSES and status < 500:
+                b["rate"] = min(b["base"], b["rate"] + b["base"] * self._recover_frac)
+
+    def governed(self, url, send):
+        """acquire -> send() -> observe, for one request; send's exception still propagates."""
+        wait = self.acquire(url)
+        t0 = time.perf_counter()
+        try:
+            resp = send()
+        except Exception:
+            self.observe(url, None, None, time.perf_counter() - t0, wait)
+            raise
+        self.observe(url, getattr(resp, "status_code", None), getattr(resp, "headers", None),
+                     time.perf_counter() - t0, wait)
+        return resp
+
+    def rate(self, host):
+        """The host's current adaptive rate (requests/s), or None when ungoverned / not yet seen."""
+        b = self._buckets.get(host.lower())
+        return b["rate"] if b else None
+
+    def metrics(self):
+        """{lis_ep_<endpoint>_requests/_latency_ms_avg/_wait_ms/_throttled/_errors,
+        lis_host_<host>_rate_pct, lis_governor_wait_ms/_throttled: int} for SYSTEM_METRICS."""
+        slug = lambda label: re.sub(r"[^a-z0-9]+", "_", label.lower()).strip("_")
+        out = {"lis_governor_wait_ms": 0, "lis_governor_throttled": 0}
+        with self._lock:
+            for label, (n, lat, wait, thr, err) in sorted(self._stats.items()):
+                k = f"lis_ep_{slug(label)}"
+                out[f"{k}_requests"] = n
+                out[f"{k}_latency_ms_avg"] = int(round(1000 * lat / n)) if n else 0
+                out[f"{k}_wait_ms"] = int(round(1000 * wait))
+                out[f"{k}_throttled"] = thr
+                out[f"{k}_errors"] = err
+                out["lis_governor_wait_ms"] += int(round(1000 * wait))
+                out["lis_governor_throttled"] += thr
+            for host, b in sorted(self._buckets.items()):
+                if b is not None:
+                    out[f"lis_host_{slug(host)}_rate_pct"] = int(round(100 * b["rate"] / b["base"]))
+        return out
+
+    def reset_stats(self):
+        """Clear the per-endpoint telemetry (at cycle start); adaptive rates carry over."""
+        with self._lock:
+            self._stats.clear()
+
+
+_LIS_GOVERNOR = _HostGovernor(_GOVERNOR_HOST_RPS, _GOVERNOR_DEFAULT_RPS)
+
+
+class _GovernedRetry(Retry):
+    """urllib3 Retry that reports every retried 429/503 to the governor BEFORE urllib3 sleeps it out, so
+    a throttle slows every thread on the host — not just this request's own backoff. Retry.new()
+    re-instantiates type(self), so the hook survives each increment."""
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if response is not None and response.status in _HostGovernor.THROTTLE_STATUSES and _pool is not None:
+            _LIS_GOVERNOR.throttle(f"{_pool.scheme}://{_pool.host}{url or ''}",
+                                   response.headers.get("Retry-After"))
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
 
 def get_armored_session():
     session = requests.Session()
     session.headers.update({'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0 Safari/537.36'})
-    retries = Retry(total=4, backoff_factor=2, status_forcelist=[429, 500, 502, 503, 504])
+    retries = _GovernedRetry(total=4, backoff_factor=2, status_forcelist=[429, 500, 502, 503, 504])
     adapter = _CountingHTTPAdapter(max_retries=retries)  # guardrail #4: count (in send) + cap
     session.mount('http://', adapter)
     session.mount('https://', adapter)
@@ -2655,7 +4280,9 @@ def get_active_session_info(http_session):
 # docs/knowledge/lis_api_safety.md.
 _BLOB_CACHE_DIR = os.environ.get("LIS_BLOB_CACHE_DIR", ".lis_blob_cache")
 _BLOB_CACHE_ENABLED = os.environ.get("LIS_BLOB_CACHE", "1") == "1"  # kill switch: LIS_BLOB_CACHE=0
-blob_cache_stats = {"reuse_304": 0, "download_200": 0}
+blob_cache_stats = {"reuse_304": 0, "download_200": 0, "frame_hit": 0, "range_requests": 0, "range_resumed_bytes": 0,
+                    "range_restart": 0, "tail_fetch": 0, "tail_bytes_saved": 0, "tail_rejected": 0, "tail_skipped": 0,
+                    "corrupt": 0, "evicted": 0, "evicted_bytes": 0}
 # Source-feed freshness: the blob's server-declared Last-Modified per URL. The bill data is
 # bulk re-derived from HISTORY.CSV every cycle, so a SINGLE bill can never be "stale" vs LIS
 # (we ARE LIS's last-action by construction) — the real blind spot is the SOURCE BLOB itself
@@ -2664,15 +4291,214 @@ blob_cache_stats = {"reuse_304": 0, "download_200": 0}
 # is populated even on a cold-start cache hit. A side-channel dict (like blob_cache_stats), so
 # it never leaks into the event schema / Schedule_Witness whitelist.
 _blob_last_modified = {}
+# The exact (etag, body) each safe_fetch_csv call last RETURNED a frame for — the HISTORY delta ingester
+# diffs these bytes, never a cache file that a failed write could have left one version behind.
+_blob_served = {}
+
+def _blob_cache_key(url):
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()[:24]
 
 def _blob_cache_paths(url):
-    key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:24]
+    key = _blob_cache_key(url)
     return (os.path.join(_BLOB_CACHE_DIR, key + ".bin"),
             os.path.join(_BLOB_CACHE_DIR, key + ".json"))
 
+# ── Blob cache manager: manifest, integrity, size budget (2026-10-18) ──
+# .lis_blob_cache/ only ever grew — every blob of every session year plus its frame snapshot, vote index
+# and HISTORY delta state — and actions/cache restores (and bills quota for) every byte of it each run. A
+# damaged .bin of the recorded length was caught only by the CSV marker check or read_csv failing.
+# manifest.json now indexes each entry (the 24-hex URL key all of its `<key>.*` files share) with its URL,
+# ETag, length, SHA-256, codec, bytes on disk and last access:
+#   • _read_blob_cache verifies the body against the SHA-256 in its meta; a mismatch, length mismatch or
+#     undecodable body moves the .bin/.json pair to quarantine/ (newest _BLOB_QUARANTINE_KEEP kept for a
+#     post-mortem) and reads as a miss, so safe_fetch_csv's unconditional GET refetches it;
+#   • blob_cache_maintain(), once per cycle after the last blob read, evicts whole entries least recently
+#     used first until the directory fits LIS_BLOB_CACHE_MAX_MB (0 = unbounded) — never an entry this
+#     process read or wrote. The singleton state files (stm_*.json, legevent_refresh.json, ...) count
+#     toward the size but are never evicted;
+#   • LIS_BLOB_CACHE_CODEC=gzip|zstd stores new bodies compressed (zstd needs `zstandard`, else gzip).
+#     The SHA-256 and length are of the plain bytes, and an entry written under any codec stays readable.
+# Pre-manifest entries are adopted at their newest file's mtime; a pre-checksum meta is length-checked as
+# before and gains its SHA-256 on first read.
+BLOB_CACHE_MAX_BYTES = int(float(os.environ.get("LIS_BLOB_CACHE_MAX_MB", "128") or 0) * 1024 * 1024)
+BLOB_CACHE_CODEC = os.environ.get("LIS_BLOB_CACHE_CODEC", "none").strip().lower()
+_BLOB_MANIFEST_SCHEMA = "1"
+_BLOB_QUARANTINE_KEEP = 4
+_BLOB_KEY_RE = re.compile(r"^([0-9a-f]{24})\.")
+try:
+    import zstandard as _zstd
+except ImportError:
+    _zstd = None
+
+
+def _blob_codec():
+    """The codec new entries are written with: zstd falls back to gzip without `zstandard`; anything
+    unrecognised is stored plain."""
+    if BLOB_CACHE_CODEC == "zstd":
+        return "zstd" if _zstd is not None else "gzip"
+    return "gzip" if BLOB_CACHE_CODEC == "gzip" else "none"
+
+
+def _blob_encode(body, codec):
+    if codec == "gzip":
+        return gzip.compress(body, compresslevel=6, mtime=0)
+    if codec == "zstd":
+        return _zstd.ZstdCompressor(level=10).compress(body)
+    return body
+
+
+def _blob_decode(stored, codec):
+    if codec == "gzip":
+        return gzip.decompress(stored)
+    if codec == "zstd":
+        return _zstd.ZstdDecompressor().decompress(stored)
+    if codec == "none":
+        return stored
+    raise ValueError(f"unknown codec {codec!r}")
+
+
+class _BlobCacheManifest:
+    """Thread-safe key -> {url, etag, length, sha256, codec, stored, last_access} index of the blob cache
+    (the startup fan-out fetches DOCKET and HISTORY concurrently), loaded lazily for the current
+    _BLOB_CACHE_DIR. `_touched` holds the keys this process read or wrote: eviction skips them."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._dir, self._entries, self._touched = None, {}, set()
+
+    @staticmethod
+    def path():
+        return os.path.join(_BLOB_CACHE_DIR, "manifest.json")
+
+    def _load_locked(self):
+        if self._dir == _BLOB_CACHE_DIR:
+            return self._entries
+        self._dir, self._entries, self._touched = _BLOB_CACHE_DIR, {}, set()
+        try:
+            with open(self.path(), "r") as f:
+                raw = json.load(f)
+            if isinstance(raw, dict) and raw.get("schema") == _BLOB_MANIFEST_SCHEMA \
+                    and isinstance(raw.get("entries"), dict):
+                self._entries = {k: e for k, e in raw["entries"].items() if isinstance(e, dict)}
+        except FileNotFoundError:
+            pass
+        except Exception as _e:
+            print(f"⚠️ blob cache manifest unreadable ({_e}); entries are re-adopted from disk.")
+        return self._entries
+
+    def touch(self, key, **fields):
+        with self._lock:
+            entry = self._load_locked().setdefault(key, {})
+            entry.update(fields, last_access=round(time.time(), 3))
+            self._touched.add(key)
+
+    def forget(self, key):
+        with self._lock:
+            self._load_locked().pop(key, None)
+
+    def entries(self):
+        with self._lock:
+            return {k: dict(e) for k, e in self._load_locked().items()}
+
+    def maintain(self, max_bytes):
+        """Reconcile the index with the files on disk, evict least-recently-used entries this process
+        didn't touch until the directory fits `max_bytes` (0 = unbounded), save. Returns (bytes on disk
+        after eviction, entries, evicted, evicted bytes)."""
+        if not (_BLOB_CACHE_ENABLED and os.path.isdir(_BLOB_CACHE_DIR)):
+            return 0, 0, 0, 0
+        with self._lock:
+            entries = self._load_locked()
+            families, mtimes, other = defaultdict(int), {}, 0
+            for root, _dirs, names in os.walk(_BLOB_CACHE_DIR):
+                for name in names:
+                    try:
+                        st = os.stat(os.path.join(root, name))
+                    except FileNotFoundError:
+                        continue
+                    m = _BLOB_KEY_RE.match(name) if root == _BLOB_CACHE_DIR else None
+                    if m is None:
+                        other += st.st_size
+                        continue
+                    families[m.group(1)] += st.st_size
+                    mtimes[m.group(1)] = max(mtimes.get(m.group(1), 0.0), st.st_mtime)
+            for key in [k for k in entries if k not in families]:
+                del entries[key]
+            for key, size in families.items():
+                entry = entries.setdefault(key, {"last_access": round(mtimes[key], 3)})
+                entry["stored"] = size
+            total, evicted, freed = other + sum(families.values()), 0, 0
+            idle = sorted((k for k in families if k not in self._touched),
+                          key=lambda k: (entries[k].get("last_access") or 0, k))
+            for key in idle:
+                if not max_bytes or total <= max_bytes:
+                    break
+                for name in [n for n in os.listdir(_BLOB_CACHE_DIR) if n.startswith(key + ".")]:
+                    try:
+                        os.remove(os.path.join(_BLOB_CACHE_DIR, name))
+                    except FileNotFoundError:
+                        pass
+                total -= families[key]
+                freed += families[key]
+                evicted += 1
+                del entries[key]
+            path = self.path()
+            tmp = path + ".tmp"
+            try:
+                with open(tmp, "w") as f:
+                    json.dump({"schema": _BLOB_MANIFEST_SCHEMA, "entries": entries}, f, separators=(",", ":"))
+                os.replace(tmp, path)
+            except Exception as _e:
+                print(f"⚠️ blob cache manifest write skipped: {_e}")
+            return total, len(entries), evicted, freed
+
+
+_BLOB_MANIFEST = _BlobCacheManifest()
+
+
+def blob_cache_maintain(max_bytes=None):
+    """End-of-cycle cache upkeep (see the cache-manager comment): LRU eviction down to the budget plus the
+    cycle's cache telemetry as SYSTEM_METRICS ints — size, entries, 304 hit rate, evictions, corrupt
+    entries quarantined."""
+    total, entries, evicted, freed = _BLOB_MANIFEST.maintain(BLOB_CACHE_MAX_BYTES if max_bytes is None else max_bytes)
+    blob_cache_stats["evicted"] += evicted
+    blob_cache_stats["evicted_bytes"] += freed
+    if evicted:
+        print(f"🧹 blob cache: evicted {evicted} least-recently-used entr{'y' if evicted == 1 else 'ies'} "
+              f"({freed // 1024} KB); {total // 1024} KB in {entries} entries now.")
+    served = blob_cache_stats["reuse_304"] + blob_cache_stats["download_200"]
+    return {"blob_cache_bytes": total, "blob_cache_entries": entries,
+            "blob_cache_hit_pct": round(100 * blob_cache_stats["reuse_304"] / served) if served else 0,
+            **{f"blob_{k}": v for k, v in blob_cache_stats.items()}}
+
+
+def _quarantine_blob(url, reason):
+    """Move url's cached body + meta into quarantine/ (the newest _BLOB_QUARANTINE_KEEP pairs are kept) and
+    drop it from the index; the caller then reads a miss, so the next GET is unconditional."""
+    key = _blob_cache_key(url)
+    qdir = os.path.join(_BLOB_CACHE_DIR, "quarantine")
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+    blob_cache_stats["corrupt"] += 1
+    print(f"⚠️ blob cache entry failed its integrity check ({reason}); quarantined, refetching: {url}")
+    try:
+        os.makedirs(qdir, exist_ok=True)
+        for path in _blob_cache_paths(url):
+            if os.path.exists(path):
+                os.replace(path, os.path.join(qdir, f"{key}.{stamp}{os.path.splitext(path)[1]}"))
+        for name in sorted(os.listdir(qdir), key=lambda n: n.split(".")[1], reverse=True)[2 * _BLOB_QUARANTINE_KEEP:]:
+            os.remove(os.path.join(qdir, name))
+    except Exception as _e:
+        print(f"⚠️ blob cache quarantine failed ({_e}); deleting the entry instead.")
+        for path in _blob_cache_paths(url):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+    _BLOB_MANIFEST.forget(key)
+
 def _read_blob_cache(url):
-    """Return (etag, body_bytes) iff a COMPLETE, length-verified cache entry exists, else
-    (None, None). A missing/partial/length-mismatched entry reads as no-cache (→ full GET)."""
+    """Return (etag, body_bytes) iff a COMPLETE, verified cache entry exists, else (None, None). A
+    missing/partial entry reads as no-cache (→ full GET); one whose bytes fail the recorded length,
+    SHA-256 or codec is quarantined first."""
     if not _BLOB_CACHE_ENABLED:
         return None, None
     try:
@@ -2685,27 +4511,51 @@ def _read_blob_cache(url):
             return None, None
         etag = meta.get("etag")
         length = meta.get("length")
-        if not etag:
+        codec = meta.get("codec") or "none"
+        if not etag or (codec == "zstd" and _zstd is None):   # zstd entry, no `zstandard` here → miss
             return None, None
         with open(bin_path, "rb") as f:
-            body = f.read()
-        if length is not None and len(body) != int(length):  # integrity: bytes match recorded length
-            return None, None
-        return etag, body
+            stored = f.read()
     except Exception:
         return None, None  # any cache fault → behave as a miss (fail-safe)
-
-def _write_blob_cache(url, etag, body):
-    """Persist bytes + ETag. Bytes first (temp+fsync+rename), meta LAST, so a present meta
-    implies complete bytes. Best-effort: a write failure never breaks the fetch."""
+    sha = meta.get("sha256")
+    try:
+        body = _blob_decode(stored, codec)
+        fault = None if length is None or len(body) == int(length) else f"{len(body)} bytes, recorded {length}"
+    except Exception as _e:
+        body, fault = None, f"undecodable {codec} body: {_e}"
+    if fault is None and sha and hashlib.sha256(body).hexdigest() != sha:
+        fault = "SHA-256 mismatch"
+    if fault:                                  # integrity: bytes match the recorded length + digest
+        _quarantine_blob(url, fault)
+        return None, None
+    if not sha:                                # pre-checksum entry: record the digest of the bytes it has
+        sha = hashlib.sha256(body).hexdigest()
+        tmp = meta_path + ".tmp"
+        try:
+            with open(tmp, "w") as f:
+                json.dump({**meta, "length": len(body), "sha256": sha, "codec": codec, "stored": len(stored)}, f)
+            os.replace(tmp, meta_path)
+        except Exception as _e:
+            print(f"⚠️ blob cache checksum backfill skipped for {url}: {_e}")
+    _BLOB_MANIFEST.touch(_blob_cache_key(url), url=url, etag=etag, length=len(body), sha256=sha, codec=codec)
+    return etag, body
+
+def _write_blob_cache(url, etag, body, md5=None):
+    """Persist bytes + ETag (+ the whole-blob MD5 the server published, if any — _blob_get only tries
+    a tail fetch for an entry that has one). Bytes first (temp+fsync+rename), meta LAST, so a present
+    meta implies complete bytes. Best-effort: a write failure never breaks the fetch."""
     if not (_BLOB_CACHE_ENABLED and etag):
         return
     bin_path, meta_path = _blob_cache_paths(url)   # computed OUTSIDE the try so the except can
     bin_tmp, meta_tmp = bin_path + ".tmp", meta_path + ".tmp"   # always clean up its temp files
     try:
+        codec = _blob_codec()
+        stored = _blob_encode(body, codec)
+        sha = hashlib.sha256(body).hexdigest()
         os.makedirs(_BLOB_CACHE_DIR, exist_ok=True)
         with open(bin_tmp, "wb") as f:
-            f.write(body)
+            f.write(stored)
             f.flush()
             os.fsync(f.fileno())
         # Remove the OLD meta before swapping in the new bytes (Gemini #153 r3): if the meta
@@ -2717,10 +4567,12 @@ def _write_blob_cache(url, etag, body):
             pass
         os.replace(bin_tmp, bin_path)
         with open(meta_tmp, "w") as f:         # meta write is atomic too (Gemini #153): a partial
-            json.dump({"etag": etag, "length": len(body)}, f)   # meta reads as a miss anyway, but
-            f.flush()                          # temp+replace avoids leaving a corrupt meta on disk
+            json.dump({"etag": etag, "length": len(body), "sha256": sha, "md5": md5 or "",   # meta reads as
+                       "codec": codec, "stored": len(stored)}, f)   # a miss anyway, but temp+replace avoids
+            f.flush()                          # leaving a corrupt meta on disk
             os.fsync(f.fileno())
         os.replace(meta_tmp, meta_path)
+        _BLOB_MANIFEST.touch(_blob_cache_key(url), url=url, etag=etag, length=len(body), sha256=sha, codec=codec)
     except Exception as _e:
         print(f"⚠️ blob cache write skipped for {url}: {_e}")
         for _t in (bin_tmp, meta_tmp):         # remove orphaned temp files on failure (Gemini #153 r2)
@@ -2730,6 +4582,307 @@ def _write_blob_cache(url, etag, body):
             except Exception:
                 pass
 
+# Parsed-frame snapshot (2026-10-18): a 304 saved the transfer but still paid iso-8859-1 decode +
+# pd.read_csv + header strip on the full body every cycle, in BOTH workers. safe_fetch_csv now pickles
+# its FINAL DataFrame next to the raw blob (<key>.frame.pkl + <key>.frame.json) tagged with the ETag,
+# the body's length + SHA-256, _BLOB_FRAME_SCHEMA and the pandas version, and a 304 whose cached body
+# matches every tag is served from the pickle instead of re-parsing. Same zero-trust rule as the blob
+# itself: any mismatch / unreadable / unpicklable snapshot reads as a miss → the normal parse. The
+# pickle is our own artifact in our own cache dir (never a downloaded one). Off with the blob cache.
+_BLOB_FRAME_SCHEMA = "1"   # bump whenever safe_fetch_csv's read_csv args or column normalization change
+
+def _blob_frame_paths(url):
+    bin_path, _ = _blob_cache_paths(url)
+    stem = bin_path[:-len(".bin")]
+    return stem + ".frame.pkl", stem + ".frame.json"
+
+def _blob_frame_tags(etag, body):
+    return {"etag": etag, "schema": _BLOB_FRAME_SCHEMA, "pandas": pd.__version__,
+            "length": len(body), "sha256": hashlib.sha256(body).hexdigest()}
+
+def _read_blob_frame(url, etag, body):
+    """The snapshot DataFrame iff its tags match (etag, body) exactly, else None (→ parse)."""
+    if not (_BLOB_CACHE_ENABLED and etag):
+        return None
+    try:
+        pkl_path, meta_path = _blob_frame_paths(url)
+        if not (os.path.exists(pkl_path) and os.path.exists(meta_path)):
+            return None
+        with open(meta_path, "r") as f:
+            meta = json.load(f)
+        if meta != _blob_frame_tags(etag, body):
+            return None
+        df = pd.read_pickle(pkl_path)
+        return df if isinstance(df, pd.DataFrame) else None
+    except Exception:
+        return None  # any snapshot fault → re-parse the bytes (fail-safe)
+
+def _write_blob_frame(url, etag, body, df):
+    """Persist the parsed frame for (etag, body). Meta removed first and written LAST, so a present
+    meta implies the pickle beside it is the one it describes. Best-effort, like _write_blob_cache."""
+    if not (_BLOB_CACHE_ENABLED and etag):
+        return
+    pkl_path, meta_path = _blob_frame_paths(url)
+    pkl_tmp, meta_tmp = pkl_path + ".tmp", meta_path + ".tmp"
+    try:
+        os.makedirs(_BLOB_CACHE_DIR, exist_ok=True)
+        try:
+            os.remove(meta_path)
+        except FileNotFoundError:
+            pass
+        df.to_pickle(pkl_tmp, compression=None)
+        os.replace(pkl_tmp, pkl_path)
+        with open(meta_tmp, "w") as f:
+            json.dump(_blob_frame_tags(etag, body), f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(meta_tmp, meta_path)
+    except Exception as _e:
+        print(f"⚠️ blob frame snapshot skipped for {url}: {_e}")
+        for _t in (pkl_tmp, meta_tmp):
+            try:
+                if os.path.exists(_t):
+                    os.remove(_t)
+            except Exception:
+                pass
+
+# ── Blob transfer: one pooled keep-alive session, ranged + resumable GETs (2026-10-18) ──
+# A changed ETag used to cost a full unconditional re-download over a fresh connection, and a reset
+# mid-transfer started the multi-MB HISTORY.CSV over on the next attempt. _blob_get keeps every blob GET
+# on ONE pooled session (_BLOB_SESSION) and asks Azure for byte ranges (Range + x-ms-version):
+#   • by default a full download is ONE request (`bytes=0-`), so the request count stays one conditional
+#     GET per blob; BLOB_RANGE_WORKERS > 1 opts into chunked transfers — the first request is for the
+#     first BLOB_RANGE_CHUNK_BYTES (a small blob is still one request) and a larger blob fetches its
+#     remaining chunks in parallel, each sent If-Match the first response's ETag (a blob that changes
+#     mid-transfer is a 412, never a splice of two versions). That trades ~size/chunk requests per
+#     changed blob for wall time, so it is off unless asked for;
+#   • chunks land in `<key>.part` beside the blob cache, with the ranges done in `<key>.part.json`, so a
+#     retry (the next safe_fetch_csv attempt, or the next cycle) resumes with only the missing ranges;
+#   • an append-only blob (HISTORY.CSV) whose ETag changed asks only for the bytes past the cached length
+#     (less BLOB_TAIL_OVERLAP_BYTES, which must equal the cached tail) and is accepted ONLY when the whole
+#     spliced body matches Azure's whole-blob MD5 — an edited row inside the old prefix (HISTORY does get
+#     edited, see _history_delta_hashes) fails it and falls back to the full download (a second request).
+#     The tail is only tried when the cached entry recorded that MD5: a blob Azure publishes none for
+#     could never pass, so it goes straight to the full download.
+# Same zero-trust rule as the cache: a server without Range support (200), an unparseable Content-Range,
+# a short chunk or a failed MD5 never yields bytes — they fall back to the full download or raise into
+# safe_fetch_csv's retry loop. Each request is governed (blob-host rate) on its own. Kill switch
+# BLOB_RANGED=0: one plain GET per attempt, as before.
+BLOB_RANGED = os.environ.get("BLOB_RANGED", "1") == "1"
+BLOB_RANGE_CHUNK_BYTES = max(64 * 1024, int(os.environ.get("BLOB_RANGE_CHUNK_BYTES", str(2 * 1024 * 1024)) or 0))
+BLOB_RANGE_WORKERS = max(1, min(int(os.environ.get("BLOB_RANGE_WORKERS", "1") or 1), 8))   # >1 = chunked
+BLOB_TAIL_OVERLAP_BYTES = 64 * 1024
+_BLOB_APPEND_ONLY = ("/HISTORY.CSV",)
+_AZURE_API_VERSION = "2020-04-08"   # >= 2016-05-31: a ranged GET carries x-ms-blob-content-md5 (whole blob)
+_BLOB_SESSION = requests.Session()
+_BLOB_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=BLOB_RANGE_WORKERS + 2))
+_CONTENT_RANGE_RE = re.compile(r"bytes (\d+)-(\d+)/(\d+)$")
+
+
+class _BlobResponse:
+    """The status_code / content / headers safe_fetch_csv reads off a Response, for a body assembled
+    from ranges: always a 200 whose Content-Length is the blob's full size."""
+
+    def __init__(self, content, first):
+        self.status_code = 200
+        self.content = content
+        self.headers = {k: first.headers[k] for k in ("ETag", "Last-Modified", "x-ms-blob-content-md5")
+                        if first.headers.get(k)}
+        self.headers["Content-Length"] = str(len(content))
+
+
+class _BlobPartial:
+    """A ranged download in progress: the bytes so far in `<key>.part` (pre-sized), the ranges done in
+    `<key>.part.json` ({"etag", "size", "done": [[start, end), ...]}), written after each chunk's bytes
+    are fsynced. Resumed only for the same ETag and size; anything else (or an unreadable state) starts
+    fresh. In memory when the blob cache is off."""
+
+    def __init__(self, url, etag, size):
+        self.etag, self.size, self.done, self.resumed = etag, size, [], 0
+        self._lock = threading.Lock()
+        self._buf = None
+        self._paths = None
+        if _BLOB_CACHE_ENABLED and etag:
+            stem = _blob_cache_paths(url)[0][:-len(".bin")]
+            self._paths = (stem + ".part", stem + ".part.json")
+            try:
+                with open(self._paths[1], "r") as f:
+                    meta = json.load(f)
+                done = [[int(a), int(b)] for a, b in meta["done"]]
+                if meta["etag"] == etag and meta["size"] == size and os.path.getsize(self._paths[0]) == size \
+                        and all(0 <= a < b <= size for a, b in done):
+                    self.done = done
+                    self.resumed = sum(b - a for a, b in done)
+                    return
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"⚠️ blob partial state unreadable, starting the transfer fresh ({e})")
+            try:
+                os.makedirs(_BLOB_CACHE_DIR, exist_ok=True)
+                self.discard()
+                with open(self._paths[0], "wb") as f:
+                    f.truncate(size)
+                return
+            except OSError as e:
+                print(f"⚠️ blob partial file unavailable, transferring in memory ({e})")
+                self._paths = None
+        self._buf = bytearray(size)
+
+    def missing(self, chunk):
+        """The byte ranges not yet in, as [start, end) pieces of at most `chunk` bytes, in order."""
+        out, pos = [], 0
+        for a, b in sorted(self.done) + [[self.size, self.size]]:
+            for s in range(pos, a, chunk):
+                out.append((s, min(s + chunk, a)))
+            pos = max(pos, b)
+        return out
+
+    def write(self, start, data):
+        with self._lock:
+            if self._paths is None:
+                self._buf[start:start + len(data)] = data
+            else:
+                with open(self._paths[0], "r+b") as f:
+                    f.seek(start)
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+            self.done.append([start, start + len(data)])
+            if self._paths is not None:
+                tmp = self._paths[1] + ".tmp"
+                with open(tmp, "w") as f:
+                    json.dump({"etag": self.etag, "size": self.size, "done": self.done}, f)
+                os.replace(tmp, self._paths[1])
+
+    def read(self):
+        if self._paths is None:
+            return bytes(self._buf)
+        with open(self._paths[0], "rb") as f:
+            return f.read()
+
+    def discard(self):
+        for p in (self._paths or ()):
+            try:
+                os.remove(p)
+            except FileNotFoundError:
+                pass
+
+
+def _blob_request(url, headers, timeout):
+    """One governed GET on the pooled session."""
+    if "Range" in headers:
+        blob_cache_stats["range_requests"] += 1
+    return _LIS_GOVERNOR.governed(url, lambda: _BLOB_SESSION.get(
+        url, timeout=timeout, headers={"x-ms-version": _AZURE_API_VERSION, **headers}))
+
+
+def _content_range(res):
+    """(start, end_exclusive, total) of a 206 whose body is exactly that range, else None."""
+    m = _CONTENT_RANGE_RE.match(str(res.headers.get("Content-Range", "")).strip())
+    if not m:
+        return None
+    a, b, total = int(m.group(1)), int(m.group(2)) + 1, int(m.group(3))
+    return (a, b, total) if a < b <= total and len(res.content) == b - a else None
+
+
+def _blob_md5(res):
+    """The whole blob's MD5 the response carries (x-ms-blob-content-md5 on a ranged GET, Content-MD5 on a
+    plain 200), else None."""
+    return res.headers.get("x-ms-blob-content-md5") or (res.headers.get("Content-MD5") if res.status_code == 200 else None)
+
+
+def _blob_md5_ok(res, body):
+    """True iff the response carries the whole blob's MD5 and `body` matches it."""
+    want = _blob_md5(res)
+    return bool(want) and base64.b64encode(hashlib.md5(body).digest()).decode() == want
+
+
+def _blob_cached_md5(url):
+    """The whole-blob MD5 recorded with the cached entry ("" for none, or an unreadable meta)."""
+    try:
+        with open(_blob_cache_paths(url)[1], "r") as f:
+            meta = json.load(f)
+        return str(meta.get("md5") or "") if isinstance(meta, dict) else ""
+    except Exception:
+        return ""
+
+
+def _blob_first_range():
+    """The first request's Range: the whole blob, unless chunked transfers are opted into."""
+    return f"bytes=0-{BLOB_RANGE_CHUNK_BYTES - 1}" if BLOB_RANGE_WORKERS > 1 else "bytes=0-"
+
+
+def _blob_get_ranged(url, timeout, first=None):
+    """Full ranged download: first chunk (unless given), then the missing chunks in parallel, If-Match
+    its ETag, through a _BlobPartial. Returns the first response untouched when it isn't a usable 206."""
+    if first is None:
+        first = _blob_request(url, {"Range": _blob_first_range()}, timeout)
+    if first.status_code != 206:
+        return first
+    cr, etag = _content_range(first), first.headers.get("ETag")
+    if cr is None or cr[0] != 0 or not etag:
+        return _blob_request(url, {}, timeout)   # a 206 we can't place: one plain GET, as before
+    _, got, total = cr
+    if got == total:
+        return _BlobResponse(first.content, first)
+    part = _BlobPartial(url, etag, total)
+    blob_cache_stats["range_resumed_bytes"] += part.resumed
+    if not any(a == 0 for a, _ in part.done):
+        part.write(0, first.content)
+    todo = part.missing(BLOB_RANGE_CHUNK_BYTES)
+
+    def fetch(rng):
+        s, e = rng
+        res = _blob_request(url, {"Range": f"bytes={s}-{e - 1}", "If-Match": etag}, timeout)
+        if res.status_code == 412:
+            part.discard()
+            blob_cache_stats["range_restart"] += 1
+            raise RuntimeError(f"blob changed mid-transfer (412 on If-Match {etag})")
+        if res.status_code != 206 or _content_range(res) != (s, e, total):
+            raise RuntimeError(f"range {s}-{e - 1}: HTTP {res.status_code} {res.headers.get('Content-Range')}")
+        part.write(s, res.content)
+
+    with ThreadPoolExecutor(max_workers=min(BLOB_RANGE_WORKERS, max(1, len(todo)))) as pool:
+        for fut in [pool.submit(fetch, rng) for rng in todo]:
+            fut.result()
+    body = part.read()
+    part.discard()
+    if len(body) != total or (first.headers.get("x-ms-blob-content-md5") and not _blob_md5_ok(first, body)):
+        raise RuntimeError(f"assembled blob failed verification ({len(body)}/{total} bytes)")
+    return _BlobResponse(body, first)
+
+
+def _blob_get(url, cached_etag=None, cached_body=None, timeout=60):
+    """safe_fetch_csv's transfer: a Response-like 304 / 200 (anything else is returned for its own
+    handling). See the section comment; BLOB_RANGED=0 is one plain GET."""
+    conditional = {"If-None-Match": cached_etag} if cached_etag else {}
+    if not BLOB_RANGED:
+        return _LIS_GOVERNOR.governed(url, lambda: _BLOB_SESSION.get(url, timeout=timeout, headers=conditional))
+    tail = bool(cached_etag and cached_body and url.upper().endswith(_BLOB_APPEND_ONLY))
+    if tail and not _blob_cached_md5(url):
+        blob_cache_stats["tail_skipped"] += 1   # no MD5 to verify a splice against: don't spend the request
+        tail = False
+    if not tail:
+        first = _blob_request(url, {"Range": _blob_first_range(), **conditional}, timeout)
+        return first if first.status_code == 304 else _blob_get_ranged(url, timeout, first)
+    # Append-only blob with a cached copy and its MD5: ask for the tail only (304 when unchanged).
+    start = max(0, len(cached_body) - BLOB_TAIL_OVERLAP_BYTES)
+    res = _blob_request(url, {"Range": f"bytes={start}-", **conditional}, timeout)
+    if res.status_code != 206:
+        # 304 / a server without Range (200) / an error: as before; 416 (shrank): full download
+        return _blob_get_ranged(url, timeout) if res.status_code == 416 else res
+    cr = _content_range(res)
+    if cr is not None and cr[0] == start and cr[1] == cr[2] >= len(cached_body):
+        body = cached_body[:start] + res.content
+        if res.content[:len(cached_body) - start] == cached_body[start:] and _blob_md5_ok(res, body):
+            blob_cache_stats["tail_fetch"] += 1
+            blob_cache_stats["tail_bytes_saved"] += start
+            return _BlobResponse(body, res)
+    blob_cache_stats["tail_rejected"] += 1
+    return _blob_get_ranged(url, timeout)
+
+
 def safe_fetch_csv(url, attempts=3):
     """Fetch a LIS blob CSV (HISTORY.CSV / DOCKET.CSV) with completeness guards.
 
@@ -2757,14 +4910,21 @@ def safe_fetch_csv(url, attempts=3):
     download, so a corrupt/stale cache can never yield bad data — any failure drops the cache
     and falls back to a full unconditional GET. The parsed DataFrame is identical to a fresh
     download; this only cuts upstream bytes, never accuracy. See lis_api_safety.md.
+
+    Parsed-frame snapshot (2026-10-18): every parsed frame is also pickled beside the blob, tagged
+    with its ETag + body SHA-256 + _BLOB_FRAME_SCHEMA; a 304 on a validated cached body returns that
+    snapshot instead of re-running read_csv. Any tag mismatch or snapshot fault → the normal parse.
+
+    Transfer (2026-10-18): _blob_get — pooled session, one whole-blob range (chunked + resumable when
+    BLOB_RANGE_WORKERS > 1), tail-only for an extended HISTORY.CSV (MD5-verified). It hands back the
+    same 304 / 200 shapes, so every guard below applies unchanged to an assembled body.
     """
     last_err = None
     cached_etag, cached_body = _read_blob_cache(url)
     for attempt in range(1, attempts + 1):
         from_cache = False                     # reset per attempt so the except below reflects THIS try
         try:
-            res = requests.get(url, timeout=60,
-                               headers={"If-None-Match": cached_etag} if cached_etag else {})
+            res = _blob_get(url, cached_etag, cached_body, timeout=60)
             # Source-feed freshness: hold the server's Last-Modified as a LOCAL for now (200 OR 304 —
             # a 304 still carries it per RFC 7232). It is committed to _blob_last_modified ONLY after the
             # body passes the completeness + CSV-marker checks below, so a non-CSV / error 200 that
@@ -2814,14 +4974,26 @@ def safe_fetch_csv(url, attempts=3):
             # identifier/text/date columns (no arithmetic; every isna/notna in the worker is on
             # PARSED values — to_datetime("")==NaT just like NaN — never a raw column), so all-string
             # is safe and correct. Verified zero regression: identical RefidClass over 65,367 rows.
+            # Parsed-frame snapshot: a 304 whose cached bytes match the snapshot's tags skips the parse.
+            body_etag = cached_etag if from_cache else res.headers.get("ETag")
+            snapshot = _read_blob_frame(url, body_etag, body) if from_cache else None
+            if snapshot is not None:
+                _blob_served[url] = (body_etag, body)
+                blob_cache_stats["reuse_304"] += 1
+                blob_cache_stats["frame_hit"] += 1
+                print(f"♻️  blob cache HIT — 304, served parsed snapshot ({len(snapshot)} rows, no re-parse): {url}")
+                return snapshot
             df = pd.read_csv(io.StringIO(body.decode('iso-8859-1')), dtype=str, keep_default_na=False)
+            df = df.rename(columns=lambda x: x.strip())
             if from_cache:
                 blob_cache_stats["reuse_304"] += 1
                 print(f"♻️  blob cache HIT — 304, reused {len(body)//1024} KB (no re-download): {url}")
             else:
                 blob_cache_stats["download_200"] += 1
-                _write_blob_cache(url, res.headers.get("ETag"), body)
-            return df.rename(columns=lambda x: x.strip())
+                _write_blob_cache(url, body_etag, body, _blob_md5(res))
+            _write_blob_frame(url, body_etag, body, df)
+            _blob_served[url] = (body_etag, body)
+            return df
         except Exception as e:
             if from_cache:                     # decode/parse blew up on the CACHED body (Gemini #153 r3):
                 cached_etag, cached_body = None, None  # drop it so the retry downloads fresh, not 304-loops
@@ -2830,6 +5002,187 @@ def safe_fetch_csv(url, attempts=3):
     print(f"⚠️ CSV fetch exhausted {attempts} attempts for {url}: {last_err}")
     return pd.DataFrame()
 
+# ── VOTE.CSV index (2026-10-18) ──────────────────────────────────────────────────────────────────────
+# VOTE.CSV is RAGGED (one row per roll call: the vote id, then member/token pairs) and carries NO bill or
+# date — the bill side is HISTORY's refid, which names the roll call (every HISTORY refid in the 231 / 241 /
+# 242 archives resolves to a VOTE.CSV id). The worker used to csv.reader the whole ~4 MB file every cycle.
+# VoteIndex keeps the per-roll-call tallies, persisted beside the blob for its ETag + body SHA-256
+# (<key>.votes.json), so a warm cycle loads them without csv; a new file that EXTENDS the old one
+# byte-for-byte (old body a newline-terminated prefix) parses only the appended rows. attach_history()
+# joins HISTORY onto it: bill → [VoteRecord(date, chamber, tally, outcome)] oldest first. The tally shown
+# is LIS's own published string from the HISTORY action (what bill_tracker's _latest_vote displays), else
+# the roll-call count — the two agree on 99.5% of 241's roll calls (the rest: absent members LIS omits).
+# load_vote_index() is the ONE entry point (conditional fetch + cache + index) for both workers.
+VoteRecord = namedtuple("VoteRecord", "date chamber tally outcome")
+_VOTE_INDEX_SCHEMA = "1"   # bump whenever the tally layout or the row parse changes
+_VOTE_TALLY_RE = re.compile(r'(\d+-Y\s+\d+-N(?:\s+\d+-A\w*)?)', re.IGNORECASE)
+_VOTE_TALLY_PAREN_RE = re.compile(r'\s*\(\s*\d+-Y\s+\d+-N(?:\s+\d+-A\w*)?\s*\)', re.IGNORECASE)
+
+
+def _vote_date_iso(raw):
+    """HISTORY's m/d/yy (or m/d/yyyy) date as YYYY-MM-DD; anything else is kept verbatim."""
+    raw = str(raw or "").strip()
+    for fmt in ("%m/%d/%y", "%m/%d/%Y", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(raw, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            pass
+    return raw
+
+
+class VoteIndex:
+    """VOTE.CSV roll-call tallies (vote id → [Y, N, A, X, has_member_detail]) plus, once
+    attach_history() has run, the per-bill VoteRecord lists. `source` says how this cycle got it:
+    "snapshot" (loaded for an unchanged body), "extended" (tail-parsed) or "parsed" (full parse)."""
+
+    def __init__(self):
+        self.tallies = {}
+        self.etag, self.length, self.sha256 = None, 0, ""
+        self.source = "parsed"
+        self.by_bill = {}
+
+    def _ingest(self, text):
+        for row in csv.reader(io.StringIO(text)):
+            vote_id = row[0].strip() if row else ""
+            if not vote_id:
+                continue
+            tokens = Counter(cell.strip() for cell in row[2::2])
+            self.tallies[vote_id] = [tokens["Y"], tokens["N"], tokens["A"], tokens["X"], int(len(row) > 1)]
+
+    @classmethod
+    def build(cls, body, etag, prior=None):
+        """Index `body`; reuses `prior`'s tallies and parses only the tail when body extends prior's body."""
+        index = cls()
+        index.etag, index.length, index.sha256 = etag, len(body), hashlib.sha256(body).hexdigest()
+        n = prior.length if prior is not None else 0
+        if 0 < n < len(body) and body[n - 1:n] == b"\n" and hashlib.sha256(body[:n]).hexdigest() == prior.sha256:
+            index.tallies = dict(prior.tallies)
+            index._ingest(body[n:].decode("utf-8", "replace"))
+            index.source = "extended"
+        else:
+            index._ingest(body.decode("utf-8", "replace"))
+        return index
+
+    def matches(self, etag, body):
+        return (bool(etag) and self.etag == etag and self.length == len(body)
+                and self.sha256 == hashlib.sha256(body).hexdigest())
+
+    def floor_vote_ids(self):
+        """The all-digit (floor roll-call) ids — the refid classifier's vote-join key set."""
+        return {vote_id for vote_id in self.tallies if vote_id.isdigit()}
+
+    def rollcall_tally(self, vote_id):
+        """LIS-style "Y-Y N-N [A-A]" from the roll call's member tokens; "" with no member detail."""
+        t = self.tallies.get(vote_id)
+        if not t or not t[4]:
+            return ""
+        return f"{t[0]}-Y {t[1]}-N" + (f" {t[2]}-A" if t[2] else "")
+
+    def attach_history(self, rows):
+        """Join HISTORY (bill, date, refid, description) rows whose refid names a roll call."""
+        by_bill = {}
+        for bill, date, refid, desc in rows:
+            refid = str(refid or "").strip().upper()
+            if refid not in self.tallies:
+                continue
+            desc = str(desc or "").strip()
+            m = _VOTE_TALLY_RE.search(desc)
+            tally = " ".join(m.group(1).split()) if m else self.rollcall_tally(refid)
+            outcome = _VOTE_TALLY_PAREN_RE.sub("", re.sub(r"^[HS]\s+", "", desc)).strip()
+            chamber = {"H": "House", "S": "Senate"}.get(refid[:1], "")
+            by_bill.setdefault(bill, []).append(VoteRecord(_vote_date_iso(date), chamber, tally, outcome))
+        for records in by_bill.values():
+            records.sort(key=lambda r: r.date)   # stable: same-day votes keep HISTORY order
+        self.by_bill = by_bill
+        return self
+
+    def votes_for(self, bill):
+        return self.by_bill.get(bill, [])
+
+    def latest(self, bill):
+        records = self.by_bill.get(bill)
+        return records[-1] if records else None
+
+    @classmethod
+    def load(cls, path):
+        """The persisted index, or None on any fault / schema change (→ re-parse)."""
+        if not _BLOB_CACHE_ENABLED:
+            return None
+        try:
+            with open(path, "r") as f:
+                raw = json.load(f)
+            if not isinstance(raw, dict) or raw.get("schema") != _VOTE_INDEX_SCHEMA:
+                return None
+            index = cls()
+            index.etag, index.length, index.sha256 = raw["etag"], int(raw["length"]), str(raw["sha256"])
+            index.tallies = raw["tallies"]
+            if not isinstance(index.tallies, dict) or any(
+                    not isinstance(v, list) or len(v) != 5 for v in index.tallies.values()):
+                return None
+            index.source = "snapshot"
+            return index
+        except Exception:
+            return None
+
+    def persist(self, path):
+        """Best-effort atomic write (tmp + replace); a failure only costs the next cycle a parse."""
+        if not (_BLOB_CACHE_ENABLED and self.etag):
+            return
+        tmp = path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(tmp, "w") as f:
+                json.dump({"schema": _VOTE_INDEX_SCHEMA, "etag": self.etag, "length": self.length,
+                           "sha256": self.sha256, "tallies": self.tallies}, f, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except Exception as _e:
+            print(f"⚠️ vote index write skipped for {path}: {_e}")
+            try:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+            except Exception:
+                pass
+
+
+def _vote_index_path(url):
+    bin_path, _ = _blob_cache_paths(url)
+    return bin_path[:-len(".bin")] + ".votes.json"
+
+
+def load_vote_index(blob_code):
+    """Fetch VOTE.CSV for `blob_code` (conditional, guardrail #1) and return its VoteIndex — loaded for an
+    unchanged body, tail-parsed for an extended one, else fully parsed. Raises on a fetch failure; callers
+    own the alert (the calendar worker's refid vote-join, bill_tracker's latest-vote cross-check)."""
+    url = f"https://lis.blob.core.windows.net/lisfiles/{blob_code}/VOTE.CSV"
+    # LIS-safety guardrail #1: conditional fetch (don't re-download unchanged VOTE.CSV), through the same
+    # _blob_get transfer as HISTORY / DOCKET. A 304 = Azure byte-identity guarantee → reuse cached
+    # bytes; the length-guarded cache + fail-safe full GET keep this accuracy-neutral.
+    etag, cached = _read_blob_cache(url)
+    res = _blob_get(url, etag, cached, timeout=60)
+    if res.status_code == 304 and cached is not None:
+        body = cached
+        blob_cache_stats["reuse_304"] += 1
+        print(f"♻️  blob cache HIT — 304, reused {len(body)//1024} KB (no re-download): {url}")
+    else:
+        # 304 with NO usable cache (race/eviction) hands back an EMPTY body — re-GET UNCONDITIONALLY
+        # first so we never overwrite the cache with empty bytes (Gemini #154 critical).
+        if res.status_code == 304:
+            res = _blob_get(url, timeout=60)
+        if res.status_code != 200:   # 404/500 -> the caller's except, a DISTINCT "fetch failed" alert
+            raise RuntimeError(f"VOTE.CSV returned HTTP {res.status_code}")
+        body, etag = res.content, res.headers.get("ETag")
+        blob_cache_stats["download_200"] += 1
+        _write_blob_cache(url, etag, body, _blob_md5(res))
+    path = _vote_index_path(url)
+    prior = VoteIndex.load(path)
+    if prior is not None and prior.matches(etag, body):
+        return prior
+    index = VoteIndex.build(body, etag, prior)
+    index.persist(path)
+    return index
+
 def generate_date_variants(dt):
     m = str(dt.month); d = str(dt.day); y = str(dt.year)
     m_pad = f"{dt.month:02d}"; d_pad = f"{dt.day:02d}"; y_short = y[-2:]
@@ -2839,6 +5192,7 @@ def generate_date_variants(dt):
         f"{month_full} {d}", f"{month_short} {d}", f"{month_full} {d_pad}", f"{month_short} {d_pad}"
     ]
 
+@_hot_memo(maxsize=1024)
 def _parse_relative_offset_minutes(text):
     """Minutes offset from a relative-time phrase published by LIS:
     "15 minutes after …" → 15, "30 Minutes after …" → 30, "2 hours after …"
@@ -2882,9 +5236,11 @@ def _parse_relative_offset_minutes(text):
 # (leaving those chains at the 23:59 end-of-day sentinel). Trigger word, not an
 # exhaustive phrase list, so no maintenance as LIS varies the offset prose.
 # calendar_chain_ordering §3.1/§8.
+@_hot_memo(maxsize=4096)
 def _is_relative_time_text(text):
     return bool(re.search(r'\b(?:immediately\s+)?(?:upon|after|following)\b|\brecess\b', str(text), re.I))
 
+@_hot_memo(maxsize=4096)
 def parse_24h_time(raw_time, parent_time_24h=None):
     time_val = raw_time.strip().replace('.', '').upper()
     # Relative branch consistent with _is_relative_time_text (Qodo #189): "following …"
@@ -3281,62 +5637,204 @@ def extract_rogue_agenda(url, session, target_date_dt=None, depth=0):
     # non-200, a depth give-up, or any exception returns fetch_ok=False — so an
     # empty list produced by a TRANSIENT failure is never frozen into the agenda
     # cache as a real "0 bills" answer (that would be a silent accuracy loss).
-    if depth > 1: return [], False, False
+    # Network half = _fetch_agenda_source, PDF half = _parse_agenda_pdf (split so
+    # _prefetch_agendas can run them on I/O threads / worker processes).
+    kind, src_url, payload = _fetch_agenda_source(url, session, target_date_dt, depth)
+    if kind == "pdf":
+        return _agenda_pdf_outcome(src_url, _parse_agenda_pdf(payload), target_date_dt)
+    return payload
+
+
+_AGENDA_BILL_RE = re.compile(r'\b([HS][BJR]\s*\d+)')
+
+
+def _fetch_agenda_source(url, session, target_date_dt=None, depth=0):
+    """The network half of extract_rogue_agenda: fetch `url`, following the HTML rogue-nav hop to the
+    target date's agenda (at most one hop). Returns ("pdf", pdf_url, pdf_bytes) for the caller to parse,
+    or ("done", url, (bills, is_corrupt, fetch_ok)) when the answer is already known (HTML page,
+    non-200, depth give-up, exception)."""
+    if depth > 1: return "done", url, ([], False, False)
     found_bills = set()
-    fetch_ok = False
-    regex_pattern = r'\b([HS][BJR]\s*\d+)'
     if url.startswith('/'): url = f"https://lis.virginia.gov{url}"
 
     try:
-        time.sleep(0.25)
-        res = session.get(url, timeout=15)
-        if res.status_code != 200: return [], False, False
+        # paced per host by _LIS_GOVERNOR (in the session adapter); conditional when the PDF is known
+        _conditional = _AGENDA_VALIDATORS.headers(url)
+        res = session.get(url, timeout=15, **({"headers": _conditional} if _conditional else {}))
+        if res.status_code == 304 or (res.status_code == 200 and ('.pdf' in url.lower() or b'%PDF' in res.content[:5])):
+            _unchanged = _AGENDA_VALIDATORS.reuse(url, res, target_date_dt)
+            if _unchanged is not None:
+                return "done", url, (_unchanged, False, True)   # 304 / same body: its recorded parse
+        if res.status_code != 200: return "done", url, ([], False, False)
 
         if '.pdf' in url.lower() or b'%PDF' in res.content[:5]:
-            temp_pdf_path = None
-            try:
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_pdf:
-                    temp_pdf.write(res.content)
-                    temp_pdf_path = temp_pdf.name
-                with pdfplumber.open(temp_pdf_path) as pdf:
-                    for page in pdf.pages:
-                        text = page.extract_text()
-                        if text: found_bills.update([m.upper() for m in re.findall(regex_pattern, text.replace(" ", ""))])
-                fetch_ok = True  # PDF parsed cleanly -> result (incl. empty) is authoritative
-            except Exception as e:
-                print(f"⚠️ Agenda PDF parse failed for {url}: {e}")
-                return [], True, False
-            finally:
-                # delete=False temp file must be cleaned on EVERY path — success,
-                # parse-exception, even the early return above — or it leaks to
-                # disk across PDFs in a run (Gemini #140 r2).
-                if temp_pdf_path and os.path.exists(temp_pdf_path):
-                    os.remove(temp_pdf_path)
+            return "pdf", url, res.content
+        soup = BeautifulSoup(res.text, 'html.parser')
+        target_href = None
+        if target_date_dt:
+            date_matrix = generate_date_variants(target_date_dt)
+            for row in soup.find_all(['tr', 'li', 'div', 'p']): 
+                if any(variant in row.get_text() for variant in date_matrix):
+                    link = row.find('a', string=re.compile(r'Agenda|Docket', re.I)) or row.find('a', href=re.compile(r'\.pdf$', re.I))
+                    if link: target_href = link.get('href'); break
+        if not target_href:
+            agenda_links = soup.find_all('a', href=re.compile(r'\.pdf$', re.I)) or soup.find_all('a', string=re.compile(r'Agenda|Docket', re.I))
+            if agenda_links: target_href = agenda_links[0].get('href')
+                
+        if target_href: return _fetch_agenda_source(urllib.parse.urljoin(url, target_href), session, target_date_dt, depth + 1)
+
+        for script in soup.find_all('script'):
+            if script.string and any(x in script.string for x in ['HB', 'SB', 'HJ', 'SJ']):
+                found_bills.update([m.upper() for m in _AGENDA_BILL_RE.findall(script.string.replace(" ", ""))])
+
+        found_bills.update([m.upper() for m in _AGENDA_BILL_RE.findall(soup.get_text(separator=' ').replace(" ", ""))])
+        return "done", url, (sorted(found_bills), False, True)  # HTML parsed cleanly
+    except Exception as e:
+        print(f"⚠️ Agenda extraction failed for {url}: {e}")
+        # fetch_ok False -> caller won't cache; bills found so far still flow this cycle
+        return "done", url, (sorted(found_bills), False, False)
+
+
+# Agenda-PDF text extraction. The default is pdfplumber's layout-aware extract_text() over every page of a
+# temp file. AGENDA_PDF_EXTRACTOR=stream (opt-in) swaps in _iter_agenda_pdf_bills: pdfminer straight off an
+# in-memory buffer with a char-collecting device (no LTChar objects, no word/layout analysis), rebuilding
+# each page's lines the way extract_text() does (chars clustered by top within 3pt, sorted by x0) so the
+# bill regex sees the same strings; bills are yielded page by page, and a PDF with no text layer at all is
+# answered from its bytes without pdfminer. AGENDA_PDF_PAGE_BUDGET=N (stream only; 0 = read every page)
+# stops after N consecutive pages past the first bill add no new bill number — a recall trade a docket's
+# long boilerplate tail pays for, so it stays off unless set. Recall + timing vs pdfplumber: tools/agenda_sizing/.
+AGENDA_PDF_EXTRACTOR = os.environ.get("AGENDA_PDF_EXTRACTOR", "").strip().lower()   # "" = pdfplumber
+try:
+    AGENDA_PDF_PAGE_BUDGET = max(0, int(os.environ.get("AGENDA_PDF_PAGE_BUDGET", "0") or 0))
+except (ValueError, TypeError):
+    AGENDA_PDF_PAGE_BUDGET = 0  # malformed env var must never crash the worker
+_PDF_LINE_TOLERANCE = 3            # pdfplumber's default y_tolerance for grouping chars into a line
+
+
+def _pdf_lacks_text_layer(content):
+    """True when the bytes are a complete PDF that declares no font anywhere — nothing pdfminer could turn
+    into text (a scanned-image docket). Conservative: a PDF whose objects sit in compressed object streams
+    (where a /Font could hide), or that looks truncated / isn't a PDF, is never skipped."""
+    return (content[:5] == b"%PDF-" and b"%%EOF" in content[-1024:] and b"/Root" in content
+            and b"/Font" not in content and b"/ObjStm" not in content)
+
+
+class _AgendaCharCollector(PDFTextDevice):
+    """Minimal pdfminer device: records (top, x0, text) per rendered char — the only facts the bill scan
+    needs — instead of building LTChar layout objects. Geometry matches LTChar's bbox."""
+
+    def __init__(self, rsrcmgr):
+        super().__init__(rsrcmgr)
+        self.chars = []
+
+    def render_char(self, matrix, font, fontsize, scaling, rise, cid, ncs, graphicstate):
+        try:
+            text = font.to_unichr(cid)
+        except PDFUnicodeNotDefined:
+            text = "(cid:%d)" % cid
+        adv = font.char_width(cid) * fontsize * scaling
+        if font.is_vertical():
+            y_top = apply_matrix_pt(matrix, (0, rise))[1]
+            x0 = apply_matrix_pt(matrix, (-fontsize / 2, 0))[0]
         else:
-            soup = BeautifulSoup(res.text, 'html.parser')
-            target_href = None
-            if target_date_dt:
-                date_matrix = generate_date_variants(target_date_dt)
-                for row in soup.find_all(['tr', 'li', 'div', 'p']): 
-                    if any(variant in row.get_text() for variant in date_matrix):
-                        link = row.find('a', string=re.compile(r'Agenda|Docket', re.I)) or row.find('a', href=re.compile(r'\.pdf$', re.I))
-                        if link: target_href = link.get('href'); break
-            if not target_href:
-                agenda_links = soup.find_all('a', href=re.compile(r'\.pdf$', re.I)) or soup.find_all('a', string=re.compile(r'Agenda|Docket', re.I))
-                if agenda_links: target_href = agenda_links[0].get('href')
-                    
-            if target_href: return extract_rogue_agenda(urllib.parse.urljoin(url, target_href), session, target_date_dt, depth + 1)
+            descent = font.get_descent() * fontsize
+            (ax, ay) = apply_matrix_pt(matrix, (0, descent + rise))
+            (bx, by) = apply_matrix_pt(matrix, (adv, descent + rise + fontsize))
+            x0, y_top = min(ax, bx), max(ay, by)
+        self.chars.append((-y_top, x0, text))
+        return adv
+
+
+# render_char overrides a pdfminer internal (pinned: pdfminer.six==20231228 via pdfplumber==0.11.0). If an
+# upgrade changes its parameters, every call would raise and mark each agenda PDF corrupt — so stream mode
+# is used only while the base signature matches ours, else it falls back to pdfplumber (counted as
+# agenda_stream_fallback).
+_AGENDA_STREAM_SUPPORTED = (list(inspect.signature(PDFTextDevice.render_char).parameters)
+                            == list(inspect.signature(_AgendaCharCollector.render_char).parameters))
+
+
+def _agenda_page_text(chars):
+    """One page's chars -> its text as pdfplumber's extract_text() lays it out (spaces are dropped by the
+    bill scan anyway): lines clustered by top within _PDF_LINE_TOLERANCE, chars left to right."""
+    lines, line, last_top = [], [], None
+    for top, x0, text in sorted(chars, key=lambda c: c[0]):
+        if last_top is not None and top - last_top > _PDF_LINE_TOLERANCE:
+            lines.append(line)
+            line = []
+        line.append((x0, text))
+        last_top = top
+    if line:
+        lines.append(line)
+    return "\n".join("".join(t for _, t in sorted(ln, key=lambda c: c[0])) for ln in lines)
+
+
+def _iter_agenda_pdf_bills(content, page_budget=0):
+    """Yield (page_number, new_bills) page by page from agenda-PDF bytes, new_bills being the bill numbers
+    not seen on an earlier page. Once a bill has been seen, stops after page_budget consecutive pages yield
+    nothing new (0 = never) — cover pages before the docket don't count. Raises whatever pdfminer raises on
+    a malformed PDF."""
+    if _pdf_lacks_text_layer(content):
+        return
+    rsrcmgr = PDFResourceManager(caching=True)
+    device = _AgendaCharCollector(rsrcmgr)
+    interpreter = PDFPageInterpreter(rsrcmgr, device)
+    seen, dry = set(), 0
+    for page_number, page in enumerate(PDFPage.create_pages(PDFDocument(PDFParser(io.BytesIO(content)))), 1):
+        device.chars = []
+        interpreter.process_page(page)
+        text = _agenda_page_text(device.chars)
+        new = {m.upper() for m in _AGENDA_BILL_RE.findall(text.replace(" ", ""))} - seen
+        seen |= new
+        yield page_number, sorted(new)
+        dry = 0 if new else dry + 1
+        if page_budget and seen and dry >= page_budget:
+            return
+
+
+def _parse_agenda_pdf(content):
+    """Agenda-PDF bytes -> (sorted bills, None), or ([], error_text) when the PDF can't be parsed. Pure
+    CPU, no network and no printing, so it can run in a forked worker process (_prefetch_agendas)."""
+    if AGENDA_PDF_EXTRACTOR == "stream" and _AGENDA_STREAM_SUPPORTED:
+        try:
+            return sorted(b for _, new in _iter_agenda_pdf_bills(content, AGENDA_PDF_PAGE_BUDGET) for b in new), None
+        except Exception as e:
+            return [], str(e)
+    return _parse_agenda_pdf_plumber(content)
 
-            for script in soup.find_all('script'):
-                if script.string and any(x in script.string for x in ['HB', 'SB', 'HJ', 'SJ']):
-                    found_bills.update([m.upper() for m in re.findall(regex_pattern, script.string.replace(" ", ""))])
 
-            found_bills.update([m.upper() for m in re.findall(regex_pattern, soup.get_text(separator=' ').replace(" ", ""))])
-            fetch_ok = True  # HTML parsed cleanly
+def _parse_agenda_pdf_plumber(content):
+    """_parse_agenda_pdf's default: pdfplumber extract_text() over every page of a temp file."""
+    found_bills = set()
+    temp_pdf_path = None
+    try:
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_pdf:
+            temp_pdf.write(content)
+            temp_pdf_path = temp_pdf.name
+        with pdfplumber.open(temp_pdf_path) as pdf:
+            for page in pdf.pages:
+                text = page.extract_text()
+                if text: found_bills.update([m.upper() for m in _AGENDA_BILL_RE.findall(text.replace(" ", ""))])
     except Exception as e:
-        print(f"⚠️ Agenda extraction failed for {url}: {e}")
-        # fetch_ok stays False -> caller won't cache; bills found so far still flow this cycle
-    return sorted(list(found_bills)), False, fetch_ok
+        return [], str(e)
+    finally:
+        # delete=False temp file must be cleaned on EVERY path — success,
+        # parse-exception, even the early return above — or it leaks to
+        # disk across PDFs in a run (Gemini #140 r2).
+        if temp_pdf_path and os.path.exists(temp_pdf_path):
+            os.remove(temp_pdf_path)
+    return sorted(found_bills), None
+
+
+def _agenda_pdf_outcome(url, parsed, target_date_dt=None):
+    """_parse_agenda_pdf's (bills, error) -> extract_rogue_agenda's (bills, is_corrupt, fetch_ok); a clean
+    parse is recorded against the validators of the body fetched for this meeting (_AGENDA_VALIDATORS)."""
+    bills, err = parsed
+    if err is not None:
+        _AGENDA_VALIDATORS.discard(url, target_date_dt)
+        print(f"⚠️ Agenda PDF parse failed for {url}: {err}")
+        return [], True, False
+    _AGENDA_VALIDATORS.record(url, bills, target_date_dt)
+    return bills, False, True  # PDF parsed cleanly -> result (incl. empty) is authoritative
 
 
 # ── Meeting + agenda link extraction (docs/ideas/meeting_agenda_links) ─────────────────────────────
@@ -3529,6 +6027,244 @@ def _persist_agenda_cache(sheet, ws, cache, dirty, load_ok):
         print(f"⚠️ Agenda_Cache persist failed ({e}); affected agendas re-parse next cycle (no data loss).")
 
 
+# ── Agenda validators: conditional GET for agendas Agenda_Cache can't serve ──
+# Agenda_Cache only answers SETTLED meetings; every recent/future agenda — in-season, the set that runs every
+# 15 minutes — was re-downloaded and re-parsed each cycle although most PDFs never change between cycles.
+# Per agenda-PDF URL we keep the server's ETag / Last-Modified, a SHA-256 of the body and the bills parsed
+# from it, and send If-None-Match / If-Modified-Since (guardrail #1's pattern for blobs). A 304, or a 200
+# whose body hashes identical, reuses the parsed bills without pdfplumber; a changed body always re-parses,
+# and only a clean parse is recorded. Stored as JSON next to the blob cache (restored by the Actions cache;
+# LIS_BLOB_CACHE=0 disables both) rather than in the Agenda_Cache tab: unsettled entries churn every cycle
+# in-season, and the tab's rows are served WITHOUT a request, which an unsettled answer must never be. Any
+# store fault reads as empty -> a full GET + parse, never a wrong answer.
+AGENDA_VALIDATOR_PATH = os.path.join(_BLOB_CACHE_DIR, "agenda_validators.json")
+AGENDA_VALIDATOR_RETENTION_DAYS = 14   # unused this long -> dropped (a meeting settles into Agenda_Cache in 2)
+
+
+class _AgendaValidators:
+    """Thread-safe url -> {etag, last_modified, sha256, length, bills, seen} store (the prefetch threads
+    share it). A body awaiting its parse is held in _pending until record() / discard(), keyed by
+    (url, meeting date): two prefetches of one agenda URL for different meetings overlap, and each must
+    record the validators of the body IT parsed."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries, self._pending, self._dirty = {}, {}, False
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.stats = {"not_modified": 0, "same_body": 0, "parsed": 0, "bytes_saved": 0}
+
+    def headers(self, url):
+        """Conditional-request headers for url ({} when it has no entry)."""
+        with self._lock:
+            e = self._entries.get(url)
+        out = {}
+        if e and e.get("etag"):
+            out["If-None-Match"] = e["etag"]
+        if e and e.get("last_modified"):
+            out["If-Modified-Since"] = e["last_modified"]
+        return out
+
+    def reuse(self, url, res, meeting=None):
+        """url's recorded bills when `res` proves its body unchanged (304, or a 200 with the same SHA-256),
+        else None — the new body's validators are then held under (url, meeting) until its parse lands."""
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        hdrs = getattr(res, "headers", None) or {}
+        with self._lock:
+            e = self._entries.get(url)
+            if res.status_code == 304:
+                if e is None:
+                    return None
+                e["seen"], self._dirty = today, True
+                self.stats["not_modified"] += 1
+                self.stats["bytes_saved"] += int(e.get("length") or 0)
+                return list(e["bills"])
+            sha = hashlib.sha256(res.content).hexdigest()
+            if e is not None and e.get("sha256") == sha:
+                e.update(etag=hdrs.get("ETag") or e.get("etag"),
+                         last_modified=hdrs.get("Last-Modified") or e.get("last_modified"), seen=today)
+                self._dirty = True
+                self.stats["same_body"] += 1
+                return list(e["bills"])
+            self._pending[(url, meeting)] = {"etag": hdrs.get("ETag"), "last_modified": hdrs.get("Last-Modified"),
+                                  "sha256": sha, "length": len(res.content), "seen": today}
+            return None
+
+    def record(self, url, bills, meeting=None):
+        """A clean parse of url's pending body: store its bills under the body's validators."""
+        with self._lock:
+            entry = self._pending.pop((url, meeting), None)
+            if entry is not None:
+                entry["bills"] = list(bills)
+                self._entries[url] = entry
+                self._dirty = True
+                self.stats["parsed"] += 1
+
+    def discard(self, url, meeting=None):
+        with self._lock:
+            self._pending.pop((url, meeting), None)
+
+    def load(self, path, now):
+        """Replace the store with `path`'s entries, dropping those unused past the retention horizon.
+        Never raises: a missing / unreadable / malformed file loads empty."""
+        horizon = (now - timedelta(days=AGENDA_VALIDATOR_RETENTION_DAYS)).strftime("%Y-%m-%d")
+        entries, dropped = {}, False
+        if _BLOB_CACHE_ENABLED:
+            try:
+                with open(path, "r") as f:
+                    raw = json.load(f)
+                for url, e in (raw.items() if isinstance(raw, dict) else ()):
+                    if (isinstance(e, dict) and isinstance(e.get("bills"), list) and e.get("sha256")
+                            and str(e.get("seen") or "") >= horizon):
+                        entries[url] = e
+                    else:
+                        dropped = True   # aged out / malformed -> rewrite the trimmed store on persist
+            except FileNotFoundError:
+                pass
+            except Exception as ex:
+                print(f"⚠️ agenda validator store unreadable ({ex}); every agenda parses fresh this cycle.")
+        with self._lock:
+            self._entries, self._pending, self._dirty = entries, {}, dropped
+        self.reset_stats()
+
+    def persist(self, path):
+        """Atomically rewrite `path` when the store changed. Best-effort: a failure only costs re-parses."""
+        with self._lock:
+            if not (_BLOB_CACHE_ENABLED and self._dirty):
+                return
+            snapshot = json.dumps(self._entries, sort_keys=True)
+        tmp = path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(tmp, "w") as f:
+                f.write(snapshot)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+            with self._lock:
+                self._dirty = False
+        except Exception as ex:
+            print(f"⚠️ agenda validator store write skipped ({ex}); those agendas re-parse next cycle.")
+            try:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+            except Exception:
+                pass
+
+    def metrics(self):
+        """Per-cycle SYSTEM_METRICS ints: 304s, identical-body hits, fresh parses, hit %, bytes not downloaded."""
+        st = dict(self.stats)
+        hits = st["not_modified"] + st["same_body"]
+        return {"agenda_validator_304": st["not_modified"], "agenda_validator_same_body": st["same_body"],
+                "agenda_validator_parsed": st["parsed"],
+                "agenda_validator_hit_pct": round(100 * hits / (hits + st["parsed"])) if hits + st["parsed"] else 0,
+                "agenda_validator_bytes_saved": st["bytes_saved"]}
+
+
+_AGENDA_VALIDATORS = _AgendaValidators()
+
+
+# ── Agenda prefetch (opt-in, AGENDA_FETCH_WORKERS / AGENDA_PARSE_WORKERS) ──
+# The schedule loop used to fetch + PDF-parse each meeting's agenda inline, one at a time — network RTT
+# and pdfminer CPU in series, and every in-window agenda of the cycle behind them. Phase 1
+# (_agenda_prefetch_plan) walks the same schedule through the loop's own gates and lists every agenda
+# that loop would actually fetch; phase 2 (_prefetch_agendas) fetches them on a bounded thread pool (paced
+# per host by _LIS_GOVERNOR, counted toward LIS_REQUEST_CAP by the session adapter) and parses the PDFs
+# in a forked process pool. The loop then reads the results by (url, meeting date) in its own order, so
+# combined_bills / docket_memory / _append_event see exactly what the inline path produced, and the
+# Agenda_Cache contract (cache only a fetch_ok read of a settled meeting) is untouched. A plan or
+# prefetch failure just leaves the loop on the inline path (tools/verification/test_agenda_prefetch.py).
+AGENDA_FETCH_MAX_WORKERS = 8       # <= the adapter's default connection pool (10), like LegEvent hydration
+_CHAMBER_EVENT_OWNER_TOKENS = ("caucus", "session", "floor", "convenes", "adjourned")
+
+
+def _agenda_worker_count(raw, cap):
+    """AGENDA_FETCH_WORKERS / AGENDA_PARSE_WORKERS -> worker count: "" / "0" / "1" / junk = serial,
+    "auto" = one per core, capped at `cap`."""
+    raw = (raw or "").strip().lower()
+    if raw == "auto":
+        return min(os.cpu_count() or 1, cap)
+    try:
+        return min(max(int(raw), 1), cap)
+    except ValueError:
+        return 1
+
+
+def _agenda_is_settled(meeting_date, now):
+    """A meeting older than AGENDA_CACHE_SETTLE_DAYS has an immutable docket -> cacheable."""
+    return meeting_date.date() < (now.date() - timedelta(days=AGENDA_CACHE_SETTLE_DAYS))
+
+
+def _agenda_prefetch_plan(schedules, window_start, window_end, agenda_parse_cache, now):
+    """Phase 1: the (agenda_url, meeting_date) pairs the schedule loop would pass to extract_rogue_agenda,
+    in loop order, each once. Mirrors the loop's gates (date window, chamber-event skip, cancelled,
+    fetch target) and its cache: a settled URL already in agenda_parse_cache is skipped, and a settled
+    URL is planned only for its first meeting (a later one is a cache hit once that read succeeds)."""
+    plan, seen, settled_urls = [], set(), set()
+    for meeting in schedules:
+        meeting_date = pd.to_datetime(meeting.get('ScheduleDate', '1970-01-01'), errors='coerce')
+        if not (pd.notna(meeting_date) and window_start <= meeting_date <= window_end):
+            continue
+        owner_lower = re.sub(r'\s+', ' ', str(meeting.get('OwnerName', '')).strip()).lower()
+        if any(k in owner_lower for k in _CHAMBER_EVENT_OWNER_TOKENS):
+            continue
+        agenda_url = _agenda_fetch_target(str(meeting.get('Description', ''))) or None
+        if not agenda_url or meeting.get('IsCancelled', False):
+            continue
+        if _agenda_is_settled(meeting_date, now):
+            if agenda_url in agenda_parse_cache or agenda_url in settled_urls:
+                continue
+            settled_urls.add(agenda_url)
+        key = (agenda_url, meeting_date)
+        if key not in seen:
+            seen.add(key)
+            plan.append(key)
+    return plan
+
+
+def _prefetch_agendas(plan, session, fetch_workers, parse_workers):
+    """Phase 2: run extract_rogue_agenda for every planned (url, meeting_date) concurrently. Returns
+    {(url, meeting_date): (bills, is_corrupt, fetch_ok)} — each value exactly what the inline call
+    returns. PDFs parse in a fork-based process pool of parse_workers (inline on the fetch thread when
+    <= 1 or when the pool can't start). The pool is forked BEFORE the fetch threads exist. Raises
+    LisRequestCapExceeded like the inline path; the remaining fetches are then dropped."""
+    if not plan:
+        return {}
+    pool = None
+    if parse_workers > 1:
+        try:
+            pool = ProcessPoolExecutor(max_workers=parse_workers, mp_context=multiprocessing.get_context("fork"))
+            pool.submit(int).result()   # fork every worker now, while this process is single-I/O-threaded
+        except Exception as e:
+            print(f"⚠️ Agenda parse pool unavailable ({e}); parsing agenda PDFs inline.")
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+            pool = None
+    aborted = threading.Event()
+
+    def _job(key):
+        if aborted.is_set():
+            return None
+        try:
+            kind, src_url, payload = _fetch_agenda_source(key[0], session, key[1])
+            if kind != "pdf":
+                return payload
+            return _agenda_pdf_outcome(src_url, pool.submit(_parse_agenda_pdf, payload).result()
+                                       if pool is not None else _parse_agenda_pdf(payload), key[1])
+        except BaseException:
+            aborted.set()
+            raise
+
+    io_pool = ThreadPoolExecutor(max_workers=max(1, min(fetch_workers, len(plan))))
+    try:
+        return dict(zip(plan, io_pool.map(_job, plan)))
+    finally:
+        io_pool.shutdown(wait=True, cancel_futures=True)
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
 def _is_non_concrete_time(value):
     """Check if a time value is a non-concrete placeholder (TBA, empty, etc.)."""
     t = str(value or "").strip().lower()
@@ -3801,6 +6537,168 @@ def _autoshard_witness_if_full(sheet, tab_name, threshold_cells=WITNESS_SHARD_TH
     return "ops", True, reclaimed                        # next cycle reads "absent from Live, present in Ops"
 
 
+# ── STM per-path cost attribution (STM_COST_PROFILE) ──
+# _phase() times the STM as one block. StmCostProfiler splits it: the STM marks the end of each resolution
+# stage it passes through (lap) and the profiler charges the perf_counter time since the previous mark to
+# that stage, so every row's time lands in exactly one stage bucket and the buckets sum to the loop. Each
+# row's total is also charged to its final Origin and its bill. Stages: committee resolution (+ the
+# per-row setup before it), docket reconciliation, Schedule match (incl. its TBA context recovery),
+# convene anchor, floor-miss handling, LegEvent route match, EventType admin recovery
+# (recover_admin_route), LegEvent cache-direct time, live LegEvent API resolver, anchor ladder
+# (_recover_time_via_legevent_committee), route/refid telemetry and the emit. Bills are sampled 1 in
+# STM_COST_SAMPLE_EVERY (default 4) by a stable CRC32 — whole bills, so their totals are complete and the
+# same bills are timed every cycle; an unsampled row pays one attribute test per mark (timing every row
+# costs ~10% of the bare loop; 1 in 4 is within run-to-run noise). Folded into SYSTEM_METRICS (-> Metrics_History) as stm_cost_*; the
+# slowest-bills list is over the sampled bills.
+STM_COST_PROFILE = os.environ.get("STM_COST_PROFILE", "1") == "1"
+STM_COST_SAMPLE_EVERY = max(1, int(os.environ.get("STM_COST_SAMPLE_EVERY", "4") or 1))
+STM_COST_TOP_N = max(0, int(os.environ.get("STM_COST_TOP_N", "10") or 0))
+
+
+class StmCostProfiler:
+    """Per-stage / per-Origin / per-bill wall time of one or more STM runs. The STM calls begin(bill)
+    at the top of every row, lap(stage) at the end of each stage, end(origin) after the row's event is
+    emitted; a row dropped before emitting (noise / malformed) is closed by the next begin / close(),
+    its remaining time charged to stage and origin "dropped"."""
+
+    def __init__(self, sample_every=1):
+        self.sample_every = max(1, int(sample_every))
+        self.stage_s, self.stage_n = defaultdict(float), defaultdict(int)
+        self.origin_s, self.origin_n = defaultdict(float), defaultdict(int)
+        self.bill_s = defaultdict(float)
+        self.rows = 0
+        self.on = False
+        self._bill, self._t0, self._t = None, 0.0, 0.0
+
+    def begin(self, bill):
+        if self.on:
+            self.end("dropped", "dropped")
+        self.on = self.sample_every == 1 or zlib.crc32(str(bill).encode()) % self.sample_every == 0
+        if self.on:
+            self._bill = bill
+            self._t0 = self._t = time.perf_counter()
+
+    def lap(self, stage):
+        if self.on:
+            now = time.perf_counter()
+            self.stage_s[stage] += now - self._t
+            self.stage_n[stage] += 1
+            self._t = now
+
+    def end(self, origin, stage="emit"):
+        if self.on:
+            self.lap(stage)
+            total = self._t - self._t0
+            self.origin_s[origin] += total
+            self.origin_n[origin] += 1
+            self.bill_s[self._bill] += total
+            self.rows += 1
+            self.on = False
+
+    def close(self):
+        if self.on:
+            self.end("dropped", "dropped")
+
+    def merge(self, other):
+        """Fold another profiler's totals in (the sharded STM: one profiler per bill-disjoint shard)."""
+        for mine, theirs in ((self.stage_s, other.stage_s), (self.stage_n, other.stage_n),
+                             (self.origin_s, other.origin_s), (self.origin_n, other.origin_n),
+                             (self.bill_s, other.bill_s)):
+            for k, v in theirs.items():
+                mine[k] += v
+        self.rows += other.rows
+
+    def slowest_bills(self, n):
+        return heapq.nlargest(n, self.bill_s.items(), key=lambda kv: kv[1])
+
+    def metrics(self):
+        """SYSTEM_METRICS numbers: stm_cost_ms_<stage> / stm_cost_n_<stage>, stm_cost_origin_ms_<origin> /
+        stm_cost_origin_n_<origin>, the sampled row count and rate (labels() has the slowest bills)."""
+        out = {"stm_cost_sample_every": self.sample_every, "stm_cost_rows": self.rows}
+        for stage in sorted(self.stage_s):
+            out[f"stm_cost_ms_{stage}"] = round(self.stage_s[stage] * 1000, 1)
+            out[f"stm_cost_n_{stage}"] = self.stage_n[stage]
+        for origin in sorted(self.origin_s):
+            out[f"stm_cost_origin_ms_{origin}"] = round(self.origin_s[origin] * 1000, 1)
+            out[f"stm_cost_origin_n_{origin}"] = self.origin_n[origin]
+        return out
+
+    def labels(self, top_n=STM_COST_TOP_N):
+        """SYSTEM_METRICS labels: the slowest bills as "BILL=ms,..." (ms = wall time across all of the
+        bill's rows)."""
+        return {"stm_cost_slowest_bills": ",".join(f"{b}={s * 1000:.1f}" for b, s in self.slowest_bills(top_n))}
+
+
+def _stm_cost_noop(_stage):
+    """lap/end stand-in when no StmCostProfiler is attached."""
+
+
+# ── STM columnar pre-pass (speed audit: the 60k-row loop was ~181s of a warm cycle) ──
+# Every flag below is a pure function of ONE row's own text/bill/date — none reads bill_locations /
+# last_seen_date — so they are computed ONCE per cycle as vectorized pandas string ops instead of
+# ~20 `any(x in outcome_lower ...)` scans per row inside iterrows. The loop then only carries the
+# genuinely stateful logic. Each mask is the exact substring semantics of the per-row expression it
+# replaced (one re.escape'd alternation = "any needle occurs"), so STM output is byte-identical —
+# proven by _stm_outputs_equivalent in tools/verification/test_stm_preclassify.py.
+_STM_EXEC_PHRASES = ("approved by governor", "vetoed by governor", "governor's substitute",
+                     "governor's recommendation", "governor:")
+
+
+def _contains_any(series, needles):
+    """Vectorized `any(n in s for n in needles)` over a str Series (literal, case-sensitive)."""
+    needles = [n for n in needles if n]
+    if not needles:
+        return pd.Series(False, index=series.index)
+    return series.str.contains("|".join(re.escape(n) for n in needles), regex=True)
+
+
+def _stm_preclassify(df_past, desc_col, refid_col):
+    """Row-independent STM inputs as one frame (same index/order as df_past), iterated with
+    itertuples by run_sequential_turing_machine. Columns mirror the loop's former locals."""
+    text = df_past[desc_col].astype(str).str.strip()
+    lower = text.str.lower()
+    bill = df_past["CleanBill"]
+    has_h, has_s = text.str.startswith("H "), text.str.startswith("S ")
+    has_hs = has_h | has_s
+    # PR-C5.1 malformed-row guard: empty after the chamber prefix (or a bare post-strip "H"/"S").
+    malformed = (has_hs & (text.str.slice(2).str.strip() == "")) | text.isin(("H", "S")) | (text == "")
+    bill_h = bill.astype(str).str.startswith("H")
+    chamber = pd.Series("Senate ", index=df_past.index).mask(has_h | (~has_s & bill_h), "House ")
+    joint = lower.str.contains("joint", regex=False) | (
+        lower.str.contains("house", regex=False) & lower.str.contains("senate", regex=False))
+    is_absolute_floor = _contains_any(lower, ABSOLUTE_FLOOR_VERBS)
+    reported_or_discharged = _contains_any(lower, ["reported", "discharged"])
+    is_report = reported_or_discharged & ~_contains_any(lower, ["fail", "defeat"])
+    has_fail = lower.str.contains("fail", regex=False)
+    if refid_col and refid_col in df_past.columns:
+        refid = df_past[refid_col]
+    else:
+        refid = pd.Series("", index=df_past.index)
+    return pd.DataFrame({
+        "bill": bill,
+        "text": text,
+        "lower": lower,
+        "date": df_past["ParsedDate"].dt.strftime("%Y-%m-%d"),
+        "refid": refid,
+        "malformed": malformed,
+        "chamber": chamber,
+        "search_prefix": chamber.mask(joint, "Joint "),
+        "is_exec": _contains_any(lower, _STM_EXEC_PHRASES) & ~has_hs,
+        "is_absolute_floor": is_absolute_floor,
+        "is_conf": _contains_any(lower, ["conferee", "conference report"]) & ~is_absolute_floor,
+        "is_referral": _contains_any(lower, ["referred", "assigned"]) & ~_contains_any(lower, ["fail", "defeat", "strike"]),
+        "has_from": lower.str.contains("from", regex=False),
+        "is_report": is_report,
+        "is_rerefer": is_report & (lower.str.contains("rereferred", regex=False) | (
+            lower.str.contains("referred", regex=False) & lower.str.contains("reported", regex=False))),
+        "is_timing_lag": lower.str.contains("placed on", regex=False) & lower.str.contains("agenda", regex=False),
+        "is_dynamic_verb": _contains_any(lower, DYNAMIC_VERBS),
+        "nameless_report": reported_or_discharged & ~has_fail,
+        "is_known_noise": _contains_any(lower, KNOWN_NOISE_PATTERNS),
+        "is_known_event": _contains_any(lower, KNOWN_EVENT_PATTERNS),
+    }, index=df_past.index)
+
+
 def run_sequential_turing_machine(df_past, *,
         bill_locations,
         last_seen_date,
@@ -3827,8 +6725,20 @@ def run_sequential_turing_machine(df_past, *,
         _normalize_refid,
         http_session,
         _floor_hit,
-        _floor_miss):
-    for _, row in df_past.iterrows():
+        _floor_miss,
+        schedule_index=None,
+        legevent_index=None,
+        dependency_recorder=None,
+        cost_profiler=None):
+    if df_past.empty:
+        return _floor_hit, _floor_miss
+    if schedule_index is None:   # the cycle passes its own; a standalone call builds one
+        schedule_index = ScheduleIndex(api_schedule_map)
+    if legevent_index is None:
+        legevent_index = LegEventIndex()
+    # Per-stage cost attribution (StmCostProfiler); a no-op mark when no profiler is attached.
+    _cost_lap = cost_profiler.lap if cost_profiler is not None else _stm_cost_noop
+    for row in _stm_preclassify(df_past, desc_col, refid_col).itertuples(index=False):
         source_miss_counts["total_processed"] += 1
         # Tracks whether committee was resolved via Memory Anchor fallback
         # (rather than refid or lexicon). Drives the orthogonal
@@ -3839,10 +6749,14 @@ def run_sequential_turing_machine(df_past, *,
         # so X-Ray §9 can show *why* the miss happened without hand-
         # chasing through worker logs. Empty string for sourced rows.
         diagnostic_hint = ""
-        bill_num = row['CleanBill']
-        outcome_text = str(row[desc_col]).strip()
-        outcome_lower = outcome_text.lower()
-        date_str = row['ParsedDate'].strftime('%Y-%m-%d')
+        bill_num = row.bill
+        outcome_text = row.text
+        outcome_lower = row.lower
+        date_str = row.date
+        if dependency_recorder is not None:   # incremental engine: attribute this row's shared-input reads
+            dependency_recorder.begin(bill_num)
+        if cost_profiler is not None:
+            cost_profiler.begin(bill_num)
 
         # PR-C5.1: Malformed-row guard. HISTORY.CSV occasionally contains
         # rows whose History_description is just the chamber prefix ("S "
@@ -3868,12 +6782,8 @@ def run_sequential_turing_machine(df_past, *,
         # startswith("H ") with the trailing space then returns False
         # and the malformed row would NOT be dropped. The elif branch
         # catches the post-strip bare-prefix case explicitly.
-        _outcome_remainder = outcome_text
-        if _outcome_remainder.startswith(('H ', 'S ')):
-            _outcome_remainder = _outcome_remainder[2:].strip()
-        elif _outcome_remainder in ('H', 'S'):
-            _outcome_remainder = ""
-        if not _outcome_remainder:
+        # (The strip / bare-prefix test itself is vectorized in _stm_preclassify -> row.malformed.)
+        if row.malformed:
             # A blank upstream row (LIS published a HISTORY row with no action text, just the chamber
             # prefix). We refuse to fabricate an action from it — but this is a routine UPSTREAM defect, so
             # count it and let the caller emit ONE benign summary post-loop, instead of N per-row WARNs that
@@ -3883,9 +6793,7 @@ def run_sequential_turing_machine(df_past, *,
             source_miss_counts["dropped_noise"] += 1
             continue
 
-        if outcome_text.startswith('H '): acting_chamber_prefix = "House "
-        elif outcome_text.startswith('S '): acting_chamber_prefix = "Senate "
-        else: acting_chamber_prefix = "House " if bill_num.startswith('H') else "Senate "
+        acting_chamber_prefix = row.chamber   # "H "/"S " text prefix, else the bill letter
 
         if bill_num not in bill_locations: bill_locations[bill_num] = acting_chamber_prefix + "Floor"
 
@@ -3898,13 +6806,14 @@ def run_sequential_turing_machine(df_past, *,
                     if acting_chamber_prefix.lower() in room.lower() or "joint" in room.lower():
                         bill_locations[bill_num] = room # Proactive Docket Heal
                         break
+                _cost_lap("docket_fallback")
 
         # --- ACTION SCOPE: ABSOLUTES ---
-        is_exec = any(ev in outcome_lower for ev in ["approved by governor", "vetoed by governor", "governor's substitute", "governor's recommendation", "governor:"]) and not (outcome_text.startswith('H ') or outcome_text.startswith('S '))
-        is_absolute_floor = any(f in outcome_lower for f in ABSOLUTE_FLOOR_VERBS)
+        is_exec = row.is_exec                        # exec phrase AND no "H "/"S " prefix
+        is_absolute_floor = row.is_absolute_floor
         # "conferee" alone (appointing names) = administrative, no time needed.
         # "conference report agreed" = floor vote, caught by is_absolute_floor above.
-        is_conf = ("conferee" in outcome_lower or "conference report" in outcome_lower) and not is_absolute_floor
+        is_conf = row.is_conf
 
         if is_exec:
             event_location = "Executive Action"
@@ -3917,24 +6826,24 @@ def run_sequential_turing_machine(df_past, *,
             bill_locations[bill_num] = "Conference Committee"
         else:
             # --- ACTION SCOPE: DYNAMIC & EXPLICIT ROOM MATCH ---
-            committee_search_prefix = "Joint " if "joint" in outcome_lower or ("house" in outcome_lower and "senate" in outcome_lower) else acting_chamber_prefix
+            committee_search_prefix = row.search_prefix   # "Joint " on joint/bicameral text, else the chamber
 
             # PHASE 1: Structural resolution via History_refid (primary key lookup)
             refid_committee = None
             if refid_col:
-                raw_refid = str(row.get(refid_col, '')).strip()
+                raw_refid = str(row.refid).strip()
                 refid_committee, refid_source = resolve_committee_from_refid(raw_refid)
 
-            # PHASE 2: Text-based resolution via LOCAL_LEXICON (fallback)
+            # PHASE 2: Text-based resolution via LOCAL_LEXICON (fallback). Only consulted when the
+            # refid didn't resolve (every branch below prefers refid_committee), so skip it otherwise.
             lexicon_committee = None
-            for api_name, aliases in LOCAL_LEXICON.items():
-                if api_name.startswith(committee_search_prefix) and any(alias and alias in outcome_lower for alias in aliases):
-                    lexicon_committee = api_name; break
+            if not refid_committee:
+                lexicon_committee = _lexicon_matcher().match(committee_search_prefix, outcome_lower)
 
             # Determine action type
-            is_referral = any(x in outcome_lower for x in ["referred", "assigned"]) and not any(x in outcome_lower for x in ["fail", "defeat", "strike"])
-            is_report = any(x in outcome_lower for x in ["reported", "discharged"]) and not any(x in outcome_lower for x in ["fail", "defeat"])
-            is_rerefer = is_report and ("rereferred" in outcome_lower or ("referred" in outcome_lower and "reported" in outcome_lower))
+            is_referral = row.is_referral
+            is_report = row.is_report
+            is_rerefer = row.is_rerefer
             destination_committee = None  # Used for rerefer: where the bill goes next
 
             # PHASE 3: Select the correct committee for each role
@@ -3957,9 +6866,7 @@ def run_sequential_turing_machine(df_past, *,
                     if dest_match:
                         dest_name_raw = dest_match.group(1).strip().rstrip(',').strip()
                         # Look up destination in LOCAL_LEXICON
-                        for api_name, aliases in LOCAL_LEXICON.items():
-                            if api_name.startswith(committee_search_prefix) and any(alias and alias in dest_name_raw.lower() for alias in aliases):
-                                destination_committee = api_name; break
+                        destination_committee = _lexicon_matcher().match(committee_search_prefix, dest_name_raw.lower())
                 matched_committee = acting_committee
             elif is_referral and not is_report:
                 # Pure referral: refid = destination committee code, lexicon also finds destination
@@ -3992,7 +6899,7 @@ def run_sequential_turing_machine(df_past, *,
                         is_parent_child = mem_norm.startswith(match_norm) or match_norm.startswith(mem_norm)
 
                     # Category 2: TIMING_LAG — agenda placement before referral records
-                    is_timing_lag = "placed on" in outcome_lower and "agenda" in outcome_lower
+                    is_timing_lag = row.is_timing_lag
 
                     # Route by category
                     if is_parent_child:
@@ -4002,7 +6909,7 @@ def run_sequential_turing_machine(df_past, *,
                     else:
                         outcome_text = f"⚠️ [COMMITTEE_DRIFT: Origin State was {memory_room}] " + outcome_text
 
-                if is_referral and "from" not in outcome_lower:
+                if is_referral and not row.has_from:
                     # Floor to Committee Referral
                     event_location = bill_locations[bill_num]
                     bill_locations[bill_num] = matched_committee # Update target
@@ -4018,7 +6925,7 @@ def run_sequential_turing_machine(df_past, *,
             else:
                 # Dynamic Nameless (Memory Anchor)
                 event_location = bill_locations[bill_num]
-                is_dynamic_verb = any(v in outcome_lower for v in DYNAMIC_VERBS)
+                is_dynamic_verb = row.is_dynamic_verb
                 # Previously only dynamic verbs were tagged, leaving admin Memory-Anchor
                 # rows indistinguishable from cleanly-resolved rows downstream
                 # (silent source-miss — see docs/state/open_anti_patterns.md item #3).
@@ -4032,12 +6939,12 @@ def run_sequential_turing_machine(df_past, *,
                 # docs/failures/gemini_review_patterns.md #31.
 
                 # Advance state if it was a nameless report (rare but possible)
-                if any(x in outcome_lower for x in ["reported", "discharged"]) and not any(x in outcome_lower for x in ["fail"]):
+                if row.nameless_report:
                     bill_locations[bill_num] = acting_chamber_prefix + "Floor"
 
         # === NOISE FILTER (Positive Identification — see module-level constants) ===
-        is_known_noise = any(n in outcome_lower for n in KNOWN_NOISE_PATTERNS)
-        is_known_event = any(e in outcome_lower for e in KNOWN_EVENT_PATTERNS)
+        is_known_noise = row.is_known_noise
+        is_known_event = row.is_known_event
 
         if is_known_noise and not is_known_event:
             source_miss_counts["dropped_noise"] += 1
@@ -4045,6 +6952,7 @@ def run_sequential_turing_machine(df_past, *,
         if not is_known_noise and not is_known_event:
             # UNKNOWN action type — flag but don't suppress
             outcome_text = f"❓ [UNKNOWN_ACTION] " + outcome_text
+        _cost_lap("committee_resolution")
 
         # --- UI RENDERING & FUZZY MATCH ---
         event_location = event_location.strip()
@@ -4062,6 +6970,7 @@ def run_sequential_turing_machine(df_past, *,
             event_location=event_location,
             outcome_text=outcome_text,
             acting_chamber_prefix=acting_chamber_prefix,
+            schedule_index=schedule_index,
         )
 
         if matched_api_key:
@@ -4089,10 +6998,12 @@ def run_sequential_turing_machine(df_past, *,
                     date_str, acting_chamber_prefix.strip()[:1].upper(),
                     outcome_text, api_schedule_map, convene_times,
                     committee_modal_standing, adjourned_clock_by_date,
+                    legevent_index=legevent_index,
                 )
                 if _ctx is not None:
                     time_val, sort_time_24h, status, event_location, origin = _ctx
                     source_miss_counts["legevent_context_recovered"] += 1
+        _cost_lap("schedule_match")
 
         if "Floor" in event_location:
             anchor = convene_times.get(date_str, {}).get(acting_chamber_prefix.strip())
@@ -4107,6 +7018,7 @@ def run_sequential_turing_machine(df_past, *,
                     source_miss_counts["sourced_api"] -= 1
                 source_miss_counts["sourced_convene"] += 1
                 origin = "convene_anchor"
+                _cost_lap("convene_anchor")
             else:
                 _floor_miss += 1
                 _floor_miss_dates[f"{date_str}_{acting_chamber_prefix.strip()}"] += 1
@@ -4159,6 +7071,8 @@ def run_sequential_turing_machine(df_past, *,
                         legislation_event_cache=_legislation_event_cache,
                         ministerial_codes=_ministerial_codes,
                         admin_recovery_index=_admin_recovery_index,
+                        legevent_index=legevent_index,
+                        cost_lap=_cost_lap,
                     )
                     _floor_recovered = None
                     if _floor_route == "meeting":
@@ -4190,6 +7104,7 @@ def run_sequential_turing_machine(df_past, *,
                             outcome_text=outcome_text,
                             acting_chamber_code=acting_chamber_prefix.strip()[:1].upper(),
                             push_alert=push_system_alert,
+                            legevent_index=legevent_index,
                         )
                     if _floor_recovered is not None:
                         time_val, sort_time_24h, status = _floor_recovered
@@ -4248,6 +7163,7 @@ def run_sequential_turing_machine(df_past, *,
                         diagnostic_hint = _build_diagnostic_hint(
                             date_str, event_location, acting_chamber_prefix
                         )
+                _cost_lap("floor_miss")
 
         # PR-C3: LegislationEvent API as secondary time source. Fires
         # when (a) the Schedule API didn't yield a concrete time and
@@ -4316,6 +7232,8 @@ def run_sequential_turing_machine(df_past, *,
                 legislation_event_cache=_legislation_event_cache,
                 ministerial_codes=_ministerial_codes,
                 admin_recovery_index=_admin_recovery_index,
+                legevent_index=legevent_index,
+                cost_lap=_cost_lap,
             )
             if _row_route == "meeting":
                 _row_cached_events = _legislation_event_cache.get(
@@ -4328,7 +7246,9 @@ def run_sequential_turing_machine(df_past, *,
                     outcome_text=outcome_text,
                     acting_chamber_code=acting_chamber_prefix.strip()[:1].upper(),
                     push_alert=push_system_alert,
+                    legevent_index=legevent_index,
                 )
+                _cost_lap("legevent_cache")
             if _le_result is None and _row_route == "admin":
                 # PR-C7.1g (+ #66 review fold-in): route=="admin" means
                 # LIS's own structural fields (ReferenceType / VoteTally /
@@ -4408,7 +7328,9 @@ def run_sequential_turing_machine(df_past, *,
                     legislation_id_cache=_legislation_id_cache,
                     legislation_event_cache=_legislation_event_cache,
                     push_alert=push_system_alert,
+                    legevent_index=legevent_index,
                 )
+                _cost_lap("legevent_api")
             if _le_result is not None:
                 time_val, sort_time_24h, status = _le_result
                 origin = "legislation_event"
@@ -4431,6 +7353,7 @@ def run_sequential_turing_machine(df_past, *,
                 date_str, acting_chamber_prefix.strip()[:1].upper(),
                 outcome_text, api_schedule_map, convene_times,
                 committee_modal_standing, adjourned_clock_by_date,
+                legevent_index=legevent_index,
             )
             if _ctx is not None:
                 time_val, sort_time_24h, status, event_location, origin = _ctx
@@ -4442,6 +7365,7 @@ def run_sequential_turing_machine(df_past, *,
                 elif origin == "derived_standing":
                     # FLAGGED assumed time (committee's modal standing pattern).
                     source_miss_counts["derived_standing"] += 1
+            _cost_lap("anchor_ladder")
 
         if origin == "journal_default":
             # No API match, no convene anchor, AND LegislationEvent
@@ -4487,6 +7411,8 @@ def run_sequential_turing_machine(df_past, *,
             legislation_event_cache=_legislation_event_cache,
             ministerial_codes=_ministerial_codes,
             admin_recovery_index=_admin_recovery_index,
+            legevent_index=legevent_index,
+            cost_lap=_cost_lap,
         )
         if legevent_route == "meeting":
             source_miss_counts["legevent_route_meeting"] += 1
@@ -4499,11 +7425,12 @@ def run_sequential_turing_machine(df_past, *,
 
         # PR-C8.1 (SHADOW): structural refid identity for this row — telemetry ONLY,
         # consumes no description text and does NOT change routing/placement (Standard #3).
-        _row_refid = _normalize_refid(row.get(refid_col, "")) if refid_col else ""  # float64/nan-proof
+        _row_refid = _normalize_refid(row.refid) if refid_col else ""  # float64/nan-proof
         _row_fanout = _refid_fanout.get((_row_refid, date_str), 0) if _row_refid.isdigit() else 0
         _refid_class = _classify_refid(_row_refid, fanout=_row_fanout,
                                        in_vote_csv=(_row_refid in _vote_id_set))
         source_miss_counts["refidclass_" + _refid_class.lower()] += 1
+        _cost_lap("route_telemetry")
 
         _append_event({
             "RefidClass": _refid_class,
@@ -4520,6 +7447,10 @@ def run_sequential_turing_machine(df_past, *,
             "DiagnosticHint": diagnostic_hint,
             "LegEventRoute": legevent_route,
         })
+        if cost_profiler is not None:
+            cost_profiler.end(origin)
+    if cost_profiler is not None:
+        cost_profiler.close()   # a trailing dropped row
 
     # Caller-initialised SCALAR accumulators: ints don't propagate back through the
     # call the way the mutable dicts/Counters do, so return them for the post-loop
@@ -4529,9 +7460,152 @@ def run_sequential_turing_machine(df_past, *,
     return _floor_hit, _floor_miss
 
 
-# A-1: bills-list DATA endpoint used to PROBE-verify authorization for a newly-active session (a 200 +
-# non-empty body proves the WebAPIKey is authorized for that session's data; a 401/403 proves it is not).
-_SESSION_PROBE_URL = "https://lis.virginia.gov/Legislation/api/getlegislationsessionlistasync"
+# ── SHARDED STM (opt-in, STM_SHARD_WORKERS) ──
+# The order-invariance oracle proves the STM carries no cross-bill state: its mutable per-run state is
+# either bill-keyed (bill_locations / last_seen_date / the (bill, session) LegEvent cache entries) or
+# additive (source_miss_counts ±1, _floor_miss_dates, _floor_hit/_floor_miss). So df_past can be split by
+# CleanBill, each shard run in a worker process, and the side effects (_append_event, push_system_alert)
+# replayed in the parent in the exact row order the serial run emits them — same events in the same
+# order, same first-wins alert dedup, same counters. See future_improvements Step 7.
+_STM_SHARD_INPUTS = {}   # worker-process copy of the read-only STM inputs, set once per worker
+
+
+def _stm_shard_worker_count(raw):
+    """STM_SHARD_WORKERS -> worker count: "" / "0" / "1" / junk = off (serial), "auto" = one per core."""
+    raw = (raw or "").strip().lower()
+    if raw == "auto":
+        return os.cpu_count() or 1
+    try:
+        return max(int(raw), 1)
+    except ValueError:
+        return 1
+
+
+def _stm_shards(df_past, n):
+    """Split df_past into <= n bill-disjoint shards, each keeping df_past's row order. Bills are dealt
+    largest-first onto the lightest shard (deterministic, so a re-run shards identically). Returns
+    [(positions, shard_df)] where positions[i] is shard row i's position in df_past."""
+    sizes = Counter(df_past["CleanBill"])
+    loads, owner = [0] * n, {}
+    for bill, cnt in sorted(sizes.items(), key=lambda kv: (-kv[1], kv[0])):
+        i = min(range(n), key=lambda j: (loads[j], j))
+        owner[bill] = i
+        loads[i] += cnt
+    positions = [[] for _ in range(n)]
+    for pos, bill in enumerate(df_past["CleanBill"]):
+        positions[owner[bill]].append(pos)
+    return [(p, df_past.iloc[p]) for p in positions if p]
+
+
+def _stm_shard_init(read_only_kwargs):
+    global _STM_SHARD_INPUTS
+    _STM_SHARD_INPUTS = read_only_kwargs
+
+
+def _stm_shard_task(shard_df, cost_sample_every=0):
+    """Worker-process body: run the STM on one shard with local accumulators and RECORD its side
+    effects as (kind, row_ordinal, payload) in emission order. row_ordinal is the shard-local 1-based
+    row being processed — the STM bumps total_processed first thing for every row. cost_sample_every > 0
+    profiles the shard (StmCostProfiler, returned for merge_stm_shards to fold)."""
+    shared = _STM_SHARD_INPUTS
+    smc, effects = defaultdict(int), []
+
+    def _record_event(ev):
+        effects.append(("event", smc["total_processed"], ev))
+
+    def _record_alert(*args, **kwargs):
+        effects.append(("alert", smc["total_processed"], (args, kwargs)))
+
+    id_cache, ev_cache = shared["_legislation_id_cache"], shared["_legislation_event_cache"]
+    id_before, ev_before = set(id_cache), set(ev_cache)
+    bill_locations, last_seen_date, fmd = {}, {}, Counter()
+    profiler = StmCostProfiler(cost_sample_every) if cost_sample_every else None
+    fh, fm = run_sequential_turing_machine(shard_df,
+        bill_locations=bill_locations, last_seen_date=last_seen_date, _append_event=_record_event,
+        push_system_alert=_record_alert, source_miss_counts=smc, _floor_miss_dates=fmd,
+        _floor_hit=0, _floor_miss=0, cost_profiler=profiler, **shared)
+    return {
+        "effects": effects,
+        "source_miss_counts": dict(smc),
+        "floor_miss_dates": fmd,
+        "floor_hit": fh,
+        "floor_miss": fm,
+        "bill_locations": bill_locations,
+        "last_seen_date": last_seen_date,
+        # Cache entries the resolver added for this shard's bills (a cache miss it fetched/negative-cached).
+        "id_cache_new": {k: v for k, v in id_cache.items() if k not in id_before},
+        "event_cache_new": {k: v for k, v in ev_cache.items() if k not in ev_before},
+        "cost_profiler": profiler,
+    }
+
+
+def _stm_fork_stray_threads(grace=2.0):
+    """Names of the threads other than this one still alive after up to `grace` seconds. A pool shut down
+    with wait=False (the startup graph's) drains its idle workers well inside that."""
+    deadline = time.monotonic() + grace
+    me = threading.current_thread()
+    for t in threading.enumerate():
+        if t is not me:
+            t.join(max(0.0, deadline - time.monotonic()))
+    return [t.name for t in threading.enumerate() if t is not me and t.is_alive()]
+
+
+def run_stm_shards(df_past, workers, read_only_kwargs, cost_sample_every=0):
+    """Run the STM's shards in a fork-based process pool. Returns [(positions, result)] — nothing is
+    applied to the caller's state here, so a pool failure leaves it untouched (the caller falls back to
+    the serial STM). Raises ValueError where fork is unavailable, RuntimeError while another thread is
+    alive. cost_sample_every > 0 profiles each shard at that sample rate."""
+    shards = _stm_shards(df_past, workers)
+    if not shards:
+        return []
+    # fork, not spawn: the read-only inputs include closures (_build_diagnostic_hint) and the live
+    # http_session, which a fork inherits as-is instead of pickling (spawn / forkserver would have to).
+    # fork copies only this thread, so a lock another thread holds at that instant stays held forever
+    # in the child. By the STM every pool run_calendar_update opened is shut down (startup graph,
+    # LegEvent hydration, agenda prefetch, ranged blob reads), so this process is single-threaded —
+    # checked here rather than assumed: a live thread falls back to the serial STM instead of forking.
+    stray = _stm_fork_stray_threads()
+    if stray:
+        raise RuntimeError(f"{len(stray)} other thread(s) alive ({', '.join(stray[:3])}); "
+                           f"forking could inherit a held lock")
+    ctx = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=len(shards), mp_context=ctx,
+                             initializer=_stm_shard_init, initargs=(read_only_kwargs,)) as pool:
+        results = list(pool.map(functools.partial(_stm_shard_task, cost_sample_every=cost_sample_every),
+                                [s for _, s in shards]))
+    return [(p, r) for (p, _), r in zip(shards, results)]
+
+
+def merge_stm_shards(shard_results, *, bill_locations, last_seen_date, _append_event, push_system_alert,
+                     source_miss_counts, _floor_miss_dates, _legislation_id_cache,
+                     _legislation_event_cache, _floor_hit, _floor_miss, cost_profiler=None):
+    """Apply run_stm_shards' results exactly as the serial STM would have: side effects replayed through
+    the REAL _append_event / push_system_alert in df_past row order (each shard's stream is already in
+    row order, so a k-way merge on the row position restores the serial interleaving), then the
+    additive / bill-keyed state folded in. Returns (_floor_hit, _floor_miss) like the STM. Shard cost
+    profiles fold into `cost_profiler` (per-process time, so stages sum past the pool's wall time)."""
+    streams = [[(positions[ordinal - 1], kind, payload) for kind, ordinal, payload in res["effects"]]
+               for positions, res in shard_results]
+    for _, kind, payload in heapq.merge(*streams, key=lambda e: e[0]):
+        if kind == "event":
+            _append_event(payload)
+        else:
+            push_system_alert(*payload[0], **payload[1])
+    for _, res in shard_results:
+        for k, v in res["source_miss_counts"].items():
+            source_miss_counts[k] = source_miss_counts.get(k, 0) + v
+        _floor_miss_dates.update(res["floor_miss_dates"])
+        bill_locations.update(res["bill_locations"])
+        last_seen_date.update(res["last_seen_date"])
+        _legislation_id_cache.update(res["id_cache_new"])
+        _legislation_event_cache.update(res["event_cache_new"])
+        _floor_hit += res["floor_hit"]
+        _floor_miss += res["floor_miss"]
+        if cost_profiler is not None and res.get("cost_profiler") is not None:
+            cost_profiler.merge(res["cost_profiler"])
+    return _floor_hit, _floor_miss
+
+
 # State cell holding the last probe-verified auto-followed session, e.g. "verified:20271". Distinct from V1
 # (the sheet-session marker) — this records "we PROVED the key works for this new session", so the probe
 # fires ONCE per new session, not every cycle. Sheet1 is a 26-col grid; S is col 19 (well within it).
@@ -4670,9 +7744,195 @@ GAP_STALE_DAYS = 30                        # cursor too old to trust for recover
 GAP_RECONCILIATION_MAX_DAYS = 7            # hard cap for Part C re-poll window
 
 
+# ── Startup fetch graph (speed audit: the startup calls ran back to back) ──
+# The cycle opens with independent, latency-bound calls — Session lookup, the workbook open, the Committee,
+# Schedule and LegislationStatus APIs, the DOCKET / HISTORY blobs — that nothing consumes until well after
+# the last one has been issued. Each is declared as a task with its dependencies and runs on ONE bounded
+# pool, so startup pays max(latency) along the critical path instead of the sum. Ban-safety is structural:
+# every LIS / blob task depends on "authorized" (the LIS authorization gate's PROCEED result), so none can
+# start before it passes and all are skipped if it halts; only Session (which the gate needs) and the Google
+# workbook open are roots. Each result is consumed at the call site that used to make the call, inside the
+# same try/except, so every retry / fallback path is the one it always was; alerts a task raises are
+# recorded and replayed at that point, so alert order is unchanged too. STARTUP_FETCH_WORKERS=1 runs the tasks one at a time, in declaration order.
+STARTUP_FETCH_WORKERS = max(1, min(int(os.environ.get("STARTUP_FETCH_WORKERS", "6") or 1), 8))
+
+
+class StartupTaskSkipped(Exception):
+    """A startup task never ran because a task it depends on raised."""
+
+
+class StartupFetchGraph:
+    """Fetch tasks with declared dependencies on a shared bounded ThreadPoolExecutor. add() declares a
+    task (its deps must already be declared, so the graph is acyclic by construction); it is submitted
+    the moment every dep has succeeded, or skipped (StartupTaskSkipped) if one raised. result(name)
+    blocks, replays the task's recorded alerts, then returns its value or re-raises its exception
+    (LisRequestCapExceeded included). critical_path() walks back from the last task to finish through
+    its latest-finishing dep."""
+
+    def __init__(self, workers=STARTUP_FETCH_WORKERS):
+        self.workers = max(1, int(workers))
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="startup")
+        self._lock = threading.Lock()
+        self._futures, self._deps, self._waiting = {}, {}, {}
+        self._alerts = defaultdict(list)
+        self._closed = False
+        self.started, self.ended = {}, {}
+
+    def add(self, name, fn, *args, deps=(), **kwargs):
+        with self._lock:
+            if name in self._futures:
+                raise ValueError(f"startup task {name!r} declared twice")
+            unknown = [d for d in deps if d not in self._futures]
+            if unknown:
+                raise ValueError(f"startup task {name!r} depends on undeclared {unknown}")
+            fut = Future()
+            self._futures[name], self._deps[name] = fut, tuple(deps)
+            self._waiting[name] = (fn, args, kwargs)
+        for d in deps:
+            self._futures[d].add_done_callback(lambda _f, n=name: self._release(n))
+        self._release(name)
+        return fut
+
+    def _release(self, name):
+        with self._lock:
+            if name not in self._waiting or not all(self._futures[d].done() for d in self._deps[name]):
+                return
+            fn, args, kwargs = self._waiting.pop(name)
+            failed = [d for d in self._deps[name]
+                      if self._futures[d].cancelled() or self._futures[d].exception() is not None]
+            if not failed and not self._closed:
+                self._pool.submit(self._run, name, fn, args, kwargs)
+                return
+        if failed:
+            self._futures[name].set_exception(StartupTaskSkipped(f"{name}: dependency {failed[0]} failed"))
+        else:
+            self._futures[name].cancel()
+
+    def _run(self, name, fn, args, kwargs):
+        self.started[name] = time.perf_counter()
+        try:
+            value = fn(*args, **kwargs)
+        except BaseException as e:
+            self.ended[name] = time.perf_counter()
+            self._futures[name].set_exception(e)
+        else:
+            self.ended[name] = time.perf_counter()
+            self._futures[name].set_result(value)
+
+    def alert_sink(self, name):
+        """An alert_fn for task `name`: records the call for result(name, push_alert) to replay."""
+        return lambda *a, **k: self._alerts[name].append((a, k))
+
+    def future(self, name):
+        return self._futures[name]
+
+    def result(self, name, push_alert=None):
+        try:
+            return self._futures[name].result()
+        finally:
+            for a, k in self._alerts.pop(name, ()):
+                if push_alert:
+                    push_alert(*a, **k)
+
+    def wait(self):
+        """Block until every declared task has finished (or been skipped / cancelled)."""
+        for fut in list(self._futures.values()):
+            if not fut.cancelled():
+                fut.exception()
+
+    def shutdown(self, cancel=False):
+        with self._lock:
+            self._closed = True
+            waiting = list(self._waiting) if cancel else []
+            for name in waiting:
+                del self._waiting[name]
+        for name in waiting:
+            self._futures[name].cancel()
+        self._pool.shutdown(wait=False, cancel_futures=cancel)
+
+    def critical_path(self):
+        if not self.ended:
+            return []
+        node = max(self.ended, key=self.ended.get)
+        path = [node]
+        while True:
+            done = [d for d in self._deps[node] if d in self.ended]
+            if not done:
+                return path[::-1]
+            node = max(done, key=self.ended.get)
+            path.append(node)
+
+    def metrics(self):
+        """SYSTEM_METRICS numbers: startup_wall_ms (first task start → last task end, main-thread work in
+        between included), startup_serial_ms (the sum of task times = what back-to-back calls cost), the
+        critical path's startup_critical_ms, startup_ms_<task> per task (labels() names the path)."""
+        out = {"startup_workers": self.workers, "startup_tasks": len(self.ended), "startup_wall_ms": 0.0,
+               "startup_serial_ms": 0.0, "startup_critical_ms": 0.0}
+        if not self.ended:
+            return out
+        took = {n: self.ended[n] - self.started[n] for n in self.ended}
+        path = self.critical_path()
+        out["startup_wall_ms"] = round((max(self.ended.values()) - min(self.started.values())) * 1000, 1)
+        out["startup_serial_ms"] = round(sum(took.values()) * 1000, 1)
+        out["startup_critical_ms"] = round(sum(took[n] for n in path) * 1000, 1)
+        for n in sorted(took):
+            out[f"startup_ms_{n}"] = round(took[n] * 1000, 1)
+        return out
+
+    def labels(self):
+        """SYSTEM_METRICS labels: startup_critical_path ("a>b>c")."""
+        return {"startup_critical_path": ">".join(self.critical_path())}
+
+
+def _open_workbook(creds_json):
+    """Authorize with the service account and open the workbook. PR-C7.1s (stress-test fix): retry the
+    open — a transient Google Sheets 503 here fails the ENTIRE cycle (observed 2026-06-04); the cron
+    recovers next run, but a short backoff avoids the gap and the false alarm."""
+    gc = gspread.authorize(Credentials.from_service_account_info(json.loads(creds_json), scopes=["https://www.googleapis.com/auth/spreadsheets"]))
+    for _open_attempt in range(1, 5):
+        try:
+            return gc.open_by_key(SPREADSHEET_ID)
+        except Exception as _open_err:
+            if _open_attempt == 4:
+                raise
+            print(f"⚠️ Sheets open failed ({_open_err}); retry {_open_attempt}/3 after backoff.")
+            time.sleep(2 ** _open_attempt)
+
+
+def _startup_gate_proceed(graph):
+    """The "authorized" task: session_follow_gate RETURNS (proceed, reason) rather than raising, so "gate"
+    succeeds even when it halts. This turns a halt into a raise, so every task declared on "authorized" is
+    skipped (StartupTaskSkipped) instead of run. Reads the future directly: the gate's alerts replay where
+    run_calendar_update consumes it."""
+    proceed, reason = graph.future("gate").result()
+    if not proceed:
+        raise RuntimeError(f"LIS authorization gate halted: {reason}")
+    return True
+
+
+def _declare_startup_fetches(graph, http_session, active_session, blob_code, api_is_online):
+    """The post-gate startup tasks, each the exact call its consumer used to make inline: committee maps
+    (alerts recorded for replay), the Schedule list (only when the Session API is up, as before), the
+    LegislationStatus list, and the DOCKET / HISTORY blobs (safe_fetch_csv: own blob session, never raises).
+    Each depends on the gate's PROCEED result ("authorized"), not just on its having run."""
+    graph.add("authorized", _startup_gate_proceed, graph, deps=("gate",))
+    graph.add("committee_maps", build_committee_maps, http_session, active_session,
+              alert_fn=graph.alert_sink("committee_maps"), deps=("authorized",))
+    if api_is_online:
+        graph.add("schedule", http_session.get, "https://lis.virginia.gov/Schedule/api/getschedulelistasync",
+                  headers=HEADERS, params={"sessionCode": active_session}, timeout=10, deps=("authorized",))
+    graph.add("legislation_status", http_session.get,
+              "https://lis.virginia.gov/Legislation/api/GetLegislationStatusListAsync",
+              headers=LEGISLATION_EVENT_HEADERS, timeout=10, deps=("authorized",))
+    for blob in ("DOCKET", "HISTORY"):
+        graph.add(blob.lower(), safe_fetch_csv, f"https://lis.blob.core.windows.net/lisfiles/{blob_code}/{blob}.CSV",
+                  deps=("authorized",))
+
+
 def run_calendar_update():
     with _lis_count_lock:
         lis_request_count["n"] = 0  # guardrail #4: reset the per-cycle request count at CYCLE start
+    _LIS_GOVERNOR.reset_stats()     # per-cycle endpoint telemetry (the adaptive host rates carry over)
     http_session = get_armored_session()  # (not in the factory — robust if more sessions get created; Gemini #156)
     # Phase timing (operational visibility + the speed-audit profile). Prints elapsed per
     # phase with real perf_counter() deltas (so it survives GitHub's buffered-stdout flush,
@@ -4685,7 +7945,13 @@ def run_calendar_update():
         print(f"⏱️ PHASE {label}: {_now - _phase_last:.1f}s  (cumulative {_now - _phase_t0:.1f}s)")
         _phase_last = _now
     
-    session_data, api_is_online, _session_auth_failed = get_active_session_info(http_session)
+    # Startup fetch graph (StartupFetchGraph): the roots start now — the workbook open (Google, not LIS) and
+    # the Session lookup; the LIS / blob tasks are declared once the authorization gate below has passed.
+    _startup = StartupFetchGraph()
+    if os.environ.get("GCP_CREDENTIALS"):
+        _startup.add("sheet", _open_workbook, os.environ["GCP_CREDENTIALS"])
+    _startup.add("session", get_active_session_info, http_session)
+    session_data, api_is_online, _session_auth_failed = _startup.result("session")
 
     tz = pytz.timezone('America/New_York')
     now = datetime.now(tz).replace(tzinfo=None)
@@ -4898,6 +8164,10 @@ def run_calendar_update():
         # (no Last-Modified this cycle) — sentinel-safe (an age is never negative), never false-fresh.
         "history_blob_age_min":       -1,
     }
+    # Non-numeric SYSTEM_METRICS values (e.g. the STM's slowest bills): merged into the row only at emit
+    # time, so every value in source_miss_counts stays a number — the incremental shadow / oracle subtract
+    # and reset them key by key.
+    source_miss_labels = {}
 
     def push_system_alert(message, status="ALERT", category=None, severity=None, dedup_key=None):
         """Append a row to alert_rows for Bug_Logs/Sheet1 surfacing.
@@ -5206,8 +8476,10 @@ def run_calendar_update():
             "Session API is unavailable, so the year-derived fallback session was NOT LIS-declared active; "
             "refusing to auto-follow until the Session API confirms it.")
     else:
-        _proceed, _halt_reason = session_follow_gate(ACTIVE_SESSION, http_session)
+        _startup.add("gate", session_follow_gate, ACTIVE_SESSION, http_session, deps=("session",))
+        _proceed, _halt_reason = _startup.result("gate")
     if not _proceed:
+        _startup.shutdown(cancel=True)
         _halt = (f"🛑 LIS AUTHORIZATION HALT {now:%Y-%m-%d %H:%M}: active session {ACTIVE_SESSION} — "
                  f"{_halt_reason} Skipped ALL LIS calls this cycle to avoid an API ban; last-known-good "
                  f"Sheet1 preserved.")
@@ -5242,8 +8514,13 @@ def run_calendar_update():
     # a same-cycle failure; categorized alert already fired on the miss.
     _legislation_event_cache = {}
 
+    # Gate passed: fan the LIS / blob startup calls out now (each depends on "gate"); every one is consumed
+    # below where it used to be made, so its latency hides behind the others and the setup in between.
+    blob_code = f"20{ACTIVE_SESSION}" if len(ACTIVE_SESSION) == 3 else ACTIVE_SESSION
+    _declare_startup_fetches(_startup, http_session, ACTIVE_SESSION, blob_code, api_is_online)
+
     # === DYNAMIC COMMITTEE MAPS (Enterprise: rebuilt from API each run) ===
-    build_committee_maps(http_session, ACTIVE_SESSION, alert_fn=push_system_alert)
+    _startup.result("committee_maps", push_alert=push_system_alert)
 
     # Scrape/processing window = the session window DERIVED FROM THE SESSION API
     # at runtime (Standard #5: "date ranges — derived from LIS APIs at runtime").
@@ -5272,20 +8549,7 @@ def run_calendar_update():
     creds_json = os.environ.get("GCP_CREDENTIALS")
     if not creds_json: sys.exit(1)
         
-    gc = gspread.authorize(Credentials.from_service_account_info(json.loads(creds_json), scopes=["https://www.googleapis.com/auth/spreadsheets"]))
-    # PR-C7.1s (stress-test fix): retry the workbook open. A transient Google
-    # Sheets 503 here fails the ENTIRE cycle (observed 2026-06-04) — the cron
-    # recovers next run, but a short backoff avoids the gap and the false alarm.
-    sheet = None
-    for _open_attempt in range(1, 5):
-        try:
-            sheet = gc.open_by_key(SPREADSHEET_ID)
-            break
-        except Exception as _open_err:
-            if _open_attempt == 4:
-                raise
-            print(f"⚠️ Sheets open failed ({_open_err}); retry {_open_attempt}/3 after backoff.")
-            time.sleep(2 ** _open_attempt)
+    sheet = _startup.result("sheet")   # _open_workbook (retried open), started at the top of the cycle
     worksheet = sheet.worksheet("Sheet1")
     
     try:
@@ -5755,25 +9019,19 @@ def run_calendar_update():
             dedup_key="cache_read_failure",
         )
 
-    blob_code = f"20{ACTIVE_SESSION}" if len(ACTIVE_SESSION) == 3 else ACTIVE_SESSION
-    master_events = []
+    master_events = EventBuffer()   # slotted records + interned strings (StmEventRecord), not dicts
     docket_memory = {}
 
-    # Stage-1 speedup: prefetch the two big Azure blobs CONCURRENTLY here, at the
-    # top of the fetch section, so the multi-MB HISTORY.CSV download overlaps ALL of
-    # phase 1 (committee maps, API_Cache read, the Schedule API + 3,310-row loop).
-    # By the time phase 2 calls _history_future.result() the download is already
-    # done, so its latency is hidden. safe_fetch_csv uses its OWN requests.get (not
-    # the shared http_session), so running it in a thread is safe — same bytes, same
-    # completeness guards, zero accuracy change. Errors stay inside safe_fetch_csv
-    # (it returns an empty frame, never raises), so .result() preserves the existing
-    # empty-frame handling at each call site.
-    _blob_pool = ThreadPoolExecutor(max_workers=2)
-    _docket_future = _blob_pool.submit(safe_fetch_csv, f"https://lis.blob.core.windows.net/lisfiles/{blob_code}/DOCKET.CSV")
-    _history_future = _blob_pool.submit(safe_fetch_csv, f"https://lis.blob.core.windows.net/lisfiles/{blob_code}/HISTORY.CSV")
-
+    # Stage-1 speedup: the two big Azure blobs were fanned out right after the gate (startup
+    # graph), so the multi-MB HISTORY.CSV download overlaps ALL of phase 1 (committee maps,
+    # API_Cache read, the Schedule API + 3,310-row loop). By the time phase 2 asks for the
+    # "history" result the download is already done, so its latency is hidden. safe_fetch_csv
+    # uses its OWN blob session (not the shared http_session), so running it in a thread is
+    # safe — same bytes, same completeness guards, zero accuracy change. Errors stay inside
+    # safe_fetch_csv (it returns an empty frame, never raises), so the result preserves the
+    # existing empty-frame handling at each call site.
     print("📡 Downloading Official DOCKET.CSV...")
-    df_docket = _docket_future.result()
+    df_docket = _startup.result("docket")
     if not df_docket.empty:
         df_docket.columns = df_docket.columns.str.strip().str.lower().str.replace(' ', '_')
         bill_col = next((c for c in df_docket.columns if 'bill' in c), None)
@@ -5796,6 +9054,7 @@ def run_calendar_update():
     # pruned an aged-out row, so the persist rewrites the trimmed tab this cycle.
     agenda_parse_cache, _agenda_cache_ws, _agenda_cache_dirty, _agenda_cache_load_ok = _load_agenda_cache(sheet, now)
     _agenda_cache_hits = 0
+    _AGENDA_VALIDATORS.load(AGENDA_VALIDATOR_PATH, now)   # conditional GET for the unsettled rest
 
     new_cache_entries = []
 
@@ -5848,7 +9107,7 @@ def run_calendar_update():
     if api_is_online:
         print("📡 Downloading Live API Schedule & Agendas...")
         try:
-            sched_res = http_session.get("https://lis.virginia.gov/Schedule/api/getschedulelistasync", headers=HEADERS, params={"sessionCode": ACTIVE_SESSION}, timeout=10)
+            sched_res = _startup.result("schedule")   # getschedulelistasync, fanned out after the gate
             if sched_res.status_code == 200:
                 schedules = sched_res.json().get('Schedules', []) if isinstance(sched_res.json(), dict) else sched_res.json()
                 resolved_parent_map = build_time_graph(schedules)
@@ -5866,6 +9125,47 @@ def run_calendar_update():
                 committee_modal_standing, adjourned_clock_by_date = _build_standing_schedule_maps(
                     schedules, test_start_date, test_end_date)
 
+                # Agenda prefetch (opt-in): fetch/parse every agenda this loop will need up front,
+                # concurrently; the loop below reads the results in its own order. Both knobs unset =
+                # the inline path, unchanged. Any prefetch failure leaves the loop on the inline path.
+                _agenda_fetch_workers = _agenda_worker_count(os.environ.get("AGENDA_FETCH_WORKERS", ""),
+                                                             AGENDA_FETCH_MAX_WORKERS)
+                _agenda_parse_workers = _agenda_worker_count(os.environ.get("AGENDA_PARSE_WORKERS", ""),
+                                                             os.cpu_count() or 1)
+                _agenda_prefetched, _agenda_prefetch_failed = {}, 0
+                if _agenda_fetch_workers > 1 or _agenda_parse_workers > 1:
+                    try:
+                        _t_agenda = time.perf_counter()
+                        if _agenda_parse_workers > 1:
+                            # fork only once the startup fetches (blob downloads included) are done: no live
+                            # I/O thread (and none of its locks) gets copied into the parse workers.
+                            _startup.wait()
+                        _agenda_plan = _agenda_prefetch_plan(schedules, scrape_start, effective_scrape_end,
+                                                             agenda_parse_cache, now)
+                        _agenda_prefetched = _prefetch_agendas(_agenda_plan, http_session,
+                                                               _agenda_fetch_workers, _agenda_parse_workers)
+                        print(f"📑 Agenda prefetch: {len(_agenda_plan)} agendas, {_agenda_fetch_workers} fetch / "
+                              f"{_agenda_parse_workers} parse workers, {time.perf_counter() - _t_agenda:.1f}s")
+                    except Exception as e:
+                        _agenda_prefetched, _agenda_prefetch_failed = {}, 1
+                        push_system_alert(
+                            f"Agenda prefetch failed ({type(e).__name__}: {e}); every agenda was fetched and "
+                            f"parsed inline this cycle instead (output unaffected, only slower).",
+                            status="WARN", category="API_FAILURE", severity="WARN",
+                            dedup_key="agenda_prefetch_fallback")
+                        print(f"⚠️ Agenda prefetch failed ({e}); agendas fetch inline this cycle.")
+                source_miss_counts["agenda_prefetched"] = len(_agenda_prefetched)
+                source_miss_counts["agenda_prefetch_failed"] = _agenda_prefetch_failed
+                source_miss_counts["agenda_stream_fallback"] = int(AGENDA_PDF_EXTRACTOR == "stream"
+                                                                   and not _AGENDA_STREAM_SUPPORTED)
+                if source_miss_counts["agenda_stream_fallback"]:
+                    push_system_alert(
+                        "AGENDA_PDF_EXTRACTOR=stream is set but the installed pdfminer's render_char signature "
+                        "no longer matches the streaming collector; agenda PDFs were parsed with pdfplumber "
+                        "instead (output unaffected, only slower). Re-check the pdfminer.six pin.",
+                        status="WARN", category="API_FAILURE", severity="WARN",
+                        dedup_key="agenda_stream_fallback")
+
                 for meeting in schedules:
                     meeting_date = pd.to_datetime(meeting.get('ScheduleDate', '1970-01-01'), errors='coerce')
                     # Upper bound is effective_scrape_end (NOT test_end_date) so OFF-SEASON interim meetings
@@ -6055,7 +9355,7 @@ def run_calendar_update():
                         # KeyError.
                         new_cache_entries.append([date_str, normalized_name.strip(), time_val, sort_time_24h, status, location_val])
                     
-                    if any(k in owner_lower for k in ["caucus", "session", "floor", "convenes", "adjourned"]):
+                    if any(k in owner_lower for k in _CHAMBER_EVENT_OWNER_TOKENS):
                         _append_event({"Date": date_str, "Time": time_val, "SortTime": sort_time_24h, "Status": status, "Committee": normalized_name.strip() if normalized_name else "Chamber Event", "Bill": clean_desc, "Outcome": "", "AgendaOrder": -1, "Source": "API", "Origin": "api_schedule", "DiagnosticHint": ""})
                         continue
                     
@@ -6070,13 +9370,20 @@ def run_calendar_update():
                         # parse (docket can still change). Cache only an
                         # AUTHORITATIVE read (fetch_ok) of a settled meeting — a
                         # transient empty result must never be frozen as real.
-                        _agenda_settled = meeting_date.date() < (now.date() - timedelta(days=AGENDA_CACHE_SETTLE_DAYS))
+                        _agenda_settled = _agenda_is_settled(meeting_date, now)
                         _cached = agenda_parse_cache.get(agenda_url) if _agenda_settled else None
                         if _cached is not None:
                             extracted_bills, is_corrupt = _cached[1], False
                             _agenda_cache_hits += 1
                         else:
-                            extracted_bills, is_corrupt, _fetch_ok = extract_rogue_agenda(agenda_url, http_session, meeting_date)
+                            # A prefetched read is used once when it failed (fetch_ok False), so a repeat
+                            # meeting re-fetches exactly as the inline path would.
+                            _akey = (agenda_url, meeting_date)
+                            _pre = _agenda_prefetched.get(_akey)
+                            if _pre is not None and not _pre[2]:
+                                del _agenda_prefetched[_akey]
+                            extracted_bills, is_corrupt, _fetch_ok = (
+                                _pre if _pre is not None else extract_rogue_agenda(agenda_url, http_session, meeting_date))
                             if _agenda_settled and _fetch_ok:
                                 agenda_parse_cache[agenda_url] = (meeting_date.strftime("%Y-%m-%d"), extracted_bills)
                                 _agenda_cache_dirty = True
@@ -6533,8 +9840,7 @@ def run_calendar_update():
     # canonical Azure URL only (matches DOCKET.CSV's URL pattern at line
     # ~2066). If this fails, surface it loudly — there is no longer a
     # second host to fall back to. See [[failures/assumptions_audit#52]].
-    df_past = _history_future.result()   # prefetched at the top of the fetch section; already downloaded
-    _blob_pool.shutdown(wait=False)
+    df_past = _startup.result("history")   # fanned out after the gate; already downloaded
     _phase("HISTORY.CSV download (prefetched — should be ~0s if hidden behind phase 1)")
 
     # Source-feed freshness (the grounded form of "per-bill freshness"): age of the HISTORY.CSV
@@ -6619,10 +9925,7 @@ def run_calendar_update():
     # and alert on any status we haven't classified. Read-only; any fetch
     # failure degrades to an INFO and skips (never blocks the cycle).
     try:
-        _sl = http_session.get(
-            "https://lis.virginia.gov/Legislation/api/GetLegislationStatusListAsync",
-            headers=LEGISLATION_EVENT_HEADERS, timeout=10,
-        )
+        _sl = _startup.result("legislation_status")   # GetLegislationStatusListAsync, fanned out after the gate
         if _sl.status_code == 200:
             _sl_json = _sl.json()
             # Gemini review: verify References is a LIST before iterating —
@@ -6674,6 +9977,16 @@ def run_calendar_update():
             dedup_key="status_list_fetch_exc",
         )
 
+    # Every startup task has now been consumed: fold the graph's timing into SYSTEM_METRICS.
+    _startup.shutdown()
+    _startup_metrics = _startup.metrics()
+    source_miss_counts.update(_startup_metrics)
+    source_miss_labels.update(_startup.labels())
+    print(f"⏱️ Startup fetch graph ({_startup.workers} workers): {_startup_metrics['startup_wall_ms'] / 1000:.1f}s "
+          f"wall vs {_startup_metrics['startup_serial_ms'] / 1000:.1f}s back to back; critical path "
+          f"{source_miss_labels['startup_critical_path'].replace('>', ' → ')} "
+          f"({_startup_metrics['startup_critical_ms'] / 1000:.1f}s)")
+
     # Pre-init: refid_col is assigned only inside `if not df_past.empty:` below, but the post-loop
     # refid-shape drift monitor reads it on EVERY path (incl. an empty-history cycle). Without this it
     # UnboundLocalErrors there — caught, but it silently suppresses the monitor + would fire a spurious
@@ -6701,30 +10014,12 @@ def run_calendar_update():
         # csv.reader. Vote id = the first column (a digit string like "26110000").
         # (_vote_id_set already initialised right after the HISTORY fetch — Gemini #146.)
         try:
-            _vote_url = f"https://lis.blob.core.windows.net/lisfiles/{blob_code}/VOTE.CSV"
-            # LIS-safety guardrail #1: conditional fetch (don't re-download unchanged VOTE.CSV).
-            # Reuses the blob-cache helpers; a 304 = Azure byte-identity guarantee → reuse cached
-            # bytes; the length-guarded cache + fail-safe full GET keep this accuracy-neutral.
-            _v_etag, _v_cached = _read_blob_cache(_vote_url)
-            _vr = http_session.get(_vote_url, timeout=60,
-                                   headers={**HEADERS, **({"If-None-Match": _v_etag} if _v_etag else {})})
-            if _vr.status_code == 304 and _v_cached is not None:
-                _v_bytes = _v_cached
-                blob_cache_stats["reuse_304"] += 1
-                print(f"♻️  blob cache HIT — 304, reused {len(_v_bytes)//1024} KB (no re-download): {_vote_url}")
-            else:
-                # 304 with NO usable cache (race/eviction) hands back an EMPTY body that
-                # raise_for_status() does NOT reject (304 is 3xx) — re-GET UNCONDITIONALLY first
-                # so we never overwrite the cache with empty bytes (Gemini #154 critical).
-                if _vr.status_code == 304:
-                    _vr = http_session.get(_vote_url, headers=HEADERS, timeout=60)
-                _vr.raise_for_status()   # non-200 (404/500) -> except below, a DISTINCT "fetch failed" alert
-                _v_bytes = _vr.content
-                blob_cache_stats["download_200"] += 1
-                _write_blob_cache(_vote_url, _vr.headers.get("ETag"), _v_bytes)
-            for _vrow in csv.reader(io.StringIO(_v_bytes.decode("utf-8", "replace"))):
-                if _vrow and _vrow[0].strip().isdigit():
-                    _vote_id_set.add(_vrow[0].strip())
+            # load_vote_index: the conditional fetch + the persisted per-ETag VoteIndex (shared with
+            # bill_tracker) — a warm cycle reuses the indexed roll calls instead of re-reading the file.
+            _vote_index = load_vote_index(blob_code)
+            _vote_id_set.update(_vote_index.floor_vote_ids())
+            source_miss_counts["vote_index_full_parse"] = int(_vote_index.source == "parsed")
+            source_miss_counts["vote_index_tail_parse"] = int(_vote_index.source == "extended")
         except Exception as _ve:
             push_system_alert(f"VOTE.CSV fetch failed ({_ve}); refid vote-join unavailable (shadow telemetry).",
                               status="WARN", category="API_FAILURE", severity="WARN", dedup_key="vote_csv_fail")
@@ -6775,6 +10070,7 @@ def run_calendar_update():
         # session. Standard #2 (no silent shrink) + #5 (fully API-derived).
         _eff_start = test_start_date
         _eff_end = max(test_end_date, _today_naive)
+        _history_rows_total = len(df_past)   # pre-window row count: the HISTORY delta's prefix boundary
         df_past = df_past[(df_past['ParsedDate'] >= _eff_start) & (df_past['ParsedDate'] <= _eff_end)]
 
         # ============================================================
@@ -6974,6 +10270,10 @@ def run_calendar_update():
                 (_c, str(_api_val.get("Time", "")))
             )
 
+        # Per-date schedule index for find_api_schedule_match — built once here (the Schedule API
+        # loop is done writing api_schedule_map) and shared by every STM run this cycle.
+        schedule_index = ScheduleIndex(api_schedule_map)
+
         def _build_diagnostic_hint(date_str, event_location, acting_chamber_prefix):
             """Return a compact string describing why the row couldn't be sourced.
 
@@ -7021,24 +10321,47 @@ def run_calendar_update():
         # line 2575. Hydration happens here because it depends on df_past.
         # ====================================================================
 
-        # Compute per-bill HISTORY hash from df_past. Group by CleanBill and
-        # build (date, outcome, refid) tuples so a clerk's edit to any of
-        # those fields trips the hash and queues the bill for refresh.
+        # Compute per-bill HISTORY hash from df_past: (date, outcome, refid)
+        # tuples per CleanBill, so a clerk's edit to any of those fields trips
+        # the hash and queues the bill for refresh. _history_delta_hashes
+        # re-hashes only the bills the HISTORY delta touched since last cycle
+        # (full hash when the delta is ambiguous) — same digests either way.
+        # The incremental STM's per-bill reuse keys (STM_Bill_Cache.HistoryHash)
+        # come from the same delta, only when an incremental mode will read them.
+        _stm_incremental_on = os.environ.get("STM_INCREMENTAL_PRIMARY", "") in ("1", "shadow") \
+            or os.environ.get("STM_INCREMENTAL_SHADOW") == "1"
         legevent_history_hashes: dict = {}
+        stm_bill_digests: dict = {}
         legevent_candidate_bills: set = set()
         if not df_past.empty:
-            for clean_bill, group in df_past.groupby("CleanBill"):
-                bill_str = str(clean_bill).strip()
-                if not bill_str:
-                    continue
-                legevent_candidate_bills.add(bill_str)
-                rows_tuple = []
-                for _, hr in group.iterrows():
-                    d = hr["ParsedDate"].strftime("%Y-%m-%d") if pd.notna(hr.get("ParsedDate")) else ""
-                    o = str(hr.get(desc_col, "") or "")
-                    r = str(hr.get(refid_col, "") or "") if refid_col else ""
-                    rows_tuple.append((d, o, r))
-                legevent_history_hashes[bill_str] = _hash_history_rows_for_bill(rows_tuple)
+            _hist_url = f"https://lis.blob.core.windows.net/lisfiles/{blob_code}/HISTORY.CSV"
+            legevent_history_hashes, stm_bill_digests, _delta_stats = _history_delta_hashes(
+                df_past, desc_col, refid_col, _blob_served.get(_hist_url), _history_rows_total,
+                (_eff_start, _eff_end), _history_delta_path(_hist_url), stm=_stm_incremental_on)
+            legevent_candidate_bills = set(legevent_history_hashes)
+            source_miss_counts.update(_delta_stats)
+            print(f"🧮 HISTORY delta: {_delta_stats['history_delta_touched_bills']} bill(s) touched "
+                  f"(+{_delta_stats['history_delta_inserted']} / -{_delta_stats['history_delta_removed']} / "
+                  f"~{_delta_stats['history_delta_modified']} rows; "
+                  f"{'prefix' if _delta_stats['history_delta_prefix'] else 'merge' if _delta_stats['history_delta_merge'] else 'full hash'}).")
+            if _delta_stats["history_delta_errors"]:
+                push_system_alert(
+                    "HISTORY delta failed; every bill's HISTORY digest was fully re-hashed this cycle "
+                    "(output unaffected, only slower). See the run log for the exception.",
+                    status="WARN", category="API_FAILURE", severity="WARN",
+                    dedup_key="history_delta_error")
+
+        # Adaptive TTL + value-scored queue: per-bill unchanged streaks (persisted), upcoming docket /
+        # agenda appearances, and days since each bill's latest HISTORY action.
+        _legevent_refresh_state = _load_legevent_refresh_state() if LEGEVENT_ADAPTIVE_TTL else None
+        _legevent_streaks = (_legevent_refresh_state["sessions"].setdefault(_session_code_5d, {})
+                             if _legevent_refresh_state is not None else None)
+        _legevent_upcoming = _legevent_upcoming_bills(docket_memory, now)
+        _legevent_activity_age = {}
+        if _legevent_streaks is not None and not df_past.empty:
+            _legevent_activity_age = {
+                str(_b): max((now - _d).days, 0)
+                for _b, _d in df_past.groupby("CleanBill")["ParsedDate"].max().items() if pd.notna(_d)}
 
         legevent_queue, legevent_tiers = _build_legevent_refresh_queue(
             candidate_bills=legevent_candidate_bills,
@@ -7052,6 +10375,9 @@ def run_calendar_update():
             # events" (truncation victims drain first), not merely "no
             # metadata row." Must be BEFORE the negative-cache [] seeding.
             events_cache=_legislation_event_cache,
+            unchanged_streaks=_legevent_streaks,
+            upcoming_bills=_legevent_upcoming,
+            activity_age_days=_legevent_activity_age,
         )
         source_miss_counts["legevent_tier_a_uncached"]     = legevent_tiers["tier_a"]
         source_miss_counts["legevent_tier_b_hash_changed"] = legevent_tiers["tier_b"]
@@ -7060,6 +10386,10 @@ def run_calendar_update():
         source_miss_counts["legevent_skipped_fresh"]       = legevent_tiers["skipped_fresh"]
         source_miss_counts["legevent_hydration_queued"]    = legevent_tiers["queued_overflow"]
         source_miss_counts["legevent_schema_backfill"] = legevent_tiers["schema_backfill"]
+        source_miss_counts["legevent_ttl_backoff_skipped"] = legevent_tiers["ttl_backoff_skipped"]
+        source_miss_counts["legevent_upcoming_queued"] = legevent_tiers["upcoming_queued"]
+        for _q in ("min", "p50", "p90", "max", "dropped_max"):
+            source_miss_counts[f"legevent_score_{_q}"] = legevent_tiers[f"score_{_q}"]
 
         print(
             f"📚 LegEvent cache: loaded={len(legevent_bills_meta)} bills, "
@@ -7071,6 +10401,16 @@ def run_calendar_update():
         )
 
         if legevent_queue:
+            _legevent_workers = _legevent_hydrate_worker_count(os.environ.get("LEGEVENT_HYDRATE_WORKERS", ""))
+            _legevent_t0 = time.perf_counter()
+            _legevent_before = {b: _legevent_events_signature(_legislation_event_cache.get((b, _session_code_5d)))
+                                for b in legevent_queue}
+            # Persisted LegislationID map: queued bills with a known ID skip the LegislationVersion lookup.
+            _legid_map = _load_legislation_id_map() if LEGISLATION_ID_MAP_ENABLED else None
+            if _legid_map is not None:
+                _legid_stats = _seed_legislation_ids(
+                    _legid_map, _session_code_5d, legevent_queue, _legislation_id_cache, http_session,
+                    time.time())
             n_fetched = _hydrate_legevent_cache(
                 refresh_queue=legevent_queue,
                 http_session=http_session,
@@ -7081,9 +10421,36 @@ def run_calendar_update():
                 bills_meta=legevent_bills_meta,
                 push_alert=push_system_alert,
                 now_utc=legevent_now_utc,
+                workers=_legevent_workers,
             )
             source_miss_counts["legevent_fetched_this_cycle"] = n_fetched
-            print(f"📚 LegEvent cache: hydrated {n_fetched} bills this cycle.")
+            source_miss_counts["legevent_hydrate_workers"] = _legevent_workers
+            if _legid_map is not None:
+                _legid_stats["legid_learned"] = _remember_legislation_ids(
+                    _legid_map, _session_code_5d, _legislation_id_cache)
+                _save_legislation_id_map(_legid_map)
+                _legid_stats["legid_map_size"] = len(_legid_map["sessions"][_session_code_5d]["ids"])
+                _legid_stats["legid_requests_saved"] = _legid_stats["legid_map_hits"] - _legid_stats["legid_primed"]
+                source_miss_counts.update(_legid_stats)
+                print(f"🪪 LegislationID map: {_legid_stats['legid_map_hits']} of {len(legevent_queue)} queued "
+                      f"bill(s) known, {_legid_stats['legid_learned']} learned, "
+                      f"{_legid_stats['legid_map_size']} stored; "
+                      f"{_legid_stats['legid_requests_saved']} LIS request(s) saved.")
+            print(f"📚 LegEvent cache: hydrated {n_fetched} bills this cycle "
+                  f"({_legevent_workers} worker(s), {time.perf_counter() - _legevent_t0:.1f}s).")
+            _refresh_observed, _refresh_changed = _legevent_record_refreshes(
+                _legevent_streaks if _legevent_streaks is not None else {}, legevent_queue, _legevent_before,
+                _legislation_event_cache, _session_code_5d)
+            source_miss_counts["legevent_refresh_observed"] = _refresh_observed
+            source_miss_counts["legevent_refresh_changed"] = _refresh_changed
+            source_miss_counts["legevent_refresh_changed_pct"] = (
+                round(100.0 * _refresh_changed / _refresh_observed, 1) if _refresh_observed else 0.0)
+            if _legevent_refresh_state is not None:
+                _save_legevent_refresh_state(_legevent_refresh_state)
+            print(f"📚 LegEvent refresh yield: {_refresh_changed}/{_refresh_observed} re-fetched bill(s) "
+                  f"changed; queue score p50/p90/max={legevent_tiers['score_p50']}/"
+                  f"{legevent_tiers['score_p90']}/{legevent_tiers['score_max']}, "
+                  f"{legevent_tiers['ttl_backoff_skipped']} held by backoff.")
 
         # Codex (P1) + Gemini (critical) review fix: seed negative-cache
         # entries for every candidate bill NOT in the hydration queue.
@@ -7120,6 +10487,10 @@ def run_calendar_update():
                 f"with negative cache (row-loop fetches suppressed)."
             )
 
+        # Per-bill LegEvent index (date -> chamber-filterable, pre-tokenized events) for the four
+        # cache matchers, built now that the cache is loaded + hydrated + negative-seeded.
+        legevent_index = LegEventIndex().warm(_legislation_event_cache)
+
         # PR-C7.1l: derive the MINISTERIAL EventCode set from the now-hydrated
         # cache. An event TYPE whose every occurrence (>= MINISTERIAL_MIN_SAMPLES)
         # carries neither a vote nor a real meeting timestamp is non-deliberative
@@ -7213,6 +10584,8 @@ def run_calendar_update():
         # order-invariance re-run). Bundled so the oracle can't drift from the real call.
         _stm_shared_kwargs = dict(
             api_schedule_map=api_schedule_map,
+            schedule_index=schedule_index,
+            legevent_index=legevent_index,
             docket_memory=docket_memory,
             convene_times=convene_times,
             _append_event=_append_event,
@@ -7253,20 +10626,52 @@ def run_calendar_update():
         # + the day-by-day replay; the "shadow" mode is the final gate before "1". See future_improvements Step 6.
         _incr_mode = os.environ.get("STM_INCREMENTAL_PRIMARY", "")
         _incr_ready, _incr_changed, _incr_cache = False, set(), {}
+        # The per-bill reuse keys (STM_Bill_Cache.HistoryHash), stm_bill_digests, came from
+        # _history_delta_hashes above: only the bills the HISTORY delta touched were re-digested.
+        # Per-bill dependency tracking (STM_DEPENDENCY_TRACKING): fingerprint every tracked shared-input
+        # key BEFORE the STM runs (it writes LegEvent negative-cache seeds), and record which keys each
+        # bill's STM rows read (stm_bill_deps, persisted with the bill's cached events). None = not recorded
+        # this cycle (tracking off, or the sharded STM ran) → those bills fall back to the all-or-nothing sig.
+        _stm_dep_recorder, _stm_dep_fps, _stm_dep_residual, _stm_dep_token = None, {}, "", ""
+        stm_bill_deps = None
+        if _stm_incremental_on and STM_DEPENDENCY_TRACKING:
+            try:
+                _stm_dep_fps = _stm_dependency_fingerprints(_stm_shared_kwargs)
+                _stm_dep_residual = _compute_stm_residual_sig(_stm_shared_kwargs)
+                _stm_dep_token = _stm_dependency_token(_stm_dep_residual, _stm_dep_fps)
+                _stm_dep_recorder = StmDependencyRecorder()
+            except Exception as _dep_err:
+                print(f"⚠️ STM dependency fingerprinting failed → all-or-nothing shared sig this cycle: {_dep_err}")
+                _stm_dep_recorder, _stm_dep_fps, _stm_dep_residual, _stm_dep_token = None, {}, "", ""
+        # Per-stage STM cost attribution (STM_COST_PROFILE): profiles the run that produces this cycle's
+        # events — the full STM (serial or sharded) or the incremental subset. The isolated verification
+        # and shadow re-runs are not profiled.
+        _stm_cost_profiler = StmCostProfiler(STM_COST_SAMPLE_EVERY) if STM_COST_PROFILE else None
         if _incr_mode in ("1", "shadow"):
             try:
                 _incr_sig = _compute_stm_shared_sig(ACTIVE_SESSION, df_docket, _vote_id_set,
                                                     api_schedule_map, convene_times)
-                _incr_cache, _incr_cache_ws, _incr_cache_ok, _incr_prev_sig = _load_stm_bill_cache(sheet)
-                if _incr_cache_ok and _incr_prev_sig and _incr_sig == _incr_prev_sig:
-                    _incr_changed = {b for b, h in legevent_history_hashes.items()
+                _incr_cache, _incr_cache_ws, _incr_cache_ok, _incr_prev_sig, _incr_prev_token = \
+                    _load_stm_bill_cache(sheet)
+                _incr_dep_changed = (_stm_changed_dependency_keys(_incr_prev_token, _stm_dep_residual, _stm_dep_fps)
+                                     if (_incr_cache_ok and _stm_dep_recorder is not None) else None)
+                if _incr_dep_changed is not None:
+                    # fine-grained: a bill recomputes iff its HISTORY moved or a shared key it READ moved
+                    _incr_dep_bills = _stm_dependency_changed_bills(_incr_cache, _incr_dep_changed)
+                    _incr_changed = {b for b, h in stm_bill_digests.items()
+                                     if _incr_cache.get(b, {}).get("hash") != h or b in _incr_dep_bills}
+                    _incr_ready = True
+                    print(f"🧷 STM dependencies: {sum(map(len, _incr_dep_changed.values()))} shared key(s) moved → "
+                          f"{len(_incr_dep_bills)} cached bill(s) invalidated by them.")
+                elif _incr_cache_ok and _incr_prev_sig and _incr_sig == _incr_prev_sig:
+                    _incr_changed = {b for b, h in stm_bill_digests.items()
                                      if _incr_cache.get(b, {}).get("hash") != h}
                     _incr_ready = True
             except Exception as _incr_prep_err:
                 print(f"⚠️ incremental prep failed → full STM this cycle: {_incr_prep_err}")
                 _incr_ready = False
 
-        def _run_incremental_into_master(_fh, _fm):
+        def _run_incremental_into_master(_fh, _fm, _recorder=None, _profiler=None):
             """Subset-STM on the CHANGED bills (fresh per-bill state) + reconstruct UNCHANGED bills'
             events from cache THROUGH _append_event — so every breaker counter (meeting_unsourced,
             rows_appended, invariant_violations) is reproduced exactly (they're functions of the
@@ -7284,22 +10689,23 @@ def run_calendar_update():
             The "⚡ INCREMENTAL-PRIMARY" log line labels the cycle so the lower process counts read
             correctly. Full process-counter parity would need per-bill delta caching — unnecessary
             for correctness; see future_improvements Step 6."""
-            # .astype(str).str.strip() is NOT redundant (Gemini #157): legevent_history_hashes — and
-            # thus _incr_changed — is keyed by str(clean_bill).strip() (the groupby build), so the
+            # .astype(str).str.strip() is NOT redundant (Gemini #157): stm_bill_digests — and
+            # thus _incr_changed — is keyed by the stripped CleanBill (_stm_bill_digests), so the
             # df_past side MUST use the same normalization or a changed bill with stray whitespace
             # would miss the .isin and be wrongly reused STALE. Cheap (vectorized, once/cycle).
             _df_changed = df_past[df_past["CleanBill"].astype(str).str.strip().isin(_incr_changed)]
             _fh, _fm = run_sequential_turing_machine(_df_changed,
                 bill_locations={}, last_seen_date={}, _floor_miss_dates=_floor_miss_dates,
-                _floor_hit=_fh, _floor_miss=_fm, **_stm_shared_kwargs)
+                _floor_hit=_fh, _floor_miss=_fm, dependency_recorder=_recorder, cost_profiler=_profiler,
+                **(_recorder.wrap(_stm_shared_kwargs) if _recorder is not None else _stm_shared_kwargs))
             for _cb, _entry in _incr_cache.items():
                 # Skip: the sig row; CHANGED bills (recomputed by the subset-STM above); and — the
                 # phantom guard (Gemini #157) — any cached bill NO LONGER in the current HISTORY
-                # (`legevent_history_hashes`). Without the last check a deleted/filtered bill would
+                # (`stm_bill_digests`). Without the last check a deleted/filtered bill would
                 # be reconstructed as a phantom event the full run never produces — silent in primary
                 # mode. (New bills are already in _incr_changed via a missing/mismatched cache hash.)
                 if (_cb == _STM_CACHE_SHARED_SIG_KEY or _cb in _incr_changed
-                        or _cb not in legevent_history_hashes):
+                        or _cb not in stm_bill_digests):
                     continue
                 if not isinstance(_entry, dict):       # a corrupt cache row may not be a dict (Gemini #157)
                     continue
@@ -7312,23 +10718,120 @@ def run_calendar_update():
                         _append_event(_ev)
             return _fh, _fm
 
+        # STM_SHARD_WORKERS: "" (off, serial) | N | "auto" (one per core) — the full STM's rows split by
+        # bill across a process pool and merged back in serial row order (see run_stm_shards). Any pool
+        # failure falls back to the serial STM before the caller's state is touched.
+        _stm_shard_workers = _stm_shard_worker_count(os.environ.get("STM_SHARD_WORKERS", ""))
+
         def _run_full_stm(_fh, _fm):
+            if _stm_shard_workers > 1:
+                _shard_results = None
+                try:
+                    _shard_results = run_stm_shards(df_past, _stm_shard_workers, {
+                        k: v for k, v in _stm_shared_kwargs.items()
+                        if k not in ("_append_event", "push_system_alert", "source_miss_counts")},
+                        cost_sample_every=_stm_cost_profiler.sample_every if _stm_cost_profiler is not None else 0)
+                except Exception as _shard_err:
+                    push_system_alert(
+                        f"Sharded STM failed ({type(_shard_err).__name__}: {_shard_err}); ran the serial STM "
+                        f"this cycle (output unaffected).",
+                        status="WARN", category="DATA_ANOMALY", severity="WARN", dedup_key="stm_shard_fallback")
+                    print(f"⚠️ sharded STM failed → serial STM: {_shard_err}")
+                if _shard_results is not None:
+                    print(f"⚡ STM sharded across {len(_shard_results)} worker process(es).")
+                    return merge_stm_shards(_shard_results,
+                        bill_locations=bill_locations, last_seen_date=last_seen_date,
+                        _append_event=_append_event, push_system_alert=push_system_alert,
+                        source_miss_counts=source_miss_counts, _floor_miss_dates=_floor_miss_dates,
+                        _legislation_id_cache=_legislation_id_cache,
+                        _legislation_event_cache=_legislation_event_cache, _floor_hit=_fh, _floor_miss=_fm,
+                        cost_profiler=_stm_cost_profiler)
+            _recorder = _stm_dep_recorder
             return run_sequential_turing_machine(df_past,
                 bill_locations=bill_locations, last_seen_date=last_seen_date,
                 _floor_miss_dates=_floor_miss_dates, _floor_hit=_fh, _floor_miss=_fm,
-                **_stm_shared_kwargs)
-
+                dependency_recorder=_recorder, cost_profiler=_stm_cost_profiler,
+                **(_recorder.wrap(_stm_shared_kwargs) if _recorder is not None else _stm_shared_kwargs))
+
+        def _stm_isolated_events(_df):
+            """Run the STM over `_df` through the real _append_event (so events carry the same stamps
+            as Sheet1's) and return them, restoring master_events / telemetry / alerts / floor misses /
+            the LegEvent caches (the resolver's negative-cache seeds) afterwards — a verification run
+            never reaches the cycle's output or the caches persisted after it."""
+            _n, _smc, _alerts = len(master_events), dict(source_miss_counts), list(alert_rows)
+            _dedup, _fmd = set(_alert_dedup_keys), Counter(_floor_miss_dates)
+            _idc, _evc = dict(_legislation_id_cache), dict(_legislation_event_cache)
+            try:
+                run_sequential_turing_machine(_df, bill_locations={}, last_seen_date={},
+                    _floor_miss_dates=_floor_miss_dates, _floor_hit=0, _floor_miss=0, **_stm_shared_kwargs)
+                return [dict(e) for e in master_events[_n:]]
+            finally:
+                del master_events[_n:]
+                for _k in list(source_miss_counts):
+                    source_miss_counts[_k] = _smc.get(_k, 0)
+                alert_rows[:] = _alerts
+                _alert_dedup_keys.clear(); _alert_dedup_keys.update(_dedup)
+                _floor_miss_dates.clear(); _floor_miss_dates.update(_fmd)
+                _legislation_id_cache.clear(); _legislation_id_cache.update(_idc)
+                _legislation_event_cache.clear(); _legislation_event_cache.update(_evc)
+
+        def _verify_incremental_primary():
+            """Merkle verification of this cycle's incremental-primary output without a second full STM:
+            recompute the next STM_VERIFY_SAMPLE reused bills and leaf-compare them, or — every
+            STM_VERIFY_FULL_EVERY-th primary cycle — run the full STM in isolation and root-compare.
+            Reports coverage (bills verified today: sampled + recomputed) and returns the divergent bills."""
+            _state = _load_stm_verify_state()
+            _incr_leaves = _stm_output_leaves(master_events[_pre_stm_len:])
+            _reused = (set(_incr_cache) - {_STM_CACHE_SHARED_SIG_KEY} - _incr_changed) & set(stm_bill_digests)
+            _state["since_full"] = _state.get("since_full", 0) + 1
+            if STM_VERIFY_FULL_EVERY and _state["since_full"] >= STM_VERIFY_FULL_EVERY:
+                _full_leaves = _stm_output_leaves(_stm_isolated_events(df_past))
+                _bad = ([] if _stm_merkle_root(_full_leaves) == _stm_merkle_root(_incr_leaves)
+                        else _stm_merkle_diff(_full_leaves, _incr_leaves))
+                _checked, _how = set(stm_bill_digests), "full-run root"
+                _state["since_full"] = 0
+            else:
+                _sample = _stm_verify_pick(_reused, STM_VERIFY_SAMPLE, _state)
+                _fresh = _stm_output_leaves(_stm_isolated_events(
+                    df_past[df_past["CleanBill"].astype(str).str.strip().isin(_sample)])) if _sample else {}
+                _bad = [b for b in _sample if _fresh.get(b) != _incr_leaves.get(b)]
+                _checked, _how = set(_sample), f"{len(_sample)} sampled reused bill(s)"
+            _pct = _stm_verify_coverage(_state, now.strftime("%Y-%m-%d"), _checked | _incr_changed, stm_bill_digests)
+            _save_stm_verify_state(_state)
+            source_miss_counts["stm_verify_bills"] = len(_checked)
+            source_miss_counts["stm_verify_mismatches"] = len(_bad)
+            source_miss_counts["stm_verify_coverage_pct"] = _pct
+            print(f"🔎 INCREMENTAL-PRIMARY verify ({_how}): {len(_bad)} divergent; "
+                  f"{_pct}% of bills verified today.")
+            return _bad
+
+        _incr_primary_ran = False
         if _incr_mode == "1" and _incr_ready:
             try:
-                _floor_hit, _floor_miss = _run_incremental_into_master(_floor_hit, _floor_miss)
+                _floor_hit, _floor_miss = _run_incremental_into_master(_floor_hit, _floor_miss,
+                                                                       _stm_dep_recorder, _stm_cost_profiler)
+                _incr_primary_ran = True
                 # reused = cached bills that are NOT changed AND still in the current HISTORY — exactly
                 # what the reuse loop reconstructs (excludes new bills, which are in _incr_changed, and
                 # phantom bills, which are skipped). The naive len(cache)-1-len(changed) under-counts
                 # because _incr_changed also holds NEW bills absent from the cache (Gemini #157).
                 _reused_n = len((set(_incr_cache) - {_STM_CACHE_SHARED_SIG_KEY} - _incr_changed)
-                                & set(legevent_history_hashes))
+                                & set(stm_bill_digests))
                 print(f"⚡ INCREMENTAL-PRIMARY: recomputed {len(_incr_changed)} changed bills; "
                       f"reused {_reused_n} from cache (full STM skipped).")
+                if STM_VERIFY_SAMPLE or STM_VERIFY_FULL_EVERY:
+                    _verify_bad = _verify_incremental_primary()
+                    if _verify_bad:
+                        # A reused bill's cached output no longer matches a fresh STM run of it → this
+                        # cycle's incremental output is wrong. CRITICAL, then the fail-safe below runs
+                        # the full STM, so the wrong rows never reach Sheet1.
+                        push_system_alert(
+                            f"INCREMENTAL-PRIMARY VERIFY DIVERGENCE: {len(_verify_bad)} reused bill(s) no longer "
+                            f"match a fresh STM run (Merkle leaf mismatch): {_verify_bad[:5]}. The full STM ran "
+                            f"this cycle instead; root-cause before trusting incremental-primary.",
+                            status="CRITICAL", category="DATA_ANOMALY", severity="CRITICAL",
+                            dedup_key="stm_incremental_verify_divergence")
+                        raise RuntimeError(f"Merkle verification failed for {len(_verify_bad)} bill(s)")
             except Exception as _incr_primary_err:
                 # FAIL-SAFE: any incremental failure → discard the partial contribution and run the
                 # full STM, so a reconstruction bug can never write a partial/wrong Sheet1 (accuracy > speed).
@@ -7341,9 +10844,35 @@ def run_calendar_update():
                 for _k in list(source_miss_counts):
                     source_miss_counts[_k] = _pre_stm_smc.get(_k, 0)   # reset telemetry to the pre-STM baseline
                 _floor_miss_dates.clear(); _floor_miss_dates.update(_pre_stm_fmd)  # and the floor counter
+                _incr_primary_ran = False
+                if _stm_dep_recorder is not None:
+                    _stm_dep_recorder = StmDependencyRecorder()        # the full run re-records every bill
+                if _stm_cost_profiler is not None:
+                    _stm_cost_profiler = StmCostProfiler(STM_COST_SAMPLE_EVERY)   # and is profiled afresh
                 _floor_hit, _floor_miss = _run_full_stm(_floor_hit, _floor_miss)
         else:
             _floor_hit, _floor_miss = _run_full_stm(_floor_hit, _floor_miss)
+        if _stm_dep_recorder is not None and (_stm_dep_recorder.deps or _incr_primary_ran):
+            # Recomputed bills carry this run's reads; reused bills (incremental-primary) keep the
+            # deps cached with their events — their rows did not run, so their reads are unchanged.
+            # (An empty recorder after a full run = the sharded STM ran: nothing recorded, deps None.)
+            stm_bill_deps = {b: c.get("deps") for b, c in _incr_cache.items()
+                             if b != _STM_CACHE_SHARED_SIG_KEY and isinstance(c, dict)} \
+                if _incr_primary_ran else {}
+            stm_bill_deps.update(_stm_dep_recorder.bill_deps())
+        source_miss_counts.update(legevent_index.metrics())
+        if source_miss_counts["legevent_index_nondict_events"]:
+            print(f"⚠️ LegEvent index: skipped {source_miss_counts['legevent_index_nondict_events']} non-dict "
+                  f"cached event(s) (corrupt LegEvent cache rows).")
+        if _stm_cost_profiler is not None and _stm_cost_profiler.rows:
+            source_miss_counts.update(_stm_cost_profiler.metrics())
+            source_miss_labels.update(_stm_cost_profiler.labels())
+            _cost_top = sorted(_stm_cost_profiler.stage_s.items(), key=lambda kv: -kv[1])[:4]
+            print(f"⏱️ STM cost by stage ({_stm_cost_profiler.rows} rows, 1 bill in "
+                  f"{_stm_cost_profiler.sample_every}): "
+                  + ", ".join(f"{k} {v:.2f}s" for k, v in _cost_top)
+                  + "; slowest bills: "
+                  + (", ".join(f"{b} {v * 1000:.0f}ms" for b, v in _stm_cost_profiler.slowest_bills(3)) or "-"))
 
         # SHADOW validation of the incremental-PRIMARY path: the full STM above drives Sheet1 +
         # telemetry; here we run the EXACT primary path (subset-STM + reconstruct) in ISOLATION and
@@ -7359,7 +10888,7 @@ def run_calendar_update():
             _shadow_alerts = list(alert_rows)
             _shadow_dedup = set(_alert_dedup_keys)
             _shadow_fmd = Counter(_floor_miss_dates)
-            _shadow_failed = False
+            _shadow_failed, _shadow_err = False, None
             _ev_ok, _only_full, _only_incr, _crit_diff, _tel_all = True, [], [], {}, {}
             try:
                 del master_events[_pre_stm_len:]                       # isolate the incremental run
@@ -7372,24 +10901,15 @@ def run_calendar_update():
                 # ACCURACY-CRITICAL counters — these feed the Section-9 circuit breaker. Reconstruction
                 # via _append_event reproduces them exactly, so a mismatch here is a real bug → CRITICAL.
                 _crit = ("meeting_unsourced", "rows_appended", "invariant_violations")
-                _crit_diff = {k: (_full_smc.get(k, 0) - _pre_stm_smc.get(k, 0),
-                                  source_miss_counts.get(k, 0) - _pre_stm_smc.get(k, 0))
-                              for k in _crit
-                              if (_full_smc.get(k, 0) - _pre_stm_smc.get(k, 0))
-                              != (source_miss_counts.get(k, 0) - _pre_stm_smc.get(k, 0))}
+                _crit_diff = _telemetry_deltas(_full_smc, source_miss_counts, _pre_stm_smc, _crit)
                 # FULL telemetry diff (every counter the STM moved this cycle) — OBSERVE-ONLY. The
                 # incremental reproduces event-derived counters but NOT per-row PROCESS counters
                 # (total_processed, dropped_noise, cache hits/misses, *_attempted, *_recovered) for
                 # reused bills — inherently irreproducible without re-processing, and they feed nothing
                 # downstream. Surfaced so the expected deltas are visible during the shadow window.
-                _all_keys = set(_full_smc) | set(source_miss_counts) | set(_pre_stm_smc)
-                _tel_all = {k: (_full_smc.get(k, 0) - _pre_stm_smc.get(k, 0),
-                                source_miss_counts.get(k, 0) - _pre_stm_smc.get(k, 0))
-                            for k in _all_keys
-                            if (_full_smc.get(k, 0) - _pre_stm_smc.get(k, 0))
-                            != (source_miss_counts.get(k, 0) - _pre_stm_smc.get(k, 0))}
+                _tel_all = _telemetry_deltas(_full_smc, source_miss_counts, _pre_stm_smc)
             except Exception as _incr_shadow_err:
-                _shadow_failed = True
+                _shadow_failed, _shadow_err = True, f"{type(_incr_shadow_err).__name__}: {_incr_shadow_err}"
                 print(f"⚠️ incremental-primary shadow failed (observe-only, non-fatal): {_incr_shadow_err}")
             finally:
                 # ALWAYS restore production — full output + telemetry + alerts + floor — even on exception.
@@ -7402,7 +10922,12 @@ def run_calendar_update():
                 _floor_miss_dates.clear(); _floor_miss_dates.update(_shadow_fmd)
             # Report on the RESTORED state (a divergence alert then lands on production alert_rows).
             if _shadow_failed:
-                pass
+                push_system_alert(
+                    f"INCREMENTAL-PRIMARY SHADOW could not run this cycle ({_shadow_err}); no MATCH/DIVERGENCE "
+                    f"verdict. Production output is the full STM (unaffected); the rollout gate stays closed "
+                    f"until the shadow completes.",
+                    status="WARN", category="DATA_ANOMALY", severity="WARN",
+                    dedup_key="stm_incremental_shadow_failed")
             elif _ev_ok and not _crit_diff:
                 print(f"✅ INCREMENTAL-PRIMARY SHADOW MATCH — subset-STM({len(_incr_changed)} changed) + cache "
                       f"reuse == full STM: CALENDAR + breaker telemetry identical. Non-breaker telemetry deltas "
@@ -7481,16 +11006,27 @@ def run_calendar_update():
                 # EXCEPT its own HISTORY (that's the per-bill hash). Canonical hashes so a
                 # dict/row reorder can't false-trip it (the #146 lesson). If this moved since
                 # last cycle, NO bill is reusable (times may have shifted) -> full recompute.
+                # With dependency tracking, only the bills that READ a moved shared key lose reuse.
                 _shared_sig = _compute_stm_shared_sig(
                     ACTIVE_SESSION, df_docket, _vote_id_set, api_schedule_map, convene_times)
-                _bill_cache, _bill_cache_ws, _bill_cache_ok, _prev_shared_sig = _load_stm_bill_cache(sheet)
+                _bill_cache, _bill_cache_ws, _bill_cache_ok, _prev_shared_sig, _prev_dep_token = \
+                    _load_stm_bill_cache(sheet)
                 _shared_changed = (not _prev_shared_sig) or (_shared_sig != _prev_shared_sig)
+                _dep_keys = (_stm_changed_dependency_keys(_prev_dep_token, _stm_dep_residual, _stm_dep_fps)
+                             if (_bill_cache_ok and _stm_dep_recorder is not None) else None)
+                _dep_bills = frozenset()
+                if _dep_keys is not None:
+                    _dep_bills = frozenset(_stm_dependency_changed_bills(_bill_cache, _dep_keys))
+                    _shared_changed = False
                 _stm_full_contribution = master_events[_pre_stm_len:]
                 _match, _of, _oi, _reused, _recomp = _stm_incremental_shadow(
-                    _stm_full_contribution, legevent_history_hashes, _shared_changed, _bill_cache)
+                    _stm_full_contribution, stm_bill_digests, _shared_changed, _bill_cache, _dep_bills)
                 if _match:
+                    _dep_note = (f"; {len(_dep_bills)} invalidated by "
+                                 f"{sum(map(len, _dep_keys.values()))} moved shared key(s)"
+                                 if _dep_keys is not None else "")
                     print(f"✅ INCREMENTAL SHADOW MATCH — {_reused} bills reused, {_recomp} recomputed "
-                          f"(shared_changed={_shared_changed}); cached-bill reuse is SAFE this cycle.")
+                          f"(shared_changed={_shared_changed}{_dep_note}); cached-bill reuse is SAFE this cycle.")
                 else:
                     # SHADOW / experimental (observe-only): the incremental engine's output is NEVER used —
                     # it runs in parallel to PROVE it matches the proven full engine before any future flip.
@@ -7509,8 +11045,11 @@ def run_calendar_update():
                         dedup_key="stm_incremental_divergence")
                     print(f"ℹ️ Incremental SHADOW divergence (observe-only, LIVE calendar unaffected) — "
                           f"only-full={len(_of)}, only-incr={len(_oi)}")
-                _persist_stm_bill_cache(sheet, _bill_cache_ws, _stm_full_contribution,
-                                        legevent_history_hashes, _shared_sig, _bill_cache_ok)
+                if _persist_stm_bill_cache(sheet, _bill_cache_ws, _stm_full_contribution,
+                                           stm_bill_digests, _shared_sig, _bill_cache_ok,
+                                           bill_deps=stm_bill_deps, dep_token=_stm_dep_token) \
+                        and stm_bill_deps is not None and _stm_dep_token:
+                    _save_stm_dependency_state(_stm_dep_token, _stm_dep_residual, _stm_dep_fps)
             except Exception as _shadow_err:
                 print(f"⚠️ Incremental shadow check failed (observe-only, non-fatal): {_shadow_err}")
 
@@ -7746,6 +11285,41 @@ def run_calendar_update():
             status="INFO", category="DATA_ANOMALY", severity="INFO",
             dedup_key="agenda_link_unknown_labels")
 
+    # Hot-path memo telemetry (per helper: hits / misses / size). A memo that fills to its bound means the
+    # helper's input vocabulary (time strings, room names, descriptions) blew up this cycle — the same
+    # drift the volume guards watch, surfaced as INFO so an operator sees it before it costs time.
+    source_miss_counts.update(_hot_memo_metrics())
+    _saturated_memos = _saturated_hot_memos()
+    if _saturated_memos:
+        push_system_alert(
+            f"Hot-path memo(s) saturated this cycle: {', '.join(_saturated_memos)}. The distinct-input "
+            f"vocabulary outgrew its bound (LRU eviction, slower but still correct) — check the memo_*_size "
+            f"metrics for a new LIS time/room/description phrasing flood.",
+            status="INFO", category="DATA_ANOMALY", severity="INFO", dedup_key="hot_memo_saturated")
+
+    # Agenda conditional-GET telemetry: 304s + identical bodies served from the validator store (no
+    # pdfplumber), fresh parses, the hit rate over the two, and the body bytes the 304s didn't download.
+    source_miss_counts.update(_AGENDA_VALIDATORS.metrics())
+
+    # Blob cache upkeep, after the cycle's last blob read: LRU eviction down to LIS_BLOB_CACHE_MAX_MB, then
+    # size / entries / 304 hit rate / evictions / quarantined entries plus the transfer counters (blob_*).
+    source_miss_counts.update(blob_cache_maintain())
+
+    # Request-governor telemetry (per endpoint: requests / mean latency / governor wait / throttles /
+    # errors; per host: current adaptive rate as % of base). We have never seen a 429 from LIS
+    # (lis_api_safety.md), so ANY throttle is news — WARN, with the endpoints that drew it.
+    _gov_metrics = _LIS_GOVERNOR.metrics()
+    source_miss_counts.update(_gov_metrics)
+    if _gov_metrics["lis_governor_throttled"]:
+        _throttled_eps = sorted(k[len("lis_ep_"):-len("_throttled")] for k, v in _gov_metrics.items()
+                                if k.startswith("lis_ep_") and k.endswith("_throttled") and v)
+        push_system_alert(
+            f"Upstream throttled us {_gov_metrics['lis_governor_throttled']}x this cycle (429/503) on "
+            f"{', '.join(_throttled_eps)}. The request governor halved those hosts' rate and honoured "
+            f"Retry-After; check lis_host_*_rate_pct and lower LIS_HOST_MAX_RPS / LEGEVENT_HYDRATE_WORKERS "
+            f"if it recurs (docs/knowledge/lis_api_safety.md).",
+            status="WARN", category="API_FAILURE", severity="WARN", dedup_key="lis_governor_throttled")
+
     # Encoded as a JSON-in-outcome alert row with Bill="SYSTEM_METRICS" so
     # X-Ray Section 0 can parse it. One-liner summary also goes to stdout
     # so it lands in worker logs.
@@ -7926,7 +11500,7 @@ def run_calendar_update():
             "Status": "METRICS",
             "Committee": "System Status",
             "Bill": "SYSTEM_METRICS",
-            "Outcome": json.dumps(source_miss_counts, separators=(',', ':')),
+            "Outcome": json.dumps({**source_miss_counts, **source_miss_labels}, separators=(',', ':')),
             "AgendaOrder": -100,
             "Source": "SYSTEM",
             "Origin": "system_metrics",
@@ -7974,7 +11548,7 @@ def run_calendar_update():
         filtered_events.extend(alert_rows)
 
     _phase("LegEvent cache persistence (_persist_legevent_cache — full-cache chunked write)")
-    final_df = pd.DataFrame(filtered_events)
+    final_df = _events_frame(filtered_events)   # == pd.DataFrame(filtered_events), built column-wise
     if not final_df.empty:
         # === OPTION A: Collapse unsourced rows into single Ledger Updates block ===
         # Must run BEFORE dedup so that journal entries from different phantom committees
@@ -8152,6 +11726,7 @@ def run_calendar_update():
         # Persist the settled-agenda parse cache (speed audit). Independent of
         # final_df, so it runs even on an empty-output cycle. Fail-safe inside.
         _persist_agenda_cache(sheet, _agenda_cache_ws, agenda_parse_cache, _agenda_cache_dirty, _agenda_cache_load_ok)
+        _AGENDA_VALIDATORS.persist(AGENDA_VALIDATOR_PATH)
         if _agenda_cache_hits:
             print(f"⚡ Agenda cache: {_agenda_cache_hits} settled agendas served from cache (skipped fetch+PDF-parse).")
 
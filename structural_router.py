@@ -39,6 +39,7 @@ Description — zero dictionary, zero maintenance, no KeyError surface.
 """
 from __future__ import annotations
 
+import functools as _functools
 import re as _re
 from dataclasses import dataclass
 
@@ -374,7 +375,13 @@ def normalize_event_description(s) -> str:
     to space-joined alnum tokens. Used ONLY to recover LIS's structural EventCode
     from its own published vocabulary — never to classify by text.
     """
-    s = _s(s)
+    return _normalize_description_text(_s(s))
+
+
+@_functools.lru_cache(maxsize=8192)
+def _normalize_description_text(s: str) -> str:
+    """normalize_event_description's regex pipeline, memoized on the stripped string (a small,
+    repetitive vocabulary — the caller reads hit/miss/size via normalize_event_description.cache_info)."""
     s = _re.sub(r'^[^A-Za-z0-9]*\[[^\]]*\]\s*', '', s)   # leading [tag] block (+ any emoji)
     s = _re.sub(r'^\s*[HS]\s+', '', s)                   # chamber prefix
     s = _re.sub(r'\s*\([^)]*\)\s*$', '', s)              # trailing (vote tally)
@@ -382,6 +389,10 @@ def normalize_event_description(s) -> str:
     return s
 
 
+normalize_event_description.cache_info = _normalize_description_text.cache_info
+normalize_event_description.cache_clear = _normalize_description_text.cache_clear
+
+
 def build_admin_recovery_index(reference_items, ministerial_codes=frozenset()) -> frozenset:
     """From LIS's EventType reference, the set of normalized descriptions whose
     EVERY EventCode routes admin (G-prefix executive OR ministerial).
@@ -0,0 +1,165 @@
+"""
+Agenda extraction fixture corpus builder (deterministic, offline).
+
+Writes tools/verification/fixtures/agendas/: committee-docket PDFs laid out
+the way LIS / chamber-site agendas are (header block, numbered docket
+table with bill / patron / title columns, long boilerplate tails,
+multi-column pages, compressed and uncompressed content streams, TJ
+kerning arrays, a scanned-image docket with no text layer, a truncated
+download) plus an HTML agenda page. The sandbox that built this
+corpus had no LIS access, so the files are generated stand-ins, not
+downloads. Drop real agenda PDFs / HTML into the same directory and
+extraction_benchmark.py and test_agenda_pdf_stream.py pick them up
+unchanged (recall is always measured against the pdfplumber path, not
+against a hand list).
+
+Usage
+-----
+    python3 tools/agenda_sizing/build_fixture_corpus.py      # (re)writes the corpus
+"""
+import os
+import random
+import zlib
+
+OUT = os.path.join(os.path.dirname(__file__), "..", "verification", "fixtures", "agendas")
+
+_BOILERPLATE = [
+    "Persons wishing to speak on a bill should sign in with the committee clerk before the meeting.",
+    "Written testimony may be submitted electronically through the Legislative Information System.",
+    "The committee may take up bills in an order other than the order listed on this docket.",
+    "Accessibility: please contact the committee office at least 48 hours in advance for accommodations.",
+    "Bills not reached today will be carried over to the next scheduled meeting of the committee.",
+    "Members of the public are reminded that signs and placards are not permitted in the committee room.",
+]
+_PATRONS = ["Bulova", "Helmer", "Sickles", "Watts", "Deeds", "Surovell", "McPike", "Ebbin", "Hashmi", "Lopez"]
+_TITLES = ["Income tax; subtraction for military retirement pay.", "Public schools; cell phone policies.",
+           "Firearms; purchase, possession, or transportation.", "Elections; absentee voting procedures.",
+           "Health insurance; coverage for prescription drugs.", "Highway maintenance; funding formula."]
+
+
+def _esc(text):
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _content(lines, kern):
+    """PDF content stream for [(x, y, font, size, text)]; kern=True writes TJ arrays with spacing."""
+    out = []
+    for x, y, font, size, text in lines:
+        if kern and len(text) > 4:
+            mid = len(text) // 2
+            show = f"[({_esc(text[:mid])}) -40 ({_esc(text[mid:])})] TJ"
+        else:
+            show = f"({_esc(text)}) Tj"
+        out.append(f"BT /{font} {size} Tf {x:.1f} {y:.1f} Td {show} ET")
+    return "\n".join(out).encode("latin-1")
+
+
+def _pdf(pages, compress=True, kern=False, image_only=False, truncate=False):
+    """A valid multi-page PDF; pages = [[(x, y, font, size, text)], ...]."""
+    objs = {1: b"<< /Type /Catalog /Pages 2 0 R >>"}
+    fonts = b"<< /F1 3 0 R /F2 4 0 R >>"
+    objs[3] = b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>"
+    objs[4] = b"<< /Type /Font /Subtype /Type1 /BaseFont /Times-Roman /Encoding /WinAnsiEncoding >>"
+    kids, n = [], 5
+    for lines in pages:
+        if image_only:
+            pixels = bytes(random.Random(len(lines)).randrange(256) for _ in range(64 * 64))
+            objs[n + 2] = (b"<< /Type /XObject /Subtype /Image /Width 64 /Height 64 /ColorSpace /DeviceGray "
+                           b"/BitsPerComponent 8 /Length %d >>\nstream\n" % len(pixels) + pixels + b"\nendstream")
+            stream = b"q 540 0 0 720 36 36 cm /Im1 Do Q"
+            resources = b"<< /XObject << /Im1 %d 0 R >> >>" % (n + 2)
+        else:
+            stream = _content(lines, kern)
+            resources = b"<< /Font " + fonts + b" >>"
+        if compress:
+            stream = zlib.compress(stream)
+            objs[n + 1] = b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(stream) + stream + b"\nendstream"
+        else:
+            objs[n + 1] = b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream"
+        objs[n] = (b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents %d 0 R /Resources %s >>"
+                   % (n + 1, resources))
+        kids.append(n)
+        n += 3 if image_only else 2
+    if image_only:
+        del objs[3], objs[4]
+    objs[2] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(b"%d 0 R" % k for k in kids), len(kids))
+    out, offsets = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"), {}
+    for num in sorted(objs):
+        offsets[num] = len(out)
+        out += b"%d 0 obj\n" % num + objs[num] + b"\nendobj\n"
+    size = max(objs) + 1
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % size
+    for num in range(1, size):
+        out += (b"%010d 00000 n \n" % offsets[num]) if num in offsets else b"0000000000 65535 f \n"
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (size, xref)
+    data = bytes(out)
+    return data[: len(data) // 2] if truncate else data
+
+
+def _docket(rng, committee, bills, pages, tail_pages, two_column=False):
+    """Header + numbered docket rows spread over `pages`, then `tail_pages` of boilerplate."""
+    out, queue = [], list(bills)
+    per_page = max(1, -(-len(queue) // max(pages, 1)))
+    for p in range(pages):
+        lines = []
+        y = 750
+        if p == 0:
+            lines += [(72, y, "F1", 14, f"{committee}"), (72, y - 18, "F2", 11, "Docket - Monday, January 15, 2026"),
+                      (72, y - 34, "F2", 10, "8:00 AM - House Committee Room, General Assembly Building")]
+            y -= 70
+        for k in range(per_page):
+            if not queue:
+                break
+            bill = queue.pop(0)
+            col_x = 72 if not two_column or k % 2 == 0 else 320
+            row_y = y - (k // (2 if two_column else 1)) * 28
+            lines += [(col_x, row_y, "F2", 10, f"{k + 1 + p * per_page}."),
+                      (col_x + 22, row_y, "F1", 10, bill),
+                      (col_x + 90, row_y, "F2", 10, rng.choice(_PATRONS)),
+                      (col_x + 22, row_y - 12, "F2", 9, rng.choice(_TITLES))]
+        for j in range(8):
+            lines.append((72, 140 - j * 12, "F2", 8, rng.choice(_BOILERPLATE)))
+        out.append(lines)
+    for _ in range(tail_pages):
+        out.append([(72, 740 - j * 13, "F2", 9, rng.choice(_BOILERPLATE)) for j in range(50)])
+    return out
+
+
+def _bills(rng, n, prefixes=("HB", "SB", "HJ", "SJ")):
+    return [f"{rng.choice(prefixes)} {rng.randrange(1, 2400)}" for _ in range(n)]
+
+
+def build(out_dir=OUT):
+    os.makedirs(out_dir, exist_ok=True)
+    rng = random.Random(2026)
+    corpus = {
+        "house_finance_short.pdf": _pdf(_docket(rng, "House Finance", _bills(rng, 6), 1, 0)),
+        "house_courts_long_tail.pdf": _pdf(_docket(rng, "House Courts of Justice", _bills(rng, 24), 3, 18)),
+        "senate_rules_two_column.pdf": _pdf(_docket(rng, "Senate Rules", _bills(rng, 30), 2, 6, two_column=True),
+                                            kern=True),
+        "house_education_uncompressed.pdf": _pdf(_docket(rng, "House Education", _bills(rng, 12), 2, 4),
+                                                 compress=False),
+        "joint_commission_late_bills.pdf": _pdf(
+            _docket(rng, "Joint Commission on Health Care", [], 0, 8)
+            + _docket(rng, "Joint Commission (continued)", _bills(rng, 5), 1, 2)),
+        "senate_finance_big.pdf": _pdf(_docket(rng, "Senate Finance and Appropriations", _bills(rng, 90), 9, 30)),
+        "house_labor_no_bills.pdf": _pdf(_docket(rng, "House Labor and Commerce", [], 0, 3)),
+        "scanned_image_docket.pdf": _pdf([[]] * 4, image_only=True),
+        "truncated_download.pdf": _pdf(_docket(rng, "House Rules", _bills(rng, 8), 1, 2), truncate=True),
+    }
+    html_bills = _bills(rng, 7)
+    corpus["house_agriculture_agenda.html"] = (
+        "<html><head><title>House Agriculture Agenda</title></head><body><h1>Agenda</h1><table>"
+        + "".join(f"<tr><td>{i + 1}</td><td><a href='/bill-details/20261/{b.replace(' ', '')}'>{b}</a></td>"
+                  f"<td>{rng.choice(_TITLES)}</td></tr>" for i, b in enumerate(html_bills))
+        + "</table><script>var docket = ['" + html_bills[0] + "'];</script></body></html>").encode()
+    for name, data in corpus.items():
+        with open(os.path.join(out_dir, name), "wb") as f:
+            f.write(data)
+    return sorted(corpus)
+
+
+if __name__ == "__main__":
+    for name in build():
+        print(f"wrote {os.path.join(OUT, name)}")
@@ -0,0 +1,107 @@
+"""
+Agenda extraction benchmark: pdfplumber vs the streaming pdfminer pass (offline).
+
+Context
+-------
+extract_rogue_agenda's PDF branch ran pdfplumber's layout-aware
+extract_text() over every page of a temp file. AGENDA_PDF_EXTRACTOR=stream
+swaps in _iter_agenda_pdf_bills (in-memory, char-collecting pdfminer
+device, bills yielded page by page, no-text-layer PDFs answered from
+their bytes) and AGENDA_PDF_PAGE_BUDGET=N stops after N pages in a row
+past the first bill with no new bill number.
+
+This script runs the real extract_rogue_agenda over every file in the
+fixture corpus (tools/verification/fixtures/agendas/, or --corpus DIR —
+drop real agenda PDFs/HTML in to measure them) under each mode, through
+a fake session that serves the file's bytes, and reports per-file parse
+time and recall against the pdfplumber result (the current function).
+The agenda validator store is reset before every call so each one
+really parses.
+
+Usage
+-----
+    python3 tools/agenda_sizing/extraction_benchmark.py
+    python3 tools/agenda_sizing/extraction_benchmark.py --page-budget 2 --repeat 3
+    python3 tools/agenda_sizing/extraction_benchmark.py --corpus ~/agendas
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+import calendar_worker as cw  # noqa: E402
+
+CORPUS = os.path.join(os.path.dirname(__file__), "..", "verification", "fixtures", "agendas")
+
+
+class _Resp:
+    def __init__(self, content):
+        self.status_code, self.content, self.headers = 200, content, {}
+        self.text = content.decode("latin-1")
+
+
+class _FileSession:
+    def __init__(self, content):
+        self.content = content
+
+    def get(self, url, **_):
+        return _Resp(self.content)
+
+
+def _run(path, extractor, budget, repeat):
+    """(best wall seconds, (bills, is_corrupt, fetch_ok)) for one file under one extractor mode."""
+    with open(path, "rb") as f:
+        content = f.read()
+    url = "https://lis.virginia.gov/agenda/" + os.path.basename(path)
+    saved = cw.AGENDA_PDF_EXTRACTOR, cw.AGENDA_PDF_PAGE_BUDGET
+    cw.AGENDA_PDF_EXTRACTOR, cw.AGENDA_PDF_PAGE_BUDGET = extractor, budget
+    best, result = float("inf"), None
+    try:
+        for _ in range(repeat):
+            cw._AGENDA_VALIDATORS = cw._AgendaValidators()
+            t0 = time.perf_counter()
+            result = cw.extract_rogue_agenda(url, _FileSession(content))
+            best = min(best, time.perf_counter() - t0)
+    finally:
+        cw.AGENDA_PDF_EXTRACTOR, cw.AGENDA_PDF_PAGE_BUDGET = saved
+    return best, result
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--corpus", default=CORPUS)
+    ap.add_argument("--page-budget", type=int, default=3, help="AGENDA_PDF_PAGE_BUDGET for the budgeted run")
+    ap.add_argument("--repeat", type=int, default=1, help="best-of-N timing per file and mode")
+    args = ap.parse_args()
+
+    files = sorted(glob.glob(os.path.join(args.corpus, "*.pdf")) + glob.glob(os.path.join(args.corpus, "*.htm*")))
+    if not files:
+        sys.exit(f"no .pdf / .html files in {args.corpus}")
+    modes = (("pdfplumber", "", 0), ("stream", "stream", 0), (f"stream/b{args.page_budget}", "stream", args.page_budget))
+    print(f"{'file':<36} | {'bills':>5} | " + " | ".join(f"{m:>11} ms  recall" for m, _, _ in modes))
+    totals = {m: [0.0, 0, 0] for m, _, _ in modes}   # seconds, bills found (of the reference), reference bills
+    for path in files:
+        cells, reference, ref_flags = [], None, None
+        for name, extractor, budget in modes:
+            wall, (bills, corrupt, ok) = _run(path, extractor, budget, args.repeat)
+            if reference is None:
+                reference, ref_flags = set(bills), (corrupt, ok)
+            hit = len(reference & set(bills))
+            recall = hit / len(reference) if reference else 1.0
+            if (corrupt, ok) != ref_flags:
+                recall = float("nan")   # flagged: the corrupt / fetch_ok outcome itself changed
+            totals[name][0] += wall
+            totals[name][1] += hit
+            totals[name][2] += len(reference)
+            cells.append(f"{wall * 1000:>14.1f}  {recall:>6.1%}")
+        print(f"{os.path.basename(path):<36} | {len(reference):>5} | " + " | ".join(cells))
+    base = totals["pdfplumber"][0]
+    print(f"{'TOTAL':<36} | {totals['pdfplumber'][2]:>5} | " + " | ".join(
+        f"{t * 1000:>14.1f}  {(h / n if n else 1.0):>6.1%}" for t, h, n in totals.values()))
+    print("speed-up vs pdfplumber: " + ", ".join(f"{m} {base / t:.1f}x" for m, (t, _, _) in totals.items() if t))
+
+
+if __name__ == "__main__":
+    main()
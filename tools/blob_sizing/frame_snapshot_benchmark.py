@@ -0,0 +1,129 @@
+"""
+Blob CSV parsed-frame snapshot benchmark: cold parse vs warm snapshot (offline).
+
+Context
+-------
+safe_fetch_csv turns a 304 into cached bytes, but used to re-run the
+iso-8859-1 decode + pd.read_csv(dtype=str) + header strip on them every
+cycle, in both workers. It now pickles the final DataFrame beside the
+blob (<key>.frame.pkl, tagged with ETag / body SHA-256 /
+_BLOB_FRAME_SCHEMA / pandas version) and serves a matching 304 from it.
+
+This script drives the real safe_fetch_csv over checked-in sample CSVs
+(tools/historical_cache/va/<session>/History.csv.gz + Bills.csv.gz, or
+--csv FILE ...; .gz is decompressed first) with the blob GET faked to
+answer 200 / 304 from memory, in three phases per file:
+
+    cold      200: parse + write blob and snapshot (first run after a change)
+    parse     304, snapshot disabled: the previous warm path (re-parse)
+    snapshot  304, snapshot served: the new warm path
+
+Each phase runs in its own spawned process so peak RSS is per phase:
+"rss+" is the phase's ru_maxrss over an idle child that only imported
+the worker; "py peak" is the tracemalloc peak inside the call (one extra
+call — wall time is best-of --repeat, untraced). The warm phases start
+from a cache seeded by a separate 200 process. The sample CSVs are
+archived session files, not a live DOCKET.CSV (none is checked in);
+pass one with --csv to measure it.
+
+Usage
+-----
+    python3 tools/blob_sizing/frame_snapshot_benchmark.py
+    python3 tools/blob_sizing/frame_snapshot_benchmark.py --session 231 --repeat 5
+    python3 tools/blob_sizing/frame_snapshot_benchmark.py --csv ~/DOCKET.CSV
+"""
+import argparse
+import gzip
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(__file__), "..", "..")
+SAMPLES = os.path.join(ROOT, "tools", "historical_cache", "va")
+
+
+class _Resp:
+    def __init__(self, status_code, content=b"", etag='"bench"'):
+        self.status_code, self.content = status_code, content
+        self.headers = {"ETag": etag, "Content-Length": str(len(content))} if status_code == 200 else {}
+
+
+def _phase(args):
+    """Child process: run one phase; (best seconds, tracemalloc peak bytes, ru_maxrss KB, rows)."""
+    path, phase, repeat, cache_dir = args
+    sys.path.insert(0, ROOT)
+    import calendar_worker as cw
+    if phase == "idle":
+        return 0.0, 0, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, 0
+    with open(path, "rb") as f:
+        body = f.read()
+    cw._BLOB_CACHE_DIR = cache_dir
+    url = "https://lis.blob.core.windows.net/lisfiles/bench/" + os.path.basename(path)
+    cw._LIS_GOVERNOR.governed = lambda _url, call: call()
+    if phase == "seed":   # writes the blob + snapshot the warm phases start from (own process: own RSS)
+        cw._BLOB_SESSION.get = lambda *a, **kw: _Resp(200, body)
+        cw.safe_fetch_csv(url)
+        return None
+    if phase == "parse":   # the pre-snapshot warm path: no snapshot read, none written
+        cw._read_blob_frame = lambda *a: None
+        cw._write_blob_frame = lambda *a: None
+    cw._BLOB_SESSION.get = (lambda *a, **kw: _Resp(200, body)) if phase == "cold" else (lambda *a, **kw: _Resp(304))
+    best = float("inf")
+    for _ in range(repeat):   # timed untraced: tracemalloc taxes every allocation
+        t0 = time.perf_counter()
+        df = cw.safe_fetch_csv(url)
+        best = min(best, time.perf_counter() - t0)
+        rows = len(df)
+        del df
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    cw.safe_fetch_csv(url)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak, rss, rows
+
+
+def _samples(session):
+    d = os.path.join(SAMPLES, session)
+    return [os.path.join(d, n) for n in ("History.csv.gz", "Bills.csv.gz") if os.path.exists(os.path.join(d, n))]
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--session", default="241", help="tools/historical_cache/va/<session> sample set")
+    ap.add_argument("--csv", nargs="*", help="measure these CSV files (.gz ok) instead of the samples")
+    ap.add_argument("--repeat", type=int, default=3, help="best-of-N timing per phase")
+    args = ap.parse_args()
+
+    files = args.csv or _samples(args.session)
+    if not files:
+        sys.exit(f"no sample CSVs under {os.path.join(SAMPLES, args.session)}")
+    ctx = multiprocessing.get_context("spawn")   # a fresh interpreter per phase → per-phase peak RSS
+    with tempfile.TemporaryDirectory() as work, ctx.Pool(1, maxtasksperchild=1) as pool:
+        idle_rss = pool.apply(_phase, (("", "idle", 0, work),))[2]
+        print(f"{'file':<22} | {'MB':>5} | {'rows':>6} | " + " | ".join(
+            f"{p:>8} ms  py peak  rss+" for p in ("cold", "parse", "snapshot")))
+        for src in files:
+            path = os.path.join(work, os.path.basename(src).removesuffix(".gz"))
+            opener = gzip.open if src.endswith(".gz") else open
+            with opener(src, "rb") as f, open(path, "wb") as out:
+                out.write(f.read())
+            cells, results = [], {}
+            for phase in ("cold", "parse", "snapshot"):
+                cache = tempfile.mkdtemp(dir=work)
+                if phase != "cold":
+                    pool.apply(_phase, ((path, "seed", 0, cache),))
+                wall, peak, rss, rows = pool.apply(_phase, ((path, phase, args.repeat, cache),))
+                results[phase] = wall
+                cells.append(f"{wall * 1000:>11.1f}  {peak / 2**20:>5.1f}M  {max(rss - idle_rss, 0) / 1024:>4.0f}M")
+            print(f"{os.path.basename(path):<22} | {os.path.getsize(path) / 2**20:>5.2f} | {rows:>6} | "
+                  + " | ".join(cells))
+            print(f"{'':<22}   warm speed-up (parse → snapshot): {results['parse'] / results['snapshot']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Per-bill HISTORY digest benchmark: Python per-bill hashing vs the vectorized digest (offline).
+
+Context
+-------
+The incremental STM keys reuse on a per-bill HISTORY digest
+(STM_Bill_Cache.HistoryHash). It used to be the LegEvent hash: a
+groupby("CleanBill") + iterrows pass building (date, outcome, refid)
+tuples, then one sorted string join + hashlib.sha256 per bill.
+_stm_bill_digests now hashes every row in one pd.util.hash_pandas_object
+pass and folds each bill's rows with a single segment reduction.
+
+This script times, over a checked-in HISTORY sample (the whole session
+file, no date window; tools/historical_cache/va/<session>/History.csv.gz
+or --csv FILE):
+
+    iterrows   the original groupby/iterrows + per-bill SHA-256 loop
+    columnar   _history_rows_by_bill + per-bill SHA-256 (the HISTORY
+               delta's full-hash path, still used for LastHistoryHash)
+    vectorized _stm_bill_digests
+
+Wall time is best-of --repeat after one warm-up call.
+
+Usage
+-----
+    python3 tools/legevent_sizing/digest_benchmark.py
+    python3 tools/legevent_sizing/digest_benchmark.py --session 242 --repeat 7
+"""
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+import calendar_worker as cw  # noqa: E402
+
+SAMPLES = os.path.join(os.path.dirname(__file__), "..", "historical_cache", "va")
+DESC, REFID = "History_description", "History_refid"
+
+
+def _iterrows(df_past):
+    """The pre-2026-10-18 loop, verbatim."""
+    hashes = {}
+    for clean_bill, group in df_past.groupby("CleanBill"):
+        bill_str = str(clean_bill).strip()
+        if not bill_str:
+            continue
+        rows_tuple = []
+        for _, hr in group.iterrows():
+            d = hr["ParsedDate"].strftime("%Y-%m-%d") if pd.notna(hr.get("ParsedDate")) else ""
+            o = str(hr.get(DESC, "") or "")
+            r = str(hr.get(REFID, "") or "")
+            rows_tuple.append((d, o, r))
+        hashes[bill_str] = cw._hash_history_rows_for_bill(rows_tuple)
+    return hashes
+
+
+def _columnar(df_past):
+    return {b: cw._hash_history_rows_for_bill(r) for b, r in cw._history_rows_by_bill(df_past, DESC, REFID).items()}
+
+
+def _vectorized(df_past):
+    return cw._stm_bill_digests(df_past, DESC, REFID)
+
+
+def _best(fn, df, repeat):
+    fn(df)
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn(df)
+        best = min(best, time.perf_counter() - t0)
+    return best, len(out)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--session", default="241", help="tools/historical_cache/va/<session> sample")
+    ap.add_argument("--csv", help="a HISTORY.CSV (.gz ok) instead of the sample")
+    ap.add_argument("--repeat", type=int, default=5, help="best-of-N timing per variant")
+    args = ap.parse_args()
+
+    path = args.csv or os.path.join(SAMPLES, args.session, "History.csv.gz")
+    if not os.path.exists(path):
+        sys.exit(f"no HISTORY sample at {path}")
+    df = pd.read_csv(path, dtype=str, keep_default_na=False, encoding="iso-8859-1")
+    df = df.rename(columns=lambda x: x.strip())
+    df["CleanBill"] = df["Bill_id"].astype(str).str.replace(" ", "").str.upper()
+    df["ParsedDate"] = pd.to_datetime(df["History_date"], format="mixed", errors="coerce")
+
+    print(f"{os.path.basename(path)}: {len(df):,} rows")
+    results = {}
+    for name, fn in (("iterrows", _iterrows), ("columnar", _columnar), ("vectorized", _vectorized)):
+        wall, bills = _best(fn, df, 1 if name == "iterrows" else args.repeat)
+        results[name] = wall
+        print(f"  {name:<10} {wall * 1000:>9.1f} ms   {bills:,} bills")
+    print(f"  speed-up vs iterrows: {results['iterrows'] / results['vectorized']:.0f}x; "
+          f"vs columnar: {results['columnar'] / results['vectorized']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+STM master_events benchmark: a list of dicts vs the compact EventBuffer (offline).
+
+Context
+-------
+run_calendar_update collects every STM event in master_events and turns
+it into the Sheet1 frame once, after the alert and best-time passes.
+That list used to hold one dict per event — 15 keys, each event with its
+own hash table and its own copies of the repeated strings (Source,
+Origin, Status, route/class labels, committee names). master_events is
+now an EventBuffer: slotted StmEventRecord objects whose string values
+and key layouts are interned through one pool, and _events_frame builds
+the frame column-wise from the slots instead of pd.DataFrame(dicts).
+
+This script runs the STM over a checked-in HISTORY sample (the whole
+session file; tools/historical_cache/va/<session>/History.csv.gz or
+--csv FILE) with a synthetic Schedule / convene map, as
+test_stm_sharding.py does, once per variant:
+
+    dicts   _append_event = list.append, frame = pd.DataFrame(events)
+    buffer  _append_event = EventBuffer().append, frame = _events_frame
+
+and reports the memory the collected events retain after the STM
+(tracemalloc), the frame build's wall time and peak, and checks the two
+frames are identical.
+
+Usage
+-----
+    python3 tools/legevent_sizing/event_buffer_benchmark.py
+    python3 tools/legevent_sizing/event_buffer_benchmark.py --session 242
+"""
+import argparse
+import copy
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from collections import Counter
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+import calendar_worker as cw  # noqa: E402
+
+SAMPLES = os.path.join(os.path.dirname(__file__), "..", "historical_cache", "va")
+
+
+def _inputs(path, session):
+    df = pd.read_csv(path, dtype=str, keep_default_na=False, encoding="iso-8859-1")
+    df.columns = df.columns.str.strip()
+    df["CleanBill"] = df["Bill_id"].astype(str).str.replace(" ", "").str.upper()
+    df["ParsedDate"] = pd.to_datetime(df["History_date"], format="mixed", errors="coerce")
+    df = df[df["ParsedDate"].notna()].copy()
+    df["OriginalOrder"] = range(len(df))
+    df = df.sort_values(by=["ParsedDate", "OriginalOrder"])
+    dates = sorted({d.strftime("%Y-%m-%d") for d in df["ParsedDate"]})
+    names = sorted(cw._STATIC_LOCAL_LEXICON)
+    api = {f"{d}_{n}": {"Time": f"{8 + j % 8}:00 AM", "SortTime": f"{8 + j % 8:02d}:00", "Status": ""}
+           for i, d in enumerate(dates) for j, n in enumerate(names) if (i + j) % 3 == 0}
+    convene = {d: {"House": {"Time": "12:00 PM", "SortTime": "12:00", "Name": "House Convenes"},
+                   "Senate": {"Time": "12:00 PM", "SortTime": "12:00", "Name": "Senate Convenes"}}
+               for i, d in enumerate(dates) if i % 4}
+    session_5d = f"20{session}1" if len(session) == 3 else session
+    ev_cache = {(b, session_5d): [] for b in set(df["CleanBill"])}     # every bill negative-cached: no lookups
+    ro = dict(api_schedule_map=api, docket_memory={}, convene_times=convene,
+              _admin_recovery_index=frozenset(), _ministerial_codes=frozenset(), _vote_id_set=set(),
+              _refid_fanout={}, committee_modal_standing={}, adjourned_clock_by_date={},
+              desc_col="History_description", refid_col="History_refid", _session_code_5d=session_5d,
+              _legislation_event_cache=ev_cache, _legislation_id_cache={k: "" for k in ev_cache},
+              _build_diagnostic_hint=lambda d, loc, pre: f"{d}|{loc}|{pre}",
+              _classify_refid=cw._classify_refid, _normalize_refid=cw._normalize_refid, http_session=None)
+    return df, ro
+
+
+def _phase(df, ro, variant):
+    ro = copy.deepcopy(ro)
+    ro["schedule_index"] = cw.ScheduleIndex(ro["api_schedule_map"])
+    sink = cw.EventBuffer() if variant == "buffer" else []
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    cw.run_sequential_turing_machine(
+        df, bill_locations={}, last_seen_date={}, _append_event=sink.append,
+        push_system_alert=lambda *a, **k: None, source_miss_counts=Counter(), _floor_miss_dates=Counter(),
+        _floor_hit=0, _floor_miss=0, **ro)
+    t1 = time.perf_counter()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    t2 = time.perf_counter()
+    frame = cw._events_frame(sink) if variant == "buffer" else pd.DataFrame(sink)
+    t3 = time.perf_counter()
+    peak = tracemalloc.get_traced_memory()[1] - retained
+    tracemalloc.stop()
+    return frame, len(sink), t1 - t0, retained, t3 - t2, peak
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--session", default="241", help="tools/historical_cache/va/<session> sample")
+    ap.add_argument("--csv", help="a HISTORY.CSV (.gz ok) instead of the sample")
+    args = ap.parse_args()
+
+    path = args.csv or os.path.join(SAMPLES, args.session, "History.csv.gz")
+    if not os.path.exists(path):
+        sys.exit(f"no HISTORY sample at {path}")
+    df, ro = _inputs(path, args.session)
+    print(f"{os.path.basename(path)}: {len(df):,} rows")
+    frames, results = {}, {}
+    for variant in ("dicts", "buffer"):
+        frames[variant], n, stm_s, retained, frame_s, peak = _phase(df, ro, variant)
+        results[variant] = retained, peak
+        print(f"  {variant:<6} {n:>7,} events   STM {stm_s:6.2f} s   retained {retained / 2**20:6.1f} MiB   "
+              f"frame {frame_s:5.2f} s (+{peak / 2**20:.1f} MiB peak)")
+    pd.testing.assert_frame_equal(frames["dicts"], frames["buffer"])
+    print(f"  frames identical; retained {results['buffer'][0] / results['dicts'][0]:.0%} of the dict list, "
+          f"frame peak {results['buffer'][1] / results['dicts'][1]:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+"""
+LegEvent fetch-budget convergence simulator (offline — ZERO LIS traffic).
+
+Context
+-------
+Every cycle the worker asks `_build_legevent_refresh_queue` which bills to
+re-fetch from the LegEvent API, capped at LEGEVENT_FETCHES_PER_CYCLE, with
+a TTL behind the HISTORY-hash trigger. Too small a budget leaves the
+cache stale through a session open; too large a one (two requests per
+bill without a known LegislationID) eats into LIS_REQUEST_CAP. Until now
+those knobs were set by judgement.
+
+This script replays a session through the queue builder with a fake
+clock and a fake LIS. The timeline is a recorded HISTORY file
+(tools/historical_cache/va/<session>/History.csv.gz, --csv FILE) or a
+synthetic session (--synthetic N bills). Each HISTORY row is one LIS
+event, which appears --lis-lag-hours after the row (negative = LegEvent
+leads HISTORY, the drift the TTL exists for). HISTORY rows carry dates
+only, so each action is placed at noon ET. Each --cycle-hours the
+simulator shows the policy the HISTORY visible so far, fetches what it
+queues (1 request per bill whose LegislationID is known — the persisted
+ID map — else 2), and reports per policy and budget:
+
+    coverage    first cycle every bill seen so far is cached, and the
+                share of cycles that were short of it
+    requests    per cycle (mean / p90 / max) and cycles over --request-cap
+    staleness   hours since a bill's last fetch when it is re-fetched,
+                p50 / p90 per tier (A uncached, B HISTORY changed, C TTL)
+    detect      hours from an event appearing in LIS to it being cached,
+                p50 / p90 / max, and events never cached by the end
+    yield       share of re-fetches (cached bills) that found a change
+
+Policies are pluggable: "production" (the worker's queue with its
+adaptive TTL), "flat" (the flat-TTL alphabetical queue) and
+"oldest_first" (no tiers — least recently fetched first, full budget
+every cycle), or --policy module:Name for any class with the Policy
+interface below.
+
+Usage
+-----
+    python3 tools/legevent_sizing/fetch_budget_simulator.py
+    python3 tools/legevent_sizing/fetch_budget_simulator.py --budgets 100 250 500 --lis-lag-hours 12
+    python3 tools/legevent_sizing/fetch_budget_simulator.py --start 2024-01-10 --days 21   # cold start at the open
+    python3 tools/legevent_sizing/fetch_budget_simulator.py --synthetic 3000 --policy production --policy mymod:MyPolicy
+"""
+import argparse
+import importlib
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+import calendar_worker as cw  # noqa: E402
+
+SAMPLES = os.path.join(os.path.dirname(__file__), "..", "historical_cache", "va")
+SESSION = "SIM"
+NOON_ET_UTC = 17   # HISTORY dates are placed at 12:00 ET
+
+
+class Policy:
+    """A refresh policy. build() takes _build_legevent_refresh_queue's inputs (plus each bill's days since
+    its latest HISTORY action) and returns (queue, info); observe() sees each cycle's re-fetches after the
+    fetch (`before`: {bill: _legevent_events_signature of the cached events before it})."""
+    name = "policy"
+
+    def build(self, candidate_bills, current_hashes, bills_meta, session_5d, now_utc, fetch_cap,
+              ttl_seconds, events_cache, activity_age_days):
+        raise NotImplementedError
+
+    def observe(self, queue, before, events_cache, session_5d):
+        pass
+
+
+class ProductionPolicy(Policy):
+    """The worker's queue: tiers A → B → C, adaptive per-bill TTL, value-scored within each tier."""
+    name = "production"
+
+    def __init__(self):
+        self.streaks = {}
+
+    def build(self, candidate_bills, current_hashes, bills_meta, session_5d, now_utc, fetch_cap,
+              ttl_seconds, events_cache, activity_age_days):
+        return cw._build_legevent_refresh_queue(
+            candidate_bills, current_hashes, bills_meta, session_5d, now_utc, fetch_cap, ttl_seconds,
+            events_cache, unchanged_streaks=self.streaks, activity_age_days=activity_age_days)
+
+    def observe(self, queue, before, events_cache, session_5d):
+        cw._legevent_record_refreshes(self.streaks, queue, before, events_cache, session_5d)
+
+
+class FlatPolicy(Policy):
+    """The queue before the adaptive TTL: tiers A → B → C, flat TTL, alphabetical within a tier."""
+    name = "flat"
+
+    def build(self, candidate_bills, current_hashes, bills_meta, session_5d, now_utc, fetch_cap,
+              ttl_seconds, events_cache, activity_age_days):
+        return cw._build_legevent_refresh_queue(
+            candidate_bills, current_hashes, bills_meta, session_5d, now_utc, fetch_cap, ttl_seconds,
+            events_cache)
+
+
+class OldestFirstPolicy(Policy):
+    """No tiers, no TTL: uncached bills, then least recently fetched first — the full budget every cycle."""
+    name = "oldest_first"
+
+    def build(self, candidate_bills, current_hashes, bills_meta, session_5d, now_utc, fetch_cap,
+              ttl_seconds, events_cache, activity_age_days):
+        def fetched_at(bill):
+            meta = bills_meta.get((bill, session_5d))
+            return meta["FetchedAtUTC"] if meta and events_cache.get((bill, session_5d)) else ""
+        return sorted(candidate_bills, key=lambda b: (fetched_at(b), b))[:fetch_cap], {}
+
+
+POLICIES = {p.name: p for p in (ProductionPolicy, FlatPolicy, OldestFirstPolicy)}
+
+
+def _load_policy(spec):
+    if spec in POLICIES:
+        return POLICIES[spec]()
+    module, _, attr = spec.partition(":")
+    if not attr:
+        sys.exit(f"unknown policy {spec!r}: one of {', '.join(POLICIES)} or module:Name")
+    return getattr(importlib.import_module(module), attr)()
+
+
+def _history_timeline(path):
+    df = pd.read_csv(path, dtype=str, keep_default_na=False, encoding="iso-8859-1")
+    df.columns = df.columns.str.strip()
+    bills = df["Bill_id"].astype(str).str.replace(" ", "").str.upper()
+    dates = pd.to_datetime(df["History_date"], format="mixed", errors="coerce")
+    return sorted((d.to_pydatetime().replace(hour=NOON_ET_UTC, tzinfo=timezone.utc), b)
+                  for b, d in zip(bills, dates) if pd.notna(d) and b)
+
+
+def _synthetic_timeline(n_bills, days, seed):
+    """n bills prefiled up to 30 days before a mid-January open, each acting every ~5 days (exponential
+    gaps) 2-12 times, over `days` days."""
+    rng = random.Random(seed)
+    open_at = datetime(2027, 1, 13, NOON_ET_UTC, tzinfo=timezone.utc)
+    close_at = open_at + timedelta(days=days)
+    rows = []
+    for k in range(n_bills):
+        bill = f"{'HS'[k % 2]}B{k // 2 + 1}"
+        t = open_at + timedelta(days=int(rng.uniform(-30, min(days, 20))))
+        for _ in range(rng.randint(2, 12)):
+            if t > close_at:
+                break
+            rows.append((t, bill))
+            t += timedelta(days=max(1, round(rng.expovariate(1 / 5))))
+    return sorted(rows)
+
+
+def _pct(values, q):
+    if not values:
+        return None
+    values = sorted(values)
+    return round(values[min(len(values) - 1, int(q * len(values)))], 1)
+
+
+def simulate(timeline, policy, budget, cycle_hours=3.0, ttl_seconds=None, lis_lag_hours=0.0, id_map=True,
+             start=None, end=None, request_cap=None):
+    """Replay `timeline` ([(datetime, bill)], sorted) through `policy` at `budget` fetches per cycle.
+    Everything before `start` is HISTORY already visible at the first cycle (a cold start with an empty
+    cache). Returns the report dict."""
+    ttl_seconds = cw.LEGEVENT_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+    step = timedelta(hours=cycle_hours)
+    lag = timedelta(hours=lis_lag_hours)
+    now = first_cycle = start or timeline[0][0]
+    end = end or timeline[-1][0] + max(lag, timedelta(0)) + timedelta(days=2)
+    lis_timeline = sorted((t + lag, b) for t, b in timeline)
+    hist_i = lis_i = 0
+    hist_n, last_action, first_seen = {}, {}, {}
+    lis_events, lis_seen_at = {}, {}
+    meta, cache, known_ids = {}, {}, set()
+    requests, detect, tier_age = [], [], {"A": [], "B": [], "C": []}
+    refetched = refetch_changed = 0
+    cycles = short_cycles = 0
+    full_at = None
+    while now <= end:
+        while hist_i < len(timeline) and timeline[hist_i][0] <= now:
+            t, b = timeline[hist_i]
+            hist_n[b] = hist_n.get(b, 0) + 1
+            last_action[b] = t
+            first_seen.setdefault(b, now)
+            hist_i += 1
+        while lis_i < len(lis_timeline) and lis_timeline[lis_i][0] <= now:
+            t, b = lis_timeline[lis_i]
+            n = len(lis_events.setdefault(b, []))
+            lis_events[b].append({"EventID": f"{b}-{n}", "EventDate": t.isoformat(), "ChamberCode": b[0],
+                                  "Description": f"{b} action {n}", "EventCode": "", "CommitteeName": ""})
+            lis_seen_at.setdefault(b, []).append(t)
+            lis_i += 1
+        hashes = {b: f"h{n}" for b, n in hist_n.items()}
+        activity = {b: (now - t).days for b, t in last_action.items()}
+        queue, _ = policy.build(set(hashes), hashes, meta, SESSION, now, budget, ttl_seconds, cache, activity)
+        queue = list(queue)[:budget]
+        reqs, before = 0, {}
+        for b in queue:
+            key = (b, SESSION)
+            m, ev = meta.get(key), cache.get(key)
+            tier = "A" if m is None or not ev else "B" if m["LastHistoryHash"] != hashes.get(b, "") else "C"
+            since = datetime.fromisoformat(m["FetchedAtUTC"].replace("Z", "+00:00")) if m else first_seen[b]
+            tier_age[tier].append((now - since).total_seconds() / 3600)
+            before[b] = cw._legevent_events_signature(ev)
+            reqs += 1 if id_map and b in known_ids else 2
+            known_ids.add(b)
+            fresh = list(lis_events.get(b, []))
+            for t in lis_seen_at.get(b, [])[len(ev or []):]:
+                detect.append((now - max(t, first_cycle)).total_seconds() / 3600)   # backlog: from cycle 1
+            if ev:
+                refetched += 1
+                refetch_changed += len(fresh) != len(ev)
+            cache[key] = fresh
+            meta[key] = {"LastHistoryHash": hashes.get(b, ""), "FetchedAtUTC": now.isoformat().replace("+00:00", "Z"),
+                         "LatestEventType": "", "LatestEventDate": "", "IsTerminal": False}
+        policy.observe(queue, before, cache, SESSION)
+        requests.append(reqs)
+        cycles += 1
+        covered = all((b, SESSION) in meta for b in hashes)
+        if covered and full_at is None and hashes:
+            full_at = cycles
+        short_cycles += not covered
+        now += step
+    undetected = sum(len(lis_events[b]) - len(cache.get((b, SESSION)) or []) for b in lis_events)
+    return {
+        "policy": policy.name, "budget": budget, "cycles": cycles, "bills": len(hist_n),
+        "full_coverage_cycle": full_at, "short_cycles_pct": round(100.0 * short_cycles / max(cycles, 1), 1),
+        "requests_mean": round(sum(requests) / max(cycles, 1), 1), "requests_p90": _pct(requests, 0.9),
+        "requests_max": max(requests, default=0),
+        "cycles_over_cap": sum(r > request_cap for r in requests) if request_cap else 0,
+        "staleness_h": {t: (_pct(v, 0.5), _pct(v, 0.9), len(v)) for t, v in tier_age.items()},
+        "detect_h": (_pct(detect, 0.5), _pct(detect, 0.9), round(max(detect, default=0.0), 1)),
+        "events": len(detect) + undetected, "undetected": undetected,
+        "refetch_yield_pct": round(100.0 * refetch_changed / refetched, 1) if refetched else 0.0,
+    }
+
+
+def _row(r):
+    st = "  ".join(f"{t} {p50}/{p90}" for t, (p50, p90, n) in r["staleness_h"].items() if n)
+    d50, d90, dmax = r["detect_h"]
+    return (f"  {r['policy']:<13} {r['budget']:>5}  full@{str(r['full_coverage_cycle']):>5} "
+            f"short {r['short_cycles_pct']:>5}%   req {r['requests_mean']:>6}/{r['requests_p90']}/{r['requests_max']}"
+            f" over-cap {r['cycles_over_cap']}   stale(h) {st}   detect(h) {d50}/{d90}/{dmax} "
+            f"missed {r['undetected']}   yield {r['refetch_yield_pct']}%")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--session", default="241", help="tools/historical_cache/va/<session> sample")
+    ap.add_argument("--csv", help="a HISTORY.CSV (.gz ok) instead of the sample")
+    ap.add_argument("--synthetic", type=int, metavar="N", help="a synthetic session of N bills instead")
+    ap.add_argument("--synthetic-days", type=int, default=60)
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--policy", action="append", help=f"{', '.join(POLICIES)} or module:Name (repeatable)")
+    ap.add_argument("--budgets", type=int, nargs="+", default=[cw.LEGEVENT_FETCHES_PER_CYCLE])
+    ap.add_argument("--cycle-hours", type=float, default=3.0)
+    ap.add_argument("--ttl-hours", type=float, default=cw.LEGEVENT_TTL_SECONDS / 3600)
+    ap.add_argument("--lis-lag-hours", type=float, default=0.0, help="LIS event lag behind its HISTORY row")
+    ap.add_argument("--no-id-map", action="store_true", help="every fetch costs 2 requests (no persisted IDs)")
+    ap.add_argument("--start", help="first cycle (YYYY-MM-DD); earlier HISTORY is a cold-start backlog")
+    ap.add_argument("--days", type=float, help="simulate this many days from the first cycle")
+    ap.add_argument("--request-cap", type=int, default=cw.LIS_REQUEST_CAP)
+    ap.add_argument("--json", action="store_true", help="one JSON report per line")
+    args = ap.parse_args()
+
+    if args.synthetic:
+        timeline = _synthetic_timeline(args.synthetic, args.synthetic_days, args.seed)
+        label = f"synthetic {args.synthetic} bills / {args.synthetic_days} days"
+    else:
+        path = args.csv or os.path.join(SAMPLES, args.session, "History.csv.gz")
+        if not os.path.exists(path):
+            sys.exit(f"no HISTORY sample at {path}")
+        timeline = _history_timeline(path)
+        label = os.path.relpath(path)
+    if not timeline:
+        sys.exit("empty timeline")
+    start = datetime.fromisoformat(args.start).replace(hour=NOON_ET_UTC, tzinfo=timezone.utc) if args.start else None
+    end = (start or timeline[0][0]) + timedelta(days=args.days) if args.days else None
+    print(f"{label}: {len(timeline):,} actions, {len({b for _, b in timeline}):,} bills, "
+          f"{timeline[0][0]:%Y-%m-%d} → {timeline[-1][0]:%Y-%m-%d}; cycle {args.cycle_hours}h, "
+          f"TTL {args.ttl_hours}h, LIS lag {args.lis_lag_hours}h, ID map {'off' if args.no_id_map else 'on'}")
+    for spec in args.policy or list(POLICIES):
+        for budget in args.budgets:
+            t0 = time.perf_counter()
+            r = simulate(timeline, _load_policy(spec), budget, args.cycle_hours, args.ttl_hours * 3600,
+                         args.lis_lag_hours, not args.no_id_map, start, end, args.request_cap)
+            r["wall_s"] = round(time.perf_counter() - t0, 1)
+            print(json.dumps(r) if args.json else _row(r))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Concurrent LegEvent hydration benchmark (local stub server — ZERO LIS traffic).
+
+Context
+-------
+`_hydrate_legevent_cache` drains up to LEGEVENT_FETCHES_PER_CYCLE (500)
+bills per cycle, two LIS round-trips each (LegislationID lookup + event
+history). Serially that is ~1,000 x RTT of wall-clock per cycle; a cold
+start (2,002 bills, see sizing_audit.py) or a new session open pays it
+four times over. LEGEVENT_HYDRATE_WORKERS fetches several bills at once
+through the same counted session, paced per host by the request
+governor (_LIS_GOVERNOR) in its adapter.
+
+This script measures wall-clock per 500 bills at 1, 4 and 8 workers
+against a localhost stub that answers both LIS endpoints after a fixed
+artificial latency. The real worker code runs end to end: the armored
+session (retry policy + _CountingHTTPAdapter, so the LIS_REQUEST_CAP
+tally and the governor are exercised and reported), the resolver and
+the queue-order merge. Only the transport is redirected: an adapter
+subclass rewrites https://lis.virginia.gov to the stub before sending,
+and the stub host is governed at lis.virginia.gov's rate.
+
+Usage
+-----
+    python3 tools/legevent_sizing/hydration_benchmark.py
+    python3 tools/legevent_sizing/hydration_benchmark.py --latency-ms 250 --workers 1 4 8
+    python3 tools/legevent_sizing/hydration_benchmark.py --bills 100   # quick run, scaled to /500
+
+--max-rps defaults to the worker's LIS_HOST_MAX_RPS, so the per-host
+ceiling shows up in the numbers exactly as it would in production.
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import urllib.parse
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+import calendar_worker as cw  # noqa: E402
+
+
+def _stub_handler(latency_s):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency_s)
+            url = urllib.parse.urlsplit(self.path)
+            q = dict(urllib.parse.parse_qsl(url.query))
+            if url.path.endswith("GetLegislationVersionbyBillNumberAsync"):
+                k = int(q["billNumber"][2:])
+                body = {"LegislationsVersion": [{"LegislationID": 100000 + k}]}
+            else:
+                k = int(q["legislationID"]) - 100000
+                body = {"LegislationEvents": [
+                    {"EventDate": f"2026-02-{1 + j:02d}T{9 + j % 8:02d}:30:00", "ChamberCode": "HS"[j % 2],
+                     "Description": f"Action {j} on HB{k}", "EventCode": f"H{4000 + j}",
+                     "CommitteeName": None, "ReferenceType": "", "VoteTally": "", "ActorType": "",
+                     "Status": ""} for j in range(3 + k % 6)]}
+            raw = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(raw)))
+            self.end_headers()
+            self.wfile.write(raw)
+
+        def log_message(self, *_):
+            pass
+    return Handler
+
+
+def _stub_session(base_url, retries):
+    """The worker's armored session with the LIS origin rewritten to the stub."""
+    class _StubAdapter(cw._CountingHTTPAdapter):
+        def send(self, request, *args, **kwargs):
+            request.url = request.url.replace("https://lis.virginia.gov", base_url, 1)
+            return super().send(request, *args, **kwargs)
+
+    session = cw.get_armored_session()
+    adapter = _StubAdapter(max_retries=retries, pool_maxsize=cw.LEGEVENT_HYDRATE_MAX_WORKERS)
+    session.mount("https://lis.virginia.gov", adapter)
+    session.mount(base_url, adapter)
+    return session
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--bills", type=int, default=cw.LEGEVENT_FETCHES_PER_CYCLE)
+    ap.add_argument("--latency-ms", type=float, default=120.0, help="stub response latency per request")
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    ap.add_argument("--max-rps", type=float, default=cw.LIS_HOST_MAX_RPS,
+                    help="per-host governor ceiling, requests/s (0 = unpaced)")
+    args = ap.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _stub_handler(args.latency_ms / 1000.0))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    cw._LIS_GOVERNOR.configure("127.0.0.1", args.max_rps)
+    retries = cw.get_armored_session().get_adapter("https://x").max_retries
+
+    queue = [f"HB{k}" for k in range(1, args.bills + 1)]
+    print(f"Stub LIS at {base_url}: {args.latency_ms:.0f} ms/request, {args.bills} bills "
+          f"(2 requests each), per-host ceiling {args.max_rps or float('inf'):.0f} req/s")
+    print(f"{'workers':>7} | {'wall s':>8} | {'s / 500 bills':>13} | {'requests':>8} | {'req/s':>6} | {'speed-up':>8}")
+    reference, first_state = None, None
+    for workers in args.workers:
+        cw.lis_request_count["n"] = 0
+        id_cache, ev_cache, meta, alerts = {}, {}, {}, []
+        t0 = time.perf_counter()
+        cw._hydrate_legevent_cache(
+            refresh_queue=queue, http_session=_stub_session(base_url, retries), session_5d="20261",
+            current_hashes={}, legislation_id_cache=id_cache, legislation_event_cache=ev_cache,
+            bills_meta=meta, push_alert=lambda *a, **k: alerts.append(a),
+            now_utc=datetime(2026, 10, 18, tzinfo=timezone.utc), workers=workers)
+        wall = time.perf_counter() - t0
+        n = cw.lis_request_count["n"]
+        reference = reference or wall
+        state = (id_cache, ev_cache, list(meta.items()), alerts)
+        first_state = first_state or state
+        same = "" if state == first_state else "   ⚠ RESULT DIFFERS from the first run"
+        print(f"{workers:>7} | {wall:>8.2f} | {wall * 500 / max(args.bills, 1):>13.2f} | {n:>8} | "
+              f"{n / wall:>6.1f} | {reference / wall:>7.2f}x{same}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
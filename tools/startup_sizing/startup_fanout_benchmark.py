@@ -0,0 +1,159 @@
+"""
+Startup fetch graph benchmark (local stub server — ZERO LIS traffic).
+
+Context
+-------
+run_calendar_update opens every cycle with a run of independent,
+latency-bound calls: the Session lookup, the workbook open, the
+Committee, Schedule and LegislationStatus APIs and the DOCKET / HISTORY
+blobs. They used to go out back to back (only the two blobs overlapped),
+so startup paid the sum of their latencies. They are now tasks on one
+StartupFetchGraph: Session and the workbook open are roots, the LIS
+authorization gate depends on Session, and every LIS / blob task
+depends on the gate — so startup pays session + gate + the slowest
+fanned-out call.
+
+This script replays that startup against a localhost stub that answers
+each endpoint after a fixed latency, once per pool size (1 = back to
+back). The real worker code runs: the armored session (retry policy,
+_CountingHTTPAdapter, the request governor), get_active_session_info,
+session_follow_gate (a historical session: no probe),
+_declare_startup_fetches, build_committee_maps and safe_fetch_csv (blob
+cache off). Only the transport is redirected: lis.virginia.gov through
+an adapter subclass (governed at lis.virginia.gov's rate), the blob
+host by wrapping the blob session's get (still governed as the blob host). The
+workbook open is a sleep of the same latency (Google is not stubbed).
+Each run reports its wall time, request count and critical path and
+checks every result matches the back-to-back run.
+
+Usage
+-----
+    python3 tools/startup_sizing/startup_fanout_benchmark.py
+    python3 tools/startup_sizing/startup_fanout_benchmark.py --latency-ms 400 --workers 1 2 6
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+import calendar_worker as cw  # noqa: E402
+
+BLOB_HOST = "https://lis.blob.core.windows.net"
+_CSV = {"DOCKET.CSV": b"BillNumber,MeetingDate,CommitteeDesc\nHB1,2026-01-20,House Appropriations\n",
+        "HISTORY.CSV": b"BillNumber,HistoryDate,Description,Refid\nHB1,2026-01-13,Prefiled and ordered printed,H0\n"}
+
+
+def _payload(path):
+    if path.endswith("GetSessionListAsync"):
+        return {"Sessions": [{"SessionCode": "20261", "SessionYear": 2026, "IsActive": True,
+                              "SessionEvents": [{"ActualDate": "2026-03-14"}]}]}
+    if "getcommitteelistasync" in path:
+        return {"Committees": [{"CommitteeNumber": k, "Name": v.split(" ", 1)[1], "ChamberCode": v[0],
+                                "CommitteeID": i} for i, (k, v) in enumerate(cw._STATIC_COMMITTEE_CODE_MAP.items())]}
+    if path.endswith("getschedulelistasync"):
+        return {"Schedules": []}
+    return {"References": [{"Name": "passed"}]}
+
+
+def _stub_handler(latency_s):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency_s)
+            path = self.path.split("?", 1)[0]
+            if "/lisfiles/" in path:
+                raw, ctype = _CSV[path.rsplit("/", 1)[1]], "text/csv"
+            else:
+                raw, ctype = json.dumps(_payload(path)).encode(), "application/json"
+            self.send_response(200)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(raw)))
+            self.end_headers()
+            self.wfile.write(raw)
+
+        def log_message(self, *_):
+            pass
+    return Handler
+
+
+def _stub_session(base_url):
+    """The worker's armored session with the LIS origin rewritten to the stub."""
+    class _StubAdapter(cw._CountingHTTPAdapter):
+        def send(self, request, *args, **kwargs):
+            request.url = request.url.replace("https://lis.virginia.gov", base_url, 1)
+            return super().send(request, *args, **kwargs)
+
+    session = cw.get_armored_session()
+    retries = session.get_adapter("https://lis.virginia.gov").max_retries
+    adapter = _StubAdapter(max_retries=retries)
+    session.mount("https://lis.virginia.gov", adapter)
+    session.mount(base_url, adapter)
+    return session
+
+
+def _startup(workers, http_session, latency_s):
+    """run_calendar_update's startup, in its order: roots, Session, gate, fan-out, then each consumer."""
+    graph = cw.StartupFetchGraph(workers)
+    alerts = []
+    t0 = time.perf_counter()
+    graph.add("sheet", time.sleep, latency_s)        # stand-in for _open_workbook
+    graph.add("session", cw.get_active_session_info, http_session)
+    session_data, online, _ = graph.result("session")
+    code = session_data["code"]
+    graph.add("gate", cw.session_follow_gate, code, http_session, deps=("session",))
+    proceed, reason = graph.result("gate")
+    if not proceed:
+        sys.exit(f"gate halted: {reason}")
+    blob_code = f"20{code}" if len(code) == 3 else code
+    cw._declare_startup_fetches(graph, http_session, code, blob_code, online)
+    maps = graph.result("committee_maps", push_alert=lambda *a, **k: alerts.append(a[0]))
+    graph.result("sheet")
+    docket = graph.result("docket")
+    schedule = graph.result("schedule") if online else None
+    history = graph.result("history")
+    status = graph.result("legislation_status")
+    wall = time.perf_counter() - t0
+    graph.shutdown()
+    state = (session_data["code"], online, len(maps[0]), maps[3], alerts, docket.shape, history.shape,
+             schedule.status_code if schedule is not None else None, status.status_code)
+    return wall, {**graph.metrics(), **graph.labels()}, state
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--latency-ms", type=float, default=250.0, help="stub response latency per request")
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, cw.STARTUP_FETCH_WORKERS])
+    ap.add_argument("--max-rps", type=float, default=cw.LIS_HOST_MAX_RPS,
+                    help="per-host governor ceiling for the stub LIS, requests/s (0 = unpaced)")
+    args = ap.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _stub_handler(args.latency_ms / 1000.0))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    cw._LIS_GOVERNOR.configure("127.0.0.1", args.max_rps)
+    cw._BLOB_CACHE_ENABLED = False
+    real_get = cw._BLOB_SESSION.get
+    cw._BLOB_SESSION.get = lambda url, *a, **k: real_get(url.replace(BLOB_HOST, base_url, 1), *a, **k)
+
+    print(f"Stub LIS + blob host at {base_url}: {args.latency_ms:.0f} ms/request, LIS ceiling "
+          f"{args.max_rps or float('inf'):.0f} req/s, blobs at the blob host's")
+    print(f"{'workers':>7} | {'wall s':>7} | {'task sum s':>10} | {'requests':>8} | {'speed-up':>8} | critical path")
+    reference, first_state = None, None
+    for workers in args.workers:
+        cw.lis_request_count["n"] = 0
+        wall, m, state = _startup(workers, _stub_session(base_url), args.latency_ms / 1000.0)
+        reference = reference or wall
+        first_state = first_state or state
+        same = "" if state == first_state else "   ⚠ RESULT DIFFERS from the first run"
+        print(f"{workers:>7} | {wall:>7.2f} | {m['startup_serial_ms'] / 1000:>10.2f} | {cw.lis_request_count['n']:>8} | "
+              f"{reference / wall:>7.2f}x | {m['startup_critical_path'].replace('>', ' → ')}{same}")
+    cw._BLOB_SESSION.get = real_get
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
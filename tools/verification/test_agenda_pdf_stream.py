@@ -0,0 +1,117 @@
+"""Streaming agenda-PDF extraction (AGENDA_PDF_EXTRACTOR=stream / _iter_agenda_pdf_bills): over the agenda
+fixture corpus it must find exactly the bills the pdfplumber path finds and fail on exactly the PDFs that
+path fails on; it must parse from memory (no temp file); the no-text-layer pre-scan must skip only complete,
+font-less PDFs; and AGENDA_PDF_PAGE_BUDGET must stop reading after N dry pages past the first bill.
+Timing + recall table: tools/agenda_sizing/extraction_benchmark.py."""
+import glob, inspect, os, sys
+import unittest.mock as mock
+import pdfminer
+from pdfminer.pdfdevice import PDFTextDevice
+from pdfminer.pdffont import PDFFont
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+import calendar_worker as cw
+
+_CORPUS = os.path.join(os.path.dirname(__file__), "fixtures", "agendas")
+
+
+def _stream(content, budget=0):
+    try:
+        return sorted(b for _, new in cw._iter_agenda_pdf_bills(content, budget) for b in new), None
+    except Exception as e:
+        return [], str(e)
+
+
+def main():
+    fails = []
+    pdfs = sorted(glob.glob(os.path.join(_CORPUS, "*.pdf")))
+    if len(pdfs) < 5:
+        print(f"❌ agenda fixture corpus missing under {_CORPUS} (tools/agenda_sizing/build_fixture_corpus.py)")
+        sys.exit(1)
+    corpus = {os.path.basename(p): open(p, "rb").read() for p in pdfs}
+
+    # 1) stream == pdfplumber, file by file (bills, and parse-failure vs success)
+    found = 0
+    for name, content in corpus.items():
+        want, got = cw._parse_agenda_pdf_plumber(content), _stream(content)
+        found += len(want[0])
+        if got[0] != want[0] or (got[1] is None) != (want[1] is None):
+            fails.append(f"1: {name}: stream {got} != pdfplumber {want}")
+    if found < 100 or cw._parse_agenda_pdf_plumber(corpus["truncated_download.pdf"])[1] is None:
+        fails.append("1: the corpus must carry real dockets and a PDF that fails to parse")
+
+    # 2) the dispatch: stream mode parses from memory, never through a temp file; default is pdfplumber
+    content = corpus["house_finance_short.pdf"]
+    want = cw._parse_agenda_pdf_plumber(content)
+    with mock.patch.object(cw, "AGENDA_PDF_EXTRACTOR", "stream"), \
+            mock.patch.object(cw.tempfile, "NamedTemporaryFile", side_effect=AssertionError("temp file")):
+        if cw._parse_agenda_pdf(content) != want:
+            fails.append("2: stream mode must parse in memory and agree with pdfplumber")
+        bills, err = cw._parse_agenda_pdf(corpus["truncated_download.pdf"])
+        if bills or not err:
+            fails.append("2: a malformed PDF must come back as ([], error) in stream mode too")
+    with mock.patch.object(cw, "_iter_agenda_pdf_bills", side_effect=AssertionError("stream used")):
+        cw._parse_agenda_pdf(content)   # default mode must not touch the stream extractor
+
+    # 3) no-text-layer pre-scan: only complete, font-less PDFs without object streams are skipped
+    if not cw._pdf_lacks_text_layer(corpus["scanned_image_docket.pdf"]):
+        fails.append("3: the scanned-image docket must be answered from its bytes")
+    for name in ("house_finance_short.pdf", "truncated_download.pdf"):
+        if cw._pdf_lacks_text_layer(corpus[name]):
+            fails.append(f"3: {name} must not be skipped")
+    if cw._pdf_lacks_text_layer(corpus["scanned_image_docket.pdf"].replace(b"/Root", b"/Roo", 1)) is not False \
+            or cw._pdf_lacks_text_layer(b"<html>not a pdf</html>"):
+        fails.append("3: a PDF without /Root, or not a PDF, must never be skipped")
+    hidden = corpus["scanned_image_docket.pdf"].replace(b"%%EOF", b"/ObjStm %%EOF")
+    if cw._pdf_lacks_text_layer(hidden):
+        fails.append("3: a PDF with object streams (a /Font could hide there) must not be skipped")
+    with mock.patch.object(cw, "PDFParser", side_effect=AssertionError("pdfminer ran")):
+        if _stream(corpus["scanned_image_docket.pdf"]) != ([], None):
+            fails.append("3: a no-text-layer PDF must not reach pdfminer")
+
+    # 4) page budget: pages yielded, cover pages before the first bill don't count
+    pages = [p for p, _ in cw._iter_agenda_pdf_bills(corpus["senate_finance_big.pdf"], 3)]
+    every = [p for p, _ in cw._iter_agenda_pdf_bills(corpus["senate_finance_big.pdf"], 0)]
+    if len(every) <= len(pages) or pages != every[:len(pages)] or len(pages) != 9 + 3:
+        fails.append(f"4: budget 3 must stop 3 dry pages after the last new bill ({len(pages)} of {len(every)})")
+    late = corpus["joint_commission_late_bills.pdf"]
+    if _stream(late, 2)[0] != _stream(late, 0)[0] or not _stream(late, 0)[0]:
+        fails.append("4: bills after a long bill-less preamble must survive any budget")
+    firsts = [new for _, new in cw._iter_agenda_pdf_bills(corpus["house_courts_long_tail.pdf"])]
+    if sum(map(len, firsts)) != len(set(b for new in firsts for b in new)):
+        fails.append("4: each bill must be yielded once, on the first page it appears")
+
+    # 5) page text layout: chars cluster into lines by top, left to right (same strings as pdfplumber)
+    chars = [(-700.0, 90.0, "B"), (-700.4, 72.0, "H"), (-699.8, 100.0, "9"), (-680.0, 72.0, "S"), (-680.0, 80.0, "B")]
+    if cw._agenda_page_text(chars) != "HB9\nSB":
+        fails.append(f"5: page text {cw._agenda_page_text(chars)!r}")
+
+    # 6) pdfminer drift guard. _AgendaCharCollector.render_char copies pdfminer.six 20231228 internals
+    # (PDFTextDevice.render_char's parameters, font.to_unichr / char_width / get_descent / is_vertical):
+    # any upstream change must fail HERE, loudly, before a pin bump ships. A mismatch at runtime → pdfplumber.
+    want_params = ["self", "matrix", "font", "fontsize", "scaling", "rise", "cid", "ncs", "graphicstate"]
+    got_params = list(inspect.signature(PDFTextDevice.render_char).parameters)
+    if pdfminer.__version__ != "20231228" or got_params != want_params:
+        fails.append(f"6: UPSTREAM pdfminer CHANGED (version {pdfminer.__version__}, render_char{tuple(got_params)}); "
+                     f"re-verify _AgendaCharCollector against it before moving the pdfminer.six pin")
+    if list(inspect.signature(cw._AgendaCharCollector.render_char).parameters) != want_params \
+            or not cw._AGENDA_STREAM_SUPPORTED:
+        fails.append("6: the installed pdfminer's render_char must match _AgendaCharCollector's (pin drift)")
+    if not all(callable(getattr(PDFFont, m, None)) for m in ("to_unichr", "char_width", "get_descent", "is_vertical")):
+        fails.append("6: UPSTREAM pdfminer CHANGED: PDFFont lost a method render_char calls")
+    with mock.patch.object(cw, "AGENDA_PDF_EXTRACTOR", "stream"), \
+            mock.patch.object(cw, "_AGENDA_STREAM_SUPPORTED", False), \
+            mock.patch.object(cw, "_iter_agenda_pdf_bills", side_effect=AssertionError("stream used")):
+        if cw._parse_agenda_pdf(content) != want:
+            fails.append("6: an unsupported pdfminer must fall back to pdfplumber, same bills")
+
+    if fails:
+        print("❌ FAILURES:")
+        for x in fails:
+            print("   -", x)
+        sys.exit(1)
+    print(f"✅ all streaming agenda-PDF tests passed ({len(corpus)} fixture PDFs, {found} bills: stream == "
+          f"pdfplumber; in-memory; no-text-layer pre-scan; page budget; pdfminer drift fallback)")
+
+
+if __name__ == "__main__":
+    main()
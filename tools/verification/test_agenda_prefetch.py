@@ -0,0 +1,230 @@
+"""Agenda prefetch (_agenda_prefetch_plan / _prefetch_agendas, AGENDA_FETCH_WORKERS / AGENDA_PARSE_WORKERS):
+extract_rogue_agenda split into _fetch_agenda_source + _parse_agenda_pdf must answer exactly as the original
+one-piece function did (PDF, corrupt PDF, HTML rogue-nav -> PDF, HTML text, non-200, exception); the plan
+must list exactly the agendas the schedule loop would fetch, once each, honouring the settled-agenda cache;
+and a prefetch — threads only, or with a forked parse pool — must return the inline result for every planned
+agenda while making no extra requests; a failed prefetch falls back inline with an alert + counter. No
+network."""
+import inspect, os, re, sys, tempfile, threading, time, urllib.parse
+from datetime import datetime
+import pandas as pd
+import pdfplumber
+from bs4 import BeautifulSoup
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+import calendar_worker as cw
+
+
+def _original_extract_rogue_agenda(url, session, target_date_dt=None, depth=0):
+    """extract_rogue_agenda as it was before the split (minus the removed pacing sleep), verbatim."""
+    if depth > 1: return [], False, False
+    found_bills = set()
+    if url.startswith('/'): url = f"https://lis.virginia.gov{url}"
+    try:
+        res = session.get(url, timeout=15)
+        if res.status_code != 200: return [], False, False
+        if '.pdf' in url.lower() or b'%PDF' in res.content[:5]:
+            temp_pdf_path = None
+            try:
+                with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_pdf:
+                    temp_pdf.write(res.content)
+                    temp_pdf_path = temp_pdf.name
+                with pdfplumber.open(temp_pdf_path) as pdf:
+                    for page in pdf.pages:
+                        text = page.extract_text()
+                        if text: found_bills.update([m.upper() for m in re.findall(r'\b([HS][BJR]\s*\d+)', text.replace(" ", ""))])
+            except Exception as e:
+                print(f"⚠️ Agenda PDF parse failed for {url}: {e}")
+                return [], True, False
+            finally:
+                if temp_pdf_path and os.path.exists(temp_pdf_path):
+                    os.remove(temp_pdf_path)
+            return sorted(found_bills), False, True
+        soup = BeautifulSoup(res.text, 'html.parser')
+        target_href = None
+        if target_date_dt:
+            date_matrix = cw.generate_date_variants(target_date_dt)
+            for row in soup.find_all(['tr', 'li', 'div', 'p']):
+                if any(variant in row.get_text() for variant in date_matrix):
+                    link = row.find('a', string=re.compile(r'Agenda|Docket', re.I)) or row.find('a', href=re.compile(r'\.pdf$', re.I))
+                    if link: target_href = link.get('href'); break
+        if not target_href:
+            agenda_links = soup.find_all('a', href=re.compile(r'\.pdf$', re.I)) or soup.find_all('a', string=re.compile(r'Agenda|Docket', re.I))
+            if agenda_links: target_href = agenda_links[0].get('href')
+        if target_href: return _original_extract_rogue_agenda(urllib.parse.urljoin(url, target_href), session, target_date_dt, depth + 1)
+        for script in soup.find_all('script'):
+            if script.string and any(x in script.string for x in ['HB', 'SB', 'HJ', 'SJ']):
+                found_bills.update([m.upper() for m in re.findall(r'\b([HS][BJR]\s*\d+)', script.string.replace(" ", ""))])
+        found_bills.update([m.upper() for m in re.findall(r'\b([HS][BJR]\s*\d+)', soup.get_text(separator=' ').replace(" ", ""))])
+        return sorted(found_bills), False, True
+    except Exception as e:
+        print(f"⚠️ Agenda extraction failed for {url}: {e}")
+        return sorted(found_bills), False, False
+
+
+def _pdf(*lines):
+    """A minimal one-page text PDF (Helvetica, one line per entry) with a correct xref table."""
+    text = "".join(f"BT /F1 12 Tf 72 {720 - 20 * i} Td ({ln}) Tj ET\n" for i, ln in enumerate(lines)).encode()
+    objs = [b"<< /Type /Catalog /Pages 2 0 R >>",
+            b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R "
+            b"/Resources << /Font << /F1 5 0 R >> >> >>",
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(text), text),
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    out, offsets = bytearray(b"%PDF-1.4\n"), []
+    for n, body in enumerate(objs, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (n, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objs) + 1)
+    out += b"".join(b"%010d 00000 n \n" % o for o in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objs) + 1, xref)
+    return bytes(out)
+
+
+class _Resp:
+    def __init__(self, status_code, content=b""):
+        self.status_code, self.content = status_code, content
+        self.text = content.decode("latin-1")
+
+
+_PAGES = {
+    "https://lis.virginia.gov/agenda/fin.pdf": _Resp(200, _pdf("Finance agenda", "HB 1204, SB 77", "HJ 5")),
+    "https://lis.virginia.gov/agenda/empty.pdf": _Resp(200, _pdf("No bills docketed")),
+    "https://lis.virginia.gov/agenda/bad.pdf": _Resp(200, b"%PDF-1.4\nthis is not really a pdf"),
+    "https://lis.virginia.gov/agenda/gone.pdf": _Resp(404),
+    "https://house.example/courts": _Resp(200, (
+        b"<ul><li>January 15, 2026 <a href='/docs/c15.pdf'>Agenda</a></li>"
+        b"<li>January 22, 2026 <a href='/docs/c22.pdf'>Agenda</a></li></ul>")),
+    "https://house.example/docs/c15.pdf": _Resp(200, _pdf("Courts", "HB 10, HB 11")),
+    "https://house.example/docs/c22.pdf": _Resp(200, _pdf("Courts", "SB 300")),
+    "https://house.example/page": _Resp(200, b"<p>Bills: HB 9, SJ 41</p><script>var x='SB 2';</script>"),
+}
+
+
+class _Session:
+    def __init__(self, delay=0.0):
+        self.calls, self.lock, self.delay = [], threading.Lock(), delay
+
+    def get(self, url, timeout=None, **_):
+        with self.lock:
+            self.calls.append(url)
+        time.sleep(self.delay)
+        if url == "https://lis.virginia.gov/agenda/boom.pdf":
+            raise ConnectionError("reset by peer")
+        return _PAGES.get(url, _Resp(404))
+
+
+def _meeting(date, owner, href, cancelled=False):
+    desc = f"<a href='{href}'>Agenda</a>" if href else "No agenda"
+    return {"ScheduleDate": date, "OwnerName": owner, "Description": desc, "IsCancelled": cancelled}
+
+
+def main():
+    fails = []
+    jobs = [(u, pd.Timestamp(d)) for u, d in (
+        ("https://lis.virginia.gov/agenda/fin.pdf", "2026-01-15"),
+        ("https://lis.virginia.gov/agenda/empty.pdf", "2026-01-15"),
+        ("https://lis.virginia.gov/agenda/bad.pdf", "2026-01-15"),
+        ("https://lis.virginia.gov/agenda/gone.pdf", "2026-01-15"),
+        ("https://lis.virginia.gov/agenda/boom.pdf", "2026-01-15"),
+        ("https://house.example/courts", "2026-01-15"),
+        ("https://house.example/courts", "2026-01-22"),
+        ("https://house.example/page", "2026-01-22"),
+        ("/agenda/fin.pdf", "2026-01-29"))]
+
+    # 1) the split function == the original one-piece function, case by case
+    want = {}
+    cw._AGENDA_VALIDATORS = cw._AgendaValidators()
+    for url, date in jobs:
+        want[(url, date)] = _original_extract_rogue_agenda(url, _Session(), date)
+        got = cw.extract_rogue_agenda(url, _Session(), date)
+        if got != want[(url, date)]:
+            fails.append(f"1: {url} {date:%m-%d}: {got} != original {want[(url, date)]}")
+    if want[jobs[0]] != (["HB1204", "HJ5", "SB77"], False, True) or want[jobs[2]] != ([], True, False):
+        fails.append(f"1: fixture must parse the real PDF and flag the corrupt one: {want[jobs[0]]} {want[jobs[2]]}")
+    if want[jobs[5]][0] != ["HB10", "HB11"] or want[jobs[6]][0] != ["SB300"]:
+        fails.append("1: fixture must follow the rogue-nav hop to the target date's PDF")
+
+    # 2) prefetch == inline for every job, threads only and with a forked parse pool; no extra requests
+    for fetch_w, parse_w in ((1, 1), (4, 1), (4, 2)):
+        cw._AGENDA_VALIDATORS = cw._AgendaValidators()   # cold: every PDF really parses (on the pool too)
+        sess = _Session(delay=0.01)
+        got = cw._prefetch_agendas(jobs, sess, fetch_w, parse_w)
+        if got != want:
+            bad = [k for k in want if got.get(k) != want[k]]
+            fails.append(f"2[{fetch_w}f/{parse_w}p]: prefetched results differ for {bad}")
+        inline = _Session()
+        for url, date in jobs:
+            cw.extract_rogue_agenda(url, inline, date)
+        if sorted(sess.calls) != sorted(inline.calls):
+            fails.append(f"2[{fetch_w}f/{parse_w}p]: a different set of requests than the inline path")
+    if cw._prefetch_agendas([], _Session(), 4, 2) != {}:
+        fails.append("2: an empty plan is a no-op")
+
+    # 3) the cap still aborts (BaseException), and later fetches are dropped
+    class _Capped(_Session):
+        def get(self, url, **kw):
+            if len(self.calls) >= 3:
+                raise cw.LisRequestCapExceeded("cap")
+            return super().get(url, **kw)
+    capped = _Capped()
+    try:
+        cw._prefetch_agendas(jobs * 4, capped, 2, 1)
+        fails.append("3: LisRequestCapExceeded must propagate out of the prefetch")
+    except cw.LisRequestCapExceeded:
+        pass
+    if len(capped.calls) > 3 + 2:
+        fails.append(f"3: {len(capped.calls)} requests after the cap tripped — pending fetches must be dropped")
+
+    # 4) the plan mirrors the loop's gates + cache, in loop order, each agenda once
+    now = datetime(2026, 1, 20, 12, 0)
+    fin = "https://lis.virginia.gov/agenda/fin.pdf"
+    sched = [
+        _meeting("2026-01-15", "House Finance", fin),                    # settled -> planned
+        _meeting("2026-01-16", "House Finance", fin),                    # settled, same URL -> cache hit
+        _meeting("2026-01-15", "House Courts", "https://lis.virginia.gov/agenda/cached.pdf"),  # in cache
+        _meeting("2026-01-19", "Senate Rules", fin),                     # unsettled -> planned
+        _meeting("2026-01-19", "Senate Rules", fin),                     # same (url, date) -> once
+        _meeting("2026-01-21", "House Convenes", fin),                   # chamber event -> no fetch
+        _meeting("2026-01-21", "House Caucus", fin),
+        _meeting("2026-01-21", "House Education", fin, cancelled=True),  # cancelled
+        _meeting("2026-01-21", "House Labor", ""),                       # no agenda link
+        _meeting("2025-12-01", "House Labor", fin),                      # before the window
+        _meeting("2026-03-30", "House Labor", fin),                      # after the window
+        _meeting("not a date", "House Labor", fin),
+        _meeting("2026-01-22", "House  Appropriations", "https://house.example/courts"),
+    ]
+    plan = cw._agenda_prefetch_plan(sched, pd.Timestamp("2026-01-10"), pd.Timestamp("2026-03-01"),
+                                    {"https://lis.virginia.gov/agenda/cached.pdf": ("2026-01-15", ["HB1"])}, now)
+    expect = [(fin, pd.Timestamp("2026-01-15")), (fin, pd.Timestamp("2026-01-19")),
+              ("https://house.example/courts", pd.Timestamp("2026-01-22"))]
+    if plan != expect:
+        fails.append(f"4: plan {plan} != {expect}")
+    if not cw._agenda_is_settled(pd.Timestamp("2026-01-17"), now) or cw._agenda_is_settled(pd.Timestamp("2026-01-18"), now):
+        fails.append("4: settled = older than AGENDA_CACHE_SETTLE_DAYS")
+
+    # 5) the knobs
+    for raw, cap, want_n in (("", 8, 1), ("0", 8, 1), ("junk", 8, 1), ("4", 8, 4), (" 3 ", 8, 3), ("64", 8, 8),
+                             ("auto", 2, min(os.cpu_count() or 1, 2))):
+        if cw._agenda_worker_count(raw, cap) != want_n:
+            fails.append(f"5: worker count {raw!r} (cap {cap}) -> {cw._agenda_worker_count(raw, cap)}, want {want_n}")
+
+    # 6) a failed prefetch is never silent: the inline fallback raises a categorized alert and is counted
+    src = inspect.getsource(cw.run_calendar_update)
+    fallback = src[src.index("except Exception as e:", src.index("_prefetch_agendas(_agenda_plan")):]
+    fallback = fallback[:fallback.index("for meeting in schedules:")]
+    if 'dedup_key="agenda_prefetch_fallback"' not in fallback or "_agenda_prefetch_failed = {}, 1" not in fallback \
+            or 'source_miss_counts["agenda_prefetch_failed"] = _agenda_prefetch_failed' not in fallback:
+        fails.append("6: the prefetch fallback must push_system_alert + count agenda_prefetch_failed")
+
+    if fails:
+        print("❌ FAILURES:")
+        for x in fails:
+            print("   -", x)
+        sys.exit(1)
+    print(f"✅ all agenda prefetch tests passed ({len(jobs)} agendas: split == original extract; prefetch == inline "
+          f"at 1/4 fetch x 1/2 parse workers, same requests; cap abort; plan gates + cache; knobs; alerted fallback)")
+
+
+if __name__ == "__main__":
+    main()
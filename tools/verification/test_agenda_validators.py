@@ -0,0 +1,137 @@
+"""Agenda conditional GET (_AgendaValidators / _AGENDA_VALIDATORS): an agenda PDF seen before is requested
+with If-None-Match / If-Modified-Since; a 304 or an identical body reuses its recorded bills without
+pdfplumber, a changed body always re-parses, a failed parse is never recorded, the store round-trips to
+disk (pruned, fail-safe on junk) and SYSTEM_METRICS gets the hit rate + bytes saved. No network."""
+import json, os, sys, tempfile, threading
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+import calendar_worker as cw
+from test_agenda_prefetch import _pdf
+
+_URL = "https://lis.virginia.gov/agenda/fin.pdf"
+
+
+class _Resp:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code, self.content, self.headers = status_code, content, headers or {}
+        self.text = content.decode("latin-1")
+
+
+class _Server:
+    """One agenda PDF with an ETag; honours If-None-Match unless `ignore_validators`."""
+
+    def __init__(self, body, etag='"v1"'):
+        self.body, self.etag, self.ignore_validators = body, etag, False
+        self.sent, self.lock = [], threading.Lock()
+
+    def get(self, url, timeout=None, headers=None, **_):
+        with self.lock:
+            self.sent.append(dict(headers or {}))
+        if not self.ignore_validators and (headers or {}).get("If-None-Match") == self.etag:
+            return _Resp(304, b"", {"ETag": self.etag})
+        return _Resp(200, self.body, {"ETag": self.etag, "Last-Modified": "Mon, 12 Jan 2026 09:00:00 GMT"})
+
+
+def main():
+    fails = []
+    parses = []
+    real_parse = cw._parse_agenda_pdf
+    cw._parse_agenda_pdf = lambda content: parses.append(len(content)) or real_parse(content)
+    cw._AGENDA_VALIDATORS = store = cw._AgendaValidators()
+    try:
+        pdf1, pdf2 = _pdf("Agenda", "HB 1204, SB 77"), _pdf("Agenda (revised)", "HB 1204, SB 77, HB 9")
+        srv = _Server(pdf1)
+
+        # 1) first read: unconditional, parsed, recorded
+        first = cw.extract_rogue_agenda(_URL, srv)
+        if first != (["HB1204", "SB77"], False, True) or srv.sent[-1] or len(parses) != 1:
+            fails.append(f"1: first read must be an unconditional parse: {first} {srv.sent[-1]} {parses}")
+
+        # 2) 304: validators sent, recorded bills reused, no pdfplumber
+        got = cw.extract_rogue_agenda(_URL, srv)
+        if srv.sent[-1] != {"If-None-Match": '"v1"', "If-Modified-Since": "Mon, 12 Jan 2026 09:00:00 GMT"}:
+            fails.append(f"2: conditional headers not sent: {srv.sent[-1]}")
+        if got != first or len(parses) != 1:
+            fails.append(f"2: a 304 must reuse the recorded bills without a parse: {got} parses={len(parses)}")
+
+        # 3) a server that ignores validators but returns the same bytes: hash hit, no parse
+        srv.ignore_validators = True
+        if cw.extract_rogue_agenda(_URL, srv) != first or len(parses) != 1:
+            fails.append("3: an identical body must reuse the recorded bills without a parse")
+
+        # 4) a changed body always re-parses (even under a stale ETag) and replaces the entry
+        srv.body = pdf2
+        got = cw.extract_rogue_agenda(_URL, srv)
+        if got != (["HB1204", "HB9", "SB77"], False, True) or len(parses) != 2:
+            fails.append(f"4: a changed body must re-parse: {got} parses={len(parses)}")
+        srv.ignore_validators = False
+        if cw.extract_rogue_agenda(_URL, srv) != got or len(parses) != 2:
+            fails.append("4: the re-parsed bills must be what the next 304 serves")
+
+        # 5) a corrupt body is never recorded: the next identical corrupt body parses (and fails) again
+        bad = "https://lis.virginia.gov/agenda/bad.pdf"
+        corrupt = _Server(b"%PDF-1.4\nnot a pdf")
+        for _ in range(2):
+            if cw.extract_rogue_agenda(bad, corrupt) != ([], True, False):
+                fails.append("5: a corrupt PDF must still read as corrupt")
+        if len(parses) != 4 or corrupt.sent[-1]:
+            fails.append(f"5: a failed parse must not be recorded (parses={len(parses)}, sent={corrupt.sent[-1]})")
+        if cw.extract_rogue_agenda(_URL, _Server(pdf2, etag='"zzz"')) != got:
+            fails.append("5: a new ETag on the same bytes is still a hash hit")
+
+        # 6) metrics: ints; hit % over hits + parses; bytes saved = the 304 bodies not downloaded
+        m = store.metrics()
+        want = {"agenda_validator_304": 2, "agenda_validator_same_body": 2, "agenda_validator_parsed": 2,
+                "agenda_validator_hit_pct": 67, "agenda_validator_bytes_saved": len(pdf1) + len(pdf2)}
+        if m != want:
+            fails.append(f"6: metrics {m} != {want}")
+
+        # 7) disk round-trip: persisted, reloaded, aged-out entries pruned, junk loads empty
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "sub", "agenda_validators.json")
+            store.persist(path)
+            fresh = cw._AgendaValidators()
+            fresh.load(path, datetime.now())
+            if fresh.headers(_URL).get("If-None-Match") != '"zzz"' or fresh.metrics()["agenda_validator_304"]:
+                fails.append("7: the store must reload its entries with fresh per-cycle stats")
+            fresh.load(path, datetime.now() + timedelta(days=cw.AGENDA_VALIDATOR_RETENTION_DAYS + 1))
+            if fresh.headers(_URL):
+                fails.append("7: an entry unused past the retention horizon must be dropped")
+            fresh.persist(path)
+            with open(path) as f:
+                if json.load(f):
+                    fails.append("7: a pruning load must rewrite the trimmed store")
+            for junk in ("{not json", "[1, 2]", json.dumps({_URL: {"bills": "HB1", "sha256": "x"}})):
+                with open(path, "w") as f:
+                    f.write(junk)
+                fresh.load(path, datetime.now())
+                if fresh.headers(_URL):
+                    fails.append(f"7: a malformed store must load empty: {junk!r}")
+            fresh.load(os.path.join(d, "missing.json"), datetime.now())
+
+        # 8) overlapping fetches of one URL for two meetings: each parse records the body IT fetched
+        both = cw._AgendaValidators()
+        a, b = _Resp(200, pdf1, {"ETag": '"a"'}), _Resp(200, pdf2, {"ETag": '"b"'})
+        both.reuse(_URL, a, "2026-01-13")
+        both.reuse(_URL, b, "2026-01-14")           # lands before meeting 1's parse
+        both.record(_URL, ["HB1204", "SB77"], "2026-01-13")
+        if both.headers(_URL).get("If-None-Match") != '"a"':
+            fails.append("8: meeting 1's parse must record meeting 1's body, not the later fetch's")
+        both.record(_URL, ["HB1204", "HB9", "SB77"], "2026-01-14")
+        if both.headers(_URL).get("If-None-Match") != '"b"' or both._pending:
+            fails.append("8: meeting 2's parse must then record its own body, leaving nothing pending")
+    finally:
+        cw._parse_agenda_pdf = real_parse
+        cw._AGENDA_VALIDATORS = cw._AgendaValidators()
+
+    if fails:
+        print("❌ FAILURES:")
+        for x in fails:
+            print("   -", x)
+        sys.exit(1)
+    print("✅ all agenda validator tests passed (conditional headers; 304 + identical body reuse without "
+          "pdfplumber; changed body re-parses; failed parse never recorded; metrics; disk round-trip + prune; per-meeting pending)")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,12 +18,12 @@ class FakeResp:
             self.headers["Content-Length"] = str(content_length)
 
 def install(queue):
-    """Monkeypatch requests.get to pop scripted responses; capture sent headers."""
+    """Monkeypatch the blob session's get to pop scripted responses; capture sent headers."""
     sent = []
     def fake_get(url, timeout=None, headers=None):
         sent.append(headers or {})
         return queue.pop(0)
-    cw.requests.get = fake_get
+    cw._BLOB_SESSION.get = fake_get
     return sent
 
 def reset(tmp, enabled=True):
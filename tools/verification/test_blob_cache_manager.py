@@ -0,0 +1,216 @@
+"""Blob cache manager (_BlobCacheManifest, blob_cache_maintain, _quarantine_blob, the codec on
+_write_blob_cache / _read_blob_cache): every entry is indexed with its URL, ETag, length, SHA-256, codec,
+bytes on disk and last access; a body that fails its SHA-256, length or codec is quarantined and refetched
+by an unconditional GET (only the newest pairs kept); gzip / zstd entries round-trip byte-identically and
+stay readable after the codec changes; a pre-checksum entry is adopted and gains its digest; eviction
+removes whole least-recently-used entries down to the budget, never one this process touched nor a
+singleton state file, and adopts a pre-manifest cache at its mtimes; the telemetry serializes. No network."""
+import inspect, json, os, shutil, sys, tempfile
+import unittest.mock as mock
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+import calendar_worker as cw
+import bill_tracker
+
+CSV = b"BillNumber,HistoryDate,Description\r\n" + b"".join(
+    b"HB%d,01/%02d/2026,Referred to Committee on Courts of Justice\r\n" % (k, 1 + k % 28) for k in range(2000))
+ROOT = "https://lis.blob.core.windows.net/lisfiles"
+
+
+class FakeResp:
+    def __init__(self, status, content=b"", etag=None):
+        self.status_code, self.content = status, content
+        self.headers = {"ETag": etag, "Content-Length": str(len(content))} if etag else {}
+
+
+def _fetch(url, queue):
+    """safe_fetch_csv with the blob session answering from `queue`; returns (frame, headers sent)."""
+    sent = []
+
+    def fake_get(u, timeout=None, headers=None):
+        sent.append(headers or {})
+        return queue.pop(0)
+    with mock.patch.object(cw._BLOB_SESSION, "get", fake_get):
+        return cw.safe_fetch_csv(url), sent
+
+
+def _reset(tmp):
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    cw._BLOB_CACHE_DIR, cw._BLOB_CACHE_ENABLED = tmp, True
+    cw._BLOB_MANIFEST = cw._BlobCacheManifest()          # a fresh process's view
+    for k in cw.blob_cache_stats:
+        cw.blob_cache_stats[k] = 0
+
+
+def _meta(url):
+    with open(cw._blob_cache_paths(url)[1]) as f:
+        return json.load(f)
+
+
+def _family(tmp, url):
+    key = cw._blob_cache_key(url)
+    return sorted(n for n in os.listdir(tmp) if n.startswith(key + "."))
+
+
+def main(tmp):
+    fails = []
+    url = f"{ROOT}/20261/HISTORY.CSV"
+
+    # 1) a write records length + SHA-256 + codec in the meta and the manifest; maintain persists it
+    _reset(tmp)
+    df, _ = _fetch(url, [FakeResp(200, CSV, '"v1"')])
+    meta = _meta(url)
+    entry = cw._BLOB_MANIFEST.entries().get(cw._blob_cache_key(url), {})
+    if meta.get("sha256") != cw.hashlib.sha256(CSV).hexdigest() or meta.get("codec") != "none" \
+            or meta.get("length") != len(CSV) or meta.get("stored") != len(CSV):
+        fails.append(f"1: meta must carry length / SHA-256 / codec / stored: {meta}")
+    if entry.get("url") != url or entry.get("etag") != '"v1"' or entry.get("sha256") != meta.get("sha256") \
+            or not entry.get("last_access"):
+        fails.append(f"1: manifest entry {entry}")
+    m = cw.blob_cache_maintain()
+    with open(cw._BlobCacheManifest.path()) as f:
+        saved = json.load(f)["entries"][cw._blob_cache_key(url)]
+    if saved.get("stored") != sum(os.path.getsize(os.path.join(tmp, n)) for n in _family(tmp, url)):
+        fails.append(f"1: the saved entry's stored bytes must cover all its files: {saved}")
+    if m["blob_cache_entries"] != 1 or m["blob_download_200"] != 1 or m["blob_cache_hit_pct"] != 0:
+        fails.append(f"1: metrics {m}")
+
+    # 2) same-length junk: SHA-256 mismatch -> quarantined, a miss, and the refetch is unconditional
+    bin_path = cw._blob_cache_paths(url)[0]
+    with open(bin_path, "r+b") as f:
+        f.seek(len(CSV) // 2)
+        f.write(b"X")
+    df2, sent = _fetch(url, [FakeResp(200, CSV, '"v1"')])
+    qdir = os.path.join(tmp, "quarantine")
+    if not df2.equals(df) or "If-None-Match" in sent[0] or cw.blob_cache_stats["corrupt"] != 1:
+        fails.append(f"2: a corrupt body must be refetched unconditionally: {sent}")
+    if sorted(n.rsplit(".", 1)[1] for n in os.listdir(qdir)) != ["bin", "json"]:
+        fails.append(f"2: the corrupt pair must land in quarantine/: {os.listdir(qdir)}")
+    if cw._read_blob_cache(url) != ('"v1"', CSV):
+        fails.append("2: the refetch must re-populate a verified entry")
+
+    # 3) truncated / grown bodies are quarantined too; only the newest _BLOB_QUARANTINE_KEEP pairs stay
+    for k in range(cw._BLOB_QUARANTINE_KEEP + 2):
+        cw._write_blob_cache(url, '"v1"', CSV)
+        with open(bin_path, "r+b") as f:
+            f.truncate(len(CSV) - 10 if k % 2 else len(CSV) + 5)
+        if cw._read_blob_cache(url) != (None, None) or os.path.exists(bin_path):
+            fails.append(f"3: a wrong-length body must read as a miss and leave the cache ({k})")
+    if len(os.listdir(qdir)) != 2 * cw._BLOB_QUARANTINE_KEEP or cw._blob_cache_key(url) in cw._BLOB_MANIFEST.entries():
+        fails.append(f"3: quarantine must be capped and the entry forgotten: {len(os.listdir(qdir))} files")
+
+    # 4) codecs: gzip (and zstd, when available) shrink the stored bytes and read back identically; a
+    #    change of codec leaves old entries readable; a damaged stream is quarantined
+    for codec in ("gzip", "zstd"):
+        _reset(tmp)
+        with mock.patch.object(cw, "BLOB_CACHE_CODEC", codec):
+            cw._write_blob_cache(url, '"v2"', CSV)
+        meta = _meta(url)
+        want = codec if codec == "gzip" or cw._zstd is not None else "gzip"
+        if meta["codec"] != want or not meta["stored"] < len(CSV) // 4 or os.path.getsize(bin_path) != meta["stored"]:
+            fails.append(f"4: {codec}: stored {meta}")
+        if cw._read_blob_cache(url) != ('"v2"', CSV):
+            fails.append(f"4: {codec}: must read back the exact bytes, under any configured codec")
+        df4, sent = _fetch(url, [FakeResp(304)])
+        if not df4.equals(df) or sent[0].get("If-None-Match") != '"v2"':
+            fails.append(f"4: {codec}: a 304 must serve the decompressed body")
+    with open(bin_path, "r+b") as f:
+        f.seek(20)
+        f.write(b"\x00" * 16)
+    if cw._read_blob_cache(url) != (None, None) or cw.blob_cache_stats["corrupt"] != 1:
+        fails.append("4: a damaged compressed stream must be quarantined")
+
+    # 5) a pre-checksum meta (etag + length only): length-checked as before, then gains its SHA-256
+    _reset(tmp)
+    with open(bin_path, "wb") as f:
+        f.write(CSV)
+    with open(cw._blob_cache_paths(url)[1], "w") as f:
+        json.dump({"etag": '"old"', "length": len(CSV)}, f)
+    if cw._read_blob_cache(url) != ('"old"', CSV) or _meta(url).get("sha256") != cw.hashlib.sha256(CSV).hexdigest():
+        fails.append(f"5: a legacy entry must be served and backfilled: {_meta(url)}")
+
+    # 6) LRU: whole entries (body, meta, frame snapshot, vote index, ...) go oldest-access first down to the
+    #    budget; an entry this process touched and the singleton state files stay
+    _reset(tmp)
+    urls = [f"{ROOT}/{y}1/{n}.CSV" for y in (2023, 2024, 2025) for n in ("HISTORY", "DOCKET")]
+    for u in urls:
+        cw._write_blob_cache(u, '"e"', CSV)
+        cw._write_blob_frame(u, '"e"', CSV, df)
+        with open(cw._blob_cache_paths(u)[0][:-len(".bin")] + ".votes.json", "w") as f:
+            f.write("{}")
+    for name in ("stm_verify.json", "legislation_ids.json"):
+        with open(os.path.join(tmp, name), "wb") as f:
+            f.write(b"s" * 50_000)
+    cw._BLOB_MANIFEST.maintain(0)                        # persist the index, as the writing cycle would
+    cw._BLOB_MANIFEST = cw._BlobCacheManifest()          # next cycle: nothing touched yet
+    with open(cw._BlobCacheManifest.path()) as f:
+        saved = json.load(f)
+    for age, u in enumerate(urls):                       # urls[0] least recently used ... urls[-1] most
+        saved["entries"][cw._blob_cache_key(u)]["last_access"] = 1_000_000 + age
+    with open(cw._BlobCacheManifest.path(), "w") as f:
+        json.dump(saved, f)
+    cw._read_blob_cache(urls[0])                         # this cycle reads the OLDEST entry: protected
+    per_entry = sum(os.path.getsize(os.path.join(tmp, n)) for n in _family(tmp, urls[0]))
+    total = sum(os.path.getsize(os.path.join(r, n)) for r, _d, ns in os.walk(tmp) for n in ns)
+    m = cw.blob_cache_maintain(total - 2 * per_entry)
+    left = [u for u in urls if _family(tmp, u)]
+    if left != [urls[0]] + urls[3:] or m["blob_evicted"] != 2 or m["blob_evicted_bytes"] != 2 * per_entry:
+        fails.append(f"6: want urls[1], urls[2] evicted (the touched urls[0] kept): left {left}, {m}")
+    if not all(os.path.exists(os.path.join(tmp, n)) for n in ("stm_verify.json", "legislation_ids.json")):
+        fails.append("6: singleton state files are never evicted")
+    if m["blob_cache_bytes"] > total - 2 * per_entry or m["blob_cache_entries"] != 4 \
+            or set(cw._BLOB_MANIFEST.entries()) != {cw._blob_cache_key(u) for u in left}:
+        fails.append(f"6: size / index after eviction: {m}")
+    m = cw.blob_cache_maintain(1)
+    if m["blob_cache_entries"] != 1 or not _family(tmp, urls[0]):
+        fails.append("6: an over-tight budget evicts every idle entry, never a touched one")
+    if cw.blob_cache_maintain(0)["blob_evicted"] != m["blob_evicted"]:
+        fails.append("6: a zero budget is unbounded (nothing more evicted)")
+
+    # 7) a pre-manifest cache is adopted at its files' mtimes: oldest evicted first
+    _reset(tmp)
+    for age, u in enumerate(urls[:3]):
+        cw._write_blob_cache(u, '"e"', CSV)
+        for n in _family(tmp, u):
+            os.utime(os.path.join(tmp, n), (1_000_000 + age, 1_000_000 + age))
+    cw._BLOB_MANIFEST = cw._BlobCacheManifest()
+    m = cw.blob_cache_maintain(2 * len(CSV) + 1024)
+    if [u for u in urls[:3] if _family(tmp, u)] != urls[1:3] or m["blob_cache_entries"] != 2:
+        fails.append(f"7: adoption by mtime: {m}")
+
+    # 8) telemetry: hit % over 304s vs downloads; JSON-serializable; off with the cache; wired into both workers
+    for k in cw.blob_cache_stats:
+        cw.blob_cache_stats[k] = 0
+    cw.blob_cache_stats.update(reuse_304=3, download_200=1)
+    m = cw.blob_cache_maintain()
+    try:
+        json.dumps(m)
+    except (TypeError, ValueError) as e:
+        fails.append(f"8: metrics must serialize into SYSTEM_METRICS: {e}")
+    if m["blob_cache_hit_pct"] != 75:
+        fails.append(f"8: hit % {m['blob_cache_hit_pct']}")
+    with mock.patch.object(cw, "_BLOB_CACHE_ENABLED", False):
+        if cw.blob_cache_maintain(1)["blob_cache_bytes"] != 0 or not _family(tmp, urls[1]):
+            fails.append("8: the kill switch must leave the directory alone")
+    if "blob_cache_maintain()" not in inspect.getsource(cw.run_calendar_update) \
+            or "blob_cache_maintain()" not in inspect.getsource(bill_tracker.run_bill_tracker):
+        fails.append("8: both workers must run the cache upkeep each cycle")
+
+    if fails:
+        print("❌ FAILURES:")
+        for x in fails:
+            print("   -", x)
+        sys.exit(1)
+    print(f"✅ all blob cache manager tests passed (manifest; SHA-256 / length / codec quarantine + refetch; "
+          f"gzip{' + zstd' if cw._zstd else ''} round-trip; legacy backfill; LRU eviction, touched + state "
+          f"files kept; mtime adoption; telemetry)")
+
+
+if __name__ == "__main__":
+    saved = cw._BLOB_CACHE_DIR, cw._BLOB_CACHE_ENABLED, cw._BLOB_MANIFEST
+    _tmp = tempfile.mkdtemp()
+    try:
+        main(os.path.join(_tmp, "cache"))
+    finally:
+        cw._BLOB_CACHE_DIR, cw._BLOB_CACHE_ENABLED, cw._BLOB_MANIFEST = saved
+        shutil.rmtree(_tmp, ignore_errors=True)
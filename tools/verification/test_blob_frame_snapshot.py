@@ -0,0 +1,124 @@
+"""Parsed-frame snapshot (_read_blob_frame / _write_blob_frame): a 304 on a cached blob is served from the
+pickled post-normalization DataFrame (no read_csv) and equals a fresh parse exactly — values, dtypes, the
+stripped headers; a snapshot whose ETag / body / schema / pandas tag doesn't match, or that won't unpickle,
+is a miss that re-parses and rewrites it; the kill switch disables it. No network.
+Cold vs warm timing + peak memory: tools/blob_sizing/frame_snapshot_benchmark.py."""
+import json, os, shutil, sys, tempfile
+import unittest.mock as mock
+import pandas as pd
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+import calendar_worker as cw
+from test_blob_cache import CSV, URL, FakeResp, install
+
+# leading zeros + an empty cell + padded headers: the normalization the snapshot must preserve
+BODY = b" BillNumber ,HistoryDate, Committee,Refid\r\nHB1,01/01/2026,H01,0012345\r\nHB2,01/02/2026,,H0201\r\n"
+
+
+def reset(tmp, enabled=True):
+    cw._BLOB_CACHE_DIR = tmp
+    cw._BLOB_CACHE_ENABLED = enabled
+    for k in cw.blob_cache_stats:
+        cw.blob_cache_stats[k] = 0
+
+
+def main(tmp):
+    fails = []
+    parses = []
+    real_read_csv = cw.pd.read_csv
+
+    def counting_read_csv(*a, **kw):
+        parses.append(1)
+        return real_read_csv(*a, **kw)
+
+    with mock.patch.object(cw.pd, "read_csv", side_effect=counting_read_csv):
+        # 1) cold 200: parsed once, blob + frame snapshot written
+        reset(tmp)
+        install([FakeResp(200, BODY, etag='"v1"', content_length=len(BODY))])
+        cold = cw.safe_fetch_csv(URL)
+        pkl_path, meta_path = cw._blob_frame_paths(URL)
+        if len(parses) != 1 or not (os.path.exists(pkl_path) and os.path.exists(meta_path)):
+            fails.append(f"1: cold fetch must parse once and write the snapshot (parses={len(parses)})")
+        if list(cold.columns) != ["BillNumber", "HistoryDate", "Committee", "Refid"] or cold.loc[0, "Refid"] != "0012345":
+            fails.append(f"1: normalization changed: {list(cold.columns)} {cold.to_dict()}")
+
+        # 2) warm 304: served from the snapshot, no read_csv, identical frame
+        reset(tmp)
+        install([FakeResp(304)])
+        warm = cw.safe_fetch_csv(URL)
+        if len(parses) != 1 or cw.blob_cache_stats["frame_hit"] != 1 or cw.blob_cache_stats["reuse_304"] != 1:
+            fails.append(f"2: a 304 must be served from the snapshot (parses={len(parses)}, {cw.blob_cache_stats})")
+        if not (warm.equals(cold) and list(warm.dtypes) == list(cold.dtypes) and list(warm.columns) == list(cold.columns)):
+            fails.append("2: snapshot frame differs from the parsed frame (ACCURACY)")
+        if warm.loc[1, "Committee"] != "":
+            fails.append("2: an empty cell must stay '' (keep_default_na=False), not NaN")
+
+        # 3) every tag must match: a changed tag re-parses (and rewrites the snapshot); the 304 still serves
+        for tag, value in (("etag", '"other"'), ("sha256", "0" * 64), ("schema", "0"), ("pandas", "0.0")):
+            with open(meta_path) as f:
+                meta = json.load(f)
+            meta[tag] = value
+            with open(meta_path, "w") as f:
+                json.dump(meta, f)
+            reset(tmp)
+            before = len(parses)
+            install([FakeResp(304)])
+            got = cw.safe_fetch_csv(URL)
+            if len(parses) != before + 1 or cw.blob_cache_stats["frame_hit"] or not got.equals(cold):
+                fails.append(f"3: a mismatched {tag} tag must re-parse")
+            with open(meta_path) as f:
+                if json.load(f) != cw._blob_frame_tags('"v1"', BODY):
+                    fails.append(f"3: the re-parse after a {tag} mismatch must rewrite the snapshot")
+
+        # 4) a snapshot that won't unpickle (or isn't a frame) is a miss, never an error
+        for junk in (b"not a pickle", None):
+            if junk is None:
+                pd.Series([1, 2]).to_pickle(pkl_path, compression=None)
+            else:
+                with open(pkl_path, "wb") as f:
+                    f.write(junk)
+            if cw._read_blob_frame(URL, '"v1"', BODY) is not None:
+                fails.append(f"4: a bad snapshot must read as a miss ({junk!r})")
+            reset(tmp)
+            install([FakeResp(304)])
+            if not cw.safe_fetch_csv(URL).equals(cold):
+                fails.append("4: a bad snapshot must fall back to parsing the cached bytes")
+
+        # 5) a changed blob (200, new ETag) replaces the snapshot; the next 304 serves the NEW frame
+        reset(tmp)
+        install([FakeResp(200, CSV, etag='"v2"', content_length=len(CSV))])
+        fresh = cw.safe_fetch_csv(URL)
+        install([FakeResp(304)])
+        if not cw.safe_fetch_csv(URL).equals(fresh) or cw.blob_cache_stats["frame_hit"] != 1:
+            fails.append("5: a new blob must replace the snapshot")
+
+        # 6) kill switch: no snapshot read or written
+        with tempfile.TemporaryDirectory() as off:
+            reset(off, enabled=False)
+            install([FakeResp(200, BODY, etag='"v3"', content_length=len(BODY))])
+            cw.safe_fetch_csv(URL)
+            if os.listdir(off) or cw._read_blob_frame(URL, '"v1"', BODY) is not None:
+                fails.append("6: LIS_BLOB_CACHE=0 must disable the frame snapshot")
+
+        # 7) an ETag-less 200 writes nothing (no tag to key on)
+        reset(tmp)
+        os.remove(meta_path)
+        install([FakeResp(200, BODY, content_length=len(BODY))])
+        cw.safe_fetch_csv(URL)
+        if os.path.exists(meta_path):
+            fails.append("7: a 200 without an ETag must not write a snapshot")
+
+    if fails:
+        print("❌ FAILURES:")
+        for x in fails:
+            print("   -", x)
+        sys.exit(1)
+    print("✅ all blob frame-snapshot tests passed (304 served without read_csv; identical frame + dtypes; "
+          "ETag/body/schema/pandas tags; bad pickle → re-parse; new blob replaces; kill switch)")
+
+
+if __name__ == "__main__":
+    _tmp = tempfile.mkdtemp()
+    try:
+        main(_tmp)
+    finally:
+        shutil.rmtree(_tmp, ignore_errors=True)
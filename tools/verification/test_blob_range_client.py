@@ -0,0 +1,301 @@
+"""Ranged, resumable blob transfer (_blob_get, _BlobPartial, via safe_fetch_csv) against a local HTTP
+server with Azure's Range / ETag / If-None-Match / If-Match / whole-blob MD5 semantics: by default a changed
+blob is ONE whole-blob request; opted into chunks (BLOB_RANGE_WORKERS > 1) a cold blob comes down in parallel
+ranges pinned If-Match its ETag, over pooled keep-alive connections, byte-identical; an unchanged blob is one
+304; an appended HISTORY.CSV fetches only its tail and is spliced only when the whole-blob MD5 matches — an
+edited prefix, a missing MD5 or a shrunk blob falls back to the full download, and an entry cached without an
+MD5 skips the tail attempt;
+an interrupted transfer resumes from the partial file with only the missing ranges; a blob that changes
+mid-transfer is a 412 that discards the partial, never a splice; a server without Range support and
+BLOB_RANGED=0 are the old single GET. No network."""
+import base64, hashlib, io, os, shutil, sys, tempfile, threading, time
+import unittest.mock as mock
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pandas as pd
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+import calendar_worker as cw
+
+CHUNK, OVERLAP = 4096, 512
+
+
+def _csv(rows, start=0, edit=False):
+    lines = [f"HB{k},01/{1 + k % 28:02d}/2026,{'EDITED' if edit and k == 3 else 'Referred to Committee'} {k}"
+             for k in range(start, start + rows)]
+    return (("BillNumber,HistoryDate,Description\r\n" if not start else "") + "\r\n".join(lines) + "\r\n").encode()
+
+
+class _Blob:
+    """The server's one blob (served at every path) plus switches, fault hooks and a request log."""
+
+    def __init__(self, body):
+        self.lock = threading.Lock()
+        self.set(body)
+        self.md5, self.ranges = True, True
+        self.cut, self.swap_after_first = set(), None
+        self.log, self.ports, self.inflight, self.max_inflight = [], set(), 0, 0
+
+    def set(self, body):
+        self.body = body
+        self.etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+
+    def reset_log(self):
+        self.log, self.ports, self.max_inflight = [], set(), 0
+
+
+def _handler(blob):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _empty(self, status, extra=()):
+            self.send_response(status)
+            for k, v in extra:
+                self.send_header(k, v)
+            if status != 304:
+                self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def do_GET(self):
+            with blob.lock:
+                blob.inflight += 1
+                blob.max_inflight = max(blob.max_inflight, blob.inflight)
+                blob.log.append({k: self.headers.get(k) for k in ("Range", "If-None-Match", "If-Match")})
+                blob.ports.add(self.client_address[1])
+                body, etag = blob.body, blob.etag
+            try:
+                time.sleep(0.02)
+                self._serve(body, etag)
+            finally:
+                with blob.lock:
+                    blob.inflight -= 1
+
+        def _serve(self, body, etag):
+            md5 = base64.b64encode(hashlib.md5(body).digest()).decode()
+            rng, n = self.headers.get("Range"), len(body)
+            if self.headers.get("If-Match") not in (None, etag):
+                return self._empty(412)
+            if self.headers.get("If-None-Match") == etag:
+                return self._empty(304, [("ETag", etag)])
+            if rng and blob.ranges:
+                a, _, b = rng[len("bytes="):].partition("-")
+                a, b = int(a), min(int(b) if b else n - 1, n - 1)
+                if a >= n:
+                    return self._empty(416, [("Content-Range", f"bytes */{n}")])
+                part = body[a:b + 1]
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {a}-{b}/{n}")
+                if blob.md5:
+                    self.send_header("x-ms-blob-content-md5", md5)
+            else:
+                a, part = None, body
+                self.send_response(200)
+                if blob.md5:
+                    self.send_header("Content-MD5", md5)
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", "Sun, 18 Oct 2026 07:00:00 GMT")
+            self.send_header("Content-Length", str(len(part)))
+            self.end_headers()
+            with blob.lock:
+                cut = a in blob.cut
+                blob.cut.discard(a)
+                if a == 0 and blob.swap_after_first is not None:
+                    blob.set(blob.swap_after_first)
+                    blob.swap_after_first = None
+            if cut:                                 # a reset mid-transfer: half the bytes, then hang up
+                self.wfile.write(part[:len(part) // 2])
+                self.close_connection = True
+                return
+            self.wfile.write(part)
+
+        def log_message(self, *_):
+            pass
+    return Handler
+
+
+def _frame(body):
+    return pd.read_csv(io.StringIO(body.decode("iso-8859-1")), dtype=str, keep_default_na=False).rename(
+        columns=lambda x: x.strip())
+
+
+def _forget(url):
+    for p in cw._blob_cache_paths(url):
+        if os.path.exists(p):
+            os.remove(p)
+
+
+def _stats():
+    for k in cw.blob_cache_stats:
+        cw.blob_cache_stats[k] = 0
+    return cw.blob_cache_stats
+
+
+def main(tmp):
+    fails = []
+    base = _csv(300)                      # ~13 KB: 4 chunks
+    blob = _Blob(base)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(blob))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    root = f"http://127.0.0.1:{server.server_address[1]}/lisfiles/20261"
+    hist, docket = f"{root}/HISTORY.CSV", f"{root}/DOCKET.CSV"
+    cw._BLOB_CACHE_DIR, cw._BLOB_CACHE_ENABLED = tmp, True
+    cw._LIS_GOVERNOR.configure("127.0.0.1", 0)
+    chunks = -(-len(base) // CHUNK)
+
+    # 1) cold: parallel ranges, later ones If-Match the first ETag, pooled connections, identical frame + cache
+    st = _stats()
+    df = cw.safe_fetch_csv(hist)
+    later = blob.log[1:]
+    if not df.equals(_frame(base)) or cw._read_blob_cache(hist) != (blob.etag, base):
+        fails.append("1: a ranged cold fetch must give the exact body, frame and cache entry")
+    if len(blob.log) != chunks or st["range_requests"] != chunks or any(h["If-Match"] != blob.etag for h in later):
+        fails.append(f"1: want {chunks} ranged GETs, all after the first If-Match: {blob.log}")
+    if blob.max_inflight < 2 or len(blob.ports) >= len(blob.log):
+        fails.append(f"1: ranges must overlap ({blob.max_inflight} in flight) on reused connections "
+                     f"({len(blob.ports)} for {len(blob.log)} requests)")
+
+    # 2) unchanged: one conditional request, 304
+    blob.reset_log()
+    st = _stats()
+    if not cw.safe_fetch_csv(hist).equals(df) or len(blob.log) != 1 or st["reuse_304"] != 1:
+        fails.append(f"2: an unchanged blob must be one 304: {blob.log}")
+
+    # 3) appended HISTORY: one tail request past the cached length (less the overlap), MD5-verified splice
+    grown = base + _csv(40, start=300)
+    blob.set(grown)
+    blob.reset_log()
+    st = _stats()
+    got = cw.safe_fetch_csv(hist)
+    if not got.equals(_frame(grown)) or cw._read_blob_cache(hist) != (blob.etag, grown):
+        fails.append("3: the spliced body must equal the grown blob (frame + cache)")
+    if len(blob.log) != 1 or blob.log[0]["Range"] != f"bytes={len(base) - OVERLAP}-" or st["tail_fetch"] != 1 \
+            or st["tail_bytes_saved"] != len(base) - OVERLAP:
+        fails.append(f"3: want one tail request from {len(base) - OVERLAP}: {blob.log}, {st}")
+
+    # 4) an edited prefix + appended rows: the MD5 rejects the splice -> full ranged download
+    # 6) a blob that shrank below the cached length: 416 -> full download
+    # 5) no whole-blob MD5 from the server: the splice is unverifiable -> full download
+    for label, new, md5 in (("4 edited", _csv(300, edit=True) + _csv(60, start=300), True),
+                            ("6 shrank", _csv(100), True),
+                            ("5 no MD5", _csv(100) + _csv(10, start=100), False)):
+        cached = cw._read_blob_cache(hist)[1]
+        blob.set(new)
+        blob.md5 = md5
+        blob.reset_log()
+        st = _stats()
+        got = cw.safe_fetch_csv(hist)
+        if not got.equals(_frame(new)) or cw._read_blob_cache(hist)[1] != new:
+            fails.append(f"{label}: must fall back to the full blob")
+        if label != "6 shrank" and (st["tail_rejected"] != 1 or st["tail_fetch"]):
+            fails.append(f"{label}: the tail must be rejected: {st}")
+        if blob.log[0]["Range"] != f"bytes={len(cached) - OVERLAP}-" or blob.log[1]["Range"] != f"bytes=0-{CHUNK - 1}":
+            fails.append(f"{label}: want a tail attempt, then a full ranged download: {blob.log[:2]}")
+        blob.md5 = True
+
+    # 5b) ... and that entry was cached with no MD5, so the next append skips the tail attempt outright:
+    #     straight to the full download, no request spent on a splice that could never verify
+    if cw._blob_cached_md5(hist):
+        fails.append("5b: a body served without an MD5 must be cached without one")
+    no_md5 = _csv(100) + _csv(30, start=100)
+    blob.set(no_md5)
+    blob.reset_log()
+    st = _stats()
+    if not cw.safe_fetch_csv(hist).equals(_frame(no_md5)) or st["tail_skipped"] != 1 or st["tail_rejected"] \
+            or blob.log[0]["Range"] != f"bytes=0-{CHUNK - 1}":
+        fails.append(f"5b: no cached MD5 must skip the tail: {blob.log[:1]}, {st}")
+    if not cw._blob_cached_md5(hist):
+        fails.append("5b: the full download must record the MD5 the server now sends")
+
+    # 7) interrupted: the first attempt's partial file keeps the ranges that landed; the retry asks only for
+    #    the first chunk (for the ETag) + the missing range; the partial files are gone afterwards
+    blob.set(_csv(400))
+    blob.cut = {2 * CHUNK}
+    blob.reset_log()
+    st = _stats()
+    try:
+        cw._blob_get(docket)
+        fails.append("7: a reset mid-transfer must raise into safe_fetch_csv's retry loop")
+    except Exception:
+        pass
+    part, meta = (cw._blob_cache_paths(docket)[0][:-len(".bin")] + s for s in (".part", ".part.json"))
+    n = -(-len(blob.body) // CHUNK)
+    if not (os.path.exists(part) and os.path.exists(meta)):
+        fails.append("7: the interrupted transfer must leave its partial file + state")
+    first_try = len(blob.log)
+    res = cw._blob_get(docket)
+    retry = blob.log[first_try:]
+    if res.status_code != 200 or res.content != blob.body or res.headers.get("ETag") != blob.etag:
+        fails.append("7: the resumed transfer must assemble the exact blob")
+    if first_try != n or [h["Range"] for h in retry] != [f"bytes=0-{CHUNK - 1}", f"bytes={2 * CHUNK}-{3 * CHUNK - 1}"]:
+        fails.append(f"7: the resume must fetch only the missing range: {[h['Range'] for h in retry]}")
+    if st["range_resumed_bytes"] != len(blob.body) - CHUNK or os.path.exists(part) or os.path.exists(meta):
+        fails.append(f"7: resumed {st['range_resumed_bytes']} bytes; partial files must be removed")
+    #    ... and end to end: safe_fetch_csv's second attempt resumes within the same call
+    _forget(docket)
+    blob.cut = {CHUNK}
+    if not cw.safe_fetch_csv(docket).equals(_frame(blob.body)):
+        fails.append("7: safe_fetch_csv must recover an interrupted transfer on its next attempt")
+
+    # 8) the blob changes after the first chunk: every later range is a 412, the partial is discarded, and
+    #    the retry downloads the new version — never a mix of the two
+    _forget(docket)
+    old, new = _csv(400), _csv(380, edit=True)
+    blob.set(old)
+    blob.swap_after_first = new
+    st = _stats()
+    df = cw.safe_fetch_csv(docket)
+    if not df.equals(_frame(new)) or st["range_restart"] < 1 or os.path.exists(part):
+        fails.append(f"8: a mid-transfer change must restart cleanly on the new blob: {st}")
+
+    # 9) a server without Range support: the 200 is used as is, one request
+    # 10) BLOB_RANGED=0: one plain GET, no Range header
+    for label, patch in (("9 no Range", None), ("10 kill switch", mock.patch.object(cw, "BLOB_RANGED", False))):
+        _forget(docket)
+        blob.ranges = patch is not None
+        blob.reset_log()
+        with patch or mock.patch.object(cw, "BLOB_RANGED", True):
+            got = cw.safe_fetch_csv(docket)
+        if not got.equals(_frame(blob.body)) or len(blob.log) != 1 or (patch and blob.log[0]["Range"]):
+            fails.append(f"{label}: want one plain request: {blob.log}")
+        blob.ranges = True
+
+    # 11) the default (BLOB_RANGE_WORKERS=1): every full download is ONE request for the whole blob, so a
+    #     changed blob costs one request; an appended HISTORY one (the tail), an edited one two (tail + full)
+    with mock.patch.object(cw, "BLOB_RANGE_WORKERS", 1):
+        _forget(docket)
+        counts = {}
+        for label, url, body in (("cold", docket, _csv(400)), ("unchanged", docket, None),
+                                 ("changed", docket, _csv(410)), ("appended", hist, no_md5 + _csv(20, start=130)),
+                                 ("edited", hist, _csv(150, edit=True))):
+            if body is not None:
+                blob.set(body)
+            blob.reset_log()
+            if not cw.safe_fetch_csv(url).equals(_frame(blob.body)):
+                fails.append(f"11 {label}: wrong frame")
+            counts[label] = len(blob.log)
+            if label in ("cold", "changed") and blob.log[0]["Range"] != "bytes=0-":
+                fails.append(f"11 {label}: want one whole-blob range: {blob.log}")
+        if counts != {"cold": 1, "unchanged": 1, "changed": 1, "appended": 1, "edited": 2}:
+            fails.append(f"11: requests per fetch {counts}")
+
+    server.shutdown()
+    if fails:
+        print("❌ FAILURES:")
+        for x in fails:
+            print("   -", x)
+        sys.exit(1)
+    print(f"✅ all blob range client tests passed ({chunks} parallel ranges on pooled connections when opted in; "
+          f"304; tail-only append + MD5; edited / no-MD5 / shrunk fall back; no cached MD5 skips the tail; resume; "
+          f"412 restart; no-Range + kill switch; one request per changed blob by default)")
+
+
+if __name__ == "__main__":
+    saved = (cw._BLOB_CACHE_DIR, cw._BLOB_CACHE_ENABLED, cw.BLOB_RANGE_CHUNK_BYTES, cw.BLOB_TAIL_OVERLAP_BYTES,
+             cw.BLOB_RANGE_WORKERS)
+    cw.BLOB_RANGE_CHUNK_BYTES, cw.BLOB_TAIL_OVERLAP_BYTES, cw.BLOB_RANGE_WORKERS = CHUNK, OVERLAP, 4   # chunked
+    _tmp = tempfile.mkdtemp()
+    try:
+        main(_tmp)
+    finally:
+        (cw._BLOB_CACHE_DIR, cw._BLOB_CACHE_ENABLED, cw.BLOB_RANGE_CHUNK_BYTES, cw.BLOB_TAIL_OVERLAP_BYTES,
+         cw.BLOB_RANGE_WORKERS) = saved
+        shutil.rmtree(_tmp, ignore_errors=True)
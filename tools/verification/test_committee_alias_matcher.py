@@ -0,0 +1,111 @@
+"""Compiled committee-alias matcher (_CommitteeAliasMatcher) must give the SAME first-match answer
+as the STM's old `for api_name, aliases in LOCAL_LEXICON.items()` scan — on real HISTORY text, on the
+live-API lexicon shape build_committee_maps() generates, and on an adversarial lexicon whose aliases
+overlap / prefix each other ACROSS committees (the case a plain alternation regex gets wrong)."""
+import os, sys
+import pandas as pd
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+import calendar_worker as cw
+
+_VA = os.path.join(os.path.dirname(__file__), "..", "historical_cache", "va", "241")
+
+
+def _loop(lexicon, prefix, text):
+    """The ORIGINAL STM scan, verbatim."""
+    for api_name, aliases in lexicon.items():
+        if api_name.startswith(prefix) and any(alias and alias in text for alias in aliases):
+            return api_name
+    return None
+
+
+class _Resp:
+    status_code = 200
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+
+class _Session:
+    def __init__(self, payload):
+        self._payload = payload
+
+    def get(self, *a, **k):
+        return _Resp(self._payload)
+
+
+def main():
+    fails = []
+    texts = ["referred to committee on finance and appropriations", "reported from education and health",
+             "", "joint subcommittee on health", "general laws and technology", "courts of justice-civil",
+             "finance", "appropriations (22-y 0-n)", "rules suspended", "public safety; public safety"]
+    if os.path.exists(os.path.join(_VA, "History.csv.gz")):
+        hist = pd.read_csv(os.path.join(_VA, "History.csv.gz"), dtype=str, keep_default_na=False,
+                           encoding="iso-8859-1")
+        texts += [str(t).strip().lower() for t in hist["History_description"]]
+    else:
+        fails.append("fixture missing: History.csv.gz")
+
+    adversarial = {
+        "House Zeta": ["", "finance"],                           # empty alias must be skipped
+        "House Alpha": ["finance and appropriations", "laws"],   # longer alias, LATER committee than Zeta's prefix
+        "House Beta": ["appropriations"],
+        "House Gamma": ["general laws", "general"],              # shorter alias of a later-listed longer one
+        "Senate Delta": ["health", "education and health"],
+        "Joint Epsilon": ["health"],
+        "House Empty": [],
+        "House Nil": None,                                       # corrupt entry must not crash
+    }
+
+    # 1) parity: static lexicon, adversarial lexicon — every prefix the STM can pass
+    for label, lex in (("static", cw._STATIC_LOCAL_LEXICON), ("adversarial", adversarial)):
+        m = cw._CommitteeAliasMatcher(lex)
+        safe = {k: (v or []) for k, v in lex.items()}
+        for prefix in ("House ", "Senate ", "Joint ", ""):
+            for t in texts:
+                want, got = _loop(safe, prefix, t), m.match(prefix, t)
+                if want != got:
+                    fails.append(f"1[{label}]: prefix={prefix!r} text={t[:60]!r}: loop={want!r} matcher={got!r}")
+                    break
+
+    # 2) build_committee_maps() rebinds LOCAL_LEXICON from the live API AND rebuilds the matcher with it
+    comm = pd.read_csv(os.path.join(_VA, "Committees.csv.gz"), dtype=str, keep_default_na=False,
+                       encoding="iso-8859-1")
+    payload = {"Committees": [{"CommitteeNumber": r.COM_COMNO, "Name": r.COM_NAME.strip(),
+                               "ChamberCode": r.CHAMBER, "CommitteeID": i}
+                              for i, r in enumerate(comm.itertuples(index=False))]}
+    saved = (cw.COMMITTEE_CODE_MAP, cw.LOCAL_LEXICON, cw.PARENT_COMMITTEE_MAP, cw.NORM_TO_CODE,
+             cw.CHILDREN_OF_PARENT, cw._LEXICON_MATCHER)
+    try:
+        _, live_lex, _, ok = cw.build_committee_maps(_Session(payload), "20241")
+        if not ok or cw.LOCAL_LEXICON is not live_lex:
+            fails.append("2: build_committee_maps must succeed on the fake API and rebind LOCAL_LEXICON")
+        if cw._LEXICON_MATCHER.lexicon is not cw.LOCAL_LEXICON:
+            fails.append("2: build_committee_maps must rebuild the matcher for the live lexicon")
+        for prefix in ("House ", "Senate ", "Joint "):
+            for t in texts:
+                if _loop(live_lex, prefix, t) != cw._lexicon_matcher().match(prefix, t):
+                    fails.append(f"2: live-lexicon mismatch prefix={prefix!r} text={t[:60]!r}")
+                    break
+
+        # 3) a rebind from anywhere else is picked up lazily (identity check)
+        cw.LOCAL_LEXICON = {"House Only": ["only"]}
+        if cw._lexicon_matcher().match("House ", "the only one") != "House Only":
+            fails.append("3: _lexicon_matcher() must rebuild after LOCAL_LEXICON is rebound")
+    finally:
+        (cw.COMMITTEE_CODE_MAP, cw.LOCAL_LEXICON, cw.PARENT_COMMITTEE_MAP, cw.NORM_TO_CODE,
+         cw.CHILDREN_OF_PARENT, cw._LEXICON_MATCHER) = saved
+
+    if fails:
+        print("❌ FAILURES:")
+        for x in fails[:20]:
+            print("   -", x)
+        sys.exit(1)
+    print(f"✅ all committee-alias matcher tests passed ({len(texts)} texts × static/adversarial/live "
+          f"lexicons × every prefix == the dict-order loop; build_committee_maps rebuild; rebind pickup)")
+
+
+if __name__ == "__main__":
+    main()
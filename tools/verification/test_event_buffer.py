@@ -0,0 +1,119 @@
+"""Compact event buffer (EventBuffer / StmEventRecord / _events_frame): master_events holds slotted records with
+interned strings, and the final DataFrame built from them column-wise equals pd.DataFrame over the same
+events as dicts — same columns in the same order, values, NaNs and dtypes — including the SYSTEM alert dicts
+appended after them and events mutated after append; records read and write like the dicts they replace;
+every way into the buffer stores records; the buffer retains well under the dict list's memory. Runs the STM
+over the checked-in 241 archive; no network. Sizing: tools/legevent_sizing/event_buffer_benchmark.py."""
+import copy, os, sys, tracemalloc
+import pandas as pd
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+import calendar_worker as cw
+from test_stm_sharding import _inputs
+from test_stm_dependencies import _run
+
+
+def _stamped(events):
+    """The STM's events as _append_event leaves them (the four additive columns defaulted)."""
+    out = []
+    for e in events:
+        e = dict(e)
+        for k in ("LegEventRoute", "RefidClass", "ScheduleClass", "TimeClass"):
+            e.setdefault(k, "")
+        out.append(e)
+    return out
+
+
+def _alert(i, kind="SYSTEM_ALERT"):
+    return {"Date": "2026-10-18", "Time": "09:15 AM", "SortTime": "09:15", "Status": "WARN",
+            "Committee": "System Status", "Bill": kind, "Outcome": f"[WARN:DATA_ANOMALY] alert {i}",
+            "AgendaOrder": -99, "Source": "SYSTEM", "Origin": "system_alert", "DiagnosticHint": ""}
+
+
+def main():
+    fails = []
+    df, ro = _inputs()
+    events = _stamped(_run(df, copy.deepcopy(ro))["events"])
+    alerts = [_alert(i) for i in range(3)] + [dict(_alert(9, "SYSTEM_METRICS"), AgendaOrder=-100)]
+
+    # 1) the frame: records + trailing alert dicts == pd.DataFrame over the dicts, exactly
+    buf = cw.EventBuffer(copy.deepcopy(events))
+    try:
+        pd.testing.assert_frame_equal(cw._events_frame(list(buf) + alerts), pd.DataFrame(events + alerts))
+        pd.testing.assert_frame_equal(cw._events_frame(buf), pd.DataFrame(events))
+        pd.testing.assert_frame_equal(cw._events_frame(alerts), pd.DataFrame(alerts))
+    except AssertionError as e:
+        fails.append(f"1: _events_frame != pd.DataFrame(dicts): {str(e)[:200]}")
+    if not cw._events_frame([]).equals(pd.DataFrame([])):
+        fails.append("1: an empty event list must give the empty frame")
+
+    # 2) odd shapes: an extra key, a missing slot, a None / list value, a key order that differs
+    odd = [dict(events[0], AgendaLink="https://lis.virginia.gov/x"), {k: v for k, v in events[1].items() if k != "Time"},
+           dict(events[2], DiagnosticHint=None), dict(reversed(list(events[3].items()))),
+           dict(events[4], Outcome=["a", "b"])]
+    try:
+        pd.testing.assert_frame_equal(cw._events_frame(cw.EventBuffer(copy.deepcopy(odd)) + alerts[:1]),
+                                      pd.DataFrame(odd + alerts[:1]))
+    except (AssertionError, ValueError) as e:
+        fails.append(f"2: odd event shapes: {str(e)[:200]}")
+
+    # 3) records read and write like the dicts they replace
+    rec, ev = buf[0], events[0]
+    if dict(rec) != ev or rec != ev or list(rec) != list(ev) or len(rec) != len(ev):
+        fails.append("3: dict(record) / == / key order / len must match the source dict")
+    if cw._stm_event_key(rec) != cw._stm_event_key(ev) or cw._event_bill_key(rec) != cw._event_bill_key(ev):
+        fails.append("3: _stm_event_key / _event_bill_key must read a record like a dict")
+    if rec.get("Nope", "d") != "d" or "Nope" in rec or "Time" not in rec or rec["Bill"] != ev["Bill"]:
+        fails.append("3: get / in / [] on a record")
+    try:
+        rec["Nope"]
+        fails.append("3: a missing key must raise KeyError")
+    except KeyError:
+        pass
+    rec["Time"], rec["AgendaLink"] = "3:17 PM", "x"           # the best-time promotion pass mutates in place
+    if rec["Time"] != "3:17 PM" or list(rec)[-1] != "AgendaLink" \
+            or cw._events_frame(buf[:1]).loc[0, "Time"] != "3:17 PM" or rec.setdefault("Time", "z") != "3:17 PM":
+        fails.append("3: writes after append must show in the record and the frame")
+
+    # 4) every way into the buffer stores records; slices are plain lists of the same records
+    b = cw.EventBuffer()
+    b.append(events[0])
+    b.extend(events[1:3])
+    b += events[3:4]
+    b.insert(0, events[4])
+    b[1] = events[5]
+    b[2:3] = events[6:8]
+    if not all(type(e) is cw.StmEventRecord for e in b) or [dict(e) for e in b] != \
+            [events[4], events[5], events[6], events[7], events[2], events[3]]:
+        fails.append("4: append / extend / += / insert / item + slice assignment must store records in order")
+    del b[2:]
+    if len(b) != 2 or type(b[:1]) is not list or b[:1][0] is not b[0]:
+        fails.append("4: del / slicing")
+    if buf[1]["Source"] is not buf[-1]["Source"] or buf[1]._keys is not buf[-1]._keys:
+        fails.append("4: repeated string values and key layouts must be interned (one object each)")
+
+    # 5) retained memory: the buffer holds the same events in well under the dict list's footprint
+    #    (containers only — the values are the same string objects either way; the benchmark measures the STM)
+    tracemalloc.start()
+    as_dicts = [dict(e) for e in events]
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    tracemalloc.start()
+    as_records = cw.EventBuffer(events)
+    rec_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    if len(as_records) != len(as_dicts) or rec_bytes > 0.6 * dict_bytes:
+        fails.append(f"5: buffer retains {rec_bytes / 2**20:.1f} MiB vs {dict_bytes / 2**20:.1f} MiB as dicts "
+                     f"(want ≤ 60%)")
+
+    if fails:
+        print("❌ FAILURES:")
+        for x in fails:
+            print("   -", x)
+        sys.exit(1)
+    print(f"✅ all event buffer tests passed ({len(events)} events; frame == pd.DataFrame(dicts) incl. alerts and "
+          f"odd shapes; mapping behaviour; interning; {rec_bytes / 2**20:.1f} vs {dict_bytes / 2**20:.1f} MiB)")
+
+
+if __name__ == "__main__":
+    main()
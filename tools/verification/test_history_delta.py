@@ -0,0 +1,205 @@
+"""HISTORY delta ingestion (_history_delta_hashes): whatever path it takes — prefix (appended rows),
+merge (edited / deleted rows), unchanged, grown date window — the per-bill digests must equal the
+original full groupby/iterrows hash and the incremental STM's digests a full _stm_bill_digests pass, only
+the delta's bills are re-hashed / re-digested, and the inserted / removed / modified counts are exact; a
+crash full-hashes and counts history_delta_errors; no state, a shrunk window, changed columns, a corrupt
+state file, no served body or HISTORY_DELTA=0 fall back to the full hash. Runs over the checked-in 241
+archive; no network."""
+import gzip, io, json, os, shutil, sys, tempfile
+import unittest.mock as mock
+import pandas as pd
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+import calendar_worker as cw
+
+_ARCHIVE = os.path.join(os.path.dirname(__file__), "..", "historical_cache", "va", "241", "History.csv.gz")
+_WINDOW = (pd.Timestamp("2023-11-01"), pd.Timestamp("2024-03-31"))
+
+
+def _frame(body, window=_WINDOW):
+    """df_past as run_calendar_update shapes it: parse, CleanBill/ParsedDate, window filter, date sort."""
+    df = pd.read_csv(io.StringIO(body.decode("iso-8859-1")), dtype=str, keep_default_na=False)
+    df = df.rename(columns=lambda x: x.strip())
+    nrows = len(df)
+    df["CleanBill"] = df["Bill_id"].astype(str).str.replace(" ", "").str.upper()
+    df["ParsedDate"] = pd.to_datetime(df["History_date"], format="mixed", errors="coerce")
+    df = df[(df["ParsedDate"] >= window[0]) & (df["ParsedDate"] <= window[1])]
+    df["OriginalOrder"] = range(len(df))
+    return df.sort_values(by=["ParsedDate", "OriginalOrder"]), nrows
+
+
+def _reference(df_past, desc_col="History_description", refid_col="History_refid"):
+    """The pre-delta loop, verbatim."""
+    legevent_history_hashes = {}
+    for clean_bill, group in df_past.groupby("CleanBill"):
+        bill_str = str(clean_bill).strip()
+        if not bill_str:
+            continue
+        rows_tuple = []
+        for _, hr in group.iterrows():
+            d = hr["ParsedDate"].strftime("%Y-%m-%d") if pd.notna(hr.get("ParsedDate")) else ""
+            o = str(hr.get(desc_col, "") or "")
+            r = str(hr.get(refid_col, "") or "") if refid_col else ""
+            rows_tuple.append((d, o, r))
+        legevent_history_hashes[bill_str] = cw._hash_history_rows_for_bill(rows_tuple)
+    return legevent_history_hashes
+
+
+_STM_DRIFT = []   # runs whose carried-forward STM digests differ from a full _stm_bill_digests pass
+
+
+def _run(body, path, etag='"v"', window=_WINDOW, cols=("History_description", "History_refid"), stm=True):
+    df, nrows = _frame(body, window)
+    hashes, stm_digests, stats = cw._history_delta_hashes(df, cols[0], cols[1], (etag, body), nrows, window,
+                                                          path, stm=stm)
+    if stm and stm_digests != cw._stm_bill_digests(df, cols[0], cols[1]):
+        _STM_DRIFT.append((etag, _mode(stats)))
+    return hashes, stats, df
+
+
+def _mode(stats):
+    return next(k[len("history_delta_"):] for k in ("history_delta_prefix", "history_delta_merge",
+                                                      "history_delta_full") if stats[k])
+
+
+def main(tmp):
+    fails = []
+    cw._BLOB_CACHE_DIR, cw._BLOB_CACHE_ENABLED, cw.HISTORY_DELTA_ENABLED = tmp, True, True
+    path = os.path.join(tmp, "hist.delta.json")
+    with gzip.open(_ARCHIVE) as f:
+        lines = f.read().splitlines(keepends=True)
+    header, data = lines[0], lines[1:9001]          # 9,000 rows keeps the iterrows reference quick
+    old_body = header + b"".join(data[:8000])
+    new_body = header + b"".join(data)
+
+    # 1) cold: no state → full hash, identical to the original loop; state persisted
+    hashes, stats, df = _run(old_body, path, '"v1"')
+    if _mode(stats) != "full" or hashes != _reference(df) or not os.path.exists(path):
+        fails.append(f"1: cold run must full-hash to the reference and persist ({_mode(stats)})")
+    with open(path) as f:
+        if json.load(f).get("schema") != cw._HISTORY_DELTA_SCHEMA:
+            fails.append("1: the delta state must be stored as JSON")
+
+    # 2) unchanged body + window: nothing touched, digests carried forward
+    hashes, stats, df = _run(old_body, path, '"v1"')
+    if _mode(stats) != "prefix" or stats["history_delta_touched_bills"] or hashes != _reference(df):
+        fails.append(f"2: an unchanged body must touch nothing: {stats}")
+
+    # 3) appended rows: prefix path, touched = the tail's bills, only those re-hashed
+    tail_df, _ = _frame(header + b"".join(data[8000:]))
+    want_touched = set(tail_df["CleanBill"])
+    rehashed = []
+    real_hash = cw._hash_history_rows_for_bill
+    with mock.patch.object(cw, "_hash_history_rows_for_bill", side_effect=lambda r: rehashed.append(1) or real_hash(r)):
+        hashes, stats, df = _run(new_body, path, '"v2"')
+    ref = _reference(df)
+    if _mode(stats) != "prefix" or hashes != ref:
+        fails.append(f"3: an appended body must take the prefix path to the reference digests ({_mode(stats)})")
+    if stats["history_delta_touched_bills"] != len(want_touched) or len(rehashed) != len(want_touched):
+        fails.append(f"3: touched {stats['history_delta_touched_bills']} / re-hashed {len(rehashed)}, "
+                     f"want {len(want_touched)} (the tail's bills)")
+    if stats["history_delta_stm_redigested"] != len(want_touched):
+        fails.append(f"3: the STM digests must be re-taken for the {len(want_touched)} touched bills only, "
+                     f"not {stats['history_delta_stm_redigested']}")
+    if (stats["history_delta_inserted"], stats["history_delta_removed"], stats["history_delta_modified"]) \
+            != (len(tail_df), 0, 0):
+        fails.append(f"3: counts {stats} != +{len(tail_df)} rows")
+
+    # 4) an edited row + a deleted row mid-file: merge path, exactly those two bills, exact counts
+    edited = list(data)
+    victim, dropped = edited[100], edited[4000]
+    edited[100] = victim.replace(b'","H ', b'","H (corrected) ', 1)
+    del edited[4000]
+    body4 = header + b"".join(edited)
+    hashes, stats, df = _run(body4, path, '"v3"')
+    bills = {cw.re.sub(rb'^"([^"]*)".*', rb"\1", x, flags=cw.re.S).decode().replace(" ", "").upper()
+             for x in (victim, dropped)}
+    if _mode(stats) != "merge" or hashes != _reference(df):
+        fails.append(f"4: an edited file must take the merge path to the reference digests ({_mode(stats)})")
+    if stats["history_delta_touched_bills"] != len(bills) or (stats["history_delta_inserted"],
+            stats["history_delta_removed"], stats["history_delta_modified"]) != (0, 1, 1):
+        fails.append(f"4: want {bills} touched, -1 row, ~1 row: {stats}")
+
+    # 5) the date window grows: rows it newly admits touch their bills (body unchanged)
+    wide = (_WINDOW[0], pd.Timestamp("2024-12-31"))
+    narrow = (_WINDOW[0], pd.Timestamp("2024-02-15"))
+    _run(body4, path, '"v3"', window=narrow)                    # shrink → full, re-seeds at the narrow window
+    hashes, stats, df = _run(body4, path, '"v3"', window=wide)
+    late = set(df.loc[df["ParsedDate"] > narrow[1], "CleanBill"])
+    if _mode(stats) != "prefix" or hashes != _reference(df) or stats["history_delta_touched_bills"] != len(late):
+        fails.append(f"5: a grown window must touch exactly the newly admitted bills ({stats})")
+
+    # 6) fallbacks: shrunk window, new columns, corrupt state, no served body, kill switch
+    _, stats, _ = _run(body4, path, '"v3"', window=narrow)
+    if _mode(stats) != "full":
+        fails.append("6: a shrunk window must full-hash")
+    _, stats, df = _run(body4, path, '"v3"', window=narrow, cols=("History_description", None))
+    if _mode(stats) != "full":
+        fails.append("6: a different refid column must full-hash")
+    with open(path, "wb") as f:
+        f.write(b"not json")
+    hashes, stats, df = _run(body4, path, '"v3"')
+    if _mode(stats) != "full" or hashes != _reference(df) or stats["history_delta_errors"]:
+        fails.append("6: a corrupt state file must full-hash (a fallback, not an error)")
+    _run(new_body, path, '"v2"')                                  # re-seed: body4 is then a merge
+    with mock.patch.object(cw, "_history_row_changes", side_effect=RuntimeError("boom")):
+        hashes, stats, df = _run(body4, path, '"v4"')
+    if _mode(stats) != "full" or hashes != _reference(df) or stats["history_delta_errors"] != 1:
+        fails.append(f"6: a delta crash must full-hash AND count history_delta_errors: {stats}")
+    df, nrows = _frame(body4)
+    hashes, stm_digests, stats = cw._history_delta_hashes(df, "History_description", "History_refid", None,
+                                                          nrows, _WINDOW, path, stm=True)
+    if _mode(stats) != "full" or hashes != _reference(df) \
+            or stm_digests != cw._stm_bill_digests(df, "History_description", "History_refid"):
+        fails.append("6: no served body must full-hash")
+    with mock.patch.object(cw, "HISTORY_DELTA_ENABLED", False):
+        os.remove(path)
+        _, stats, _ = _run(body4, path, '"v3"')
+        _, stats, _ = _run(body4, path, '"v3"')
+        if _mode(stats) != "full" or os.path.exists(path):
+            fails.append("6: HISTORY_DELTA=0 must always full-hash and persist nothing")
+
+    # 7) STM digests off for a cycle (no incremental mode): none are returned or carried; the next cycle that
+    #    asks re-digests everything once, then carries again
+    _, stats, _ = _run(old_body, path, '"s1"', stm=False)
+    _, stats, _ = _run(new_body, path, '"s2"', stm=False)
+    if stats["history_delta_stm_redigested"]:
+        fails.append("7: stm=False must not digest for the STM")
+    _, stats, df = _run(new_body, path, '"s2"')
+    if _mode(stats) != "prefix" or stats["history_delta_stm_redigested"] != len(cw._stm_bill_digests(
+            df, "History_description", "History_refid")):
+        fails.append(f"7: a state without STM digests must re-digest every bill once: {stats}")
+    _, stats, _ = _run(new_body, path, '"s2"')
+    if stats["history_delta_stm_redigested"]:
+        fails.append(f"7: an unchanged body must then carry every STM digest: {stats}")
+    with mock.patch.object(cw, "_STM_DIGEST_SCHEME", "h0"):
+        _, stats, _ = _run(new_body, path, '"s2"', stm=True)
+    if not stats["history_delta_stm_redigested"]:
+        fails.append("7: STM digests stored under another _STM_DIGEST_SCHEME must never be carried")
+    if _STM_DRIFT:
+        fails.append(f"7: carried STM digests must equal a full _stm_bill_digests pass: {_STM_DRIFT}")
+
+    # 8) safe_fetch_csv records the exact (etag, body) it returned a frame for
+    from test_blob_cache import CSV, URL, FakeResp, install
+    install([FakeResp(200, CSV, etag='"b1"', content_length=len(CSV))])
+    cw.safe_fetch_csv(URL)
+    if cw._blob_served.get(URL) != ('"b1"', CSV):
+        fails.append("8: safe_fetch_csv must record the served (etag, body)")
+
+    if fails:
+        print("❌ FAILURES:")
+        for x in fails:
+            print("   -", x)
+        sys.exit(1)
+    print("✅ all HISTORY delta tests passed (prefix / merge / unchanged / grown window == the full iterrows "
+          "hash, STM digests == a full pass; only touched bills re-hashed / re-digested; exact row counts; "
+          "every fallback full-hashes)")
+
+
+if __name__ == "__main__":
+    saved = cw._BLOB_CACHE_DIR, cw._BLOB_CACHE_ENABLED, cw._BLOB_SESSION.get
+    _tmp = tempfile.mkdtemp()
+    try:
+        main(_tmp)
+    finally:
+        cw._BLOB_CACHE_DIR, cw._BLOB_CACHE_ENABLED, cw._BLOB_SESSION.get = saved
+        shutil.rmtree(_tmp, ignore_errors=True)
@@ -0,0 +1,109 @@
+"""Hot-path memo layer (_hot_memo / _hot_memo_metrics): every memoized pure helper must return exactly
+what its unwrapped body returns (on real HISTORY text + LIS time phrasings), repeat calls must be
+served from the memo, the memo must be typed and bounded, unhashable args must bypass it, shared
+token sets must be immutable, and SYSTEM_METRICS must get per-helper hits/misses/size + a saturation
+signal that a real session's vocabulary doesn't trip."""
+import os, sys
+import pandas as pd
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+import calendar_worker as cw
+import structural_router as sr
+
+_HIST = os.path.join(os.path.dirname(__file__), "..", "historical_cache", "va", "241", "History.csv.gz")
+
+_TIMES = ["9:00 AM", "9:00 a.m.", "8am", "8:30AM", "12:00 PM", "1/2 hour after adjournment of the House",
+          "15 minutes after adjournment", "2 hours after adjournment", "1 1/2 hours after adjournment",
+          "Immediately upon adjournment", "following the Finance Committee", "Recess", "Time TBA", "",
+          "2½ hours after", "quarter of an hour after", "3/4 hour after", " 10:15 am "]
+
+
+def main():
+    fails = []
+    descs = ["H Reported from Courts of Justice (22-Y 0-N)", "📝 [Memory Anchor: admin] S Signed by President",
+             "", "Passed by for the day"]
+    if os.path.exists(_HIST):
+        hist = pd.read_csv(_HIST, dtype=str, keep_default_na=False, encoding="iso-8859-1")
+        hist.columns = hist.columns.str.strip()
+        descs += list(hist["History_description"].head(20000))
+    else:
+        fails.append(f"fixture missing: {_HIST}")
+
+    # 1) memoized == unwrapped body, twice over (second pass is all memo hits)
+    for _ in range(2):
+        for t in _TIMES:
+            for parent in (None, "14:00", "06:00", "23:59"):
+                if cw.parse_24h_time(t, parent) != cw.parse_24h_time.__wrapped__(t, parent):
+                    fails.append(f"1: parse_24h_time({t!r}, {parent!r})")
+            if cw._parse_relative_offset_minutes(t) != cw._parse_relative_offset_minutes.__wrapped__(t):
+                fails.append(f"1: _parse_relative_offset_minutes({t!r})")
+            if cw._is_relative_time_text(t) != cw._is_relative_time_text.__wrapped__(t):
+                fails.append(f"1: _is_relative_time_text({t!r})")
+        for d in descs:
+            if cw.normalize_room_key(d) != cw.normalize_room_key.__wrapped__(d):
+                fails.append(f"1: normalize_room_key({d!r})")
+            if cw._legislation_event_token_set(d) != cw._legislation_event_token_set.__wrapped__(d):
+                fails.append(f"1: _legislation_event_token_set({d!r})")
+            if sr.normalize_event_description(d) != sr._normalize_description_text.__wrapped__(sr._s(d)):
+                fails.append(f"1: normalize_event_description({d!r})")
+            if len(fails) > 10:
+                break
+    if cw.parse_24h_time(raw_time="9:00 AM") != "09:00":
+        fails.append("1: keyword call must work through the memo")
+
+    m = cw._hot_memo_metrics()
+    for name in ("normalize_room_key", "legislation_event_token_set", "parse_relative_offset_minutes",
+                 "is_relative_time_text", "parse_24h_time", "normalize_event_description"):
+        for suffix in ("hits", "misses", "size"):
+            if not isinstance(m.get(f"memo_{name}_{suffix}"), int):
+                fails.append(f"2: SYSTEM_METRICS key memo_{name}_{suffix} missing")
+        if m.get(f"memo_{name}_hits", 0) <= 0:
+            fails.append(f"2: {name}: repeat calls must hit the memo")
+
+    # 3) typed (1 vs "1" vs 1.0 are distinct entries), unhashable args bypass, token sets immutable
+    if (cw.normalize_room_key(1), cw.normalize_room_key(1.0)) != ("1", "1 0"):
+        fails.append("3: memo must be typed (1 and 1.0 normalize differently)")
+    if cw.normalize_room_key(["House", "Rules"]) != cw.normalize_room_key.__wrapped__(["House", "Rules"]):
+        fails.append("3: an unhashable arg must bypass the memo, not raise")
+    if not isinstance(cw._legislation_event_token_set("Reported from Finance"), frozenset):
+        fails.append("3: a memoized token set must be immutable (frozenset)")
+    if cw._legislation_event_token_set(None) != set():
+        fails.append("3: None -> empty token set")
+
+    # 4) saturation: a memo filled to its bound is reported, and bounded (LRU) beyond it
+    tiny = cw._hot_memo(maxsize=2)(lambda x: x * 2)
+    try:
+        for v in (1, 2, 3):
+            tiny(v)
+        if tiny.cache_info().currsize != 2:
+            fails.append("4: the memo must stay bounded at maxsize")
+        if "<lambda>" not in cw._saturated_hot_memos():
+            fails.append("4: a full memo must be reported as saturated")
+    finally:
+        cw._HOT_MEMOS.pop("<lambda>", None)
+    if "<lambda>" in cw._saturated_hot_memos():
+        fails.append("4: registry cleanup failed")
+
+    # 5) the bounds are sized from data: a whole session's distinct HISTORY descriptions (241: 18,340) fill
+    #    at most half the description-token memo — room for the LegEvent descriptions it also tokenizes —
+    #    so hot_memo_saturated stays a drift signal, not a routine alert
+    if os.path.exists(_HIST):
+        distinct = set(hist["History_description"])
+        cw._legislation_event_token_set.cache_clear()
+        for d in distinct:
+            cw._legislation_event_token_set(d)
+        info = cw._legislation_event_token_set.cache_info()
+        if info.currsize != len(distinct) or 2 * info.currsize > info.maxsize:
+            fails.append(f"5: {len(distinct)} distinct 241 descriptions vs memo bound {info.maxsize}")
+        cw._legislation_event_token_set.cache_clear()
+
+    if fails:
+        print("❌ FAILURES:")
+        for x in fails[:20]:
+            print("   -", x)
+        sys.exit(1)
+    print(f"✅ all hot-path memo tests passed ({len(_TIMES)} time phrasings × 4 parents, {len(descs)} descriptions: "
+          f"memo == unwrapped; hits counted; typed; unhashable bypass; frozen token sets; bounded + saturation; 241 fits the bound)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""Concurrent LegEvent hydration (_hydrate_legevent_cache workers= / LEGEVENT_HYDRATE_WORKERS): N workers
+must leave legislation_id_cache, legislation_event_cache, bills_meta (including row order) and the pushed
+alerts (including order — dedup is first-wins) EXACTLY as the serial loop does, whatever order the
+fetches complete in; known LegislationIDs must not be re-looked-up; and LisRequestCapExceeded must still
+abort the cycle — also when a skipped job precedes the aborting one in queue order. No network. (Per-host pacing is the session adapter's: test_request_governor.py.)"""
+import os, random, sys, threading, time
+import unittest.mock as mock
+from datetime import datetime, timezone
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+import calendar_worker as cw
+
+_VERSION = "https://lis.virginia.gov/LegislationVersion/api/GetLegislationVersionbyBillNumberAsync"
+_EVENTS = "https://lis.virginia.gov/LegislationEvent/api/GetPublicLegislationEventHistoryListAsync"
+
+
+class _Resp:
+    def __init__(self, status_code, payload):
+        self.status_code, self._payload = status_code, payload
+
+    def json(self):
+        if isinstance(self._payload, Exception):
+            raise self._payload
+        return self._payload
+
+
+class _FakeLis:
+    """Deterministic per-bill answers (ok / 404 / raise / bad JSON / non-dict / no versions / schema
+    drift) with a random per-call delay, so concurrent completion order is shuffled."""
+
+    def __init__(self, jitter=0.004, cap=None):
+        self.calls, self.lock, self.jitter, self.cap = [], threading.Lock(), jitter, cap
+
+    def get(self, url, params=None, **_):
+        with self.lock:
+            self.calls.append((url, dict(params or {})))
+            n = len(self.calls)
+        if self.cap is not None and n > self.cap:
+            raise cw.LisRequestCapExceeded(f"{n} > {self.cap}")
+        time.sleep(random.random() * self.jitter)
+        if url == _VERSION:
+            k = int(params["billNumber"][2:])
+            if k % 11 == 3:
+                return _Resp(404, None)
+            if k % 13 == 5:
+                raise ConnectionError("reset by peer")
+            if k % 17 == 7:
+                return _Resp(200, ValueError("bad json"))
+            if k % 19 == 2:
+                return _Resp(200, {"LegislationsVersion": []})
+            return _Resp(200, {"LegislationsVersion": [{"LegislationID": 9000 + k}]})
+        k = params["legislationID"] - 9000
+        if k % 7 == 4:
+            return _Resp(500, None)
+        if k % 23 == 1:
+            return _Resp(200, ["not", "a", "dict"])
+        ev = [{"EventDate": f"2026-0{1 + j % 3}-{10 + j:02d}T{9 + j:02d}:15:00", "ChamberCode": "HS"[j % 2],
+               "Description": f"Action {j} on HB{k}", "EventCode": f"H{4000 + j}", "CommitteeName": None,
+               "ReferenceType": "", "VoteTally": "", "ActorType": "", "Status": ""} for j in range(k % 5)]
+        if k % 29 == 6 and ev:
+            del ev[0]["EventCode"]   # schema-drift canary (shared first-wins dedup key)
+        return _Resp(200, {"LegislationEvents": ev})
+
+
+class _LastFirstPool:
+    """ThreadPoolExecutor stand-in whose map() runs the jobs last-queued first, then yields their results
+    (or raises their exceptions) in queue order — a fixed worst-case scheduling."""
+
+    def __init__(self, max_workers=None, thread_name_prefix=""):
+        pass
+
+    def map(self, fn, iterable):
+        items = list(iterable)
+        done = [None] * len(items)
+        for i in reversed(range(len(items))):
+            try:
+                done[i] = (fn(items[i]), None)
+            except BaseException as e:
+                done[i] = (None, e)
+        for value, err in done:
+            if err is not None:
+                raise err
+            yield value
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+
+def _run(queue, workers, seed_ids, stale, lis=None):
+    id_cache, ev_cache, meta, alerts = dict(seed_ids), dict(stale), {}, []
+    lis = lis or _FakeLis()
+    n = cw._hydrate_legevent_cache(
+        refresh_queue=queue, http_session=lis, session_5d="20261",
+        current_hashes={b: f"h{b}" for b in queue}, legislation_id_cache=id_cache,
+        legislation_event_cache=ev_cache, bills_meta=meta,
+        push_alert=lambda *a, **k: alerts.append((a, sorted(k.items()))),
+        now_utc=datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc), workers=workers)
+    return n, id_cache, ev_cache, meta, alerts, lis
+
+
+def main():
+    fails = []
+    random.seed(7)
+    queue = [f"HB{k}" for k in range(1, 161)]
+    random.shuffle(queue)
+    # Known IDs for a few bills (reused, never re-looked-up), stale events that a refresh must replace,
+    # and an unrelated bill's entry that must survive untouched.
+    seed_ids = {(f"HB{k}", "20261"): 9000 + k for k in range(100, 110)}
+    stale = {(b, "20261"): [{"EventDate": "1999-01-01T00:00:00", "Description": "stale"}] for b in queue[::9]}
+    stale[("SB1", "20261")] = [{"EventDate": "2026-01-01T10:00:00", "Description": "keep me"}]
+
+    # 1) serial vs 4 / 8 workers: caches, bills_meta (and its order), alerts (and their order)
+    base = _run(queue, 1, seed_ids, stale)
+    if not base[4] or not any(base[2].get((b, "20261")) for b in queue):
+        fails.append("1: fixture must produce alerts AND non-empty event lists")
+    for workers in (4, 8):
+        got = _run(queue, workers, seed_ids, stale)
+        for i, name in ((0, "fetch count"), (1, "legislation_id_cache"), (2, "legislation_event_cache"),
+                        (4, "alerts (order)")):
+            if got[i] != base[i]:
+                fails.append(f"1[{workers}w]: {name} differs from the serial loop")
+        if list(got[3].items()) != list(base[3].items()):
+            fails.append(f"1[{workers}w]: bills_meta rows differ or are out of queue order")
+        if sorted(map(repr, got[5].calls)) != sorted(map(repr, base[5].calls)):
+            fails.append(f"1[{workers}w]: a different set of upstream requests was made")
+    if base[2].get(("SB1", "20261")) != stale[("SB1", "20261")]:
+        fails.append("1: a bill outside the queue must keep its cache entry")
+    if any(base[2].get(k) == v for k, v in stale.items() if k[0] != "SB1"):
+        fails.append("1: a refreshed bill must not keep its stale events")
+    if list(base[3]) != [(b, "20261") for b in queue]:
+        fails.append("1: bills_meta must gain one row per queued bill, in queue order")
+    relooked = [p["billNumber"] for u, p in base[5].calls if u == _VERSION and 100 <= int(p["billNumber"][2:]) < 110]
+    if relooked:
+        fails.append(f"1: a known LegislationID was re-looked-up: {relooked}")
+
+    # 2) LisRequestCapExceeded still aborts the cycle, and queued fetches are dropped, not each tripped
+    try:
+        _run(queue, 4, {}, {}, lis=_FakeLis(cap=40))
+        fails.append("2: LisRequestCapExceeded must propagate out of the concurrent hydrator")
+    except cw.LisRequestCapExceeded:
+        pass
+    lis = _FakeLis(cap=40)
+    try:
+        _run(queue, 4, {}, {}, lis=lis)
+    except cw.LisRequestCapExceeded:
+        pass
+    if len(lis.calls) > 40 + 2 * 4 * 2:
+        fails.append(f"2: {len(lis.calls)} requests attempted after the cap tripped — pending fetches must be cancelled")
+
+    # 2b) the interleaving where a worker pulls an EARLIER-queued job but only checks the abort flag after a
+    #     later job has raised: forced by a pool that runs the jobs last-first. The skipped earlier slot must
+    #     re-raise the recorded LisRequestCapExceeded, not crash the merge unpacking a skipped result
+    short = queue[:5]
+
+    def fetch(_session, bill, _session_5d, _lid):
+        if bill == short[2]:
+            raise cw.LisRequestCapExceeded("cap")
+        return {}, {}, []
+    try:
+        with mock.patch.object(cw, "ThreadPoolExecutor", _LastFirstPool), \
+                mock.patch.object(cw, "_fetch_legevent_bill", fetch):
+            _run(short, 4, {}, {})
+        fails.append("2b: LisRequestCapExceeded must propagate when an earlier slot was skipped")
+    except cw.LisRequestCapExceeded:
+        pass
+    except Exception as e:
+        fails.append(f"2b: a skipped earlier slot surfaced as {type(e).__name__}: {e}")
+
+    # 3) the LEGEVENT_HYDRATE_WORKERS knob
+    for raw, want in (("", 1), ("0", 1), ("1", 1), ("junk", 1), ("auto", 1), ("4", 4), (" 6 ", 6),
+                      ("64", cw.LEGEVENT_HYDRATE_MAX_WORKERS)):
+        if cw._legevent_hydrate_worker_count(raw) != want:
+            fails.append(f"3: LEGEVENT_HYDRATE_WORKERS={raw!r} -> {cw._legevent_hydrate_worker_count(raw)}, want {want}")
+
+    if fails:
+        print("❌ FAILURES:")
+        for x in fails:
+            print("   -", x)
+        sys.exit(1)
+    print(f"✅ all LegEvent hydration tests passed ({len(queue)} bills, {len(base[4])} alerts: serial == 4 == 8 "
+          f"workers incl. order; known IDs reused; cap abort + cancel; worker knob)")
+
+
+if __name__ == "__main__":
+    main()
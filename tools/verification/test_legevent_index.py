@@ -0,0 +1,139 @@
+"""LegEventIndex — the per-bill (date -> chamber-filtered, pre-tokenized) LegislationEvent lookup
+shared by _route_for_row / _find_legevent_time_in_cache / _recover_time_via_legevent_committee /
+_resolve_via_legislation_event_api. Its candidates must equal the per-matcher linear filter it replaced
+(same events, same order, same tokens); the matchers must answer identically with the cycle's warmed
+index and without one; a warmed index must never re-tokenize; and a list added / replaced after warm
+must be picked up (the index is keyed by list identity)."""
+import os, sys
+import pandas as pd
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+import calendar_worker as cw
+
+_HIST = os.path.join(os.path.dirname(__file__), "..", "historical_cache", "va", "241", "History.csv.gz")
+
+
+def _linear(events, action_date_str, acting_chamber_code):
+    """The ORIGINAL matchers' Step-1 filter, verbatim, plus the tokenization each did per candidate."""
+    out = []
+    for e in events or ():
+        if not isinstance(e, dict):
+            continue
+        if str(e.get("EventDate") or "")[:10] != action_date_str:
+            continue
+        ev_chamber = str(e.get("ChamberCode") or "").strip().upper()
+        if acting_chamber_code and ev_chamber and ev_chamber != acting_chamber_code:
+            continue
+        out.append((e, cw._legislation_event_token_set(str(e.get("Description") or ""))))
+    return out
+
+
+def _cache():
+    """Synthetic LegEvent cache from real 2024 HISTORY text: mixed clock / midnight stamps, H/S/blank/
+    lower-case chambers, CommitteeName known / floor / unknown, and a corrupt non-dict entry."""
+    hist = pd.read_csv(_HIST, dtype=str, keep_default_na=False, encoding="iso-8859-1").head(8000)
+    hist.columns = hist.columns.str.strip()
+    cache, rows = {}, []
+    for k, (b, d, o) in enumerate(zip(hist["Bill_id"], hist["History_date"], hist["History_description"])):
+        b = b.replace(" ", "").upper()
+        date = pd.to_datetime(d).strftime("%Y-%m-%d")
+        ch = ("H", "S", "", " h ")[k % 4]
+        rows.append((b, date, o, ch.strip().upper()[:1]))
+        cache.setdefault((b, "20241"), []).append({
+            "EventDate": date + ("T%02d:%02d:00" % (7 + k % 15, k % 60) if k % 3 else "T00:00:00"),
+            "ChamberCode": ch, "Description": o[2:] if o[1:2] == " " else o,
+            "EventCode": f"{(ch.strip() or 'H')[:1].upper()}{k % 50:04d}",
+            "CommitteeName": ("Finance", None, "?")[k % 3], "ReferenceType": "", "VoteTally": "", "Status": ""})
+        if k % 997 == 0:
+            cache[(b, "20241")].append("corrupt-row")
+    return cache, rows
+
+
+def main():
+    fails = []
+    if not os.path.exists(_HIST):
+        print(f"❌ fixture missing: {_HIST}")
+        sys.exit(1)
+    cache, rows = _cache()
+    idx = cw.LegEventIndex().warm(cache)
+
+    # 1) candidates == the linear filter (events, order, tokens) for every row + chamber variant
+    n = 0
+    for b, date, _, ch in rows:
+        events = cache[(b, "20241")]
+        for q in (ch, "", "H", "S", "J"):
+            got = idx.candidates(events, date, q)
+            want = _linear(events, date, q)
+            n += 1
+            if [e for e, _ in got] != [e for e, _ in want] or [set(t) for _, t in got] != [t for _, t in want]:
+                fails.append(f"1: candidates mismatch bill={b} date={date} chamber={q!r}")
+                break
+        if fails:
+            break
+    if idx.candidates([], "2024-01-10", "H") != [] or idx.candidates(None, "2024-01-10", "H") != []:
+        fails.append("1: no events -> no candidates")
+
+    # 2) every matcher answers identically with the warmed shared index and with none
+    alerts = []
+    push = lambda *a, **k: alerts.append(a)
+    for b, date, o, ch in rows[::3]:
+        events = cache[(b, "20241")]
+        pairs = (
+            (cw._route_for_row(b, "20241", date, o, ch, cache, legevent_index=idx),
+             cw._route_for_row(b, "20241", date, o, ch, cache)),
+            (cw._find_legevent_time_in_cache(events, b, date, o, ch, push, legevent_index=idx),
+             cw._find_legevent_time_in_cache(events, b, date, o, ch, push)),
+            (cw._recover_time_via_legevent_committee(events, date, ch, o, {}, {}, legevent_index=idx),
+             cw._recover_time_via_legevent_committee(events, date, ch, o, {}, {})),
+            (cw._resolve_via_legislation_event_api(None, b, date, o, "20241", ch, {(b, "20241"): "L1"}, cache,
+                                                   push, legevent_index=idx),
+             cw._resolve_via_legislation_event_api(None, b, date, o, "20241", ch, {(b, "20241"): "L1"}, cache,
+                                                   push)),
+        )
+        for name, (with_idx, without) in zip(("route", "find_in_cache", "recover_committee", "resolver"), pairs):
+            if with_idx != without:
+                fails.append(f"2: {name} differs with the shared index for {b} {date} {o!r}: {with_idx!r} vs {without!r}")
+        if len(fails) > 10:
+            break
+
+    # 3) a warmed index never re-tokenizes
+    calls = []
+    real = cw._legislation_event_token_set
+    cw._legislation_event_token_set = lambda t: calls.append(t) or real(t)
+    try:
+        for b, date, _, ch in rows[:2000]:
+            idx.candidates(cache[(b, "20241")], date, ch)
+    finally:
+        cw._legislation_event_token_set = real
+    if calls:
+        fails.append(f"3: warmed index re-tokenized {len(calls)} description(s)")
+
+    # 4) identity keyed: a list added / replaced after warm is indexed on first use
+    key = rows[0][0], "20241"
+    fresh = [{"EventDate": rows[0][1] + "T10:00:00", "ChamberCode": "", "Description": "Brand new action"}]
+    cache[key] = fresh
+    got = idx.candidates(cache[key], rows[0][1], "H")
+    if [e for e, _ in got] != fresh or got[0][1] != frozenset({"brand", "new", "action"}):
+        fails.append("4: a replaced event list must be indexed on first use")
+    fresh.append({"EventDate": rows[0][1] + "T11:00:00", "ChamberCode": "", "Description": "Appended later"})
+    if [e for e, _ in idx.candidates(cache[key], rows[0][1], "H")] != fresh:
+        fails.append("4: an event list appended to in place must be re-indexed")
+
+    # 5) non-dict entries (a corrupt cache row) are skipped and counted once per list
+    before = idx.metrics()["legevent_index_nondict_events"]
+    junk = [None, "junk", {"EventDate": "2024-01-10", "ChamberCode": "H", "Description": "Reported"}]
+    got = idx.candidates(junk, "2024-01-10", "H")
+    idx.candidates(junk, "2024-01-10", "H")
+    if [e for e, _ in got] != [junk[2]] or idx.metrics()["legevent_index_nondict_events"] != before + 2:
+        fails.append(f"5: non-dict events must be skipped and counted once: {idx.metrics()}")
+
+    if fails:
+        print("❌ FAILURES:")
+        for x in fails:
+            print("   -", x)
+        sys.exit(1)
+    print(f"✅ all LegEventIndex tests passed ({n} candidate queries == the linear filter; 4 matchers "
+          f"identical with/without the shared index; zero re-tokenization when warm; identity + length pickup; non-dict counted)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Persisted bill → LegislationID map (_load/_save_legislation_id_map, _seed_legislation_ids,
+_remember_legislation_ids, _prime_legislation_ids): a warm map sends every queued bill straight to the
+events call (one LIS request per bill instead of two) and hydrates exactly what a cold cycle does; a
+bill list that carries IDs primes the whole session in ONE request, one without IDs (or a failed call)
+falls back to lazy fill and is not retried within the prime TTL; only real IDs are stored; sessions
+are kept apart; a corrupt file or LEGISLATION_ID_MAP=0 reads as an empty map. No network."""
+import json, os, shutil, sys, tempfile
+import unittest.mock as mock
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+import calendar_worker as cw
+from test_legevent_hydration import _FakeLis, _Resp, _VERSION, _run
+
+S = "20261"
+T0 = 1_800_000_000.0
+
+
+class _ListingLis(_FakeLis):
+    """_FakeLis plus the session bill list: `with_ids` rows carry LegislationID (as the version lookup
+    would answer); otherwise only LegislationNumber. `listing_status` != 200 fails the call."""
+
+    def __init__(self, bills, with_ids=True, listing_status=200):
+        super().__init__(jitter=0)
+        self.bills, self.with_ids, self.listing_status = bills, with_ids, listing_status
+
+    def get(self, url, params=None, **kw):
+        if url != cw._SESSION_PROBE_URL:
+            return super().get(url, params=params, **kw)
+        with self.lock:
+            self.calls.append((url, dict(params or {})))
+        rows = [dict({"LegislationNumber": f"{b[:2]} {b[2:]}"},
+                     **({"LegislationID": 9000 + int(b[2:])} if self.with_ids else {})) for b in self.bills]
+        return _Resp(self.listing_status, {"Legislations": rows})
+
+
+def _cycle(state, queue, lis):
+    """One worker cycle: seed from the map, hydrate, remember. Returns (stats, hydrate result)."""
+    ids = {}
+    stats = cw._seed_legislation_ids(state, S, queue, ids, lis, T0)
+    got = _run(queue, 1, ids, {}, lis=lis)
+    stats["legid_learned"] = cw._remember_legislation_ids(state, S, got[1])
+    return stats, got
+
+
+def _count(lis, url):
+    return sum(1 for u, _ in lis.calls if u == url)
+
+
+def main(tmp):
+    fails = []
+    cw._BLOB_CACHE_DIR, cw._BLOB_CACHE_ENABLED = tmp, True
+    queue = [f"HB{k}" for k in range(1, 41)]
+
+    # 1) lazy fill: a cold cycle looks every bill up; the next cycle reuses every real ID it learned
+    with mock.patch.object(cw, "LEGISLATION_ID_PRIME_MIN", 0):
+        state = cw._load_legislation_id_map()
+        cold_stats, cold = _cycle(state, queue, _ListingLis(queue))
+        cw._save_legislation_id_map(state)
+        state = cw._load_legislation_id_map()
+        warm_lis = _ListingLis(queue)
+        warm_stats, warm = _cycle(state, queue, warm_lis)
+    learned = {b for (b, _), lid in cold[1].items() if lid}
+    if set(state["sessions"][S]["ids"]) != learned or not all(state["sessions"][S]["ids"].values()):
+        fails.append("1: the map must hold exactly the real IDs the cold cycle learned (no negative entries)")
+    if cold_stats["legid_map_hits"] or cold_stats["legid_lookups"] != len(queue):
+        fails.append(f"1: a cold map knows nothing: {cold_stats}")
+    if warm_stats["legid_map_hits"] != len(learned) or _count(warm_lis, _VERSION) != len(queue) - len(learned):
+        fails.append(f"1: the warm cycle must look up only the {len(queue) - len(learned)} unknown bills "
+                     f"({_count(warm_lis, _VERSION)} lookups)")
+    if warm[1:5] != cold[1:5]:
+        fails.append("1: a warm map must hydrate exactly what the cold cycle did (caches, meta, alerts)")
+
+    # 2) bulk prime: one listing request seeds the whole queue; no version lookups at all
+    state = {"schema": cw._LEGISLATION_ID_MAP_SCHEMA, "sessions": {}}
+    lis = _ListingLis(queue)
+    with mock.patch.object(cw, "LEGISLATION_ID_PRIME_MIN", 25):
+        stats, primed = _cycle(state, queue, lis)
+    if stats["legid_primed"] != 1 or stats["legid_prime_new"] != len(queue) or _count(lis, _VERSION) \
+            or _count(lis, cw._SESSION_PROBE_URL) != 1:
+        fails.append(f"2: a listing with IDs must prime the queue in one request: {stats}, {len(lis.calls)} calls")
+    if {k: v for k, v in primed[2].items() if k[0] in learned} != cold[2]:
+        fails.append("2: primed IDs must hydrate the same events as looked-up ones")
+    if not all(primed[2].get((b, S)) is not None for b in queue):
+        fails.append("2: a bill whose version lookup fails must still hydrate from its primed ID")
+
+    # 3) below PRIME_MIN unknown bills, or within the prime TTL: no listing call
+    for label, st, q in (("few unknown", {"schema": "1", "sessions": {}}, queue[:24]),
+                         ("within TTL", {"schema": "1", "sessions": {S: {"ids": {}, "primed_at": T0 - 60}}}, queue)):
+        lis = _ListingLis(queue)
+        with mock.patch.object(cw, "LEGISLATION_ID_PRIME_MIN", 25):
+            stats, _ = _cycle(st, q, lis)
+        if stats["legid_primed"] or _count(lis, cw._SESSION_PROBE_URL):
+            fails.append(f"3: {label}: the bill list must not be fetched")
+
+    # 4) a listing without IDs / a failed listing: lazy fill, and no retry until the TTL passes
+    for label, lis in (("no IDs", _ListingLis(queue, with_ids=False)), ("HTTP 500", _ListingLis(queue, listing_status=500))):
+        st = {"schema": "1", "sessions": {}}
+        with mock.patch.object(cw, "LEGISLATION_ID_PRIME_MIN", 25):
+            stats, got = _cycle(st, queue, lis)
+            again = cw._seed_legislation_ids(st, S, queue[::-1], {}, lis, T0 + 3600)
+        if stats["legid_prime_new"] or _count(lis, _VERSION) != len(queue) or got[2] != cold[2]:
+            fails.append(f"4: {label}: every bill must fall back to its own lookup")
+        if (label == "HTTP 500") != bool(stats["legid_prime_failures"]):
+            fails.append(f"4: {label}: prime failures miscounted {stats}")
+        if _count(lis, cw._SESSION_PROBE_URL) != 1 or again["legid_primed"]:
+            fails.append(f"4: {label}: the bill list must not be re-fetched within the TTL")
+
+    # 5) sessions are kept apart; LegislationNumber is normalised like CleanBill
+    st = {"schema": "1", "sessions": {"20251": {"ids": {"HB1": 1}, "primed_at": T0}}}
+    ids = {}
+    cw._seed_legislation_ids(st, S, ["HB1"], ids, _ListingLis([]), T0)
+    cw._remember_legislation_ids(st, "20251", {("HB2", S): 7, ("HB3", "20251"): ""})
+    if ids or st["sessions"]["20251"]["ids"] != {"HB1": 1}:
+        fails.append("5: another session's IDs must neither seed nor be written")
+    if cw._prime_legislation_ids(_ListingLis(["HB7"]), S) != {"HB7": 9007}:
+        fails.append("5: 'HB 7' in the bill list must key as HB7")
+
+    # 6) corrupt file / wrong schema / disabled cache: an empty map, never an error
+    with open(cw._legislation_id_map_path()) as f:
+        if json.load(f).get("schema") != cw._LEGISLATION_ID_MAP_SCHEMA:
+            fails.append("6: the map must be stored as JSON")
+    with open(cw._legislation_id_map_path(), "wb") as f:
+        f.write(b"not json")
+    if cw._load_legislation_id_map()["sessions"]:
+        fails.append("6: a corrupt map must load empty")
+    cw._save_legislation_id_map({"schema": "0", "sessions": {S: {"ids": {"HB1": 1}, "primed_at": 0}}})
+    if cw._load_legislation_id_map()["sessions"]:
+        fails.append("6: an old-schema map must load empty")
+    cw._save_legislation_id_map(state)
+    with mock.patch.object(cw, "_BLOB_CACHE_ENABLED", False):
+        if cw._load_legislation_id_map()["sessions"]:
+            fails.append("6: a disabled blob cache must give an empty map")
+
+    if fails:
+        print("❌ FAILURES:")
+        for x in fails:
+            print("   -", x)
+        sys.exit(1)
+    print(f"✅ all LegislationID map tests passed ({len(queue)} bills: warm cycle {_count(warm_lis, _VERSION)} vs "
+          f"cold {len(queue)} lookups, identical hydration; 1-request prime; lazy fallback + TTL; sessions; "
+          f"corrupt file)")
+
+
+if __name__ == "__main__":
+    saved = cw._BLOB_CACHE_DIR, cw._BLOB_CACHE_ENABLED
+    _tmp = tempfile.mkdtemp()
+    try:
+        main(_tmp)
+    finally:
+        cw._BLOB_CACHE_DIR, cw._BLOB_CACHE_ENABLED = saved
+        shutil.rmtree(_tmp, ignore_errors=True)
@@ -0,0 +1,160 @@
+"""Adaptive per-host request governor (_HostGovernor / _LIS_GOVERNOR / _GovernedRetry): token-bucket
+pacing per host (independent across hosts, shared across threads), 429/503 halving with a floor,
+Retry-After (seconds or HTTP-date) as debt every later request waits out, gradual recovery capped at the
+base rate, per-endpoint SYSTEM_METRICS telemetry, and the wiring — counted adapter, urllib3 retry hook,
+bare blob GETs — with the fixed agenda sleep gone. No network. See docs/knowledge/lis_api_safety.md."""
+import inspect, os, sys, threading, time
+import unittest.mock as mock
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+import calendar_worker as cw
+
+_LIS = "https://lis.virginia.gov/LegislationEvent/api/GetPublicLegislationEventHistoryListAsync?x=1"
+_BLOB = "https://lis.blob.core.windows.net/lisfiles/20261/HISTORY.CSV"
+
+
+class _Clock:
+    def __init__(self):
+        self.t, self.slept = 1000.0, []
+
+    def __call__(self):
+        return self.t
+
+    def sleep(self, d):
+        self.slept.append(round(d, 6))
+        self.t += d
+
+
+class _Resp:
+    def __init__(self, status, headers=None):
+        self.status_code, self.status, self.headers = status, status, headers or {}
+
+    def get_redirect_location(self):
+        return False
+
+
+def main():
+    fails = []
+
+    # 1) token bucket: burst, then 1/rate spacing; hosts independent; unknown hosts at the default rate
+    c = _Clock()
+    g = cw._HostGovernor({"lis.virginia.gov": 8.0, "off.example": 0}, 2.0, clock=c, sleep=c.sleep)
+    waits = [g.acquire(_LIS) for _ in range(4)]          # burst = max(1, 8/4) = 2 tokens
+    if waits != [0.0, 0.0, 0.125, 0.125]:
+        fails.append(f"1: expected burst 2 then 1/8s spacing, got {waits}")
+    if g.acquire(_BLOB) != 0.0 or g.acquire(_BLOB) != 0.5:
+        fails.append("1: another host must have its own bucket (default 2 req/s)")
+    if g.acquire("https://off.example/x") or g.acquire("https://off.example/x") or g.acquire(""):
+        fails.append("1: rate 0 / hostless URLs are ungoverned")
+
+    # 2) throttle halves the rate (floor 5%), Retry-After becomes debt; recovery is gradual and capped
+    c = _Clock()
+    g = cw._HostGovernor({"lis.virginia.gov": 10.0}, 4.0, clock=c, sleep=c.sleep)
+    g.acquire(_LIS)
+    g.observe(_LIS, 429, {"Retry-After": "3"}, 0.1, 0.0)
+    if g.rate("lis.virginia.gov") != 5.0:
+        fails.append(f"2: a 429 must halve the rate, got {g.rate('lis.virginia.gov')}")
+    if g.acquire(_LIS) < 3.0:
+        fails.append("2: Retry-After must hold off the NEXT request on the host")
+    for _ in range(10):
+        g.throttle(_LIS)
+    if abs(g.rate("lis.virginia.gov") - 0.5) > 1e-9:
+        fails.append(f"2: repeated throttles must stop at the 5% floor, got {g.rate('lis.virginia.gov')}")
+    g.observe(_LIS, 200, {}, 0.1, 0.0)
+    if abs(g.rate("lis.virginia.gov") - 0.7) > 1e-9:
+        fails.append("2: one clean response wins back 2% of base (not a snap back)")
+    for _ in range(200):
+        g.observe(_LIS, 200, {}, 0.1, 0.0)
+    if g.rate("lis.virginia.gov") != 10.0:
+        fails.append("2: recovery must cap at the base rate")
+    g.observe(_LIS, 503, {}, 0.1, 0.0)
+    g.observe(_LIS, 500, {}, 0.1, 0.0)
+    if g.rate("lis.virginia.gov") != 5.0:
+        fails.append("2: 503 throttles; a plain 5xx neither throttles nor counts as recovery")
+
+    # 3) Retry-After parsing
+    future = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=90), usegmt=True)
+    cases = {"7": 7.0, " 2.5 ": 2.5, "-4": 0.0, "junk": None, None: None, "99999": 600.0}
+    for raw, want in cases.items():
+        if cw._retry_after_seconds(raw) != want:
+            fails.append(f"3: Retry-After {raw!r} -> {cw._retry_after_seconds(raw)}, want {want}")
+    if not 80 <= cw._retry_after_seconds(future) <= 90:
+        fails.append(f"3: an HTTP-date Retry-After must parse, got {cw._retry_after_seconds(future)}")
+
+    # 4) per-endpoint telemetry for SYSTEM_METRICS (ints; endpoint = host + first path segment)
+    c = _Clock()
+    g = cw._HostGovernor({"lis.virginia.gov": 1000.0}, 4.0, clock=c, sleep=c.sleep)
+    g.governed(_LIS, lambda: _Resp(200))
+    g.governed(_LIS, lambda: _Resp(429, {"Retry-After": "1"}))
+    try:
+        g.governed(_BLOB, lambda: (_ for _ in ()).throw(ConnectionError("reset")))
+        fails.append("4: a raising send must propagate")
+    except ConnectionError:
+        pass
+    m = g.metrics()
+    ep = "lis_ep_lis_virginia_gov_legislationevent"
+    if (m.get(f"{ep}_requests"), m.get(f"{ep}_throttled"), m.get(f"{ep}_errors")) != (2, 1, 0):
+        fails.append(f"4: LegislationEvent endpoint counters wrong: {m}")
+    if m.get("lis_ep_lis_blob_core_windows_net_lisfiles_errors") != 1:
+        fails.append("4: a raising request must count as an endpoint error")
+    if m.get("lis_governor_throttled") != 1 or m.get("lis_host_lis_virginia_gov_rate_pct") != 50:
+        fails.append(f"4: totals / host rate pct wrong: {m}")
+    if not all(isinstance(v, int) for v in m.values()):
+        fails.append("4: every metric must be an int")
+    g.reset_stats()
+    if g.metrics().get(f"{ep}_requests") is not None or g.rate("lis.virginia.gov") != 500.0:
+        fails.append("4: reset_stats clears telemetry but keeps the adaptive rate")
+    for k in range(cw._GOVERNOR_MAX_ENDPOINTS + 5):
+        g.observe(f"https://lis.virginia.gov/p{k}/x", 200, {}, 0.0, 0.0)
+    if len([k for k in g.metrics() if k.endswith("_requests")]) > cw._GOVERNOR_MAX_ENDPOINTS + 1:
+        fails.append("4: endpoint cardinality must be bounded")
+
+    # 5) shared across threads: 4 threads x 5 acquires at 50 req/s (burst 12.5) must take >= the paced time
+    g = cw._HostGovernor({"lis.virginia.gov": 50.0}, 4.0)
+    threads = [threading.Thread(target=lambda: [g.acquire(_LIS) for _ in range(5)]) for _ in range(4)]
+    t0 = time.monotonic()
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+    if time.monotonic() - t0 < (20 - 12.5) / 50 * 0.9:
+        fails.append(f"5: concurrent callers must share one bucket ({time.monotonic() - t0:.3f}s)")
+
+    # 6) wiring: the counted adapter goes through _LIS_GOVERNOR; the urllib3 retry hook reports throttles
+    saved = cw._LIS_GOVERNOR
+    cw._LIS_GOVERNOR = cw._HostGovernor({"lis.virginia.gov": 1000.0}, 4.0)
+    try:
+        cw.LIS_REQUEST_CAP, cw.lis_request_count["n"] = 0, 0
+        req = mock.Mock(url=_LIS)
+        with mock.patch.object(cw.HTTPAdapter, "send", return_value=_Resp(503, {"Retry-After": "0"})):
+            cw._CountingHTTPAdapter().send(req)
+        if cw._LIS_GOVERNOR.metrics().get(f"{ep}_throttled") != 1 or cw.lis_request_count["n"] != 1:
+            fails.append("6: a counted-session request must be counted AND governed")
+        retry = cw.get_armored_session().get_adapter("https://x").max_retries
+        pool = mock.Mock(scheme="https", host="lis.virginia.gov")
+        nxt = retry.increment("GET", "/Schedule/api/x", response=_Resp(429, {"Retry-After": "0"}), _pool=pool)
+        if not isinstance(retry, cw._GovernedRetry) or type(nxt) is not cw._GovernedRetry:
+            fails.append("6: the armored session must use _GovernedRetry, preserved across increments")
+        if cw._LIS_GOVERNOR.metrics().get("lis_ep_lis_virginia_gov_schedule_throttled") != 1:
+            fails.append("6: a 429 retried inside urllib3 must reach the governor")
+        with mock.patch.object(cw._BLOB_SESSION, "get", return_value=_Resp(500)):
+            cw.safe_fetch_csv(_BLOB, attempts=2)
+        if cw._LIS_GOVERNOR.metrics().get("lis_ep_lis_blob_core_windows_net_lisfiles_requests") != 2:
+            fails.append("6: bare blob GETs (safe_fetch_csv) must go through the governor")
+    finally:
+        cw._LIS_GOVERNOR = saved
+    if "time.sleep" in inspect.getsource(cw.extract_rogue_agenda):
+        fails.append("6: extract_rogue_agenda must not carry a fixed pacing sleep (the governor paces)")
+
+    if fails:
+        print("❌ FAILURES:")
+        for x in fails:
+            print("   -", x)
+        sys.exit(1)
+    print("✅ all request-governor tests passed (per-host token bucket, AIMD halving/floor/recovery, Retry-After "
+          "seconds + HTTP-date, endpoint telemetry, thread-shared, adapter + retry-hook + blob wiring)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""ScheduleIndex + find_api_schedule_match: the indexed lookup must return the SAME key as the
+pre-index full-map scan (kept verbatim below as the oracle) for every (date, room, outcome) query —
+exact / TBA-exact, structural child (CHILDREN_OF_PARENT) and parent (PARENT_COMMITTEE_MAP) fallbacks,
+hyphen sub-panels, the name-prefix heuristic when no parent map is loaded, room hints, and the final
+substring fallback. Also: the STM call path accepts a prebuilt index, and non-dated keys are ignored."""
+import itertools, os, sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+import calendar_worker as cw
+
+
+def _oracle(api_schedule_map, date_str, event_location, outcome_text, acting_chamber_prefix):
+    """The ORIGINAL find_api_schedule_match, verbatim (module globals read through cw)."""
+    normalize_room_key = cw.normalize_room_key
+    prefix = f"{date_str}_"
+    dated_keys = [k for k in api_schedule_map.keys() if k.startswith(prefix)]
+    if not dated_keys:
+        return None
+
+    def has_concrete_time(key):
+        time_val = str(api_schedule_map.get(key, {}).get("Time", "")).strip().lower()
+        return time_val not in ["", "time tba", "tba", "journal entry", "ledger"]
+
+    target_norm = normalize_room_key(event_location)
+    exact_matches = [k for k in dated_keys if normalize_room_key(k.split("_", 1)[1]) == target_norm]
+    for k in exact_matches:
+        if has_concrete_time(k):
+            return k
+    parent_matches, child_matches = [], []
+    if exact_matches and not any(has_concrete_time(k) for k in exact_matches):
+        if cw.CHILDREN_OF_PARENT:
+            event_code = cw.NORM_TO_CODE.get(target_norm)
+            if event_code and event_code in cw.CHILDREN_OF_PARENT:
+                dated_norms = {k: normalize_room_key(k.split("_", 1)[1]) for k in dated_keys}
+                for child_code in cw.CHILDREN_OF_PARENT[event_code]:
+                    child_name = cw.COMMITTEE_CODE_MAP.get(child_code, "")
+                    if child_name:
+                        child_norm = normalize_room_key(child_name)
+                        for k in dated_keys:
+                            if dated_norms[k] == child_norm and has_concrete_time(k):
+                                child_matches.append(k)
+        if not child_matches:
+            for em in exact_matches:
+                raw_target = em.split("_", 1)[1]
+                if not raw_target:
+                    continue
+                for k in dated_keys:
+                    raw_k = k.split("_", 1)[1]
+                    if raw_k.startswith((raw_target + "-", raw_target + " -")) and has_concrete_time(k):
+                        if k not in child_matches:
+                            child_matches.append(k)
+        if child_matches:
+            child_matches.sort(key=lambda k: api_schedule_map[k].get("SortTime", "23:59"))
+            return child_matches[0]
+    if not exact_matches:
+        if cw.PARENT_COMMITTEE_MAP:
+            event_code = cw.NORM_TO_CODE.get(target_norm)
+            if event_code and event_code in cw.PARENT_COMMITTEE_MAP:
+                parent_name = cw.COMMITTEE_CODE_MAP.get(cw.PARENT_COMMITTEE_MAP[event_code], "")
+                if parent_name:
+                    parent_norm = normalize_room_key(parent_name)
+                    for k in dated_keys:
+                        if normalize_room_key(k.split("_", 1)[1]) == parent_norm:
+                            parent_matches.append(k)
+        if not parent_matches and not cw.PARENT_COMMITTEE_MAP:
+            for k in dated_keys:
+                k_norm = normalize_room_key(k.split("_", 1)[1])
+                if k_norm and target_norm.startswith(k_norm) and target_norm != k_norm:
+                    parent_matches.append(k)
+        for k in parent_matches:
+            if has_concrete_time(k):
+                return k
+    hint_matches = []
+    for hint in cw.derive_room_hints(outcome_text, acting_chamber_prefix):
+        hint_norm = normalize_room_key(hint)
+        for k in dated_keys:
+            k_norm = normalize_room_key(k.split("_", 1)[1])
+            if hint_norm and (hint_norm in k_norm or k_norm in hint_norm):
+                hint_matches.append(k)
+    for k in hint_matches:
+        if has_concrete_time(k):
+            return k
+    if exact_matches:
+        return exact_matches[0]
+    if parent_matches:
+        return parent_matches[0]
+    if hint_matches:
+        return hint_matches[0]
+    for k in dated_keys:
+        k_norm = normalize_room_key(k.split("_", 1)[1])
+        if target_norm and (target_norm in k_norm or k_norm in target_norm):
+            return k
+    return None
+
+
+def _schedule():
+    """Three dates mixing concrete / TBA / Journal times, raw-name variants that normalize alike,
+    structural children, hyphen sub-panels, and a junk key with no date separator."""
+    times = ["9:00 AM", "Time TBA", "", "1/2 hour after adjournment", "Journal Entry", "7:30 AM", "TBA"]
+    rooms = ["House Courts of Justice", "House Committee on Courts of Justice", "House Courts of Justice-Civil",
+             "House Courts of Justice - Criminal", "House Courts of Justice-Criminal", "House Finance",
+             "House Appropriations", "House Appropriations - Transportation Subcommittee",
+             "House Appropriations Transportation Subcommittee", "House Education", "House Education-K12",
+             "Senate Finance and Appropriations", "Senate Finance and Appropriations Health Subcommittee",
+             "Senate Rules", "Joint Commission on Health Care", "House Privileges and Elections"]
+    m = {}
+    for di, d in enumerate(("2024-01-10", "2024-01-11", "2024-02-01")):
+        for ri, r in enumerate(rooms):
+            if (di + ri) % 5 == 4:
+                continue
+            t = times[(di * 3 + ri) % len(times)]
+            st = "23:59" if not t[:1].isdigit() else f"{7 + (ri * 5 + di) % 9:02d}:{(ri * 7) % 60:02d}"
+            m[f"{d}_{r}"] = {"Time": t, "SortTime": st, "Status": ""}
+    m["nodatekey"] = {"Time": "9:00 AM", "SortTime": "09:00", "Status": ""}
+    return m, rooms
+
+
+def _set_maps(structural):
+    if structural:
+        cw.COMMITTEE_CODE_MAP = {"H08": "House Courts of Justice", "H081": "House Courts of Justice Civil",
+                                 "H082": "House Courts of Justice-Criminal", "H02": "House Appropriations",
+                                 "H021": "House Appropriations Transportation Subcommittee",
+                                 "S05": "Senate Finance and Appropriations",
+                                 "S051": "Senate Finance and Appropriations Health Subcommittee",
+                                 "H09": "House Education", "H091": "House Education K12"}
+        cw.PARENT_COMMITTEE_MAP = {"H081": "H08", "H082": "H08", "H021": "H02", "S051": "S05", "H091": "H09"}
+    else:
+        cw.COMMITTEE_CODE_MAP, cw.PARENT_COMMITTEE_MAP = dict(cw._STATIC_COMMITTEE_CODE_MAP), {}
+    cw.CHILDREN_OF_PARENT = {}
+    for child, parent in cw.PARENT_COMMITTEE_MAP.items():
+        cw.CHILDREN_OF_PARENT.setdefault(parent, []).append(child)
+    cw.NORM_TO_CODE = {cw.normalize_room_key(n): c for c, n in cw.COMMITTEE_CODE_MAP.items()}
+
+
+def main():
+    fails = []
+    m, rooms = _schedule()
+    idx = cw.ScheduleIndex(m)
+    if "nodatekey" in {k for day in idx.by_date.values() for k in day["keys"]}:
+        fails.append("0: a key with no date separator must not be indexed")
+    locations = rooms + ["House Courts of Justice Civil", "House Courts of Justice-Criminal",
+                         "House Appropriations Transportation Subcommittee", "House Education K12",
+                         "Senate Finance and Appropriations Health Subcommittee", "House Floor", "Senate Floor",
+                         "Courts", "House", "", "Unknown Room", "Senate Finance"]
+    outcomes = ["Reported from Courts of Justice", "Placed on Finance agenda", "Sub: Transportation",
+                "sub: health", "Read third time", "Placed on Courts of Justice-Civil agenda"]
+    saved = (cw.COMMITTEE_CODE_MAP, cw.PARENT_COMMITTEE_MAP, cw.CHILDREN_OF_PARENT, cw.NORM_TO_CODE)
+    n = 0
+    try:
+        for structural in (True, False):
+            _set_maps(structural)
+            idx = cw.ScheduleIndex(m)
+            for d, loc, out, pre in itertools.product(("2024-01-10", "2024-01-11", "2024-02-01", "2024-03-01"),
+                                                      locations, outcomes, ("House ", "Senate ")):
+                want = _oracle(m, d, loc, out, pre)
+                got = cw.find_api_schedule_match(m, d, loc, out, pre, schedule_index=idx)
+                got_noidx = cw.find_api_schedule_match(m, d, loc, out, pre)
+                n += 1
+                if not (want == got == got_noidx):
+                    fails.append(f"1[structural={structural}]: {d} {loc!r} {out!r} {pre!r}: "
+                                 f"oracle={want!r} indexed={got!r} unindexed={got_noidx!r}")
+                    if len(fails) > 10:
+                        break
+    finally:
+        cw.COMMITTEE_CODE_MAP, cw.PARENT_COMMITTEE_MAP, cw.CHILDREN_OF_PARENT, cw.NORM_TO_CODE = saved
+
+    # 2) sub-panel groups are memoized per (date, raw parent) and hold only concrete-time entries
+    first = idx.subpanels("2024-01-10", "House Courts of Justice")
+    if idx.subpanels("2024-01-10", "House Courts of Justice") is not first:
+        fails.append("2: subpanels must be memoized")
+    if any(not idx.by_date["2024-01-10"]["concrete"][k] for k in first):
+        fails.append("2: subpanels must only hold concrete-time entries")
+    if idx.subpanels("1999-01-01", "House Courts of Justice") != []:
+        fails.append("2: an unscheduled date has no sub-panels")
+
+    if fails:
+        print("❌ FAILURES:")
+        for x in fails:
+            print("   -", x)
+        sys.exit(1)
+    print(f"✅ all ScheduleIndex tests passed ({n} queries × structural/heuristic parent maps: indexed == "
+          f"unindexed == the full-map-scan oracle; non-dated keys skipped; memoized concrete sub-panels)")
+
+
+if __name__ == "__main__":
+    main()
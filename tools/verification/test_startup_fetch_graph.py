@@ -0,0 +1,210 @@
+"""Startup fetch graph (StartupFetchGraph, _declare_startup_fetches): independent tasks overlap, so the
+graph's wall time is the critical path, not the sum (STARTUP_FETCH_WORKERS=1 = back to back); a task
+starts only after its deps succeed and is skipped when one raises; result() re-raises the task's own
+exception (LisRequestCapExceeded included) and replays its recorded alerts in order at the consumer;
+the critical path is reported; every LIS / blob task depends on the authorization gate's proceed result,
+so none starts before it passes and none runs when it halts, and run_calendar_update fans them out only
+after the gate. No network."""
+import inspect, json, os, sys, threading, time
+import unittest.mock as mock
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+import calendar_worker as cw
+
+D = 0.15   # per-call latency, s
+
+
+def _sleepy(value, delay=D, log=None):
+    def fn():
+        if log is not None:
+            log.append(("start", value, time.perf_counter()))
+        time.sleep(delay)
+        return value
+    return fn
+
+
+def _startup_shape(workers):
+    """session -> gate -> {committee_maps, schedule, legislation_status, docket, history}; sheet is a root."""
+    g = cw.StartupFetchGraph(workers)
+    t0 = time.perf_counter()
+    g.add("sheet", _sleepy("sheet"))
+    g.add("session", _sleepy("session"))
+    g.result("session")
+    g.add("gate", _sleepy("gate", 0.01), deps=("session",))
+    g.result("gate")
+    for name in ("committee_maps", "schedule", "legislation_status", "docket", "history"):
+        g.add(name, _sleepy(name), deps=("gate",))
+    got = [g.result(n) for n in ("committee_maps", "sheet", "docket", "schedule", "history", "legislation_status")]
+    wall = time.perf_counter() - t0
+    g.shutdown()
+    return g, got, wall
+
+
+class _Resp:
+    def __init__(self, status):
+        self.status_code = status
+
+    def json(self):
+        return {}
+
+
+class _FakeLis:
+    def __init__(self):
+        self.calls, self.lock = [], threading.Lock()
+
+    def get(self, url, **kw):
+        with self.lock:
+            self.calls.append((url, time.perf_counter()))
+        time.sleep(0.02)
+        return _Resp(500)
+
+
+def main():
+    fails = []
+
+    # 1) the win: 7 calls of ~D each; fanned out, startup ≈ session + gate + one call; serial ≈ the sum
+    g, got, wall = _startup_shape(6)
+    _, got1, wall1 = _startup_shape(1)
+    if got != got1 or got[0] != "committee_maps":
+        fails.append(f"1: results differ between pool sizes: {got} vs {got1}")
+    if not wall < 3.5 * D or not wall1 > 6 * D:
+        fails.append(f"1: fanned out {wall:.2f}s (want < {3.5 * D:.2f}), serial {wall1:.2f}s (want > {6 * D:.2f})")
+    m, labels = g.metrics(), g.labels()
+    if not m["startup_serial_ms"] > 2 * m["startup_critical_ms"] or m["startup_tasks"] != 8:
+        fails.append(f"2: serial sum must dwarf the critical path: {m}")
+
+    # 2) the critical path ends on the last task and walks back through its latest dep
+    path = labels["startup_critical_path"].split(">")
+    if path[:2] != ["session", "gate"] or len(path) != 3 or path[2] not in \
+            ("committee_maps", "schedule", "legislation_status", "docket", "history"):
+        fails.append(f"2: critical path {labels['startup_critical_path']}")
+    try:
+        json.dumps({**m, **labels})
+    except (TypeError, ValueError) as e:
+        fails.append(f"2: metrics must serialize into SYSTEM_METRICS: {e}")
+    if not all(isinstance(v, (int, float)) for v in m.values()) \
+            or "source_miss_labels.update(_startup.labels())" not in inspect.getsource(cw.run_calendar_update):
+        fails.append(f"2: metrics() feeds the integer counters (the incremental shadow diffs them) — numbers "
+                     f"only; the path goes to source_miss_labels: {m}")
+    if cw.StartupFetchGraph(1).labels()["startup_critical_path"] != "":
+        fails.append("2: an empty graph has no critical path")
+
+    # 3) deps: a child starts after its parent ends; a failed parent skips the child, which never runs
+    log, ran = [], []
+    g = cw.StartupFetchGraph(4)
+    g.add("a", _sleepy("a", 0.05, log))
+    g.add("b", _sleepy("b", 0.0, log), deps=("a",))
+    g.add("boom", lambda: (_ for _ in ()).throw(RuntimeError("HTTP 503")))
+    g.add("child", lambda: ran.append(1), deps=("a", "boom"))
+    g.add("cap", lambda: (_ for _ in ()).throw(cw.LisRequestCapExceeded("cap")))
+    if g.result("b") != "b" or not g.ended["a"] <= g.started["b"]:
+        fails.append("3: b must start only after a has finished")
+    try:
+        g.result("boom")
+        fails.append("3: result() must re-raise the task's exception")
+    except RuntimeError:
+        pass
+    try:
+        g.result("child")
+        fails.append("3: a task whose dep raised must be skipped")
+    except cw.StartupTaskSkipped:
+        pass
+    try:
+        g.result("cap")
+        fails.append("3: LisRequestCapExceeded must reach the consumer")
+    except cw.LisRequestCapExceeded:
+        pass
+    if ran or "child" in g.started:
+        fails.append("3: a skipped task must never run")
+    for bad in (lambda: g.add("a", _sleepy("x")), lambda: g.add("z", _sleepy("z"), deps=("nope",))):
+        try:
+            bad()
+            fails.append("3: a duplicate / undeclared-dep task must be refused")
+        except ValueError:
+            pass
+    g.shutdown()
+
+    # 4) alerts: recorded while the task runs, replayed in order at result() — also when it raises
+    g, pushed = cw.StartupFetchGraph(2), []
+    sink = g.alert_sink("maps")
+
+    def maps():
+        sink("first", status="WARN")
+        sink("second", status="INFO")
+        raise ValueError("bad payload")
+    g.add("maps", maps)
+    g.future("maps").exception()
+    if pushed:
+        fails.append("4: nothing reaches push_alert before the consumer asks")
+    try:
+        g.result("maps", push_alert=lambda *a, **k: pushed.append((a, k)))
+    except ValueError:
+        pass
+    if pushed != [(("first",), {"status": "WARN"}), (("second",), {"status": "INFO"})]:
+        fails.append(f"4: replayed alerts {pushed}")
+    g.shutdown()
+
+    # 5) the real declarations: every task depends on the gate's PROCEED result ("authorized"); none is
+    #    called before the gate passes; the Schedule list only when the Session API is online; committee-map
+    #    alerts replay at the consumer
+    for online in (True, False):
+        lis, blobs, pushed = _FakeLis(), [], []
+        g = cw.StartupFetchGraph(6)
+        g.add("gate", _sleepy((True, None), 0.1))
+        with mock.patch.object(cw, "safe_fetch_csv", lambda url: blobs.append((url, time.perf_counter())) or url):
+            cw._declare_startup_fetches(g, lis, "261", "20261", online)
+            g.result("committee_maps", push_alert=lambda *a, **k: pushed.append(a[0]))
+            g.wait()
+        gate_end = g.ended["gate"]
+        declared = sorted(n for n in g._deps if n not in ("gate", "authorized"))
+        want = sorted(["committee_maps", "legislation_status", "docket", "history"] + (["schedule"] if online else []))
+        if declared != want or g._deps["authorized"] != ("gate",) \
+                or any(g._deps[n] != ("authorized",) for n in declared):
+            fails.append(f"5: online={online}: declared {declared}, want {want}, each on the gate's proceed")
+        if any(t < gate_end for _, t in lis.calls + blobs) or len(lis.calls) != 2 + online or len(blobs) != 2:
+            fails.append(f"5: online={online}: {len(lis.calls)} LIS / {len(blobs)} blob calls, none before the gate")
+        if len(pushed) != 1 or "Committee API returned HTTP 500" not in pushed[0]:
+            fails.append(f"5: the committee-map fallback alert must replay at the consumer: {pushed}")
+        g.shutdown()
+
+    # 5b) a HALTING gate (it returns (False, reason), it does not raise): no LIS / blob call at all, and
+    #     every fan-out task (LegislationStatus included) is skipped, not run
+    lis, blobs = _FakeLis(), []
+    g = cw.StartupFetchGraph(6)
+    g.add("gate", _sleepy((False, "unauthorized"), 0.05))
+    with mock.patch.object(cw, "safe_fetch_csv", lambda url: blobs.append(url) or url):
+        cw._declare_startup_fetches(g, lis, "261", "20261", True)
+        g.wait()
+    if g.result("gate") != (False, "unauthorized") or lis.calls or blobs:
+        fails.append(f"5b: a halting gate must issue no call: {len(lis.calls)} LIS / {len(blobs)} blob")
+    for name in ("authorized", "committee_maps", "schedule", "legislation_status", "docket", "history"):
+        try:
+            g.result(name)
+            fails.append(f"5b: {name} ran although the gate halted")
+        except cw.StartupTaskSkipped:
+            if name == "authorized":
+                fails.append("5b: authorized must raise the halt, not be skipped")
+        except RuntimeError as e:
+            if name != "authorized" or "unauthorized" not in str(e):
+                fails.append(f"5b: {name}: {e!r}")
+    g.shutdown()
+
+    # 6) run_calendar_update: the gate is consumed before the fan-out is declared; no inline LIS call left
+    src = inspect.getsource(cw.run_calendar_update)
+    if not 0 < src.index('_startup.result("gate")') < src.index("_declare_startup_fetches(") \
+            < src.index('_startup.result("committee_maps"'):
+        fails.append("6: the LIS / blob fan-out must be declared after the gate and before its first consumer")
+    if "ThreadPoolExecutor(max_workers=2)" in src or "api/getschedulelistasync" in src \
+            or "api/GetLegislationStatusListAsync" in src or "get_active_session_info(http_session)" in src:
+        fails.append("6: the startup calls must go through the graph")
+
+    if fails:
+        print("❌ FAILURES:")
+        for x in fails:
+            print("   -", x)
+        sys.exit(1)
+    print(f"✅ all startup fetch graph tests passed (8 tasks: {wall:.2f}s fanned out vs {wall1:.2f}s back to back; "
+          f"critical path {labels['startup_critical_path']}; deps / skip / re-raise; alert replay; gate-first fan-out; halt skips all)")
+
+
+if __name__ == "__main__":
+    main()
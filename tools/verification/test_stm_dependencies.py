@@ -0,0 +1,172 @@
+"""Per-bill STM dependency tracking (StmDependencyRecorder + the fingerprint state): recording through the
+read-through proxies leaves the STM's output untouched; every bill records the shared keys it read; after a
+Schedule change on one date only the bills that read that date are invalidated, and reusing every other
+bill's cached events still equals a full re-run (while ignoring the dependency would not); a token
+mismatch, a moved residual sig, a corrupt state file or STM_DEPENDENCY_TRACKING=0 fall back to the
+all-or-nothing sig; STM_Bill_Cache round-trips DepsJSON and reads pre-DepsJSON rows as "unknown".
+Runs over the checked-in 241 archive; no network."""
+import copy, os, shutil, sys, tempfile
+import unittest.mock as mock
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+import calendar_worker as cw
+from test_stm_sharding import _inputs, _sinks
+
+D, R = "History_description", "History_refid"
+
+
+def _run(df, ro, recorder=None):
+    """One STM cycle over `ro` (mutated in place, like the worker's caches); returns the sinks."""
+    s = _sinks()
+    ro["schedule_index"] = cw.ScheduleIndex(ro["api_schedule_map"])
+    kwargs = recorder.wrap(ro) if recorder is not None else ro
+    cw.run_sequential_turing_machine(
+        df, bill_locations=s["bl"], last_seen_date=s["lsd"], _append_event=s["append"],
+        push_system_alert=s["push"], source_miss_counts=s["smc"], _floor_miss_dates=s["fmd"],
+        _floor_hit=0, _floor_miss=0, dependency_recorder=recorder, **kwargs)
+    return s
+
+
+def _cache(events, hashes, deps):
+    by_bill = {}
+    for e in events:
+        by_bill.setdefault(cw._event_bill_key(e), []).append(list(cw._stm_event_key(e)))
+    return {b: {"hash": hashes.get(b, ""), "events": by_bill.get(b, []), "deps": deps.get(b)}
+            for b in set(by_bill) | set(hashes)}
+
+
+class _FakeWS:
+    def __init__(self, rows=None, cols=4):
+        self.rows, self.row_count, self.col_count = [list(r) for r in rows or []], 1000, cols
+
+    def get_all_values(self):
+        return [list(r) for r in self.rows]
+
+    def clear(self):
+        self.rows = []
+
+    def add_rows(self, n):
+        self.row_count += n
+
+    def add_cols(self, n):
+        self.col_count += n
+
+    def update(self, values, range_name):
+        start = int(range_name[1:]) - 1
+        self.rows[start:start + len(values)] = [list(v) for v in values]
+
+
+class _FakeSheet:
+    def __init__(self, ws):
+        self.ws = ws
+
+    def worksheet(self, name):
+        return self.ws
+
+
+def main(tmp):
+    fails = []
+    cw._BLOB_CACHE_DIR, cw._BLOB_CACHE_ENABLED = tmp, True
+    df, ro = _inputs()
+    hashes = cw._stm_bill_digests(df, D, R)
+
+    # 1) recording is transparent: identical events / alerts / counters / floor misses; every bill has deps
+    plain = _run(df, copy.deepcopy(ro))
+    ro1 = copy.deepcopy(ro)
+    fps1 = cw._stm_dependency_fingerprints(ro1)          # BEFORE the run, as the worker takes them
+    rec = cw.StmDependencyRecorder()
+    cycle1 = _run(df, ro1, rec)
+    for k in ("events", "alerts", "smc", "fmd"):
+        if plain[k] != cycle1[k]:
+            fails.append(f"1: recording changed the STM's {k}")
+    deps = rec.bill_deps()
+    if set(deps) != set(hashes) or not all(d.get("schedule") for d in deps.values()):
+        fails.append(f"1: {len(deps)} of {len(hashes)} bills recorded deps (each must read the schedule)")
+    if any(cw._STM_DEP_ALL in d.get("schedule", []) for d in deps.values()):
+        fails.append("1: a bill read the whole Schedule map — per-date reuse would never apply")
+
+    # 2) fingerprints are deterministic and per key: a change on one date moves only that date (+ "*")
+    if cw._stm_dependency_fingerprints(copy.deepcopy(ro)) != cw._stm_dependency_fingerprints(copy.deepcopy(ro)):
+        fails.append("2: fingerprints must be deterministic")
+    by_date = {}
+    for b, d in deps.items():
+        for day in d["schedule"]:
+            by_date.setdefault(day, set()).add(b)
+    # a date some event took its time from the Schedule on (the fixture's Schedule times are 8-15:00)
+    day = next(e["Date"] for e in cycle1["events"] if e.get("Time") == "9:00 AM" and e["Date"] in by_date)
+    ro2 = copy.deepcopy(ro1)                               # next cycle: cycle 1's cache writes carried over
+    for k, v in ro2["api_schedule_map"].items():
+        if k.startswith(day + "_"):
+            v.update(Time="3:17 PM", SortTime="15:17")
+    fps2 = cw._stm_dependency_fingerprints(ro2)
+    residual = cw._compute_stm_residual_sig(ro1)
+    token = cw._stm_dependency_token(residual, fps1)
+    cw._save_stm_dependency_state(token, residual, fps1)
+    changed = cw._stm_changed_dependency_keys(token, cw._compute_stm_residual_sig(ro2), fps2)
+    if changed is None or changed["schedule"] != {day, cw._STM_DEP_ALL}:
+        fails.append(f"2: want schedule keys {{{day}, *}} moved, got {changed and changed['schedule']}")
+
+    # 3) only the bills that read the moved keys recompute; reuse + recompute == a full re-run
+    cache = _cache(cycle1["events"], hashes, deps)
+    invalid = cw._stm_dependency_changed_bills(cache, changed or {})
+    if not by_date[day] <= invalid or len(invalid) >= len(hashes):
+        fails.append(f"3: invalidated {len(invalid)} of {len(hashes)} bills; must cover the {len(by_date[day])} "
+                     f"that read {day} and spare the rest")
+    cycle2 = _run(df, ro2)
+    ok, of, oi, reused, recomputed = cw._stm_incremental_shadow(cycle2["events"], hashes, False, cache,
+                                                                frozenset(invalid))
+    if not ok or recomputed != len(invalid) or reused + recomputed != len(hashes):
+        fails.append(f"3: fine-grained reuse diverged (only-full={of[:2]}, only-incr={oi[:2]}; "
+                     f"reused {reused}, recomputed {recomputed})")
+    if cw._stm_incremental_shadow(cycle2["events"], hashes, False, cache)[0]:
+        fails.append("3: ignoring the dependency must diverge (else the fixture does not exercise it)")
+
+    # 4) fallbacks → None (the caller reverts to the all-or-nothing shared sig)
+    if cw._stm_changed_dependency_keys("deps1:other", residual, fps2) is not None:
+        fails.append("4: a token the state file does not hold must fall back")
+    if cw._stm_changed_dependency_keys(token, residual + "x", fps2) is not None:
+        fails.append("4: a moved residual sig must fall back")
+    with mock.patch.object(cw, "STM_DEPENDENCY_TRACKING", False):
+        if cw._stm_changed_dependency_keys(token, residual, fps2) is not None:
+            fails.append("4: STM_DEPENDENCY_TRACKING=0 must fall back")
+    if not cw._stm_dependency_state_path().endswith(".json"):
+        fails.append("4: the dependency state must be stored as JSON")
+    with open(cw._stm_dependency_state_path(), "wb") as f:
+        f.write(b"not json")
+    if cw._stm_changed_dependency_keys(token, residual, fps2) is not None:
+        fails.append("4: a corrupt state file must fall back")
+    unknown = {"HB1": {"hash": "h", "events": [], "deps": None}}
+    if cw._stm_dependency_changed_bills(unknown, {"schedule": {day}}) != {"HB1"} \
+            or cw._stm_dependency_changed_bills(unknown, {"schedule": set()}):
+        fails.append("4: unknown deps must recompute iff any key moved")
+
+    # 5) STM_Bill_Cache round-trip: DepsJSON + the token in the sig row; a pre-DepsJSON row reads as unknown
+    ws = _FakeWS([cw.STM_BILL_CACHE_HEADER[:3], [cw._STM_CACHE_SHARED_SIG_KEY, "sig0", ""], ["SB9", "h9", "[]"]], cols=3)
+    loaded, _, ok, sig, tok = cw._load_stm_bill_cache(_FakeSheet(ws))
+    if not ok or sig != "sig0" or tok != "" or loaded.get("SB9", {}).get("deps", 0) is not None:
+        fails.append(f"5: a pre-DepsJSON tab must load (deps None, no token): {loaded.get('SB9')}, {tok!r}")
+    written = cw._persist_stm_bill_cache(_FakeSheet(ws), ws, cycle1["events"], hashes, "sig1", True,
+                                        bill_deps=deps, dep_token=token)
+    back, _, ok, sig, tok = cw._load_stm_bill_cache(_FakeSheet(ws))
+    if not written or ws.col_count != len(cw.STM_BILL_CACHE_HEADER) or not ok or (sig, tok) != ("sig1", token):
+        fails.append(f"5: persist must widen the tab and write the sig + token ({sig!r}, {tok!r})")
+    if {b: c["deps"] for b, c in back.items()} != deps or {b: c["hash"] for b, c in back.items()} != hashes:
+        fails.append("5: DepsJSON / HistoryHash must round-trip")
+
+    if fails:
+        print("❌ FAILURES:")
+        for x in fails:
+            print("   -", x)
+        sys.exit(1)
+    print(f"✅ all STM dependency tests passed ({len(deps)} bills; recording transparent; a Schedule change on "
+          f"{day} invalidated {len(invalid)} bills and reuse == full; fallbacks; cache round-trip)")
+
+
+if __name__ == "__main__":
+    saved = cw._BLOB_CACHE_DIR, cw._BLOB_CACHE_ENABLED
+    _tmp = tempfile.mkdtemp()
+    try:
+        main(_tmp)
+    finally:
+        cw._BLOB_CACHE_DIR, cw._BLOB_CACHE_ENABLED = saved
+        shutil.rmtree(_tmp, ignore_errors=True)
@@ -0,0 +1,104 @@
+"""Vectorized incremental-STM digests (_stm_bill_digests): one digest per bill, the same keys and the same
+change semantics as the SHA-256 LegEvent hash (row order irrelevant; any added / removed / edited / moved
+row changes only its own bill's digest); scheme-prefixed, so an STM_Bill_Cache written under the old
+bare-SHA digests is never reused; a pinned value guards pandas' row hash against silent drift.
+Runs over the checked-in 241 archive; no network. Timing: tools/legevent_sizing/digest_benchmark.py."""
+import gzip, os, sys
+import pandas as pd
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+import calendar_worker as cw
+
+_ARCHIVE = os.path.join(os.path.dirname(__file__), "..", "historical_cache", "va", "241", "History.csv.gz")
+D, R = "History_description", "History_refid"
+
+
+def _frame():
+    with gzip.open(_ARCHIVE) as f:
+        df = pd.read_csv(f, dtype=str, keep_default_na=False, encoding="iso-8859-1")
+    df["CleanBill"] = df["Bill_id"].astype(str).str.replace(" ", "").str.upper()
+    df["ParsedDate"] = pd.to_datetime(df["History_date"], format="mixed", errors="coerce")
+    return df
+
+
+def _sha(df):
+    return {b: cw._hash_history_rows_for_bill(r) for b, r in cw._history_rows_by_bill(df, D, R).items()}
+
+
+def main():
+    fails = []
+    df = _frame()
+    dig, sha = cw._stm_bill_digests(df, D, R), _sha(df)
+
+    # 1) same keys as the LegEvent hash; every digest carries the scheme; no collisions across bills
+    if set(dig) != set(sha):
+        fails.append(f"1: key sets differ: {sorted(set(dig) ^ set(sha))[:5]}")
+    if not all(v.startswith(cw._STM_DIGEST_SCHEME + ":") and len(v) == len(cw._STM_DIGEST_SCHEME) + 17
+               for v in dig.values()):
+        fails.append("1: every digest must be '<scheme>:<16 hex>'")
+    if len(set(dig.values())) != len(set(sha.values())):
+        fails.append(f"1: {len(set(dig.values()))} distinct digests vs {len(set(sha.values()))} distinct SHA-256s")
+
+    # 2) frame row order is irrelevant (HISTORY reorders / the date sort)
+    if cw._stm_bill_digests(df.sample(frac=1, random_state=7), D, R) != dig:
+        fails.append("2: a row-order permutation changed a digest")
+
+    # 3) each mutation changes exactly the bills the SHA-256 says changed — and nothing else
+    hb1 = df.index[df["CleanBill"] == "HB1"]
+    mutations = {
+        "edit outcome": lambda x: x.assign(**{D: x[D].where(x.index != hb1[0], x[D] + " (corrected)")}),
+        "edit refid": lambda x: x.assign(**{R: x[R].where(x.index != hb1[1], "H9999")}),
+        "move date": lambda x: x.assign(ParsedDate=x["ParsedDate"].where(
+            x.index != hb1[2], x["ParsedDate"] + pd.Timedelta(days=1))),
+        "swap outcomes": lambda x: x.assign(**{D: x[D].rename(lambda i: {hb1[0]: hb1[3], hb1[3]: hb1[0]}.get(i, i))}),
+        "delete row": lambda x: x.drop(index=hb1[4]),
+        "duplicate row": lambda x: pd.concat([x, x.loc[[hb1[0]]]]),
+        "new bill": lambda x: pd.concat([x, x.loc[[hb1[0]]].assign(CleanBill="HB99999")]),
+        "drop bill": lambda x: x[x["CleanBill"] != "SB1"],
+    }
+    for name, mutate in mutations.items():
+        m = mutate(df.copy())
+        got, want = cw._stm_bill_digests(m, D, R), _sha(m)
+        moved = {b for b in set(got) | set(dig) if got.get(b) != dig.get(b)}
+        moved_sha = {b for b in set(want) | set(sha) if want.get(b) != sha.get(b)}
+        if not moved_sha or moved != moved_sha:
+            fails.append(f"3: {name}: digest moved {sorted(moved)}, SHA-256 moved {sorted(moved_sha)}")
+
+    # 4) scheme upgrade: a cache written with the old bare-SHA digests reuses nothing; a cache written with
+    #    the new digests reuses every bill (events here are placeholders — reuse is keyed on the digest)
+    events = [{"Bill": b} for b in dig]
+    old_cache = {b: {"hash": h, "events": [cw._stm_event_key(e)]} for b, h, e in
+                 ((e["Bill"], sha[e["Bill"]], e) for e in events)}
+    new_cache = {b: dict(c, hash=dig[b]) for b, c in old_cache.items()}
+    _, _, _, reused_old, _ = cw._stm_incremental_shadow(events, dig, False, old_cache)
+    ok, _, _, reused_new, _ = cw._stm_incremental_shadow(events, dig, False, new_cache)
+    if reused_old or not ok or reused_new != len(dig):
+        fails.append(f"4: old-scheme cache reused {reused_old} (want 0); new-scheme reused {reused_new}/{len(dig)}")
+
+    # 5) edge cases: empty frame, no refid column, blank bill rows skipped
+    if cw._stm_bill_digests(df.iloc[:0], D, R) != {}:
+        fails.append("5: an empty frame must give {}")
+    no_refid = cw._stm_bill_digests(df, D, None)
+    if set(no_refid) != set(dig) or no_refid == dig:
+        fails.append("5: no refid column must still digest every bill (differently)")
+    if "" in cw._stm_bill_digests(pd.concat([df.head(3), df.head(1).assign(CleanBill=" ")]), D, R):
+        fails.append("5: a blank CleanBill must be skipped")
+
+    # 6) pinned value: pandas' row hash or the fold changing must be a deliberate _STM_DIGEST_SCHEME bump
+    tiny = pd.DataFrame({"CleanBill": ["HB1", "HB1", "SB2"], D: ["Referred", "Reported", "Passed"],
+                         R: ["H0101", "", "S1"],
+                         "ParsedDate": pd.to_datetime(["2026-01-10", "2026-01-12", None])})
+    pinned = {"HB1": "h2:771b69f89b108494", "SB2": "h2:c7c81e7009dfa4bf"}
+    if cw._stm_bill_digests(tiny, D, R) != pinned:
+        fails.append(f"6: pinned digests drifted: {cw._stm_bill_digests(tiny, D, R)} — bump _STM_DIGEST_SCHEME")
+
+    if fails:
+        print("❌ FAILURES:")
+        for x in fails:
+            print("   -", x)
+        sys.exit(1)
+    print(f"✅ all STM digest tests passed ({len(dig)} bills; order-free; {len(mutations)} mutations move exactly "
+          f"the SHA-256's bills; old-scheme cache never reused; pinned)")
+
+
+if __name__ == "__main__":
+    main()
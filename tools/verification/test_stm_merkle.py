@@ -0,0 +1,144 @@
+"""Merkle digest of STM output (_stm_output_leaf / _stm_merkle_root) and the sampled verification built on it:
+a single-event mutation (edit / drop / duplicate / add) in ANY bill moves that bill's leaf and the root and
+nothing else; leaves are order-free; STM_Bill_Cache stores the leaves + root and discards a tab that no
+longer hashes to its root; the rotating sample walks every reused bill and the per-day coverage resets at
+midnight; recomputing a sample catches a stale reused bill; the isolated verification run restores the LegEvent caches.
+Runs over the checked-in 241 archive; no network."""
+import copy, inspect, json, os, shutil, sys, tempfile
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+import calendar_worker as cw
+from test_stm_sharding import _inputs
+from test_stm_dependencies import _FakeSheet, _FakeWS, _run
+
+D, R = "History_description", "History_refid"
+
+
+def main(tmp):
+    fails = []
+    cw._BLOB_CACHE_DIR, cw._BLOB_CACHE_ENABLED = tmp, True
+    df, ro = _inputs()
+    events = _run(df, copy.deepcopy(ro))["events"]
+    leaves = cw._stm_output_leaves(events)
+    root = cw._stm_merkle_root(leaves)
+
+    # 1) order-free, deterministic, one leaf per bill with output
+    if cw._stm_output_leaves(list(reversed(events))) != leaves or cw._stm_merkle_root(dict(leaves)) != root:
+        fails.append("1: event order must not move a leaf or the root")
+    if set(leaves) != {cw._event_bill_key(e) for e in events}:
+        fails.append("1: one leaf per bill with events")
+
+    # 2) a single-event mutation in ANY bill moves that bill's leaf and the root (every bill, four kinds);
+    #    on the whole output (every 15th bill — full re-leafing is the slow part) it moves nothing else
+    by_bill = {}
+    for e in events:
+        by_bill.setdefault(cw._event_bill_key(e), []).append(e)
+    mutations = {
+        "edit": lambda ev: [dict(ev[0], Time=str(ev[0].get("Time")) + "*")] + ev[1:],
+        "drop": lambda ev: ev[1:],
+        "duplicate": lambda ev: ev + [dict(ev[0])],
+        "add": lambda ev: ev + [dict(ev[0], Outcome="Continued to 2025")],
+    }
+    missed = []
+    for n, (bill, evs) in enumerate(sorted(by_bill.items())):
+        for name, mutate in mutations.items():
+            mutated = mutate(evs)
+            got = dict(leaves)
+            got[bill] = cw._stm_output_leaf([cw._stm_event_key(e) for e in mutated])
+            if not mutated:
+                del got[bill]
+            if got.get(bill) == leaves[bill] or cw._stm_merkle_root(got) == root:
+                missed.append(f"{bill}/{name}")
+            if n % 15 == 0:
+                whole = cw._stm_output_leaves([e for e in events if cw._event_bill_key(e) != bill] + mutated)
+                if cw._stm_merkle_diff(leaves, whole) != [bill]:
+                    missed.append(f"{bill}/{name} (whole output)")
+    if missed:
+        fails.append(f"2: {len(missed)} single-event mutation(s) not localized to their bill: {missed[:5]}")
+
+    # 3) STM_Bill_Cache: leaves + root round-trip; a tampered tab is discarded / the tampered bill recomputed
+    hashes = cw._stm_bill_digests(df, D, R)
+    ws = _FakeWS()
+    cw._persist_stm_bill_cache(_FakeSheet(ws), ws, events, hashes, "sig", True)
+    cache = cw._load_stm_bill_cache(_FakeSheet(ws))[0]
+    if {b: c["output"] for b, c in cache.items() if b in leaves} != leaves or ws.rows[1][4] != root:
+        fails.append("3: OutputDigest leaves and the sig row's root must round-trip")
+    bill_row = next(i for i, r in enumerate(ws.rows) if r[0] in leaves)
+    edited = copy.deepcopy(ws.rows)
+    edited[bill_row][2] = edited[bill_row][2].replace('"', '"~', 1)
+    ws.rows = edited
+    cache = cw._load_stm_bill_cache(_FakeSheet(ws))[0]
+    if cache[edited[bill_row][0]]["events"] is not None or sum(c["events"] is None for c in cache.values()) != 1:
+        fails.append("3: an EventsJSON cell that no longer matches its leaf must recompute that bill only")
+    for tamper in ("leaf", "row"):
+        rows = copy.deepcopy(edited)
+        if tamper == "leaf":
+            rows[bill_row][4] = "m1:0000000000000000"
+        else:
+            del rows[bill_row]
+        ws.rows = rows
+        if cw._load_stm_bill_cache(_FakeSheet(ws))[0] != {}:
+            fails.append(f"3: a tab whose {tamper}s no longer hash to the root must load empty")
+    ws.rows = [r[:4] for r in edited]                       # a tab from before OutputDigest: no root, no check
+    if len(cw._load_stm_bill_cache(_FakeSheet(ws))[0]) != len(edited) - 2:
+        fails.append("3: a pre-OutputDigest tab must load unchecked")
+
+    # 4) the rotating sample walks every reused bill; coverage accumulates per day and resets on a new one
+    state = cw._load_stm_verify_state()
+    reused, seen, k = sorted(leaves), set(), 40
+    pct = 0
+    for _ in range(-(-len(reused) // k)):
+        picked = cw._stm_verify_pick(reused, k, state)
+        seen |= set(picked)
+        pct = cw._stm_verify_coverage(state, "2026-10-18", picked, reused)
+    if seen != set(reused) or pct != 100:
+        fails.append(f"4: {-(-len(reused) // k)} cycles of {k} must cover all {len(reused)} bills ({pct}%)")
+    cw._save_stm_verify_state(state)
+    with open(cw._stm_verify_state_path()) as f:
+        on_disk = json.load(f)                               # JSON, not pickle
+    state = cw._load_stm_verify_state()
+    if state["covered"] != set(reused) or state["cursor"] != on_disk["cursor"]:
+        fails.append("4: the verify state must round-trip through its JSON file (covered as a set)")
+    if cw._stm_verify_coverage(state, "2026-10-19", reused[:10], reused) != int(100 * 10 / len(reused)):
+        fails.append("4: coverage must restart at a new day")
+    if cw._stm_verify_pick([], k, state) or cw._stm_verify_pick(reused, 0, state):
+        fails.append("4: nothing to sample / K=0 picks nothing")
+
+    # 5) a stale reused bill (its schedule moved, reuse didn't notice) is caught by recomputing it
+    ro2 = copy.deepcopy(ro)
+    day = next(e["Date"] for e in events if e.get("Time") == "9:00 AM")
+    for key, v in ro2["api_schedule_map"].items():
+        if key.startswith(day + "_"):
+            v.update(Time="3:17 PM", SortTime="15:17")
+    fresh = cw._stm_output_leaves(_run(df, ro2)["events"])
+    stale = cw._stm_merkle_diff(leaves, fresh)
+    sample = cw._stm_verify_pick(sorted(leaves), len(leaves), {"cursor": 0})
+    if not stale or [b for b in sample if fresh.get(b) != leaves.get(b)] != stale:
+        fails.append(f"5: recomputing the sample must flag exactly the stale bills {stale[:5]}")
+
+    # 6) the isolated verification run restores every piece of cycle state it can touch — the LegEvent
+    #    caches included (the resolver writes negative-cache seeds into them on a miss)
+    src = inspect.getsource(cw.run_calendar_update)
+    body = src[src.index("def _stm_isolated_events("):src.index("def _verify_incremental_primary(")]
+    for cache in ("_legislation_id_cache", "_legislation_event_cache"):
+        if f"dict({cache})" not in body or f"{cache}.clear(); {cache}.update(" not in body.split("finally:")[1]:
+            fails.append(f"6: _stm_isolated_events must snapshot {cache} and restore it in its finally")
+
+    if fails:
+        print("❌ FAILURES:")
+        for x in fails:
+            print("   -", x)
+        sys.exit(1)
+    print(f"✅ all STM Merkle tests passed ({len(leaves)} bills; {len(by_bill) * len(mutations)} single-event "
+          f"mutations each localized to its bill; tamper-evident cache; rotating sample covers every bill; "
+          f"{len(stale)} stale bill(s) caught; isolated run restores the LegEvent caches)")
+
+
+if __name__ == "__main__":
+    saved = cw._BLOB_CACHE_DIR, cw._BLOB_CACHE_ENABLED
+    _tmp = tempfile.mkdtemp()
+    try:
+        main(_tmp)
+    finally:
+        cw._BLOB_CACHE_DIR, cw._BLOB_CACHE_ENABLED = saved
+        shutil.rmtree(_tmp, ignore_errors=True)
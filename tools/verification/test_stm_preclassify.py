@@ -0,0 +1,138 @@
+"""STM columnar pre-pass (_stm_preclassify): every vectorized flag must equal the per-row
+expression it replaced, on real HISTORY text + the malformed-prefix edge cases, so the STM's
+output stays byte-identical. Also a small end-to-end STM run through the itertuples loop.
+See docs/ideas/future_improvements.md (worker speed audit)."""
+import os, sys
+from collections import Counter
+import pandas as pd
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+import calendar_worker as cw
+
+_HIST = os.path.join(os.path.dirname(__file__), "..", "historical_cache", "va", "241", "History.csv.gz")
+
+
+def _scalar_flags(bill_num, raw_desc):
+    """The ORIGINAL per-row expressions, verbatim from the pre-vectorization STM loop."""
+    outcome_text = str(raw_desc).strip()
+    outcome_lower = outcome_text.lower()
+    rem = outcome_text
+    if rem.startswith(('H ', 'S ')):
+        rem = rem[2:].strip()
+    elif rem in ('H', 'S'):
+        rem = ""
+    if outcome_text.startswith('H '): acting = "House "
+    elif outcome_text.startswith('S '): acting = "Senate "
+    else: acting = "House " if bill_num.startswith('H') else "Senate "
+    is_absolute_floor = any(f in outcome_lower for f in cw.ABSOLUTE_FLOOR_VERBS)
+    is_report = any(x in outcome_lower for x in ["reported", "discharged"]) and not any(x in outcome_lower for x in ["fail", "defeat"])
+    return {
+        "text": outcome_text,
+        "lower": outcome_lower,
+        "malformed": not rem,
+        "chamber": acting,
+        "search_prefix": "Joint " if "joint" in outcome_lower or ("house" in outcome_lower and "senate" in outcome_lower) else acting,
+        "is_exec": any(ev in outcome_lower for ev in ["approved by governor", "vetoed by governor", "governor's substitute", "governor's recommendation", "governor:"]) and not (outcome_text.startswith('H ') or outcome_text.startswith('S ')),
+        "is_absolute_floor": is_absolute_floor,
+        "is_conf": ("conferee" in outcome_lower or "conference report" in outcome_lower) and not is_absolute_floor,
+        "is_referral": any(x in outcome_lower for x in ["referred", "assigned"]) and not any(x in outcome_lower for x in ["fail", "defeat", "strike"]),
+        "has_from": "from" in outcome_lower,
+        "is_report": is_report,
+        "is_rerefer": is_report and ("rereferred" in outcome_lower or ("referred" in outcome_lower and "reported" in outcome_lower)),
+        "is_timing_lag": "placed on" in outcome_lower and "agenda" in outcome_lower,
+        "is_dynamic_verb": any(v in outcome_lower for v in cw.DYNAMIC_VERBS),
+        "nameless_report": any(x in outcome_lower for x in ["reported", "discharged"]) and not any(x in outcome_lower for x in ["fail"]),
+        "is_known_noise": any(n in outcome_lower for n in cw.KNOWN_NOISE_PATTERNS),
+        "is_known_event": any(e in outcome_lower for e in cw.KNOWN_EVENT_PATTERNS),
+    }
+
+
+def _frame(rows):
+    df = pd.DataFrame(rows, columns=["Bill_id", "History_date", "History_description", "History_refid"])
+    df["CleanBill"] = df["Bill_id"].astype(str).str.replace(" ", "").str.upper()
+    df["ParsedDate"] = pd.to_datetime(df["History_date"], errors="coerce")
+    return df
+
+
+def main():
+    fails = []
+
+    # 1) flag parity on the real 2024 HISTORY corpus + hand-picked edge cases
+    edge = [("HB1", "2024-01-10", d, "") for d in (
+        "H", "S", "H ", "S  ", "", "  H  ", "H  Reported", "HJR", "Governor: Approved by Governor",
+        "S Governor's recommendation received", "Joint committee meets", "house and senate conferees",
+        "Placed on Finance agenda", "Reported from X and rereferred to Y", "effective - 07/01/24",
+        "REPORTED (caps)", "s reported", "Conference report agreed to by House", "Rules (a|b) [x]")]
+    rows = edge
+    if os.path.exists(_HIST):
+        hist = pd.read_csv(_HIST, dtype=str, keep_default_na=False, encoding="iso-8859-1")
+        hist.columns = hist.columns.str.strip()
+        rows = edge + list(hist[["Bill_id", "History_date", "History_description", "History_refid"]]
+                           .itertuples(index=False, name=None))
+    else:
+        fails.append(f"1: fixture missing: {_HIST}")
+    df = _frame(rows)
+    pre = cw._stm_preclassify(df, "History_description", "History_refid")
+    if list(pre.index) != list(df.index):
+        fails.append("1: pre-pass must keep df_past's index/order")
+    n_checked = 0
+    for (bill, raw), rec in zip(zip(df["CleanBill"], df["History_description"]), pre.itertuples(index=False)):
+        want = _scalar_flags(bill, raw)
+        for k, v in want.items():
+            if getattr(rec, k) != v:
+                fails.append(f"1: {k} mismatch for {raw!r}: vectorized={getattr(rec, k)!r} scalar={v!r}")
+                break
+        n_checked += 1
+        if len(fails) > 10:
+            break
+
+    # 2) refid column: passed through raw when present, "" when the column is absent / refid_col is None
+    if list(pre["refid"][:3]) != ["", "", ""]:
+        fails.append("2: refid must pass through the raw column values")
+    if set(cw._stm_preclassify(df.head(3), "History_description", None)["refid"]) != {""}:
+        fails.append("2: refid must be '' when refid_col is None")
+
+    # 3) empty-needle guard: _contains_any([]) is all-False (a bare '' alternation would match everything)
+    if cw._contains_any(pd.Series(["abc", ""]), []).any() or cw._contains_any(pd.Series(["abc"]), [""]).any():
+        fails.append("3: _contains_any with no usable needles must be all-False")
+
+    # 4) end-to-end through the itertuples loop: the malformed row drops + counts, the real row appends
+    events, smc = [], Counter()
+    small = _frame([("HB5", "2024-01-10", "H ", ""), ("HB5", "2024-01-10", "H Read first time", "")])
+    cw.run_sequential_turing_machine(
+        small, bill_locations={}, last_seen_date={}, api_schedule_map={}, docket_memory={},
+        convene_times={"2024-01-10": {"House": {"Time": "12:00 PM", "SortTime": "12:00", "Name": "House Convenes"}}},
+        _append_event=events.append, push_system_alert=lambda *a, **k: None, source_miss_counts=smc,
+        _admin_recovery_index=frozenset(), _ministerial_codes=frozenset(), _vote_id_set=set(),
+        _refid_fanout={}, committee_modal_standing={}, adjourned_clock_by_date={},
+        _floor_miss_dates=Counter(), desc_col="History_description", refid_col="History_refid",
+        _session_code_5d="20241", _legislation_event_cache={}, _legislation_id_cache={},
+        _build_diagnostic_hint=lambda *a: "", _classify_refid=cw._classify_refid,
+        _normalize_refid=cw._normalize_refid, http_session=None, _floor_hit=0, _floor_miss=0)
+    if smc["malformed_empty_history"] != 1 or len(events) != 1:
+        fails.append(f"4: expected 1 malformed drop + 1 event, got {smc['malformed_empty_history']} / {len(events)}")
+    elif (events[0]["Committee"], events[0]["Time"], events[0]["Origin"]) != ("House Convenes", "12:00 PM", "convene_anchor"):
+        fails.append(f"4: floor row must anchor to the convene time, got {events[0]}")
+
+    # 5) an empty frame is a no-op that returns the accumulators unchanged
+    if cw.run_sequential_turing_machine(
+            small.iloc[0:0], bill_locations={}, last_seen_date={}, api_schedule_map={}, docket_memory={},
+            convene_times={}, _append_event=events.append, push_system_alert=None, source_miss_counts=smc,
+            _admin_recovery_index=frozenset(), _ministerial_codes=frozenset(), _vote_id_set=set(),
+            _refid_fanout={}, committee_modal_standing={}, adjourned_clock_by_date={},
+            _floor_miss_dates=Counter(), desc_col="History_description", refid_col=None,
+            _session_code_5d="20241", _legislation_event_cache={}, _legislation_id_cache={},
+            _build_diagnostic_hint=None, _classify_refid=None, _normalize_refid=None,
+            http_session=None, _floor_hit=3, _floor_miss=4) != (3, 4):
+        fails.append("5: empty df_past must return (_floor_hit, _floor_miss) unchanged")
+
+    if fails:
+        print("❌ FAILURES:")
+        for x in fails:
+            print("   -", x)
+        sys.exit(1)
+    print(f"✅ all STM pre-pass tests passed ({n_checked} rows: every vectorized flag == the per-row "
+          f"expression; refid passthrough; empty-needle guard; itertuples loop end-to-end; empty frame)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Sharded STM (run_stm_shards + merge_stm_shards, STM_SHARD_WORKERS) must reproduce the serial
+run_sequential_turing_machine EXACTLY — the same events in the same order, the same alerts in the same
+order, the same counters / floor-miss Counter / bill state / LegEvent-cache additions — on real 2024
+HISTORY rows. Also: deterministic sharding, the worker-count knob, and the empty frame."""
+import copy, os, sys, threading
+import unittest.mock as mock
+from collections import Counter
+import pandas as pd
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+import calendar_worker as cw
+
+_HIST = os.path.join(os.path.dirname(__file__), "..", "historical_cache", "va", "241", "History.csv.gz")
+
+
+def _inputs(limit=6000):
+    df = pd.read_csv(_HIST, dtype=str, keep_default_na=False, encoding="iso-8859-1").head(limit)
+    df.columns = df.columns.str.strip()
+    df["CleanBill"] = df["Bill_id"].astype(str).str.replace(" ", "").str.upper()
+    df["ParsedDate"] = pd.to_datetime(df["History_date"], errors="coerce")
+    df = df[df["ParsedDate"].notna()].copy()
+    df["OriginalOrder"] = range(len(df))
+    df = df.sort_values(by=["ParsedDate", "OriginalOrder"])
+    dates = sorted({d.strftime("%Y-%m-%d") for d in df["ParsedDate"]})
+    names = sorted(cw._STATIC_LOCAL_LEXICON)
+    api = {f"{d}_{n}": {"Time": f"{8 + j % 8}:00 AM", "SortTime": f"{8 + j % 8:02d}:00", "Status": ""}
+           for i, d in enumerate(dates) for j, n in enumerate(names) if (i + j) % 3 == 0}
+    convene = {d: {"House": {"Time": "12:00 PM", "SortTime": "12:00", "Name": "House Convenes"},
+                   "Senate": {"Time": "12:00 PM", "SortTime": "12:00", "Name": "Senate Convenes"}}
+               for i, d in enumerate(dates) if i % 4}
+    # Half the bills have a negative-cached LegEvent entry; the rest are MISSING, so the resolver takes
+    # its lookup path (http_session=None -> categorized alert + negative-cache write) — exercising the
+    # alert replay and the cache merge.
+    id_cache, ev_cache = {}, {}
+    for b in sorted(set(df["CleanBill"]))[::2]:
+        id_cache[(b, "20241")] = ""
+        ev_cache[(b, "20241")] = []
+    ro = dict(api_schedule_map=api, docket_memory={}, convene_times=convene,
+              _admin_recovery_index=frozenset(), _ministerial_codes=frozenset(), _vote_id_set=set(),
+              _refid_fanout={}, committee_modal_standing={}, adjourned_clock_by_date={},
+              desc_col="History_description", refid_col="History_refid", _session_code_5d="20241",
+              _legislation_event_cache=ev_cache, _legislation_id_cache=id_cache,
+              _build_diagnostic_hint=lambda d, loc, pre: f"{d}|{loc}|{pre}",
+              _classify_refid=cw._classify_refid, _normalize_refid=cw._normalize_refid, http_session=None)
+    return df, ro
+
+
+def _sinks():
+    s = {"events": [], "alerts": [], "smc": Counter(), "fmd": Counter({"2024-01-01_House": 2}),
+         "bl": {}, "lsd": {}}
+    s["append"] = s["events"].append
+    s["push"] = lambda *a, **k: s["alerts"].append((a, sorted(k.items())))
+    return s
+
+
+def main():
+    fails = []
+    if not os.path.exists(_HIST):
+        print(f"❌ fixture missing: {_HIST}")
+        sys.exit(1)
+    df, ro = _inputs()
+
+    # 1) serial vs sharded (3 workers) on identical fresh inputs
+    ro_a = copy.deepcopy(ro)
+    a = _sinks()
+    fa = cw.run_sequential_turing_machine(
+        df, bill_locations=a["bl"], last_seen_date=a["lsd"], _append_event=a["append"],
+        push_system_alert=a["push"], source_miss_counts=a["smc"], _floor_miss_dates=a["fmd"],
+        _floor_hit=5, _floor_miss=7, **ro_a)
+    ro_b = copy.deepcopy(ro)
+    b = _sinks()
+    results = cw.run_stm_shards(df, 3, ro_b)
+    fb = cw.merge_stm_shards(
+        results, bill_locations=b["bl"], last_seen_date=b["lsd"], _append_event=b["append"],
+        push_system_alert=b["push"], source_miss_counts=b["smc"], _floor_miss_dates=b["fmd"],
+        _legislation_id_cache=ro_b["_legislation_id_cache"],
+        _legislation_event_cache=ro_b["_legislation_event_cache"], _floor_hit=5, _floor_miss=7)
+    if len(results) != 3:
+        fails.append(f"1: expected 3 shards, got {len(results)}")
+    if not a["events"] or not a["alerts"]:
+        fails.append("1: fixture must produce events AND alerts (else the replay is untested)")
+    if a["events"] != b["events"]:
+        fails.append(f"1: events differ (serial {len(a['events'])}, sharded {len(b['events'])}) or are out of order")
+    if a["alerts"] != b["alerts"]:
+        fails.append(f"1: alerts differ (serial {len(a['alerts'])}, sharded {len(b['alerts'])}) or are out of order")
+    if a["smc"] != b["smc"]:
+        fails.append(f"1: source_miss_counts differ: {set(a['smc'].items()) ^ set(b['smc'].items())}")
+    if (a["fmd"], fa) != (b["fmd"], fb):
+        fails.append(f"1: floor accumulators differ: {fa} vs {fb}")
+    if (a["bl"], a["lsd"]) != (b["bl"], b["lsd"]):
+        fails.append("1: bill_locations / last_seen_date differ")
+    if (ro_a["_legislation_id_cache"], ro_a["_legislation_event_cache"]) != (
+            ro_b["_legislation_id_cache"], ro_b["_legislation_event_cache"]):
+        fails.append("1: the resolver's LegEvent cache additions were not merged back")
+
+    # 2) sharding is bill-disjoint, covers every row once, keeps row order, and is deterministic
+    shards = cw._stm_shards(df, 4)
+    seen = [p for pos, _ in shards for p in pos]
+    if sorted(seen) != list(range(len(df))) or any(pos != sorted(pos) for pos, _ in shards):
+        fails.append("2: shards must partition the rows and keep df_past order")
+    bills = [set(s["CleanBill"]) for _, s in shards]
+    if any(bills[i] & bills[j] for i in range(len(bills)) for j in range(i + 1, len(bills))):
+        fails.append("2: a bill must never span two shards")
+    if [p for p, _ in cw._stm_shards(df, 4)] != [p for p, _ in shards]:
+        fails.append("2: sharding must be deterministic")
+    if cw.run_stm_shards(df.iloc[0:0], 4, ro) != []:
+        fails.append("2: an empty frame yields no shards")
+
+    # 2b) never fork while another thread is alive (a lock it holds would stay held in the child)
+    release = threading.Event()
+    busy = threading.Thread(target=release.wait, name="busy-io", daemon=True)
+    busy.start()
+    try:
+        cw.run_stm_shards(df, 2, ro)
+        fails.append("2b: forking with another live thread must refuse (the caller runs the serial STM)")
+    except RuntimeError as e:
+        if "busy-io" not in str(e):
+            fails.append(f"2b: the refusal must name the live thread: {e}")
+    finally:
+        release.set()
+        busy.join()
+    with mock.patch.object(cw.threading, "enumerate", return_value=[cw.threading.current_thread()]):
+        if cw._stm_fork_stray_threads():
+            fails.append("2b: a single-threaded process has no stray threads")
+
+    # 3) the STM_SHARD_WORKERS knob
+    for raw, want in (("", 1), ("0", 1), ("1", 1), ("junk", 1), ("4", 4), (" 2 ", 2)):
+        if cw._stm_shard_worker_count(raw) != want:
+            fails.append(f"3: STM_SHARD_WORKERS={raw!r} -> {cw._stm_shard_worker_count(raw)}, want {want}")
+    if cw._stm_shard_worker_count("auto") != (os.cpu_count() or 1):
+        fails.append("3: 'auto' must mean one worker per core")
+
+    if fails:
+        print("❌ FAILURES:")
+        for x in fails:
+            print("   -", x)
+        sys.exit(1)
+    print(f"✅ all sharded-STM tests passed ({len(df)} rows, {len(a['events'])} events, {len(a['alerts'])} "
+          f"alerts: serial == sharded in order; counters/floor/bill state/cache merge; deterministic "
+          f"bill-disjoint shards; no fork beside a live thread; worker knob)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""VOTE.CSV index (VoteIndex / load_vote_index): roll-call tallies built once per ETag and persisted in the
+blob cache; a warm 304 loads them without csv.reader; a file that extends the old one byte-for-byte is
+tail-parsed to the same tallies a full parse gives; anything else (rewrite, corrupt index, schema bump)
+re-parses; the HISTORY join gives bill → date-sorted VoteRecords with LIS's own tally; the worker's
+floor-vote id set is unchanged; the fetch is one _blob_get request. Runs over the checked-in 241 archive; no
+network."""
+import csv, gzip, io, json, os, shutil, sys, tempfile
+import unittest.mock as mock
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+import calendar_worker as cw
+
+_ARCHIVE = os.path.join(os.path.dirname(__file__), "..", "historical_cache", "va", "241")
+
+
+class _Resp:
+    def __init__(self, status_code, content=b"", etag=None):
+        self.status_code, self.content = status_code, content
+        self.headers = {"ETag": etag} if etag else {}
+
+
+class _Session:
+    """Serves one VOTE.CSV body under an ETag; honours If-None-Match."""
+
+    def __init__(self, body, etag):
+        self.body, self.etag, self.sent = body, etag, []
+
+    def get(self, url, timeout=None, headers=None, **_):
+        self.sent.append(dict(headers or {}))
+        if (headers or {}).get("If-None-Match") == self.etag:
+            return _Resp(304)
+        return _Resp(200, self.body, self.etag)
+
+
+def _load(session):
+    """load_vote_index with `session` standing in for the pooled blob session (_blob_get's transfer)."""
+    with mock.patch.object(cw, "_BLOB_SESSION", session):
+        return cw.load_vote_index("20241")
+
+
+def main(tmp):
+    fails = []
+    with gzip.open(os.path.join(_ARCHIVE, "Vote.csv.gz")) as f:
+        vote = f.read()
+    with gzip.open(os.path.join(_ARCHIVE, "History.csv.gz")) as f:
+        history = list(csv.DictReader(io.StringIO(f.read().decode("iso-8859-1"))))
+    cw._BLOB_CACHE_DIR, cw._BLOB_CACHE_ENABLED = tmp, True
+
+    # 1) full parse: every row indexed; the floor-id set is exactly the old inline csv.reader loop's
+    full = cw.VoteIndex.build(vote, '"v1"')
+    old = {r[0].strip() for r in csv.reader(io.StringIO(vote.decode("utf-8", "replace")))
+           if r and r[0].strip().isdigit()}
+    rows = sum(1 for r in csv.reader(io.StringIO(vote.decode("utf-8", "replace"))) if r and r[0].strip())
+    if len(full.tallies) != rows or full.floor_vote_ids() != old or full.source != "parsed":
+        fails.append(f"1: {len(full.tallies)} of {rows} rows indexed; floor ids differ={full.floor_vote_ids() ^ old}")
+    if full.rollcall_tally("H0101V0001") != "6-Y 4-N":
+        fails.append(f"1: roll-call tally {full.rollcall_tally('H0101V0001')!r}")
+
+    # 2) HISTORY join: every refid resolves; LIS's tally text wins; date-sorted; chamber + outcome
+    full.attach_history((r["Bill_id"], r["History_date"], r["History_refid"], r["History_description"])
+                        for r in history)
+    joined = sum(len(v) for v in full.by_bill.values())
+    want = sum(1 for r in history if r["History_refid"].strip())
+    if joined != want:
+        fails.append(f"2: {joined} of {want} HISTORY refids joined")
+    hb1 = full.votes_for("HB1")
+    if hb1[0] != cw.VoteRecord("2024-01-18", "House", "12-Y 10-N", "Reported from Labor and Commerce"):
+        fails.append(f"2: HB1 first vote {hb1[0]}")
+    if any(a.date > b.date for v in full.by_bill.values() for a, b in zip(v, v[1:])):
+        fails.append("2: per-bill votes must be oldest first")
+    if full.latest("HB1") != hb1[-1] or full.latest("HB99999") is not None or full.votes_for("HB99999"):
+        fails.append("2: latest() / votes_for() on a known and an unknown bill")
+    fallback = cw.VoteIndex.build(b'"H9V1","H1","Y","H2","N","H3","A"\n', '"x"').attach_history(
+        [("HB7", "1/9/2026", "h9v1", "S Passed by indefinitely")])
+    if fallback.votes_for("HB7") != [cw.VoteRecord("2026-01-09", "House", "1-Y 1-N 1-A", "Passed by indefinitely")]:
+        fails.append(f"2: no tally text must fall back to the roll-call count: {fallback.votes_for('HB7')}")
+
+    # 3) append-only: a body that extends the old one parses only the tail, to the same tallies
+    cut = vote.rfind(b"\n", 0, len(vote) // 2) + 1
+    prior = cw.VoteIndex.build(vote[:cut], '"v0"')
+    real_reader = csv.reader
+    with mock.patch.object(cw.csv, "reader", side_effect=lambda f: real_reader(f)) as reader:
+        extended = cw.VoteIndex.build(vote, '"v1"', prior)
+    fed = reader.call_args[0][0].getvalue()
+    if extended.source != "extended" or extended.tallies != full.tallies or len(fed) != len(vote) - cut:
+        fails.append(f"3: tail parse must read only the {len(vote) - cut} appended bytes (read {len(fed)})")
+    rewritten = vote[:cut - 40] + b"X" * 40 + vote[cut:]
+    if cw.VoteIndex.build(rewritten, '"v2"', prior).source != "parsed":
+        fails.append("3: a body whose old prefix changed must be fully re-parsed")
+    mid_row = cw.VoteIndex.build(vote[:cut - 5], '"v0"')
+    if cw.VoteIndex.build(vote, '"v1"', mid_row).source != "parsed":
+        fails.append("3: a prior body that ended mid-row must never seed a tail parse")
+
+    # 4) load_vote_index: cold 200 persists; warm 304 loads with no csv parse; extension; fault → parse
+    session = _Session(vote[:cut], '"v0"')
+    cold = _load(session)
+    path = cw._vote_index_path("https://lis.blob.core.windows.net/lisfiles/20241/VOTE.CSV")
+    if cold.source != "parsed" or not os.path.exists(path) or "If-None-Match" in session.sent[0]:
+        fails.append("4: a cold fetch must parse, persist and send no validator")
+    if len(session.sent) != 1 or session.sent[0].get("Range") != "bytes=0-":
+        fails.append(f"4: VOTE.CSV must come down through _blob_get in ONE request: {session.sent}")
+    with mock.patch.object(cw.csv, "reader", side_effect=AssertionError("csv parse on a warm cycle")):
+        try:
+            warm = _load(session)
+            if warm.source != "snapshot" or warm.tallies != prior.tallies or session.sent[-1].get("If-None-Match") != '"v0"':
+                fails.append("4: a 304 must load the persisted index")
+        except AssertionError as e:
+            fails.append(f"4: {e}")
+    session.body, session.etag = vote, '"v1"'
+    grown = _load(session)
+    if grown.source != "extended" or grown.tallies != full.tallies:
+        fails.append(f"4: a grown VOTE.CSV must be tail-parsed ({grown.source})")
+    for junk in ("{not json", json.dumps({"schema": "0"}), json.dumps({"schema": cw._VOTE_INDEX_SCHEMA})):
+        with open(path, "w") as f:
+            f.write(junk)
+        if _load(session).source != "parsed":
+            fails.append(f"4: a bad index file must re-parse: {junk!r}")
+    if _load(session).source != "snapshot":
+        fails.append("4: the re-parse must rewrite the index")
+
+    # 5) 304 with no cached bytes → unconditional re-GET; kill switch → no index file
+    shutil.rmtree(tmp)
+    os.makedirs(tmp)
+    class _Stale(_Session):
+        def get(self, url, timeout=None, headers=None, **_):
+            self.sent.append(dict(headers or {}))
+            return _Resp(304) if len(self.sent) == 1 else _Resp(200, self.body, self.etag)
+    stale = _Stale(vote, '"v1"')
+    if _load(stale).tallies != full.tallies or "If-None-Match" in stale.sent[1]:
+        fails.append("5: a 304 without a cache must re-GET unconditionally")
+    cw._BLOB_CACHE_ENABLED = False
+    shutil.rmtree(tmp)
+    if _load(_Session(vote, '"v1"')).source != "parsed" or os.path.exists(tmp):
+        fails.append("5: LIS_BLOB_CACHE=0 must parse every time and persist nothing")
+
+    if fails:
+        print("❌ FAILURES:")
+        for x in fails:
+            print("   -", x)
+        sys.exit(1)
+    print(f"✅ all VOTE.CSV index tests passed ({len(full.tallies)} roll calls, {joined} HISTORY joins; warm "
+          f"load without csv; tail parse == full parse; faults re-parse; kill switch)")
+
+
+if __name__ == "__main__":
+    saved = cw._BLOB_CACHE_DIR, cw._BLOB_CACHE_ENABLED
+    _tmp = tempfile.mkdtemp()
+    try:
+        main(_tmp)
+    finally:
+        cw._BLOB_CACHE_DIR, cw._BLOB_CACHE_ENABLED = saved
+        shutil.rmtree(_tmp, ignore_errors=True)